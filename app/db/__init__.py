@@ -1,7 +1,6 @@
 """
 数据库模块
 """
-from app.db.database import get_db, init_db
-
-__all__ = ['get_db', 'init_db']
+from app.db.database import close_connections, get_db, get_read_connection, get_write_connection, init_db
 
+__all__ = ['get_db', 'init_db', 'get_read_connection', 'get_write_connection', 'close_connections']
@@ -1,13 +1,63 @@
 """
 数据库连接和初始化
+
+读写函数使用按线程复用的持久连接：读连接以只读 URI 打开，两者都设置 mmap/cache 等 pragma，
+并依赖 sqlite3 的语句缓存复用预编译语句。
+
+仓库中的 data/fan_database.db 是纳入版本管理的种子数据，保持回滚日志模式，运行时不改写其日志模式；
+部署时通过环境变量 FAN_DB_PATH 指向种子库的运行时副本，该副本才切换为 WAL 模式。
 """
 import sqlite3
 import os
+import shutil
+import threading
+from itertools import islice
 from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.db.fan_envelope import create_envelope_tables, find_envelope_candidates, rebuild_fan_envelopes
 
 # 数据库文件路径
 BASE_DIR = Path(__file__).parent.parent.parent
-DB_PATH = BASE_DIR / "data" / "fan_database.db"
+SEED_DB_PATH = BASE_DIR / "data" / "fan_database.db"
+DB_PATH = Path(os.environ.get("FAN_DB_PATH") or SEED_DB_PATH)
+
+# 连接调优参数
+MMAP_SIZE = 64 * 1024 * 1024
+CACHE_SIZE_KB = 8 * 1024
+BUSY_TIMEOUT_MS = 5000
+CACHED_STATEMENTS = 64
+
+# 语句保持为模块常量：相同的SQL文本才能命中连接上的预编译语句缓存
+SELECT_FAN_PERFORMANCE_SQL = """
+    SELECT point_index, phi, psi_p, eta
+    FROM fan_performance
+    WHERE fan_type = ?
+    ORDER BY point_index ASC
+"""
+SELECT_FAN_TYPES_SQL = """
+    SELECT DISTINCT fan_type
+    FROM fan_performance
+    ORDER BY fan_type ASC
+"""
+UPSERT_FAN_PERFORMANCE_SQL = """
+    INSERT OR REPLACE INTO fan_performance
+    (fan_type, point_index, phi, psi_p, eta, updated_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+DELETE_FAN_TYPE_SQL = "DELETE FROM fan_performance WHERE fan_type = ?"
+
+_local = threading.local()
+
+# 本进程内的写入计数，供内存缓存判断是否需要重新加载
+_write_version = 0
+_write_version_lock = threading.Lock()
+
+# 本进程内各读写函数的调用次数与新建连接数（/metrics 导出，见 app/services/metrics.py）
+_query_counts: Dict[str, int] = {}
+_connection_counts: Dict[str, int] = {}
+_counts_lock = threading.Lock()
 
 
 def get_db():
@@ -22,12 +72,121 @@ def get_db():
     return conn
 
 
+def _count(counts: Dict[str, int], key: str) -> None:
+    with _counts_lock:
+        counts[key] = counts.get(key, 0) + 1
+
+
+def reset_counts() -> None:
+    """清空本进程的调用次数与连接数（fork 后子进程从 0 开始，不重复统计父进程预加载时的计数）"""
+    global _counts_lock
+    _counts_lock = threading.Lock()
+    _query_counts.clear()
+    _connection_counts.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_counts)
+
+
+def query_counts() -> Dict[str, int]:
+    """本进程内各读写函数的调用次数 {函数名: 次数}"""
+    with _counts_lock:
+        return dict(_query_counts)
+
+
+def connection_counts() -> Dict[str, int]:
+    """本进程内新建的复用连接数 {"read"/"write": 个数}"""
+    with _counts_lock:
+        return dict(_connection_counts)
+
+
+def uses_wal(path: Optional[Path] = None) -> bool:
+    """数据库是否使用 WAL 模式（默认当前数据库）：纳入版本管理的种子库不切换，避免改写文件并留下 -wal/-shm"""
+    return Path(path or DB_PATH).resolve() != SEED_DB_PATH.resolve()
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KB}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+
+
+def _pooled_connection(readonly: bool, path: Optional[Path] = None) -> sqlite3.Connection:
+    """
+    获取当前线程的持久连接，不存在时创建
+
+    连接按 (数据库路径, 读/写) 缓存在线程局部变量中；进程 fork 后会重新建立，
+    避免子进程继续使用父进程的连接。path 为空时使用风机数据库 DB_PATH。
+    """
+    path = Path(path or DB_PATH)
+    key = (str(path), readonly)
+    pid = os.getpid()
+    connections = getattr(_local, "connections", None)
+    if connections is None or getattr(_local, "pid", None) != pid:
+        connections = _local.connections = {}
+        _local.pid = pid
+
+    conn = connections.get(key)
+    if conn is None:
+        if readonly:
+            uri = f"{path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, cached_statements=CACHED_STATEMENTS)
+            _apply_pragmas(conn)
+            conn.execute("PRAGMA query_only = ON")
+        else:
+            conn = sqlite3.connect(str(path), cached_statements=CACHED_STATEMENTS)
+            _apply_pragmas(conn)
+            if uses_wal(path):
+                conn.execute("PRAGMA journal_mode = WAL")
+                conn.execute("PRAGMA synchronous = NORMAL")
+        conn.row_factory = sqlite3.Row
+        connections[key] = conn
+        _count(_connection_counts, "read" if readonly else "write")
+    return conn
+
+
+def get_read_connection(path: Optional[Path] = None) -> sqlite3.Connection:
+    """获取当前线程复用的只读连接（path 为空时连接风机数据库）"""
+    return _pooled_connection(readonly=True, path=path)
+
+
+def get_write_connection(path: Optional[Path] = None) -> sqlite3.Connection:
+    """获取当前线程复用的读写连接（path 为空时连接风机数据库；种子库以外为 WAL 模式）"""
+    return _pooled_connection(readonly=False, path=path)
+
+
+def bump_write_version() -> int:
+    """写入 fan_performance 后调用，递增本进程的写入计数"""
+    global _write_version
+    with _write_version_lock:
+        _write_version += 1
+        return _write_version
+
+
+def get_write_version() -> int:
+    """本进程内 fan_performance 的写入计数"""
+    return _write_version
+
+
+def close_connections() -> None:
+    """关闭当前线程持有的所有复用连接"""
+    connections = getattr(_local, "connections", None) or {}
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
 def init_db():
     """
     初始化数据库，创建表结构
     """
     # 确保data目录存在
     os.makedirs(DB_PATH.parent, exist_ok=True)
+    # 运行时副本不存在时从种子库复制
+    if uses_wal() and not DB_PATH.exists() and SEED_DB_PATH.exists():
+        shutil.copyfile(SEED_DB_PATH, DB_PATH)
     
     conn = get_db()
     cursor = conn.cursor()
@@ -53,7 +212,20 @@ def init_db():
         ON fan_performance(fan_type)
     """)
     
+    # 性能包络索引：已有曲线但尚未建立包络时（旧数据库）补建
+    create_envelope_tables(conn)
+    has_curves = cursor.execute("SELECT 1 FROM fan_performance LIMIT 1").fetchall()
+    has_envelopes = cursor.execute("SELECT 1 FROM fan_envelope_meta LIMIT 1").fetchall()
+    if has_curves and not has_envelopes:
+        rebuild_fan_envelopes(conn)
+    
     conn.commit()
+    
+    # WAL 模式下读连接不会被写事务阻塞；journal_mode 持久保存在数据库文件中，只对运行时副本开启。
+    # 事务内无法切换日志模式，必须在上面的提交之后执行
+    if uses_wal():
+        cursor.execute("PRAGMA journal_mode = WAL").fetchall()
+    
     conn.close()
     print(f"数据库初始化完成: {DB_PATH}")
 
@@ -68,18 +240,8 @@ def get_fan_performance(fan_type: str):
     Returns:
         list: 性能点列表，每个点包含 phi, psi_p, eta
     """
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT point_index, phi, psi_p, eta
-        FROM fan_performance
-        WHERE fan_type = ?
-        ORDER BY point_index ASC
-    """, (fan_type,))
-    
-    results = cursor.fetchall()
-    conn.close()
+    _count(_query_counts, "get_fan_performance")
+    results = get_read_connection().execute(SELECT_FAN_PERFORMANCE_SQL, (fan_type,)).fetchall()
     
     if not results:
         return None
@@ -107,17 +269,55 @@ def insert_fan_performance(fan_type: str, point_index: int, phi: float, psi_p: f
         psi_p: 压力系数
         eta: 效率（百分比，如87.6表示87.6%）
     """
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        INSERT OR REPLACE INTO fan_performance 
-        (fan_type, point_index, phi, psi_p, eta, updated_at)
-        VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-    """, (fan_type, point_index, phi, psi_p, eta))
-    
-    conn.commit()
-    conn.close()
+    _count(_query_counts, "insert_fan_performance")
+    conn = get_write_connection()
+    with conn:
+        conn.execute(UPSERT_FAN_PERFORMANCE_SQL, (fan_type, point_index, phi, psi_p, eta))
+        rebuild_fan_envelopes(conn, [fan_type])
+    bump_write_version()
+
+
+def bulk_insert_fan_performance(
+    rows: Iterable[Tuple[str, int, float, float, float]],
+    replace: bool = False,
+    batch_size: int = 5000,
+) -> int:
+    """
+    在一个事务内批量插入或更新风机性能参数
+
+    Args:
+        rows: (fan_type, point_index, phi, psi_p, eta) 元组的可迭代对象，可以是生成器
+        replace: 为True时，每个型号首次出现前先删除其已有性能点
+        batch_size: 每次 executemany 的行数
+
+    Returns:
+        int: 写入的行数
+    """
+    _count(_query_counts, "bulk_insert_fan_performance")
+    conn = get_write_connection()
+    count = 0
+    seen: Set[str] = set()
+    with conn:
+        for batch in _batched(rows, batch_size):
+            new_types = {row[0] for row in batch} - seen
+            if replace and new_types:
+                conn.executemany(DELETE_FAN_TYPE_SQL, [(fan_type,) for fan_type in sorted(new_types)])
+            seen.update(new_types)
+            conn.executemany(UPSERT_FAN_PERFORMANCE_SQL, batch)
+            count += len(batch)
+        # 曲线变化后同步重建受影响型号的性能包络
+        rebuild_fan_envelopes(conn, seen)
+    bump_write_version()
+    return count
+
+
+def _batched(rows: Iterable[Tuple], size: int) -> Iterator[List[Tuple]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
 
 def get_all_fan_types():
@@ -127,17 +327,31 @@ def get_all_fan_types():
     Returns:
         list: 风机型号列表
     """
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT DISTINCT fan_type
-        FROM fan_performance
-        ORDER BY fan_type ASC
-    """)
-    
-    results = cursor.fetchall()
-    conn.close()
+    _count(_query_counts, "get_all_fan_types")
+    results = get_read_connection().execute(SELECT_FAN_TYPES_SQL).fetchall()
     
     return [row["fan_type"] for row in results]
 
+
+def find_fan_candidates(
+    flow: float, pressure: float, density: float, suction: str = "单吸", pressure_margin: float = 0.0,
+    compressibility: float = 1.0,
+):
+    """
+    通过性能包络索引查找可能满足工况点的风机方案
+
+    Args:
+        flow: 流量 Q (m³/h)
+        pressure: 工况全压 P (Pa)
+        density: 工况密度 (kg/m³)
+        suction: 单吸/双吸
+        pressure_margin: 允许的全压富余比例
+        compressibility: 压缩性系数 Z（BB24/BB50 的全压修正）
+
+    Returns:
+        list: (fan_type, size_no, speed) 列表
+    """
+    _count(_query_counts, "find_fan_candidates")
+    return find_envelope_candidates(
+        get_read_connection(), flow, pressure, density, suction, pressure_margin, compressibility
+    )
@@ -0,0 +1,197 @@
+"""
+风机性能包络索引
+按风机相似定律，同一型号在任意机号、转速下的性能都落在同一条无因次曲线上，
+因此每个型号只需保存一个 (流量系数 φ, 全压系数 ψ) 包络矩形，存入 SQLite R-tree
+虚拟表 fan_envelope。选型时把工况点 (Q, P) 按各标准机号与允许转速换算为 (φ, ψ)
+在一次查询中做区间筛选，只有包络包含工况点的方案才进入完整的性能曲线计算。
+"""
+import math
+import sqlite3
+from typing import Iterable, List, Optional, Tuple
+
+# 标准机号（叶轮直径，dm）
+FAN_SIZES = (2.8, 3.15, 3.55, 4.0, 4.5, 5.0, 5.6, 6.3, 7.1, 8.0, 9.0, 10.0, 11.2, 12.5, 14.0, 16.0, 18.0, 20.0)
+
+# 允许的工作转速（rpm），对应常用异步电机直联转速
+FAN_SPEEDS = (2900.0, 1450.0, 960.0, 730.0, 580.0, 480.0)
+
+SUCTION_FACTORS = {"单吸": 1, "双吸": 2}
+
+# 包络上下各放宽的比例（查询已按型号做压缩性修正，这里只是保守的余量）
+ENVELOPE_MARGIN = 0.05
+
+# 全压按压缩性修正的型号：P = ψp × ρ × u² / Z × 0.9784
+COMPRESSIBLE_FAN_TYPES = frozenset({"BB24", "BB50"})
+COMPRESSIBLE_PRESSURE_FACTOR = 0.9784
+
+CREATE_META_SQL = """
+    CREATE TABLE IF NOT EXISTS fan_envelope_meta (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        fan_type TEXT NOT NULL UNIQUE
+    )
+"""
+CREATE_RTREE_SQL = "CREATE VIRTUAL TABLE IF NOT EXISTS fan_envelope USING rtree(id, min_phi, max_phi, min_psi, max_psi)"
+# 编译时未启用 R-tree 的 SQLite 退化为普通表，查询语句不变
+CREATE_PLAIN_SQL = """
+    CREATE TABLE IF NOT EXISTS fan_envelope (
+        id INTEGER PRIMARY KEY, min_phi REAL, max_phi REAL, min_psi REAL, max_psi REAL
+    )
+"""
+
+CURVE_BOUNDS_SQL = """
+    SELECT fan_type, MIN(phi), MAX(phi), MIN(psi_p), MAX(psi_p)
+    FROM fan_performance
+    {where}
+    GROUP BY fan_type
+"""
+
+# 全部 (机号, 转速) 组合的工况点作为 VALUES 表，一次查询完成包络筛选；
+# 组合数固定，SQL 文本不变，可以命中连接上的预编译语句缓存
+CANDIDATES_SQL = """
+    WITH duty(size_no, speed, phi, psi, psi_low, psi_high) AS (VALUES {values})
+    SELECT m.fan_type, duty.size_no, duty.speed, duty.psi, e.min_psi, e.max_psi
+    FROM duty
+    JOIN fan_envelope AS e
+        ON e.min_phi <= duty.phi AND e.max_phi >= duty.phi
+        AND e.min_psi <= duty.psi_high AND e.max_psi >= duty.psi_low
+    JOIN fan_envelope_meta AS m ON m.id = e.id
+""".format(values=", ".join(["(?, ?, ?, ?, ?, ?)"] * (len(FAN_SIZES) * len(FAN_SPEEDS))))
+
+
+def flow_factor(diameter: float, speed: float, suction_factor: int = 1) -> float:
+    """流量与流量系数之比：Q = φ × π/4 × D² × π × D × n/60 × 3600 × 吸入系数"""
+    return (math.pi / 4) * diameter ** 2 * math.pi * diameter * speed / 60 * 3600 * suction_factor
+
+
+def tip_speed(diameter: float, speed: float) -> float:
+    """叶轮圆周速度 u = π × D × n/60"""
+    return math.pi * diameter * speed / 60
+
+
+def compressibility_factor(pressure: float, absolute_pressure: float, k: float = 1.4) -> float:
+    """
+    压缩性系数 Z = (k/(k-1)) × ((1 + P/P_abs)^((k-1)/k) - 1) × (P/P_abs)^(-1)
+
+    Args:
+        pressure: 全压 P (Pa)
+        absolute_pressure: 进口绝对压力 P_atm + P_inlet (Pa)
+        k: 绝热指数
+    """
+    ratio = pressure / absolute_pressure
+    return (k / (k - 1)) * (((1 + ratio) ** ((k - 1) / k)) - 1) * (ratio ** (-1))
+
+
+def pressure_factor(fan_type: str, compressibility: float) -> float:
+    """全压与 ψp × ρ × u² 之比：BB24/BB50 为 0.9784/Z，其余型号为 1"""
+    if fan_type in COMPRESSIBLE_FAN_TYPES:
+        return COMPRESSIBLE_PRESSURE_FACTOR / compressibility
+    return 1.0
+
+
+def fan_pressure(fan_type: str, psi_p: float, density: float, u: float, compressibility: float) -> float:
+    """
+    性能点的全压，风机选型与型号搜索共用
+
+    Args:
+        fan_type: 风机型号
+        psi_p: 全压系数
+        density: 工况密度 (kg/m³)
+        u: 叶轮圆周速度 (m/s)
+        compressibility: 压缩性系数 Z
+
+    Returns:
+        float: 全压 P (Pa)
+    """
+    return psi_p * density * u ** 2 * pressure_factor(fan_type, compressibility)
+
+
+def create_envelope_tables(conn: sqlite3.Connection) -> None:
+    """创建包络表（R-tree 不可用时使用普通表）"""
+    conn.execute(CREATE_META_SQL)
+    try:
+        conn.execute(CREATE_RTREE_SQL)
+    except sqlite3.OperationalError:
+        conn.execute(CREATE_PLAIN_SQL)
+
+
+def rebuild_fan_envelopes(conn: sqlite3.Connection, fan_types: Optional[Iterable[str]] = None) -> int:
+    """
+    重建包络索引（在调用方的事务内执行）
+
+    Args:
+        conn: 可写连接
+        fan_types: 只重建这些型号，None 表示全部
+
+    Returns:
+        int: 写入的包络行数
+    """
+    create_envelope_tables(conn)
+    if fan_types is None:
+        conn.execute("DELETE FROM fan_envelope")
+        conn.execute("DELETE FROM fan_envelope_meta")
+        bounds = conn.execute(CURVE_BOUNDS_SQL.format(where="")).fetchall()
+    else:
+        types = sorted(set(fan_types))
+        if not types:
+            return 0
+        placeholders = ", ".join("?" * len(types))
+        conn.execute(
+            f"DELETE FROM fan_envelope WHERE id IN "
+            f"(SELECT id FROM fan_envelope_meta WHERE fan_type IN ({placeholders}))",
+            types,
+        )
+        conn.execute(f"DELETE FROM fan_envelope_meta WHERE fan_type IN ({placeholders})", types)
+        bounds = conn.execute(
+            CURVE_BOUNDS_SQL.format(where=f"WHERE fan_type IN ({placeholders})"), types
+        ).fetchall()
+
+    low, high = 1 - ENVELOPE_MARGIN, 1 + ENVELOPE_MARGIN
+    for fan_type, phi_min, phi_max, psi_min, psi_max in bounds:
+        cursor = conn.execute("INSERT INTO fan_envelope_meta (fan_type) VALUES (?)", (fan_type,))
+        conn.execute(
+            "INSERT INTO fan_envelope (id, min_phi, max_phi, min_psi, max_psi) VALUES (?, ?, ?, ?, ?)",
+            (cursor.lastrowid, phi_min * low, phi_max * high, psi_min * low, psi_max * high),
+        )
+    return len(bounds)
+
+
+def find_envelope_candidates(
+    conn: sqlite3.Connection, flow: float, pressure: float, density: float, suction: str = "单吸",
+    pressure_margin: float = 0.0, compressibility: float = 1.0,
+) -> List[Tuple[str, float, float]]:
+    """
+    查询包络包含工况点的 (型号, 机号, 转速)
+
+    全压系数按 fan_pressure 的同一修正换算：BB24/BB50 的所需 ψ 为 P / (ρ × u²) × Z / 0.9784。
+    SQL 按两类型号所需 ψ 的并集筛选，再按各型号自己的修正精确比较。
+
+    Args:
+        conn: 数据库连接
+        flow: 流量 Q (m³/h)
+        pressure: 工况全压 P (Pa)
+        density: 工况密度 (kg/m³)
+        suction: 单吸/双吸
+        pressure_margin: 允许的全压富余比例，全压区间为 [P, P × (1 + 富余)]
+        compressibility: 压缩性系数 Z
+
+    Returns:
+        list: (fan_type, size_no, speed) 列表
+    """
+    suction_factor = SUCTION_FACTORS[suction]
+    compressible = COMPRESSIBLE_PRESSURE_FACTOR / compressibility
+    args: List[float] = []
+    for size_no in FAN_SIZES:
+        diameter = size_no / 10
+        for speed in FAN_SPEEDS:
+            phi = flow / flow_factor(diameter, speed, suction_factor)
+            psi = pressure / (density * tip_speed(diameter, speed) ** 2)
+            low, high = sorted((psi, psi / compressible))
+            args.extend((size_no, speed, phi, psi, low, high * (1 + pressure_margin)))
+
+    candidates = []
+    for fan_type, size_no, speed, psi, min_psi, max_psi in conn.execute(CANDIDATES_SQL, args):
+        required = psi / pressure_factor(fan_type, compressibility)
+        if min_psi <= required * (1 + pressure_margin) and max_psi >= required:
+            candidates.append((fan_type, size_no, speed))
+    candidates.sort()
+    return candidates
@@ -0,0 +1,217 @@
+"""
+风机性能曲线内存缓存
+启动时一次性读取 fan_performance 全表，按型号保存为紧凑的 NumPy 数组，
+查询时不再访问数据库；检测到本进程写入（写入计数）或其他连接/进程写入
+（PRAGMA data_version）后整体重新加载。data_version 对库内任意表的写入都会变化，
+这里不再区分写入的是哪张表：计算历史已移到独立的 history.db，风机库里其余的
+写入（包络索引）只随曲线写入一起发生，多读一次全表远比漏掉一次修改代价小。
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.db import database
+
+SELECT_ALL_CURVES_SQL = """
+    SELECT fan_type, phi, psi_p, eta
+    FROM fan_performance
+    ORDER BY fan_type ASC, point_index ASC
+"""
+
+# 按内容计算：外部直接 UPDATE 不会改变 updated_at（没有触发器），只看行数/id 会漏掉
+CURVES_FINGERPRINT_SQL = """
+    SELECT COUNT(*), MAX(id), TOTAL(phi), TOTAL(psi_p), TOTAL(eta),
+           TOTAL(point_index * (phi + psi_p + eta))
+    FROM fan_performance
+"""
+
+
+@dataclass(frozen=True)
+class FanCurve:
+    """单个风机型号的无因次性能曲线"""
+
+    fan_type: str
+    phi: np.ndarray
+    psi_p: np.ndarray
+    eta: np.ndarray
+    points: Tuple[Dict[str, float], ...]
+
+    def __len__(self) -> int:
+        return len(self.phi)
+
+
+class FanCurveStore:
+    """
+    风机性能曲线的进程内缓存
+
+    Args:
+        db_path: 数据库路径，默认使用 app.db.database.DB_PATH
+        check_interval: 两次检查 PRAGMA data_version 的最小间隔（秒）；
+            本进程内的写入通过写入计数立即生效，不受此间隔限制
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, check_interval: float = 1.0):
+        self.db_path = Path(db_path) if db_path else None
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = os.getpid()
+        self._curves: Dict[str, FanCurve] = {}
+        self._loaded = False
+        self._write_version = -1
+        self._data_version: Optional[int] = None
+        self._checked_at = 0.0
+        # 查询与加载计数（/metrics 导出）；miss 为型号不存在
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """清空查询与加载计数（fork 后子进程从 0 开始）"""
+        self._counts_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # 固定使用同一个连接：data_version 只对同一连接的前后两次读取有意义
+        if self._pid != os.getpid():
+            # fork 后不能沿用父进程的连接
+            self._conn, self._pid = None, os.getpid()
+        if self._conn is None:
+            path = Path(self.db_path or database.DB_PATH).resolve()
+            self._conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True, check_same_thread=False)
+            # 新连接的 data_version 与旧连接记下的值无法比较，下次检查时重新加载
+            self._data_version = None
+        return self._conn
+
+    def _read_data_version(self) -> int:
+        return self._connection().execute("PRAGMA data_version").fetchone()[0]
+
+    def _load(self) -> None:
+        write_version = database.get_write_version()
+        conn = self._connection()
+        rows = conn.execute(SELECT_ALL_CURVES_SQL).fetchall()
+        grouped: Dict[str, List[Tuple[float, float, float]]] = {}
+        for fan_type, phi, psi_p, eta in rows:
+            grouped.setdefault(fan_type, []).append((phi, psi_p, eta))
+
+        curves: Dict[str, FanCurve] = {}
+        for fan_type, values in grouped.items():
+            array = np.asarray(values, dtype=np.float64)
+            points = tuple({"phi": phi, "psi_p": psi_p, "eta": eta} for phi, psi_p, eta in values)
+            curves[fan_type] = FanCurve(fan_type, array[:, 0].copy(), array[:, 1].copy(), array[:, 2].copy(), points)
+
+        self._curves = curves
+        self._write_version = write_version
+        self._data_version = self._read_data_version()
+        self._checked_at = time.monotonic()
+        self._loaded = True
+        self.reloads += 1
+
+    def _is_stale(self) -> bool:
+        if database.get_write_version() != self._write_version:
+            return True
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        return self._read_data_version() != self._data_version
+
+    def _curves_changed(self) -> bool:
+        if self._write_version != database.get_write_version():
+            return True
+        return self._read_data_version() != self._data_version
+
+    def _ensure_fresh(self) -> None:
+        if self._loaded and not self._is_stale():
+            return
+        with self._lock:
+            # 并发线程可能已先行重新加载，重新比较版本号避免重复读取
+            if not self._loaded or self._curves_changed():
+                self._load()
+
+    def refresh(self) -> None:
+        """强制重新加载"""
+        with self._lock:
+            self._load()
+
+    def get(self, fan_type: str) -> Optional[FanCurve]:
+        """获取指定型号的性能曲线，不存在时返回None"""
+        self._ensure_fresh()
+        curve = self._curves.get(fan_type)
+        with self._counts_lock:
+            if curve is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return curve
+
+    def fan_types(self) -> List[str]:
+        """全部风机型号（已排序）"""
+        self._ensure_fresh()
+        return sorted(self._curves)
+
+    def release_connection(self) -> None:
+        """关闭数据库连接但保留已加载的曲线（如 fork 之前），下次检查时重新连接并重新加载"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._loaded = False
+
+
+_store: Optional[FanCurveStore] = None
+_store_lock = threading.Lock()
+
+
+def get_fan_curve_store() -> FanCurveStore:
+    """获取进程级共享的性能曲线缓存"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FanCurveStore()
+    return _store
+
+
+def _reset_counters_after_fork() -> None:
+    if _store is not None:
+        _store.reset_counters()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_counters_after_fork)
+
+
+def get_fan_curve(fan_type: str) -> Optional[FanCurve]:
+    """从内存缓存获取风机性能曲线"""
+    return get_fan_curve_store().get(fan_type)
+
+
+def curves_fingerprint() -> str:
+    """fan_performance 的内容指纹（行数/最大 id/各列加权和），曲线数据变化时改变；数据库不可用时为空串"""
+    try:
+        row = database.get_read_connection().execute(CURVES_FINGERPRINT_SQL).fetchone()
+    except sqlite3.Error:
+        return ""
+    return json.dumps(list(row), default=str)
+
+
+def warm_up() -> Dict[str, Any]:
+    """启动时预加载全部曲线，返回型号数与点数"""
+    store = get_fan_curve_store()
+    store.refresh()
+    types = store.fan_types()
+    return {"fan_types": len(types), "points": sum(len(store.get(name)) for name in types)}
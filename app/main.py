@@ -3,18 +3,35 @@ FastAPI应用主文件
 Excel工具转Web在线工具站
 """
 import json
+import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import HTMLResponse, PlainTextResponse
+from markupsafe import Markup
 
+from app.db.fan_store import curves_fingerprint
+from app.routers.history_api import build_history_api_router
+from app.routers.tool_routes import ToolRouteTable
 from app.routers.tools import build_tools_router
 from app.routers.tools_api import build_tools_api_router
+from app.services.client_evaluators import client_evaluator_script, invalidate_client_evaluators
+from app.services.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, collect_metrics, start_metrics_writer
+from app.services.pages import (
+    INDEX_PAGE,
+    build_fingerprint,
+    index_context,
+    live_response,
+    load_prerendered_pages,
+    tool_page_key,
+)
 from app.services.registry import load_configured_tools, ToolSpec
+from app.services.service_worker import ServiceWorkerScript, render_service_worker
+from app.services.static_files import FingerprintedStaticFiles
+from app.services.templating import create_templates, warm_templates
 
 # 创建FastAPI应用实例
 app = FastAPI(
@@ -27,7 +44,7 @@ app = FastAPI(
 BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATE_DIR = BASE_DIR / "templates"
 STATIC_DIR = BASE_DIR / "static"
-TOOLS_CONFIG_DIR = BASE_DIR / "tools"
+TOOLS_CONFIG_DIR = Path(os.environ.get("TOOLS_CONFIG_DIR", BASE_DIR / "tools"))
 MANIFEST_PATH = STATIC_DIR / "manifest.json"
 
 
@@ -48,41 +65,189 @@ def static_asset(path: str) -> str:
     return f"/static/{manifest.get(path, path)}"
 
 
+def page_bundle(tool: Optional[ToolSpec]) -> Optional[str]:
+    """
+    返回工具页面的 JS bundle 路径（scripts/bundle_js.py 生成，已包含 common.js）
+
+    Args:
+        tool: 页面对应的工具，非工具页面为空
+
+    Returns:
+        str: 带指纹的 bundle 路径，未打包时返回None，页面分别加载 common.js 与工具脚本
+    """
+    if not tool:
+        return None
+    bundle = load_asset_manifest().get(f"js/bundles/{Path(tool.template).stem}.js")
+    return f"/static/{bundle}" if bundle else None
+
+
+def client_evaluators(tool: Optional[ToolSpec]) -> Markup:
+    """
+    工具页面内联的浏览器端计算函数（见 app/services/client_evaluators.py）
+
+    Args:
+        tool: 页面对应的工具，非工具页面为空
+
+    Returns:
+        Markup: JavaScript 语句，工具没有可在浏览器端计算的场景时为空
+    """
+    if not tool:
+        return Markup("")
+    return Markup(client_evaluator_script(tool))
+
+
 # 加载工具配置
 TOOL_SPECS: Dict[str, ToolSpec] = load_configured_tools(TOOLS_CONFIG_DIR)
 
-# 配置模板引擎
-templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# 启动时编译配置公式定义的工具，避免首个请求承担编译开销
+for _spec in TOOL_SPECS.values():
+    if _spec.formula_config:
+        _spec.create_calculator()
+
+# 配置模板引擎（带持久化字节码缓存，打包时由 scripts/precompile_templates.py 预编译）
+templates = create_templates(TEMPLATE_DIR)
 templates.env.globals["static_asset"] = static_asset
+templates.env.globals["page_bundle"] = page_bundle
+templates.env.globals["client_evaluators"] = client_evaluators
+
+# 构建时预渲染的页面（scripts/prerender_pages.py），开发模式或已过期时为空
+PAGES = load_prerendered_pages(build_fingerprint(TEMPLATE_DIR, load_asset_manifest(), TOOL_SPECS))
 
-# 配置静态文件服务
-app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
+# 配置静态文件服务：优先返回 scripts/fingerprint_static.py 生成的 .br/.gz 预压缩副本，
+# manifest 中的指纹化文件长期缓存
+app.mount(
+    "/static",
+    FingerprintedStaticFiles(directory=str(STATIC_DIR), manifest=load_asset_manifest()),
+    name="static",
+)
+
+
+def build_tool_routes(spec: ToolSpec) -> List:
+    """
+    生成单个工具的页面与计算接口路由
+
+    预渲染页面只用于启动时生成的路由：之后因配置或其引用的公式文件变化而重建时，
+    页面（含内联的浏览器端计算函数）一律实时渲染。
+    """
+    key = tool_page_key(spec.id)
+    pages = {key: PAGES.pop(key)} if key in PAGES and TOOL_SPECS.get(spec.id) is spec else {}
+    return [
+        *build_tools_router({spec.id: spec}, templates, pages).routes,
+        *build_tools_api_router({spec.id: spec}).routes,
+    ]
+
+
+# 工具路由表：配置热加载（TOOL_CONFIG_WATCH）时整体替换，无需重启 worker
+TOOL_ROUTES = ToolRouteTable(build_tool_routes, TOOL_SPECS)
+
+
+@lru_cache(maxsize=1)
+def _service_worker_script(data_version: str) -> ServiceWorkerScript:
+    manifest = load_asset_manifest()
+    version = build_fingerprint(TEMPLATE_DIR, manifest, TOOL_ROUTES.specs)[:16]
+    return ServiceWorkerScript(render_service_worker(manifest, version, static_asset, data_version), version)
+
+
+def service_worker_script() -> ServiceWorkerScript:
+    """
+    当前模板、静态资源、工具配置与风机曲线数据对应的 Service Worker 入口
+
+    配置热加载后重新生成；曲线数据（如其他进程导入）变化时结果版本号随之改变。
+    """
+    return _service_worker_script(curves_fingerprint())
+
+
+def _on_tools_changed(tool_ids: List[str]) -> None:
+    PAGES.pop(INDEX_PAGE, None)
+    app.openapi_schema = None
+    # 工具配置变化后计算结果可能不同：换新版本号，浏览器中旧的计算结果缓存随之失效
+    _service_worker_script.cache_clear()
+    invalidate_client_evaluators(tool_ids)
+
+
+TOOL_ROUTES.add_listener(_on_tools_changed)
+
+
+def tool_openapi() -> dict:
+    """OpenAPI 文档包含路由表中的当前工具接口"""
+    if app.openapi_schema is None:
+        app.openapi_schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            description=app.description,
+            routes=[*app.routes, *TOOL_ROUTES.routes],
+        )
+    return app.openapi_schema
+
+
+app.openapi = tool_openapi
 
 # 注册路由
-app.include_router(build_tools_router(TOOL_SPECS, templates))
-app.include_router(build_tools_api_router(TOOL_SPECS))
+app.router.routes.append(TOOL_ROUTES)
+app.include_router(build_history_api_router())
 
 
 @app.on_event("startup")
 async def startup_event():
-    """应用启动时初始化数据库"""
+    """应用启动时预热模板、初始化数据库、预加载风机性能曲线并启动计算历史与指标快照写入线程
+
+    由 app.server 在主进程预加载时，前几步已在 fork 前完成，worker 只启动后台线程。
+    """
     from app.db.database import init_db
+    from app.db.fan_store import warm_up
+    from app.services.calculator import warm_up_calculators
+    from app.services.config_watcher import ToolConfigWatcher, watch_interval_from_env
+    from app.services.history import get_history_recorder
+
+    if not getattr(app.state, "preloaded", False):
+        warm_templates(templates.env)
+        init_db()
+        warm_up()
+        # 计算器默认按需导入，设置 CALCULATOR_WARMUP 可在启动时预先导入
+        warm_up_calculators()
+    get_history_recorder().start()
+    # 多进程部署（设置了 METRICS_DIR）时定期写出本进程的指标快照，供 /metrics 汇总
+    app.state.metrics_writer = start_metrics_writer()
+
+    interval = watch_interval_from_env()
+    if interval is not None:
+        app.state.config_watcher = ToolConfigWatcher(TOOL_ROUTES, TOOLS_CONFIG_DIR, interval=interval)
+        app.state.config_watcher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """应用关闭前停止配置监视、写完队列中的计算历史并写出最后一次指标快照"""
+    from app.services.history import get_history_recorder
 
-    init_db()
+    watcher = getattr(app.state, "config_watcher", None)
+    if watcher is not None:
+        watcher.stop()
+    get_history_recorder().stop()
+    writer = getattr(app.state, "metrics_writer", None)
+    if writer is not None:
+        writer.stop()
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """主页 - 显示工具列表"""
-    tools_list = [
-        {
-            "id": spec.id,
-            "name": spec.display_name,
-            "description": spec.description or "",
-        }
-        for spec in TOOL_SPECS.values()
-    ]
-    return templates.TemplateResponse("index.html", {"request": request, "tools": tools_list})
+    page = PAGES.get(INDEX_PAGE)
+    if page is not None:
+        return page.response(request)
+    return live_response(templates, request, "index.html", index_context(TOOL_ROUTES.specs))
+
+
+@app.get("/sw.js", include_in_schema=False)
+async def service_worker(request: Request):
+    """Service Worker 入口，位于根路径才能控制首页与工具页"""
+    return service_worker_script().response(request)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 指标（多进程部署时汇总全部 worker，见 app/services/metrics.py）"""
+    return PlainTextResponse(collect_metrics(), media_type=METRICS_CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+"""
+计算历史查询接口
+"""
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.services.history import MAX_PAGE_SIZE, get_history_recorder, query_history
+
+
+def build_history_api_router() -> APIRouter:
+    """生成计算历史查询路由"""
+    router = APIRouter(prefix="/api/history", tags=["api"])
+
+    @router.get("")
+    async def list_history(
+        tool: Optional[str] = None,
+        scenario: Optional[str] = None,
+        since: Optional[float] = Query(None, description="起始时间（Unix 时间戳）"),
+        until: Optional[float] = Query(None, description="截止时间（Unix 时间戳）"),
+        page: int = Query(1, ge=1),
+        page_size: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        try:
+            data = query_history(tool, scenario, since, until, page, page_size)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        recorder = get_history_recorder()
+        data["pending"] = recorder.pending
+        data["dropped"] = recorder.dropped
+        return data
+
+    return router
@@ -0,0 +1,115 @@
+"""
+可热替换的工具路由表
+全部工具的页面路由与计算接口路由保存在一个不可变的快照中，作为单个路由挂到应用上。
+配置变化时只为变化的工具重新生成路由，其余工具沿用原有路由对象，再整体替换快照：
+替换是一次属性赋值，匹配阶段把选中的路由放进请求 scope，处理中的请求不受影响。
+"""
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+from app.services.registry import ToolSpec
+
+# 匹配到的路由在 scope 中的键
+SCOPE_ROUTE_KEY = "tool_route"
+
+
+class _Table(NamedTuple):
+    specs: Dict[str, ToolSpec]
+    routes_by_tool: Dict[str, Tuple[BaseRoute, ...]]
+    routes: Tuple[BaseRoute, ...]
+
+
+class ToolRouteTable(BaseRoute):
+    """
+    工具路由表
+
+    Args:
+        build_routes: 为单个工具生成路由（页面、计算接口）的函数
+        specs: 初始工具注册表
+    """
+
+    def __init__(self, build_routes: Callable[[ToolSpec], List[BaseRoute]], specs: Mapping[str, ToolSpec]):
+        self._build_routes = build_routes
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self._table = self._build_table(dict(specs), {}, set(specs))
+
+    def _build_table(
+        self, specs: Dict[str, ToolSpec], previous: Dict[str, Tuple[BaseRoute, ...]], rebuild: Iterable[str]
+    ) -> _Table:
+        rebuild = set(rebuild)
+        routes_by_tool = {
+            tool_id: tuple(self._build_routes(spec)) if tool_id in rebuild or tool_id not in previous
+            else previous[tool_id]
+            for tool_id, spec in specs.items()
+        }
+        routes = tuple(route for tool_routes in routes_by_tool.values() for route in tool_routes)
+        return _Table(specs, routes_by_tool, routes)
+
+    @property
+    def specs(self) -> Dict[str, ToolSpec]:
+        """当前工具注册表（只读使用）"""
+        return self._table.specs
+
+    @property
+    def routes(self) -> List[BaseRoute]:
+        """当前全部工具路由，用于生成 OpenAPI 文档"""
+        return list(self._table.routes)
+
+    def routes_for(self, tool_id: str) -> Tuple[BaseRoute, ...]:
+        return self._table.routes_by_tool.get(tool_id, ())
+
+    def add_listener(self, callback: Callable[[List[str]], None]) -> None:
+        """注册路由表替换后的回调，参数为变化的工具 id"""
+        self._listeners.append(callback)
+
+    def update(self, changed: Mapping[str, ToolSpec], removed: Iterable[str] = ()) -> List[str]:
+        """
+        更新部分工具并原子替换路由表
+
+        Args:
+            changed: 新增或修改的工具规格
+            removed: 删除的工具 id
+
+        Returns:
+            list: 路由被重建或删除的工具 id
+        """
+        removed = set(removed)
+        with self._lock:
+            current = self._table
+            specs = {tool_id: spec for tool_id, spec in current.specs.items() if tool_id not in removed}
+            specs.update(changed)
+            # 生成新路由可能失败（如计算器导入错误），失败时保留旧路由表
+            table = self._build_table(specs, current.routes_by_tool, changed)
+            self._table = table
+        touched = sorted(set(changed) | (removed & set(current.specs)))
+        for callback in self._listeners:
+            callback(touched)
+        return touched
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        partial: Optional[Tuple[BaseRoute, Scope]] = None
+        for route in self._table.routes:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return Match.FULL, {**child_scope, SCOPE_ROUTE_KEY: route}
+            if match == Match.PARTIAL and partial is None:
+                partial = (route, child_scope)
+        if partial is not None:
+            route, child_scope = partial
+            return Match.PARTIAL, {**child_scope, SCOPE_ROUTE_KEY: route}
+        return Match.NONE, {}
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await scope[SCOPE_ROUTE_KEY].handle(scope, receive, send)
+
+    def url_path_for(self, name: str, /, **path_params):
+        for route in self._table.routes:
+            try:
+                return route.url_path_for(name, **path_params)
+            except NoMatchFound:
+                pass
+        raise NoMatchFound(name, path_params)
@@ -1,24 +1,36 @@
 """
 工具页面路由工厂
 """
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from app.services.pages import PrerenderedPage, live_response, tool_page_key
 from app.services.registry import ToolSpec
 
 
-def build_tools_router(tool_specs: Dict[str, ToolSpec], templates: Jinja2Templates) -> APIRouter:
-    """根据注册表生成页面路由"""
+def build_tools_router(
+    tool_specs: Dict[str, ToolSpec],
+    templates: Jinja2Templates,
+    pages: Optional[Dict[str, PrerenderedPage]] = None,
+) -> APIRouter:
+    """根据注册表生成页面路由（有预渲染页面时直接返回，否则实时渲染）"""
     router = APIRouter(prefix="/tools", tags=["tools"])
+    pages = pages or {}
 
     for spec in tool_specs.values():
         # 使用闭包捕获当前 spec 的值
         def make_page_handler(s: ToolSpec):
+            prerendered = pages.get(tool_page_key(s.id))
+            if prerendered is not None:
+                async def cached_page(request: Request):
+                    return prerendered.response(request)
+                return cached_page
+
             async def page(request: Request):
-                return templates.TemplateResponse(s.template, {"request": request, "tool": s})
+                return live_response(templates, request, s.template, {"tool": s})
             return page
 
         router.add_api_route(f"/{spec.id}", make_page_handler(spec), response_class=HTMLResponse)
@@ -1,13 +1,49 @@
 """
 工具API接口路由工厂
 """
-from typing import Any, Dict
+import time
+from typing import Any, Callable, Coroutine, Dict, Optional, Type
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
 from pydantic import BaseModel
+from starlette.responses import Response
 
 from app.models.schemas import CurrentCalcResponse
+from app.services.history import get_history_recorder
+from app.services.metrics import ERROR_BAD_REQUEST, ERROR_INTERNAL, ERROR_VALUE, get_metrics
 from app.services.registry import ToolSpec
+from app.services.units import UnitConverter, convert, load_unit_converter
+
+
+def _convert_response(
+    response: CurrentCalcResponse, converter: UnitConverter, scenario: str, output_units: Dict[str, str]
+) -> CurrentCalcResponse:
+    """按客户端要求的单位换算计算结果（标量结果用 "result" 键指定单位）"""
+    if isinstance(response.result, dict):
+        result = dict(response.result)
+        for name, unit in output_units.items():
+            source_unit = converter.output_unit(scenario, name)
+            if source_unit is not None and isinstance(result.get(name), (int, float)):
+                result[name] = convert(result[name], source_unit, unit)
+        return response.copy(update={"result": result})
+
+    target_unit = output_units.get("result")
+    if target_unit and isinstance(response.result, (int, float)):
+        return response.copy(update={"result": convert(response.result, response.unit, target_unit), "unit": target_unit})
+    return response
+
+
+def _check_unit_map(value: Any, field: str) -> Optional[Dict[str, str]]:
+    """校验客户端单位映射必须是 {名称: 单位} 的字符串字典，否则返回400"""
+    if value is None:
+        return None
+    if not isinstance(value, dict) or not all(
+        isinstance(name, str) and isinstance(unit, str) for name, unit in value.items()
+    ):
+        raise HTTPException(status_code=400, detail=f"{field}必须是 {{名称: 单位}} 形式的字符串映射")
+    return value
 
 
 def _build_handler(spec: ToolSpec, request_model: BaseModel):
@@ -15,33 +51,91 @@ def _build_handler(spec: ToolSpec, request_model: BaseModel):
         calculator = spec.create_calculator()
         params: Dict[str, Any] = payload.dict(exclude_none=True)
         scenario = params.pop("scenario", None)
+        # 可选：客户端自带的输入/输出单位，{参数名或输出名: 单位}
+        input_units = params.pop("input_units", None)
+        output_units = params.pop("output_units", None)
         
         # 检查计算器的 calculate 方法签名
         import inspect
         sig = inspect.signature(calculator.calculate)
         param_count = len(sig.parameters)
         
+        recorder = get_history_recorder()
+        metrics = get_metrics()
+        error = ERROR_INTERNAL
+        started = time.perf_counter()
+        metrics.start_calculation(spec.id)
         try:
+            input_units = _check_unit_map(input_units, "input_units")
+            output_units = _check_unit_map(output_units, "output_units")
+            if input_units or output_units:
+                converter = load_unit_converter(spec.id)
+                if converter is None:
+                    raise HTTPException(status_code=400, detail=f"工具 {spec.id} 未配置参数单位，无法换算")
+            if input_units:
+                params = converter.convert_params(params, input_units)
+
             if param_count == 1:
                 # 只需要 params，不需要 scenario（如 electronic-gear-ratio）
-                return calculator.calculate(params)
+                response = calculator.calculate(params)
             elif param_count == 2:
                 # 需要 scenario 和 params
                 if not scenario:
                     raise HTTPException(status_code=400, detail="缺少scenario字段")
-                return calculator.calculate(scenario, params)
+                response = calculator.calculate(scenario, params)
             else:
                 raise HTTPException(status_code=500, detail=f"不支持的 calculate 方法签名: {param_count} 个参数")
-        except HTTPException:
+
+            if output_units:
+                response = _convert_response(response, converter, scenario, output_units)
+            recorder.record(spec.id, scenario, params, response, (time.perf_counter() - started) * 1000)
+            error = None
+            return response
+        except HTTPException as exc:
+            error = ERROR_BAD_REQUEST if exc.status_code < 500 else ERROR_INTERNAL
+            recorder.record(spec.id, scenario, params, None, (time.perf_counter() - started) * 1000,
+                            error=str(exc.detail))
             raise
         except ValueError as exc:
+            error = ERROR_VALUE
+            recorder.record(spec.id, scenario, params, None, (time.perf_counter() - started) * 1000, error=str(exc))
             raise HTTPException(status_code=400, detail=str(exc)) from exc
         except Exception as exc:  # pragma: no cover - 防御性兜底
-            raise HTTPException(status_code=500, detail=f"计算错误: {exc}") from exc
+            detail = f"计算错误: {exc}"
+            recorder.record(spec.id, scenario, params, None, (time.perf_counter() - started) * 1000, error=detail)
+            raise HTTPException(status_code=500, detail=detail) from exc
+        finally:
+            metrics.finish_calculation(spec.id, spec.scenarios, scenario, error, time.perf_counter() - started)
 
     return handler
 
 
+def _validation_counting_route(spec: ToolSpec) -> Type[APIRoute]:
+    """
+    计算接口的路由类：请求体未通过请求模型校验（422）时计入指标
+
+    校验在处理函数之前完成，处理函数内的统计覆盖不到这类请求；异常继续交给 FastAPI 生成 422 响应。
+    """
+
+    class ValidationCountingRoute(APIRoute):
+        def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+            route_handler = super().get_route_handler()
+
+            async def counting_route_handler(request: Request) -> Response:
+                try:
+                    return await route_handler(request)
+                except RequestValidationError as exc:
+                    scenario = exc.body.get("scenario") if isinstance(exc.body, dict) else None
+                    get_metrics().reject_request(
+                        spec.id, spec.scenarios, scenario if isinstance(scenario, str) else None
+                    )
+                    raise
+
+            return counting_route_handler
+
+    return ValidationCountingRoute
+
+
 def build_tools_api_router(tool_specs: Dict[str, ToolSpec]) -> APIRouter:
     """根据注册表生成API路由"""
     router = APIRouter(prefix="/api/tools", tags=["api"])
@@ -54,6 +148,7 @@ def build_tools_api_router(tool_specs: Dict[str, ToolSpec]) -> APIRouter:
             endpoint,
             methods=["POST"],
             response_model=CurrentCalcResponse,
+            route_class_override=_validation_counting_route(spec),
         )
 
     return router
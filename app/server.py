@@ -0,0 +1,184 @@
+"""
+多进程启动器（预加载后 fork）
+主进程先完成全部只读初始化：加载工具配置、构建请求模型与路由、导入全部计算器、
+编译配置公式、加载单位换算与风机性能曲线、预热模板和 OpenAPI 文档；随后冻结 GC
+并 fork 出多个 worker 共享同一个监听 socket。worker 继承这些对象，通过写时复制
+共享内存页，启动时只需建立各自的数据库连接和后台线程。
+
+用法:
+    python -m app.server --workers 4 --host 0.0.0.0 --port 8000
+    python -m app.server --workers 4 --no-preload   # 各 worker 独立初始化（对照）
+
+也可以配合 gunicorn 使用应用工厂:
+    gunicorn 'app.server:create_app()' --preload -k uvicorn.workers.UvicornWorker
+    （在 gunicorn 的 pre_fork 钩子中调用 prepare_fork()；/metrics 汇总全部 worker 需设置
+    METRICS_DIR，并在 on_starting 钩子中调用 app.services.metrics.prepare_metrics_dir()）
+"""
+import argparse
+import gc
+import logging
+import os
+import shutil
+import signal
+import time
+from typing import Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI
+
+from app.services.metrics import prepare_metrics_dir
+
+logger = logging.getLogger("uvicorn.error")
+
+APP_PATH = "app.main:app"
+
+# 短于该时间退出的 worker 视为启动失败，重启前等待，避免反复 fork
+MIN_WORKER_LIFETIME = 1.0
+
+
+def preload() -> FastAPI:
+    """
+    在当前进程完成全部只读初始化
+
+    Returns:
+        FastAPI: 已初始化的应用，startup 时不再重复这些步骤
+    """
+    from app.db.database import close_connections, init_db
+    from app.db.fan_store import get_fan_curve_store, warm_up
+    from app.main import TOOL_ROUTES, app, service_worker_script, templates
+    from app.services.calculator import CALCULATOR_REGISTRY, warm_up_calculators
+    from app.services.templating import warm_templates
+    from app.services.units import load_unit_converter
+
+    warm_templates(templates.env)
+    init_db()
+    warm_up()
+    warm_up_calculators(list(CALCULATOR_REGISTRY))
+    for spec in TOOL_ROUTES.specs.values():
+        # 导入计算器类、编译配置公式
+        spec.create_calculator()
+        load_unit_converter(spec.id)
+    app.openapi()
+    service_worker_script()
+
+    # 连接不能跨 fork 使用：关闭主进程的连接，worker 首次访问时各自重新建立
+    get_fan_curve_store().release_connection()
+    close_connections()
+    app.state.preloaded = True
+    return app
+
+
+def create_app() -> FastAPI:
+    """应用工厂：返回预加载完成的应用"""
+    return preload()
+
+
+def prepare_fork() -> None:
+    """
+    fork 前调用：回收垃圾后把现存对象移入永久代
+
+    被冻结的对象不再参与 worker 中的垃圾回收，GC 不会改写它们的对象头，
+    对应的内存页保持与主进程共享。
+    """
+    gc.collect()
+    gc.freeze()
+
+
+class PreforkServer:
+    """
+    预加载后 fork 的多进程服务
+
+    Args:
+        host: 监听地址
+        port: 监听端口
+        workers: worker 进程数
+        preload_app: 是否在主进程预加载；False 时每个 worker fork 后各自导入应用
+        log_level: uvicorn 日志级别
+    """
+
+    def __init__(self, host: str, port: int, workers: int, preload_app: bool = True, log_level: str = "info"):
+        if workers < 1:
+            raise ValueError(f"worker 数量必须大于 0: {workers}")
+        self.config = uvicorn.Config(APP_PATH, host=host, port=port, log_level=log_level)
+        self.workers = workers
+        self.preload_app = preload_app
+        self.app: Optional[FastAPI] = None
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+
+    def _spawn(self, sock) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+
+        code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            gc.enable()
+            config = uvicorn.Config(self.app or APP_PATH, log_level=self.config.log_level)
+            uvicorn.Server(config).run(sockets=[sock])
+            code = 0
+        except BaseException:
+            logger.exception("worker %s 异常退出", os.getpid())
+        finally:
+            os._exit(code)
+
+    def _stop(self, signum, frame) -> None:
+        self.stopping = True
+        if signum == signal.SIGTERM:
+            for pid in list(self.children):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    def run(self) -> None:
+        sock = self.config.bind_socket()
+        # 各 worker 的指标快照目录，/metrics 由此汇总全部 worker
+        metrics_dir, temporary = prepare_metrics_dir()
+        if self.preload_app:
+            gc.disable()
+            start = time.perf_counter()
+            self.app = preload()
+            prepare_fork()
+            logger.info("主进程预加载完成，耗时 %.0f ms", (time.perf_counter() - start) * 1000)
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        for _ in range(self.workers):
+            self._spawn(sock)
+        logger.info("已启动 %d 个 worker（预加载: %s）", self.workers, "是" if self.preload_app else "否")
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            logger.warning("worker %s 退出（状态 %s），重新启动", pid, status)
+            if time.monotonic() - started < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+            self._spawn(sock)
+        sock.close()
+        if temporary:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预加载后 fork 的多进程服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)))
+    parser.add_argument("--no-preload", action="store_true", help="不预加载，每个 worker 各自初始化")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    PreforkServer(args.host, args.port, args.workers, not args.no_preload, args.log_level).run()
+
+
+if __name__ == "__main__":
+    main()
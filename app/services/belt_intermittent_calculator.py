@@ -22,7 +22,48 @@ class BeltIntermittentCalculator:
     # 常数
     G = 9.8  # 重力加速度 m/s²
     PI = math.pi  # 圆周率
-    
+
+    # 可在浏览器端计算的场景（公式图，见 app/services/client_evaluators.py），须与对应的
+    # _calculate_* 方法逐步一致；修改后运行 scripts/crosscheck_client_evaluators.py
+    CLIENT_FORMULAS = {
+        "speed_curve": {
+            "inputs": {"t": None, "A": None},
+            "require": ["t > 0", "A >= 0", "A <= 1"],
+            "steps": {"t0": "t * A"},
+            "result": "t0",
+            "unit": "s",
+            "formula": "t₀ = t × A<br>  = {t} × {A}<br>  = {t0:.4f} s",
+        },
+        "motor_speed": {
+            "inputs": {"L": None, "D": None, "t": None, "t0": None, "i": None},
+            "require": ["L > 0", "D > 0", "t > 0", "t0 > 0", "t0 < t", "i > 0"],
+            "steps": {
+                "beta": "2 * (L / D) / (t0 * (t - t0))",
+                "N": "(beta * t0 / (2 * π)) * 60",
+                "betaM": "i * beta",
+                "NM": "N * i",
+            },
+            "result": "NM",
+            "digits": 2,
+            "unit": "rpm",
+            "formula": (
+                "减速机输出轴角加速度: β = 2×(L/D)/(t₀×(t-t₀))<br>"
+                "  = 2×({L}/{D})/({t0}×({t}-{t0}))<br>"
+                "  = {beta:.4f} rad/s²<br>"
+                "减速机输出轴转速: N = (β×t₀/(2π))×60<br>"
+                "  = ({beta:.4f}×{t0}/(2π))×60<br>"
+                "  = {N:.2f} rpm<br>"
+                "电机输出轴角加速度: β<sub>M</sub> = i×β<br>"
+                "  = {i}×{beta:.4f}<br>"
+                "  = {betaM:.4f} rad/s²<br>"
+                "电机输出轴转速: N<sub>M</sub> = N×i<br>"
+                "  = {N:.2f}×{i}<br>"
+                "  = {NM:.2f} rpm"
+            ),
+            "extra": ["beta", "N", "betaM"],
+        },
+    }
+
     def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
         """
         根据场景计算皮带轮间歇运动选型
@@ -1,71 +1,210 @@
-"""计算器注册表和统一入口。"""
+"""计算器注册表和统一入口。
+
+注册表只登记各计算器的导入路径，模块在第一次使用时才导入；
+场景名取自 configs/tools 下的配置，并静态解析源码中的 SCENARIO_NAMES 字面量补全，
+建立场景索引不需要导入任何计算器模块。
+"""
+from __future__ import annotations
+
+import ast
 import logging
-from typing import Any, Dict, Type
-
-from app.models.schemas import CurrentCalcResponse
-from app.services.angular_acceleration_calculator import AngularAccelerationCalculator
-from app.services.base_calculator import BaseCalculator
-from app.services.belt_continuous_calculator import BeltContinuousCalculator
-from app.services.belt_intermittent_calculator import BeltIntermittentCalculator
-from app.services.blower_selection_calculator import BlowerSelectionCalculator
-from app.services.cart_drive_power_calculator import CartDrivePowerCalculator
-from app.services.crawler_robot_force_calculator import CrawlerRobotForceCalculator
-from app.services.current_calculator import CurrentCalculator
-from app.services.electronic_gear_ratio_calculator import ElectronicGearRatioCalculator
-from app.services.fan_performance_calculator import FanPerformanceCalculator
-from app.services.fan_selection_calculator import FanSelectionCalculator
-from app.services.fan_selection_example_calculator import FanSelectionExampleCalculator
-from app.services.indexing_table_calculator import IndexingTableCalculator
-from app.services.inertia_calculator import InertiaCalculator
-from app.services.load_torque_calculator import LoadTorqueCalculator
-from app.services.motor_startup_voltage_calculator import MotorStartupVoltageCalculator
-from app.services.screw_horizontal_calculator import ScrewHorizontalCalculator
-from app.services.screw_vertical_calculator import ScrewVerticalCalculator
-from app.services.servo_motor_inertia_calculator import ServoMotorInertiaCalculator
-from app.services.servo_motor_params_calculator import ServoMotorParamsCalculator
-from app.services.servo_motor_selection_calculator import ServoMotorSelectionCalculator
-from app.services.servo_motor_selection_example_calculator import (
-    ServoMotorSelectionExampleCalculator,
-)
-from app.services.stepper_motor_inertia_calculator import StepperMotorInertiaCalculator
+import os
+import threading
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Type
+
+if TYPE_CHECKING:  # pragma: no cover - 仅用于类型标注
+    from app.models.schemas import CurrentCalcResponse
 
 CalculatorType = Type[Any]
 
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 启动时预先导入的计算器：空（默认，全部按需导入）、"all" 或逗号分隔的工具名
+WARMUP_ENV = "CALCULATOR_WARMUP"
+
+
+CALCULATOR_PATHS: Dict[str, str] = {
+    "current": "app.services.current_calculator.CurrentCalculator",
+    "inertia": "app.services.inertia_calculator.InertiaCalculator",
+    "screw_horizontal": "app.services.screw_horizontal_calculator.ScrewHorizontalCalculator",
+    "screw_vertical": "app.services.screw_vertical_calculator.ScrewVerticalCalculator",
+    "belt_intermittent": "app.services.belt_intermittent_calculator.BeltIntermittentCalculator",
+    "belt_continuous": "app.services.belt_continuous_calculator.BeltContinuousCalculator",
+    "indexing_table": "app.services.indexing_table_calculator.IndexingTableCalculator",
+    "motor_startup_voltage": "app.services.motor_startup_voltage_calculator.MotorStartupVoltageCalculator",
+    "cart_drive_power": "app.services.cart_drive_power_calculator.CartDrivePowerCalculator",
+    "crawler_robot_force": "app.services.crawler_robot_force_calculator.CrawlerRobotForceCalculator",
+    "electronic_gear_ratio": "app.services.electronic_gear_ratio_calculator.ElectronicGearRatioCalculator",
+    "angular_acceleration": "app.services.angular_acceleration_calculator.AngularAccelerationCalculator",
+    "stepper_motor_inertia": "app.services.stepper_motor_inertia_calculator.StepperMotorInertiaCalculator",
+    "load_torque": "app.services.load_torque_calculator.LoadTorqueCalculator",
+    "fan_performance": "app.services.fan_performance_calculator.FanPerformanceCalculator",
+    "blower_selection": "app.services.blower_selection_calculator.BlowerSelectionCalculator",
+    "fan_selection": "app.services.fan_selection_calculator.FanSelectionCalculator",
+    "fan_selection_example": "app.services.fan_selection_example_calculator.FanSelectionExampleCalculator",
+    "servo_motor_inertia": "app.services.servo_motor_inertia_calculator.ServoMotorInertiaCalculator",
+    "servo_motor_selection": "app.services.servo_motor_selection_calculator.ServoMotorSelectionCalculator",
+    "servo_motor_params": "app.services.servo_motor_params_calculator.ServoMotorParamsCalculator",
+    "servo_motor_selection_example": (
+        "app.services.servo_motor_selection_example_calculator.ServoMotorSelectionExampleCalculator"
+    ),
+}
 
-CALCULATOR_REGISTRY: Dict[str, CalculatorType] = {
-    "current": CurrentCalculator,
-    "inertia": InertiaCalculator,
-    "screw_horizontal": ScrewHorizontalCalculator,
-    "screw_vertical": ScrewVerticalCalculator,
-    "belt_intermittent": BeltIntermittentCalculator,
-    "belt_continuous": BeltContinuousCalculator,
-    "indexing_table": IndexingTableCalculator,
-    "motor_startup_voltage": MotorStartupVoltageCalculator,
-    "cart_drive_power": CartDrivePowerCalculator,
-    "crawler_robot_force": CrawlerRobotForceCalculator,
-    "electronic_gear_ratio": ElectronicGearRatioCalculator,
-    "angular_acceleration": AngularAccelerationCalculator,
-    "stepper_motor_inertia": StepperMotorInertiaCalculator,
-    "load_torque": LoadTorqueCalculator,
-    "fan_performance": FanPerformanceCalculator,
-    "blower_selection": BlowerSelectionCalculator,
-    "fan_selection": FanSelectionCalculator,
-    "fan_selection_example": FanSelectionExampleCalculator,
-    "servo_motor_inertia": ServoMotorInertiaCalculator,
-    "servo_motor_selection": ServoMotorSelectionCalculator,
-    "servo_motor_params": ServoMotorParamsCalculator,
-    "servo_motor_selection_example": ServoMotorSelectionExampleCalculator,
+# 有工具配置的计算器，场景列表优先取自配置文件
+CALCULATOR_CONFIGS: Dict[str, str] = {
+    "current": "configs/tools/current_calc.yaml",
+    "inertia": "configs/tools/inertia_calc.yaml",
 }
 
 
-SCENARIO_TO_TOOL: Dict[str, str] = {}
-for tool_name, calculator_cls in CALCULATOR_REGISTRY.items():
-    scenario_names = getattr(calculator_cls, "SCENARIO_NAMES", {})
-    for scenario in scenario_names:
-        SCENARIO_TO_TOOL[scenario] = tool_name
+logger = logging.getLogger(__name__)
 
 
-logger = logging.getLogger(__name__)
+def _config_scenarios(config_path: str) -> List[str]:
+    """读取工具配置中的场景 id"""
+    import yaml
+
+    path = BASE_DIR / config_path
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f) or {}
+    return [item["id"] for item in raw.get("scenarios", []) if isinstance(item, dict) and "id" in item]
+
+
+def _source_scenarios(import_path: str) -> List[str]:
+    """静态解析计算器类的 SCENARIO_NAMES 字面量，不导入模块"""
+    module_path, class_name = import_path.rsplit(".", 1)
+    spec = find_spec(module_path)
+    if spec is None or not spec.origin:
+        return []
+    tree = ast.parse(Path(spec.origin).read_text(encoding="utf-8"))
+    for node in tree.body:
+        if not (isinstance(node, ast.ClassDef) and node.name == class_name):
+            continue
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets, value = statement.targets, statement.value
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                targets, value = [statement.target], statement.value
+            else:
+                continue
+            if any(getattr(target, "id", None) == "SCENARIO_NAMES" for target in targets):
+                return list(ast.literal_eval(value))
+    return []
+
+
+@lru_cache(maxsize=None)
+def scenario_names_for(tool: str) -> tuple:
+    """工具支持的场景名（配置中的场景在前，源码中其余场景在后）"""
+    names: List[str] = []
+    if tool in CALCULATOR_CONFIGS:
+        names.extend(_config_scenarios(CALCULATOR_CONFIGS[tool]))
+    for name in _source_scenarios(CALCULATOR_PATHS[tool]):
+        if name not in names:
+            names.append(name)
+    return tuple(names)
+
+
+class LazyCalculatorRegistry(Mapping):
+    """
+    工具名到计算器类的映射，按需导入
+
+    Args:
+        paths: {工具名: 计算器类导入路径}
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        self._paths = dict(paths)
+        self._classes: Dict[str, CalculatorType] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, tool: str) -> CalculatorType:
+        calculator_cls = self._classes.get(tool)
+        if calculator_cls is not None:
+            return calculator_cls
+        import_path = self._paths[tool]
+        with self._lock:
+            if tool not in self._classes:
+                module_path, class_name = import_path.rsplit(".", 1)
+                self._classes[tool] = getattr(import_module(module_path), class_name)
+                logger.debug("导入计算器: %s", import_path)
+        return self._classes[tool]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, tool: object) -> bool:
+        return tool in self._paths
+
+    def is_loaded(self, tool: str) -> bool:
+        """该计算器模块是否已导入"""
+        return tool in self._classes
+
+    def import_path(self, tool: str) -> str:
+        return self._paths[tool]
+
+
+class ScenarioIndex(Mapping):
+    """场景名到工具名的映射，第一次查询时建立（同名场景以注册表中靠后的工具为准）"""
+
+    def __init__(self, registry: LazyCalculatorRegistry):
+        self._registry = registry
+        self._index: Optional[Dict[str, str]] = None
+
+    def _build(self) -> Dict[str, str]:
+        if self._index is None:
+            index: Dict[str, str] = {}
+            for tool in self._registry:
+                for scenario in scenario_names_for(tool):
+                    index[scenario] = tool
+            self._index = index
+        return self._index
+
+    def __getitem__(self, scenario: str) -> str:
+        return self._build()[scenario]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._build())
+
+    def __len__(self) -> int:
+        return len(self._build())
+
+
+CALCULATOR_REGISTRY = LazyCalculatorRegistry(CALCULATOR_PATHS)
+SCENARIO_TO_TOOL = ScenarioIndex(CALCULATOR_REGISTRY)
+
+
+def warm_up_calculators(tools: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    预先导入计算器模块
+
+    Args:
+        tools: 工具名列表；None 时读取环境变量 CALCULATOR_WARMUP
+            （空表示不预热，"all" 表示全部，或逗号分隔的工具名）
+
+    Returns:
+        list: 本次预热的工具名
+    """
+    if tools is None:
+        setting = os.environ.get(WARMUP_ENV, "").strip()
+        if not setting:
+            return []
+        tools = list(CALCULATOR_REGISTRY) if setting == "all" else [t.strip() for t in setting.split(",") if t.strip()]
+    warmed = []
+    for tool in tools:
+        if tool not in CALCULATOR_REGISTRY:
+            raise ValueError(f"未知的计算器: {tool}")
+        CALCULATOR_REGISTRY[tool]
+        warmed.append(tool)
+    return warmed
 
 
 def get_calculator(tool: str | None = None, scenario: str | None = None) -> Any:
@@ -84,10 +223,17 @@ def get_calculator(tool: str | None = None, scenario: str | None = None) -> Any:
 
 def calculate(tool: str, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
     """统一计算入口，带有日志和校验钩子。"""
+    from app.services.base_calculator import BaseCalculator
 
     calculator = get_calculator(tool, scenario)
     runner = BaseCalculator(calculator)
     return runner.calculate(scenario, params)
 
 
-__all__ = ["calculate", "get_calculator", "CALCULATOR_REGISTRY", "SCENARIO_TO_TOOL"]
+__all__ = [
+    "calculate",
+    "get_calculator",
+    "warm_up_calculators",
+    "CALCULATOR_REGISTRY",
+    "SCENARIO_TO_TOOL",
+]
@@ -0,0 +1,392 @@
+"""
+浏览器端计算器生成
+简单场景的计算只是几步四则运算，为此往返一次服务器的延迟比计算本身长得多。
+这里把可在浏览器中得到与服务器逐位相同结果的场景生成为 JavaScript 函数，内联到工具页面：
+
+- 配置公式定义的工具（formula_config）直接使用编译后的公式语法树；
+- 手写计算器在类属性 CLIENT_FORMULAS 中声明场景的公式图（输入、校验条件、计算步骤、
+  结果与公式说明模板），须与对应的 _calculate_* 方法逐步一致。
+
+只接受 JavaScript 与 Python 结果逐位一致的运算：加减乘除与 sqrt（IEEE 754 要求正确舍入）、
+abs/min/max；幂运算与三角、指数函数的结果取决于各平台的数学库，这类场景以及依赖数据库、
+查表的场景仍由服务器计算。生成的函数在参数缺失、不满足校验条件、除以 0、中间结果超出
+可精确表示的整数范围等情况下返回 null，由页面改为请求服务器——错误提示始终来自服务器。
+两端一致性由 scripts/crosscheck_client_evaluators.py 用随机输入交叉验证。
+"""
+import json
+import logging
+import math
+import re
+import string
+import threading
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from app.services.formula_compiler import (
+    FormulaSyntaxError,
+    Node,
+    fold_constants,
+    load_formula_calculator,
+    parse_formula,
+    resolve_config_path,
+)
+from app.services.registry import ToolSpec
+
+logger = logging.getLogger(__name__)
+
+# 可在浏览器端计算的函数及其在运行时（static/js/common.js 的 pyRuntime）中的实现
+CLIENT_FUNCTIONS = {"sqrt": "r.sqrt", "abs": "Math.abs", "min": "r.min", "max": "r.max"}
+
+# 请求中由接口自身处理的字段，不能作为计算输入
+RESERVED_PARAMS = {"scenario", "input_units", "output_units"}
+
+_COMPARISON_RE = re.compile(r"^(.+?)(<=|>=|==|!=|<|>)(.+)$")
+_JS_COMPARISONS = {"==": "===", "!=": "!=="}
+_FIXED_SPEC_RE = re.compile(r"^\.(\d+)f$")
+
+
+class UnsupportedScenario(ValueError):
+    """场景无法生成与服务器结果一致的浏览器端计算函数。"""
+
+
+@dataclass
+class ClientEvaluators:
+    """单个工具的浏览器端计算函数"""
+
+    tool_id: str
+    scenarios: Dict[str, str] = field(default_factory=dict)  # 场景 -> JavaScript 函数源码
+    skipped: Dict[str, str] = field(default_factory=dict)  # 场景 -> 由服务器计算的原因
+
+
+def _js_string(text: str) -> str:
+    # 内联在 <script> 中："</" 会提前结束脚本元素
+    return json.dumps(text, ensure_ascii=False).replace("</", "<\\/")
+
+
+def _js_number(value: float) -> str:
+    if not math.isfinite(value):
+        raise UnsupportedScenario(f"常量 {value} 不是有限数")
+    text = repr(float(value))
+    return f"({text})" if text.startswith("-") else text
+
+
+def _python_value(value: Any, name: str) -> str:
+    """默认值编码为 [值, 是否为Python整数]，None 编码为 null"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise UnsupportedScenario(f"参数 {name} 的默认值 {value!r} 不是数字")
+    if abs(value) >= 2 ** 53:
+        raise UnsupportedScenario(f"参数 {name} 的默认值 {value!r} 超出可精确计算的范围")
+    if isinstance(value, int):
+        return f"[{value},true]"
+    return f"[{_js_number(value)},false]"
+
+
+def _expression(node: Node, names: Mapping[str, str]) -> str:
+    """语法树 -> JavaScript 表达式；每个中间结果经运行时检查，保证与 Python 逐位一致"""
+    kind = node[0]
+    if kind == "num":
+        return _js_number(node[1])
+    if kind == "var":
+        if node[1] not in names:
+            raise UnsupportedScenario(f"未定义的符号: {node[1]}")
+        return names[node[1]]
+    if kind == "neg":
+        return f"r.n(-{_expression(node[1], names)})"
+    if kind == "bin":
+        op, left, right = node[1], _expression(node[2], names), _expression(node[3], names)
+        if op == "/":
+            return f"r.div({left},{right})"
+        if op in ("+", "-", "*"):
+            return f"r.n({left}{op}{right})"
+        raise UnsupportedScenario("幂运算的结果取决于服务器的数学库，由服务器计算")
+    function = CLIENT_FUNCTIONS.get(node[1])
+    if function is None:
+        raise UnsupportedScenario(f"函数 {node[1]} 的结果取决于服务器的数学库，由服务器计算")
+    return f"{function}({','.join(_expression(arg, names) for arg in node[2])})"
+
+
+def _formula_expression(formula: Union[str, Node], names: Mapping[str, str]) -> str:
+    """公式文本或已折叠常量的语法树 -> JavaScript 表达式"""
+    if not isinstance(formula, str):
+        return _expression(formula, names)
+    try:
+        output, tree = parse_formula(formula)
+    except FormulaSyntaxError as exc:
+        raise UnsupportedScenario(f"无法解析 {formula!r}: {exc}") from exc
+    if output is not None:
+        raise UnsupportedScenario(f"表达式不能包含等号: {formula!r}")
+    return _expression(fold_constants(tree), names)
+
+
+def _condition(text: str, names: Mapping[str, str]) -> str:
+    """校验条件（如 "t0 < t"）-> JavaScript 布尔表达式"""
+    match = _COMPARISON_RE.match(text)
+    if match is None:
+        raise UnsupportedScenario(f"校验条件缺少比较运算符: {text!r}")
+    left, op, right = match.groups()
+    op = _JS_COMPARISONS.get(op, op)
+    return f"{_formula_expression(left, names)}{op}{_formula_expression(right, names)}"
+
+
+def _template(text: str, names: Mapping[str, str], ints: Mapping[str, str]) -> str:
+    """
+    公式说明模板 -> JavaScript 字符串表达式
+
+    模板与 Python f-string 写法相同：{t} 按 str() 输出输入参数，{beta:.4f} 保留固定小数位，
+    字面的花括号写作 {{ }}。
+    """
+    parts: List[str] = []
+    for literal, name, spec, conversion in string.Formatter().parse(text):
+        if literal:
+            parts.append(_js_string(literal))
+        if name is None:
+            continue
+        if name not in names or conversion:
+            raise UnsupportedScenario(f"公式模板中的字段无法生成: {{{name}}}")
+        fixed = _FIXED_SPEC_RE.match(spec or "")
+        if fixed:
+            parts.append(f"r.fixed({names[name]},{fixed.group(1)})")
+        elif not spec and name in ints:
+            parts.append(f"r.str({names[name]},{ints[name]})")
+        else:
+            # 计算步骤的 Python 类型（int/float）取决于输入，只允许带格式的输出
+            raise UnsupportedScenario(f"公式模板字段 {{{name}}} 需要 .Nf 格式")
+    return "+".join(parts) or '""'
+
+
+def _inputs(spec: ToolSpec, inputs: Mapping[str, Any]) -> str:
+    """r.inputs 的参数描述：[参数名, 请求模型类型, 请求模型默认值, 计算器默认值]"""
+    fields = spec.request_field_definitions()
+    entries = []
+    for name, default in inputs.items():
+        if name in RESERVED_PARAMS:
+            raise UnsupportedScenario(f"参数名 {name} 与接口字段冲突")
+        field_type, field_default = fields.get(name, (None, None))
+        if field_type not in (None, "float", "int"):
+            raise UnsupportedScenario(f"参数 {name} 的类型为 {field_type}，不是数字")
+        entries.append(
+            f"[{_js_string(name)},{_js_string(field_type) if field_type else 'null'},"
+            f"{_python_value(field_default, name)},{_python_value(default, name)}]"
+        )
+    return f"[{','.join(entries)}]"
+
+
+def _function(
+    spec: ToolSpec,
+    inputs: Mapping[str, Any],
+    requires: List[str],
+    steps: Mapping[str, Union[str, Node]],
+    result: str,
+    digits: int,
+    unit: str,
+    formula: str,
+    scenario_name: str,
+    extra: Optional[List[str]] = None,
+    aliases: Optional[Mapping[str, str]] = None,
+    formula_template: bool = True,
+) -> str:
+    """
+    生成单个场景的 JavaScript 函数 function(p, r)：p 为请求参数，r 为运行时
+
+    Args:
+        spec: 工具规格（请求模型的参数类型与默认值）
+        inputs: {参数名: 计算器中的默认值}，与 params.get(name, default) 对应
+        requires: 校验条件，不满足时由服务器计算（并返回错误提示）
+        steps: 按顺序计算的中间值 {名称: 表达式}
+        result: 结果取值的名称，按 digits 位小数四舍五入
+        digits: 结果保留的小数位数
+        unit: 单位
+        formula: 公式说明（formula_template 为 True 时为模板）
+        scenario_name: 场景名称
+        extra: 写入 extra 的值的名称
+        aliases: 表达式中的符号 -> 参数名
+        formula_template: formula 是否按模板填入数值
+
+    Returns:
+        str: JavaScript 函数源码
+    """
+    names = {name: f"a{index}" for index, name in enumerate(inputs)}
+    ints = {name: f"i{index}" for index, name in enumerate(inputs)}
+    for symbol, name in (aliases or {}).items():
+        if name in names:
+            names.setdefault(symbol, names[name])
+    declare = f"[[{','.join(names[name] for name in inputs)}],[{','.join(ints.values())}]]"
+    lines = [f"const {declare}=r.inputs(p,{_inputs(spec, inputs)});"]
+    if requires:
+        lines.append(f"r.need({'&&'.join(f'({_condition(text, names)})' for text in requires)});")
+    for index, (name, expression) in enumerate(steps.items()):
+        if name in names:
+            raise UnsupportedScenario(f"计算步骤 {name} 与输入参数重名")
+        code = _formula_expression(expression, names)
+        names[name] = f"s{index}"
+        lines.append(f"const s{index}={code};")
+    if result not in names:
+        raise UnsupportedScenario(f"结果 {result} 不是输入参数或计算步骤")
+    extra_code = "null"
+    if extra:
+        missing = [name for name in extra if name not in names]
+        if missing:
+            raise UnsupportedScenario(f"extra 引用了未定义的值: {', '.join(missing)}")
+        extra_code = "{" + ",".join(f"{_js_string(name)}:{names[name]}" for name in extra) + "}"
+    formula_code = _template(formula, names, ints) if formula_template else _js_string(formula)
+    lines.append(
+        f"return{{result:r.round({names[result]},{int(digits)}),unit:{_js_string(unit)},"
+        f"formula:{formula_code},scenario_name:{_js_string(scenario_name)},mass:null,extra:{extra_code}}};"
+    )
+    return "function(p,r){" + "".join(lines) + "}"
+
+
+def _numeric_limit(limit: Any) -> bool:
+    return not isinstance(limit, bool) and isinstance(limit, (int, float)) and abs(limit) < 2 ** 53
+
+
+def _formula_config_evaluators(spec: ToolSpec, evaluators: ClientEvaluators) -> None:
+    """配置公式：FormulaCalculator.calculate 的取值范围校验、公式与 round(result, 4)"""
+    calculator = load_formula_calculator(spec.formula_config)
+    evaluators.skipped.update(calculator.skipped)
+    aliases = {
+        param["symbol"]: name for name, param in calculator.parameter_specs.items() if param.get("symbol")
+    }
+    for scenario, compiled in calculator.formulas.items():
+        requires = []
+        for name, _label, minimum, maximum in calculator._bounds[scenario]:
+            for op, limit in ((">=", minimum), ("<=", maximum)):
+                if limit is None:
+                    continue
+                if not _numeric_limit(limit):
+                    evaluators.skipped[scenario] = f"参数 {name} 的取值范围 {limit!r} 无法在浏览器端校验"
+                    break
+                requires.append(f"{name} {op} {limit!r}")
+        if scenario in evaluators.skipped:
+            continue
+        try:
+            evaluators.scenarios[scenario] = _function(
+                spec,
+                inputs={name: None for name in compiled.parameters},
+                requires=requires,
+                steps={"result": compiled.tree},
+                result="result",
+                digits=4,
+                unit=calculator.units.get(scenario, ""),
+                formula=compiled.source,
+                scenario_name=calculator.SCENARIO_NAMES[scenario],
+                aliases=aliases,
+                formula_template=False,
+            )
+        except UnsupportedScenario as exc:
+            evaluators.skipped[scenario] = str(exc)
+
+
+def _formula_graph_evaluators(spec: ToolSpec, evaluators: ClientEvaluators) -> None:
+    """手写计算器：按 CLIENT_FORMULAS 中声明的公式图生成"""
+    calculator_class = spec.get_calculator_class()
+    graphs: Mapping[str, Mapping[str, Any]] = getattr(calculator_class, "CLIENT_FORMULAS", {})
+    scenario_names: Mapping[str, str] = getattr(calculator_class, "SCENARIO_NAMES", {})
+    for scenario, graph in graphs.items():
+        try:
+            evaluators.scenarios[scenario] = _function(
+                spec,
+                inputs=graph["inputs"],
+                requires=list(graph.get("require", [])),
+                steps=graph.get("steps", {}),
+                result=graph["result"],
+                digits=graph.get("digits", 4),
+                unit=graph.get("unit", ""),
+                formula=graph.get("formula", ""),
+                scenario_name=scenario_names.get(scenario, scenario),
+                extra=graph.get("extra"),
+            )
+        except UnsupportedScenario as exc:
+            evaluators.skipped[scenario] = str(exc)
+
+
+def build_client_evaluators(spec: ToolSpec) -> ClientEvaluators:
+    """
+    生成工具的浏览器端计算函数
+
+    Args:
+        spec: 工具规格
+
+    Returns:
+        ClientEvaluators: 可在浏览器端计算的场景及其余场景由服务器计算的原因
+    """
+    evaluators = ClientEvaluators(spec.id)
+    if spec.formula_config:
+        _formula_config_evaluators(spec, evaluators)
+    elif spec.calculator:
+        _formula_graph_evaluators(spec, evaluators)
+    return evaluators
+
+
+def render_client_evaluators(spec: ToolSpec) -> str:
+    """
+    工具页面内联脚本：注册工具的浏览器端计算函数
+
+    Args:
+        spec: 工具规格
+
+    Returns:
+        str: JavaScript 语句；没有可在浏览器端计算的场景时为空字符串
+    """
+    evaluators = build_client_evaluators(spec)
+    if not evaluators.scenarios:
+        return ""
+    functions = ",".join(f"{_js_string(scenario)}:{source}" for scenario, source in evaluators.scenarios.items())
+    return f"window.CLIENT_EVALUATORS={{{_js_string(spec.id)}:{{{functions}}}}};"
+
+
+def evaluator_sources(spec: ToolSpec) -> List[Path]:
+    """
+    生成结果所依赖的源文件（本模块、公式配置或计算器模块），计入预渲染页面的构建指纹
+
+    Args:
+        spec: 工具规格
+
+    Returns:
+        list: 存在的文件路径
+    """
+    paths = [Path(__file__)]
+    if spec.formula_config:
+        paths.append(resolve_config_path(spec.formula_config))
+    elif spec.calculator:
+        try:
+            module = find_spec(spec.calculator.rsplit(".", 1)[0])
+        except (ImportError, ValueError):
+            module = None
+        if module is not None and module.origin:
+            paths.append(Path(module.origin))
+    return [path for path in paths if path.is_file()]
+
+
+_scripts: Dict[str, Tuple[ToolSpec, str]] = {}
+_scripts_lock = threading.Lock()
+
+
+def client_evaluator_script(spec: ToolSpec) -> str:
+    """render_client_evaluators 的缓存版本（按工具缓存，工具规格对象替换后重新生成）"""
+    cached = _scripts.get(spec.id)
+    if cached is not None and cached[0] is spec:
+        return cached[1]
+    try:
+        script = render_client_evaluators(spec)
+    except (ImportError, AttributeError, FileNotFoundError, ValueError) as exc:
+        # 计算器无法加载时页面照常渲染，计算全部交给服务器（接口会返回具体错误）
+        logger.warning("工具 %s 无法生成浏览器端计算函数: %s", spec.id, exc)
+        script = ""
+    with _scripts_lock:
+        _scripts[spec.id] = (spec, script)
+    return script
+
+
+def invalidate_client_evaluators(tool_ids: Optional[List[str]] = None) -> None:
+    """工具配置或其公式文件变化后丢弃缓存的脚本；tool_ids 为 None 时全部丢弃"""
+    with _scripts_lock:
+        if tool_ids is None:
+            _scripts.clear()
+        else:
+            for tool_id in tool_ids:
+                _scripts.pop(tool_id, None)
@@ -0,0 +1,181 @@
+"""
+工具配置热加载
+轮询工具规格目录（tools/*.yaml）与工具元数据目录（configs/tools/*.yaml）的修改时间，
+只重新解析变化的文件，重建受影响工具的请求模型与路由并原子替换路由表；
+未变化工具的路由、计算器实例与缓存全部保留，无需重启 worker。
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.routers.tool_routes import ToolRouteTable
+from app.services.formula_compiler import invalidate_formula_calculator, resolve_config_path
+from app.services.registry import ToolSpec, get_tool_spec_sources, load_tool_spec_file
+from app.services.units import TOOL_METADATA_DIR, invalidate_unit_converter
+
+logger = logging.getLogger(__name__)
+
+# 轮询间隔（秒）；未设置或为空时不启用热加载
+WATCH_ENV = "TOOL_CONFIG_WATCH"
+
+CONFIG_SUFFIXES = (".yaml", ".yml")
+
+
+@dataclass
+class ReloadReport:
+    """一次热加载的结果"""
+
+    files: List[str]
+    tools: List[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    error: Optional[str] = None
+
+
+class ToolConfigWatcher:
+    """
+    工具配置监视器
+
+    Args:
+        table: 应用的工具路由表
+        config_dir: 工具规格目录
+        metadata_dir: 工具元数据（公式、单位）目录
+        interval: 轮询间隔（秒）
+    """
+
+    def __init__(
+        self,
+        table: ToolRouteTable,
+        config_dir: Path,
+        metadata_dir: Path = TOOL_METADATA_DIR,
+        interval: float = 1.0,
+    ):
+        self.table = table
+        self.config_dir = Path(config_dir).resolve()
+        self.metadata_dir = Path(metadata_dir).resolve()
+        self.interval = interval
+        self._sources = get_tool_spec_sources(self.config_dir)
+        self._stats = self._scan()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        stats: Dict[Path, Tuple[int, int]] = {}
+        for directory in {self.config_dir, self.metadata_dir}:
+            if not directory.exists():
+                continue
+            for path in directory.iterdir():
+                if path.suffix in CONFIG_SUFFIXES:
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def check(self) -> Optional[ReloadReport]:
+        """
+        检查一次配置变化，有变化时热加载
+
+        Returns:
+            ReloadReport: 没有变化时返回None
+        """
+        stats = self._scan()
+        changed = {path for path, stat in stats.items() if self._stats.get(path) != stat}
+        removed = set(self._stats) - set(stats)
+        if not changed and not removed:
+            return None
+
+        start = time.perf_counter()
+        report = ReloadReport(files=sorted(path.name for path in changed | removed))
+        try:
+            report.tools = self._reload(changed, removed)
+        except Exception as exc:
+            # 配置有误时保留旧路由表，文件再次修改后重试
+            report.error = str(exc)
+            logger.error("工具配置热加载失败，继续使用原配置: %s", exc)
+        # 无论成功与否都记录新的修改时间，避免对同一错误反复重试
+        self._stats = stats
+        report.elapsed_ms = (time.perf_counter() - start) * 1000
+        if report.error is None:
+            logger.info("已热加载工具配置 %s，重建工具 %s，耗时 %.1f ms", report.files, report.tools, report.elapsed_ms)
+        return report
+
+    def _reload(self, changed: Set[Path], removed: Set[Path]) -> List[str]:
+        specs = self.table.specs
+        sources = dict(self._sources)
+        changed_specs: Dict[str, ToolSpec] = {}
+        removed_ids: Set[str] = set()
+
+        for path in sorted(changed):
+            if path.parent != self.config_dir:
+                continue
+            spec = load_tool_spec_file(path)
+            if any(name != path.name and tool_id == spec.id for name, tool_id in sources.items()):
+                raise ValueError(f"配置文件 {path.name} 的工具 id 与其他配置重复: {spec.id}")
+            previous_id = sources.get(path.name)
+            if previous_id is not None and previous_id != spec.id:
+                removed_ids.add(previous_id)
+            sources[path.name] = spec.id
+            changed_specs[spec.id] = spec
+        for path in removed:
+            if path.parent == self.config_dir and path.name in sources:
+                removed_ids.add(sources.pop(path.name))
+
+        # 元数据文件（公式配置、参数单位）变化：丢弃对应缓存并重建引用它的工具
+        for path in changed | removed:
+            if path.parent != self.metadata_dir:
+                continue
+            invalidate_formula_calculator(str(path))
+            for tool_id, spec in specs.items():
+                uses_formula = spec.formula_config and resolve_config_path(spec.formula_config).resolve() == path
+                if uses_formula or path.stem in (tool_id, tool_id.replace("-", "_")):
+                    invalidate_unit_converter(tool_id)
+                    changed_specs.setdefault(tool_id, spec)
+
+        removed_ids -= set(changed_specs)
+        for spec in changed_specs.values():
+            invalidate_unit_converter(spec.id)
+            if spec.formula_config:
+                # 预先编译，公式有误时在替换路由表之前失败
+                spec.create_calculator()
+
+        tools = self.table.update(changed_specs, removed_ids)
+        self._sources = sources
+        return tools
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:  # pragma: no cover - 监视线程不能退出
+                logger.exception("检查工具配置变化失败")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tool-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(self.interval + 1)
+        self._thread = None
+
+
+def watch_interval_from_env() -> Optional[float]:
+    """读取 TOOL_CONFIG_WATCH，未启用时返回None"""
+    value = os.environ.get(WATCH_ENV, "").strip()
+    if not value:
+        return None
+    try:
+        interval = float(value)
+    except ValueError:
+        raise ValueError(f"{WATCH_ENV} 必须是轮询间隔秒数: {value}") from None
+    return interval if interval > 0 else None
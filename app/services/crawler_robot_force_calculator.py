@@ -2,10 +2,90 @@
 履带机器人驱动力计算服务
 """
 import math
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, List, Optional
 from app.models.schemas import CurrentCalcResponse
 
 
+# 车体参数块的输入参数（道路、车体、电机规格、减速器）：只由这些参数决定的中间值
+# （坡度角、减速比、总质量）按参数组缓存，批量计算中车体相同的行共享
+VEHICLE_PARAM_KEYS = (
+    "f", "u", "peak_attachment", "slope_percent", "obstacle_height",
+    "m1", "m2", "D", "D_drive", "B", "L",
+    "P_motor", "I_no_load", "T_rated", "I_rated", "T_max", "n_rated", "n_max", "current_unevenness",
+    "i_total", "i_custom", "i_reducer", "gear_large", "gear_small",
+    "T_gear_large", "T_gear_small", "n_reducer_rated", "n_reducer_max", "T_reducer_rated",
+)
+
+# 运行参数（v_rated、v_max、a、a_slope、n_motor、n_effective、I_actual）不参与缓存键，
+# 由 _merge_run_params 逐行与车体参数块合并
+
+
+class CrawlerEvaluationContext:
+    """
+    履带机器人计算上下文
+    
+    按车体参数缓存车体参数块（坡度角、减速比、总质量等），同一组参数的多个场景、
+    以及只有运行参数（速度、加速度、电流等）不同的批量行只计算一次；
+    运行参数每次与车体参数块合并成新的通用参数块，缓存的车体参数块不会被修改。
+    """
+    
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> Optional[tuple]:
+        """生成车体参数块的缓存键（只含车体参数），参数不可哈希时返回None"""
+        key = tuple(params.get(name) for name in VEHICLE_PARAM_KEYS)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def get_common_params(self, calculator: "CrawlerRobotForceCalculator", params: Dict[str, Any]) -> Dict[str, Any]:
+        """获取通用参数块：车体参数块命中缓存时直接复用，运行参数逐行合并"""
+        return calculator._merge_run_params(params, self.get_vehicle_params(calculator, params))
+    
+    def get_vehicle_params(self, calculator: "CrawlerRobotForceCalculator", params: Dict[str, Any]) -> Dict[str, Any]:
+        """获取车体参数块，命中缓存时直接复用（调用方不得修改返回值）"""
+        key = self.make_key(params)
+        if key is None:
+            with self._lock:
+                self.misses += 1
+            return calculator._get_vehicle_params(params)
+        
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        
+        vehicle = calculator._get_vehicle_params(params)
+        with self._lock:
+            self._cache[key] = vehicle
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return vehicle
+
+
+# 进程内共享的计算上下文：接口每次请求都会新建计算器，
+# 页面各标签页以相同车体参数分别请求不同场景时复用同一车体参数块
+_shared_context = CrawlerEvaluationContext()
+
+
+def get_shared_context() -> CrawlerEvaluationContext:
+    """获取进程内共享的计算上下文"""
+    return _shared_context
+
+
 class CrawlerRobotForceCalculator:
     """履带机器人驱动力计算器"""
     
@@ -20,10 +100,29 @@ class CrawlerRobotForceCalculator:
         "speed_calc": "速度计算"
     }
     
+    # 场景与计算方法的对应关系（用于批量/全场景计算）
+    SCENARIO_METHODS = {
+        "crawler_robot_force": "_calculate_crawler_robot_force",
+        "power_calc": "_calculate_power",
+        "torque_calc": "_calculate_torque",
+        "acceleration_torque_calc": "_calculate_acceleration_torque",
+        "obstacle_calc": "_calculate_obstacle",
+        "rotation_calc": "_calculate_rotation",
+        "reducer_check": "_calculate_reducer_check",
+        "speed_calc": "_calculate_speed"
+    }
+    
     # 常数
     G = 10  # 重力加速度 m/s² (Excel中使用10)
     # 使用math.pi确保精度一致性
     
+    def __init__(self, context: Optional[CrawlerEvaluationContext] = None):
+        """
+        Args:
+            context: 计算上下文，默认使用进程内共享的上下文
+        """
+        self.context = context if context is not None else get_shared_context()
+    
     def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
         """
         根据场景计算履带机器人驱动力
@@ -35,27 +134,66 @@ class CrawlerRobotForceCalculator:
         Returns:
             CurrentCalcResponse: 计算结果
         """
-        if scenario == "crawler_robot_force":
-            return self._calculate_crawler_robot_force(params)
-        elif scenario == "power_calc":
-            return self._calculate_power(params)
-        elif scenario == "torque_calc":
-            return self._calculate_torque(params)
-        elif scenario == "acceleration_torque_calc":
-            return self._calculate_acceleration_torque(params)
-        elif scenario == "obstacle_calc":
-            return self._calculate_obstacle(params)
-        elif scenario == "rotation_calc":
-            return self._calculate_rotation(params)
-        elif scenario == "reducer_check":
-            return self._calculate_reducer_check(params)
-        elif scenario == "speed_calc":
-            return self._calculate_speed(params)
-        else:
+        method_name = self.SCENARIO_METHODS.get(scenario)
+        if method_name is None:
             raise ValueError(f"未知的计算场景: {scenario}")
+        p = self.context.get_common_params(self, params)
+        return getattr(self, method_name)(params, p)
+    
+    def calculate_all(
+        self,
+        params: Dict[str, Any],
+        scenarios: Optional[Iterable[str]] = None,
+        context: Optional[CrawlerEvaluationContext] = None
+    ) -> Dict[str, CurrentCalcResponse]:
+        """
+        对同一组参数计算多个场景，通用参数块只计算一次
+        
+        Args:
+            params: 参数字典
+            scenarios: 需要计算的场景，为 None 时计算全部场景
+            context: 计算上下文，默认使用计算器的上下文
+            
+        Returns:
+            dict: 场景 -> 计算结果；缺少必需参数的场景抛出 ValueError
+        """
+        context = context if context is not None else self.context
+        p = context.get_common_params(self, params)
+        results = {}
+        for scenario in self.SCENARIO_METHODS if scenarios is None else scenarios:
+            method_name = self.SCENARIO_METHODS.get(scenario)
+            if method_name is None:
+                raise ValueError(f"未知的计算场景: {scenario}")
+            results[scenario] = getattr(self, method_name)(params, p)
+        return results
+    
+    def calculate_batch(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        scenarios: Optional[Iterable[str]] = None,
+        context: Optional[CrawlerEvaluationContext] = None
+    ) -> List[Dict[str, CurrentCalcResponse]]:
+        """
+        批量计算多组参数，车体参数相同的行共享车体参数块
+        
+        Args:
+            rows: 参数字典列表
+            scenarios: 需要计算的场景，为 None 时计算全部场景
+            context: 计算上下文，默认使用计算器的上下文
+            
+        Returns:
+            list: 每行一个 场景 -> 计算结果 的字典
+        """
+        context = context if context is not None else self.context
+        scenario_list = list(self.SCENARIO_METHODS if scenarios is None else scenarios)
+        return [self.calculate_all(row, scenario_list, context) for row in rows]
     
     def _get_common_params(self, params: Dict[str, Any]) -> Dict[str, float]:
-        """获取通用参数并计算中间值"""
+        """获取通用参数并计算中间值（车体参数块与运行参数合并）"""
+        return self._merge_run_params(params, self._get_vehicle_params(params))
+    
+    def _get_vehicle_params(self, params: Dict[str, Any]) -> Dict[str, float]:
+        """获取车体参数（道路、车体、电机规格、减速器）并计算只依赖它们的中间值"""
         # 道路参数
         f = params.get("f", 0.11)  # 滚动摩擦系数
         u = params.get("u", 1.1)  # 滑动摩擦系数
@@ -71,18 +209,9 @@ class CrawlerRobotForceCalculator:
         B = params.get("B", 446)  # 履带间距（左右）(mm)
         L = params.get("L", 592)  # 接地长度（前后）(mm)
         
-        # 运行参数
-        v_rated = params.get("v_rated", 0.4)  # 平地车体额定速度 (m/s)
-        v_max = params.get("v_max", 0.5)  # 平地车体最大速度 (m/s)
-        a = params.get("a", 0.3)  # 运行加速度 (m/s²)
-        a_slope = params.get("a_slope")  # 坡道加速度 (m/s²)，默认等于a
-        
         # 电机参数
-        n_motor = params.get("n_motor", 2)  # 电机数量
-        n_effective = params.get("n_effective", 2)  # 有效电机数
         P_motor = params.get("P_motor", 250)  # 电机功率 (W)
         I_no_load = params.get("I_no_load", 1)  # 空转电流 (A)
-        I_actual = params.get("I_actual", 9)  # 实际电流(平均) (A)
         T_rated = params.get("T_rated", 0.52)  # 额定扭矩 (Nm)
         I_rated = params.get("I_rated", 9.1)  # 额定电流 (A)
         T_max = params.get("T_max", 1.5)  # 最大扭矩 (Nm)
@@ -102,10 +231,6 @@ class CrawlerRobotForceCalculator:
         n_reducer_max = params.get("n_reducer_max", 6000)  # 减速器最高转速 (rpm)
         T_reducer_rated = params.get("T_reducer_rated", 35)  # 减速器额定扭矩 (Nm)
         
-        # 计算中间值
-        if a_slope is None:
-            a_slope = a
-        
         # 轨道坡度角度（弧度）
         slope_rad = math.atan(slope_percent / 100)  # B7 = ATAN(B6/100)
         slope_deg = slope_rad * 180 / math.pi  # B8 = B7*180/π
@@ -120,9 +245,6 @@ class CrawlerRobotForceCalculator:
             if i_custom and i_reducer:
                 i_total = i_custom * i_reducer  # E26 = E27*E32
         
-        # 实际扭矩
-        T_actual = (I_actual - I_no_load) / I_rated * T_rated  # E9 = (E11-E10)/E13*E12
-        
         # 总质量
         m_total = m1 + m2
         
@@ -130,9 +252,7 @@ class CrawlerRobotForceCalculator:
             'f': f, 'u': u, 'peak_attachment': peak_attachment, 'slope_percent': slope_percent,
             'obstacle_height': obstacle_height, 'm1': m1, 'm2': m2, 'm_total': m_total,
             'D': D, 'D_drive': D_drive, 'B': B, 'L': L,
-            'v_rated': v_rated, 'v_max': v_max, 'a': a, 'a_slope': a_slope,
-            'n_motor': n_motor, 'n_effective': n_effective, 'P_motor': P_motor,
-            'I_no_load': I_no_load, 'I_actual': I_actual, 'T_rated': T_rated,
+            'P_motor': P_motor, 'I_no_load': I_no_load, 'T_rated': T_rated,
             'I_rated': I_rated, 'T_max': T_max, 'n_rated': n_rated, 'n_max': n_max,
             'current_unevenness': current_unevenness,
             'i_total': i_total, 'i_custom': i_custom, 'i_reducer': i_reducer,
@@ -140,12 +260,37 @@ class CrawlerRobotForceCalculator:
             'T_gear_large': T_gear_large, 'T_gear_small': T_gear_small,
             'n_reducer_rated': n_reducer_rated, 'n_reducer_max': n_reducer_max,
             'T_reducer_rated': T_reducer_rated,
-            'slope_rad': slope_rad, 'slope_deg': slope_deg, 'T_actual': T_actual
+            'slope_rad': slope_rad, 'slope_deg': slope_deg
+        }
+    
+    def _merge_run_params(self, params: Dict[str, Any], vehicle: Dict[str, float]) -> Dict[str, float]:
+        """运行参数与车体参数块合并为通用参数块（返回新字典，不修改车体参数块）"""
+        # 运行参数
+        v_rated = params.get("v_rated", 0.4)  # 平地车体额定速度 (m/s)
+        v_max = params.get("v_max", 0.5)  # 平地车体最大速度 (m/s)
+        a = params.get("a", 0.3)  # 运行加速度 (m/s²)
+        a_slope = params.get("a_slope")  # 坡道加速度 (m/s²)，默认等于a
+        n_motor = params.get("n_motor", 2)  # 电机数量
+        n_effective = params.get("n_effective", 2)  # 有效电机数
+        I_actual = params.get("I_actual", 9)  # 实际电流(平均) (A)
+        
+        if a_slope is None:
+            a_slope = a
+        
+        # 实际扭矩
+        T_actual = (I_actual - vehicle['I_no_load']) / vehicle['I_rated'] * vehicle['T_rated']  # E9 = (E11-E10)/E13*E12
+        
+        return {
+            **vehicle,
+            'v_rated': v_rated, 'v_max': v_max, 'a': a, 'a_slope': a_slope,
+            'n_motor': n_motor, 'n_effective': n_effective, 'I_actual': I_actual,
+            'T_actual': T_actual
         }
     
-    def _calculate_power(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_power(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """功率计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         # 整车平地行走所需功率: P1 = f×(m1+m2)×10×v
         # Excel公式：H3 = B3*(B19+B20)*10*B25
@@ -185,9 +330,10 @@ class CrawlerRobotForceCalculator:
             extra={'P1': P1, 'P2': P2, 'P3': P3}
         )
     
-    def _calculate_torque(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_torque(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """扭矩计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -229,9 +375,10 @@ class CrawlerRobotForceCalculator:
             extra={'T1': T1, 'T2': T2, 'T3': T3}
         )
     
-    def _calculate_acceleration_torque(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_acceleration_torque(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """加速扭矩计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -276,9 +423,10 @@ class CrawlerRobotForceCalculator:
             extra={'T4': T4, 'T5': T5, 'T6': T6}
         )
     
-    def _calculate_obstacle(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_obstacle(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """越障计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -351,9 +499,10 @@ class CrawlerRobotForceCalculator:
             extra={'T7': T7, 'T8': T8, 'T9': T9, 'T_road': T_road, 'K_road': K_road}
         )
     
-    def _calculate_rotation(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_rotation(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """原地回转计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -389,9 +538,10 @@ class CrawlerRobotForceCalculator:
             extra={'F1': F1, 'F2': F2}
         )
     
-    def _calculate_reducer_check(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_reducer_check(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """减速器校验"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -451,9 +601,10 @@ class CrawlerRobotForceCalculator:
             }
         )
     
-    def _calculate_speed(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_speed(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """速度计算"""
-        p = self._get_common_params(params)
+        if p is None:
+            p = self._get_common_params(params)
         
         if p['i_total'] is None:
             raise ValueError("需要提供总减速比i_total或自制减速比i_custom和减速器减速比i_reducer")
@@ -481,7 +632,7 @@ class CrawlerRobotForceCalculator:
             extra={'v_max_calc': v_max_calc}
         )
     
-    def _calculate_crawler_robot_force(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+    def _calculate_crawler_robot_force(self, params: Dict[str, Any], p: Optional[Dict[str, Any]] = None) -> CurrentCalcResponse:
         """履带机器人驱动力计算（完整计算）"""
         # 调用功率计算作为主要结果
-        return self._calculate_power(params)
\ No newline at end of file
+        return self._calculate_power(params, p)
\ No newline at end of file
@@ -32,7 +32,44 @@ class CurrentCalculator:
         "voltage_loss_line_voltage": "线电压的电压损失计算",
         "voltage_loss_percent_formula": "电压损失率公式计算"
     }
-    
+
+    # 可在浏览器端计算的场景（公式图，见 app/services/client_evaluators.py），须与对应的
+    # _calculate_* 方法逐步一致；修改后运行 scripts/crosscheck_client_evaluators.py
+    CLIENT_FORMULAS = {
+        "pure_resistor": {
+            "inputs": {"power": None, "voltage": None},
+            "require": ["voltage != 0"],
+            "steps": {"result": "power / voltage"},
+            "result": "result",
+            "unit": "A",
+            "formula": "I = P / U",
+        },
+        "inductive": {
+            "inputs": {"power": None, "voltage": None, "cos_phi": 0.85},
+            "require": ["voltage != 0", "cos_phi != 0"],
+            "steps": {"result": "power / (voltage * cos_phi)"},
+            "result": "result",
+            "unit": "A",
+            "formula": "I = P / (U × cosφ)",
+        },
+        "single_phase_motor": {
+            "inputs": {"power": None, "voltage": None, "efficiency": 0.875, "cos_phi": 0.89},
+            "require": ["voltage != 0", "efficiency != 0", "cos_phi != 0"],
+            "steps": {"result": "power / (voltage * efficiency * cos_phi)"},
+            "result": "result",
+            "unit": "A",
+            "formula": "I = P / (U × η × cosφ)",
+        },
+        "three_phase_motor": {
+            "inputs": {"power": None, "voltage": None, "efficiency": 0.875, "cos_phi": 0.89},
+            "require": ["voltage != 0", "efficiency != 0", "cos_phi != 0"],
+            "steps": {"result": "power / (√3 * voltage * efficiency * cos_phi)"},
+            "result": "result",
+            "unit": "A",
+            "formula": "I = P / (√3 × U × η × cosφ)",
+        },
+    }
+
     def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
         """
         根据场景计算电流
@@ -0,0 +1,185 @@
+"""
+多段工作周期（duty cycle）计算引擎
+根据任意分段的运行曲线计算有效转矩/推力、平均速度与电机热裕量，
+支持一次性批量评估成千上万个候选周期（供排程优化器调用）。
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass(frozen=True)
+class DutyCycleResult:
+    """批量工作周期计算结果，每个字段的长度等于周期数"""
+
+    cycle_time: np.ndarray  # 周期总时间 (s)
+    rms: np.ndarray  # 有效转矩/推力（已乘安全系数）
+    peak: np.ndarray  # 峰值转矩/推力（绝对值最大，已乘安全系数）
+    average_speed: np.ndarray  # 时间加权平均速度（取绝对值）
+    thermal_margin: Optional[np.ndarray] = None  # 热裕量 = 1 - rms/额定值
+    peak_margin: Optional[np.ndarray] = None  # 峰值裕量 = 1 - peak/最大值
+
+    def row(self, index: int = 0) -> Dict[str, Optional[float]]:
+        """取出单个周期的结果"""
+        return {
+            "cycle_time": float(self.cycle_time[index]),
+            "rms": float(self.rms[index]),
+            "peak": float(self.peak[index]),
+            "average_speed": float(self.average_speed[index]),
+            "thermal_margin": None if self.thermal_margin is None else float(self.thermal_margin[index]),
+            "peak_margin": None if self.peak_margin is None else float(self.peak_margin[index]),
+        }
+
+
+def _as_float_array(values: Any, name: str) -> np.ndarray:
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{name}必须是数值") from exc
+
+
+def _as_2d(values: ArrayLike, name: str) -> np.ndarray:
+    """把单周期 (n_segments,) 或批量 (n_cycles, n_segments) 输入统一为二维数组"""
+    array = _as_float_array(values, name)
+    if array.ndim == 1:
+        array = array[np.newaxis, :]
+    if array.ndim != 2:
+        raise ValueError(f"{name}必须是一维（单周期）或二维（批量周期）数组")
+    return array
+
+
+def _check_safety_factor(safety_factor: Any) -> float:
+    """安全系数必须是有限的正数；字符串、布尔值等来自请求体的非数值输入按参数错误处理"""
+    if isinstance(safety_factor, bool) or not isinstance(safety_factor, (int, float, np.integer, np.floating)):
+        raise ValueError(f"安全系数必须是数值: {safety_factor!r}")
+    if not math.isfinite(safety_factor) or safety_factor <= 0:
+        raise ValueError(f"安全系数必须大于0: {safety_factor}")
+    return float(safety_factor)
+
+
+def pack_segments(cycles: Iterable[Iterable[Any]]) -> Dict[str, np.ndarray]:
+    """
+    将不等长的分段列表打包为补零的二维数组
+
+    Args:
+        cycles: 周期列表，每个周期是分段列表；分段可以是 (t, v, F) 元组
+            或包含 t/time、v/speed、F/load 键的字典
+
+    Returns:
+        dict: 包含 times、speeds、loads 三个 (n_cycles, max_segments) 数组。
+            补齐的分段时间为0，不影响有效值与平均速度
+    """
+    rows: List[List[tuple]] = []
+    for cycle in cycles:
+        segments = []
+        for segment in cycle:
+            if isinstance(segment, dict):
+                t = segment.get("t", segment.get("time"))
+                v = segment.get("v", segment.get("speed", 0))
+                load = segment.get("F", segment.get("T", segment.get("load")))
+            else:
+                try:
+                    t, v, load = segment
+                except (TypeError, ValueError) as exc:
+                    raise ValueError("每个分段必须是 (t, v, F) 三元组或包含 t、v、F 键的字典") from exc
+            if t is None or load is None:
+                raise ValueError("每个分段必须提供时间t和负载F(或T)")
+            try:
+                segments.append((float(t), float(v or 0), float(load)))
+            except (TypeError, ValueError) as exc:
+                raise ValueError(f"分段的时间、速度与负载必须是数值: {segment!r}") from exc
+        rows.append(segments)
+
+    if not rows:
+        raise ValueError("至少需要一个工作周期")
+    width = max(len(segments) for segments in rows)
+    if width == 0:
+        raise ValueError("工作周期至少需要一个分段")
+
+    packed = np.zeros((len(rows), width, 3), dtype=float)
+    for index, segments in enumerate(rows):
+        if segments:
+            packed[index, : len(segments)] = segments
+    return {"times": packed[:, :, 0], "speeds": packed[:, :, 1], "loads": packed[:, :, 2]}
+
+
+def evaluate_duty_cycles(
+    times: ArrayLike,
+    loads: ArrayLike,
+    speeds: Optional[ArrayLike] = None,
+    rated: Optional[ArrayLike] = None,
+    peak_limit: Optional[ArrayLike] = None,
+    safety_factor: float = 1.0,
+) -> DutyCycleResult:
+    """
+    向量化计算工作周期的有效值、平均速度与热裕量
+
+    有效值: X_rms = √(Σ X_i² × t_i / Σ t_i) × 安全系数
+    平均速度: v_avg = Σ |v_i| × t_i / Σ t_i
+    热裕量: 1 - X_rms / X_rated（小于0表示过热）
+
+    Args:
+        times: 各分段时间 (s)，形状 (n_segments,) 或 (n_cycles, n_segments)
+        loads: 各分段转矩 (N·m) 或推力 (N)，形状同 times
+        speeds: 各分段平均速度，可选，形状同 times
+        rated: 电机额定转矩/推力，标量或每个周期一个值
+        peak_limit: 电机最大转矩/推力，标量或每个周期一个值
+        safety_factor: 安全系数（大于0），同时作用于有效值与峰值
+
+    Returns:
+        DutyCycleResult: 每个周期一项的计算结果
+    """
+    safety_factor = _check_safety_factor(safety_factor)
+    t = _as_2d(times, "分段时间")
+    load = _as_2d(loads, "分段负载")
+    if load.shape != t.shape:
+        raise ValueError("分段负载与分段时间的形状必须一致")
+    if np.any(t < 0):
+        raise ValueError("分段时间不能为负数")
+
+    cycle_time = t.sum(axis=1)
+    if np.any(cycle_time <= 0):
+        raise ValueError("每个工作周期的总时间必须大于0")
+
+    rms = np.sqrt(np.einsum("ij,ij,ij->i", load, load, t) / cycle_time) * safety_factor
+    peak = np.abs(np.where(t > 0, load, 0.0)).max(axis=1) * safety_factor
+
+    if speeds is None:
+        average_speed = np.zeros_like(cycle_time)
+    else:
+        v = _as_2d(speeds, "分段速度")
+        if v.shape != t.shape:
+            raise ValueError("分段速度与分段时间的形状必须一致")
+        average_speed = np.einsum("ij,ij->i", np.abs(v), t) / cycle_time
+
+    thermal_margin = None
+    if rated is not None:
+        rated_array = _as_float_array(rated, "电机额定值")
+        if np.any(rated_array <= 0):
+            raise ValueError("电机额定值必须大于0")
+        thermal_margin = 1 - rms / rated_array
+
+    peak_margin = None
+    if peak_limit is not None:
+        peak_array = _as_float_array(peak_limit, "电机最大值")
+        if np.any(peak_array <= 0):
+            raise ValueError("电机最大值必须大于0")
+        peak_margin = 1 - peak / peak_array
+
+    return DutyCycleResult(
+        cycle_time=cycle_time,
+        rms=rms,
+        peak=peak,
+        average_speed=average_speed,
+        thermal_margin=thermal_margin,
+        peak_margin=peak_margin,
+    )
+
+
+def rms_value(times: Sequence[float], loads: Sequence[float], safety_factor: float = 1.0) -> float:
+    """单周期有效值的便捷入口"""
+    return float(evaluate_duty_cycles(times, loads, safety_factor=safety_factor).rms[0])
@@ -0,0 +1,684 @@
+"""
+Excel 公式计算引擎
+读取 .xlsx 工作簿（.xls 需要安装 xlrd）中的公式，翻译为 Python 表达式并建立单元格依赖图，
+修改输入单元格后只重算受影响（脏）的单元格。解析结果按文件指纹缓存到磁盘，
+再次加载同一工作簿时无需重新解析，可作为手写计算器的校验基准。
+"""
+import hashlib
+import marshal
+import math
+import pickle
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from openpyxl.formula.tokenizer import Token, Tokenizer
+from openpyxl.utils.cell import get_column_letter, range_boundaries
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+CACHE_DIR = BASE_DIR / ".cache" / "excel_engine"
+
+# 缓存格式版本；翻译规则变化时递增，使旧缓存失效
+CACHE_VERSION = 3
+
+
+class CellError:
+    """单元格错误值（#DIV/0! 等），参与运算时继续向下游传播"""
+
+    __slots__ = ("code",)
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def __repr__(self) -> str:
+        return self.code
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CellError) and other.code == self.code
+
+    def __hash__(self) -> int:
+        return hash(self.code)
+
+
+class _Propagate(Exception):
+    """公式引用了错误值"""
+
+    def __init__(self, error: CellError):
+        super().__init__(error.code)
+        self.error = error
+
+
+def _error_literal(code: str) -> CellError:
+    """公式中的错误字面量（如 =IF(A1>0, #N/A, 1)）：求值到时按原错误向下游传播"""
+    raise _Propagate(CellError(code))
+
+
+def _flatten(args: Iterable[Any]) -> List[Any]:
+    values: List[Any] = []
+    for arg in args:
+        if isinstance(arg, list):
+            values.extend(_flatten(arg))
+        else:
+            values.append(arg)
+    return values
+
+
+def _numbers(args: Iterable[Any]) -> List[float]:
+    return [value for value in _flatten(args) if isinstance(value, (int, float)) and not isinstance(value, bool)]
+
+
+def _round(value: float, digits: float = 0) -> float:
+    factor = 10 ** int(digits)
+    return math.floor(abs(value) * factor + 0.5) / factor * (1 if value >= 0 else -1)
+
+
+def _round_up(value: float, digits: float = 0) -> float:
+    factor = 10 ** int(digits)
+    return math.ceil(abs(value) * factor) / factor * (1 if value >= 0 else -1)
+
+
+def _round_down(value: float, digits: float = 0) -> float:
+    factor = 10 ** int(digits)
+    return math.floor(abs(value) * factor) / factor * (1 if value >= 0 else -1)
+
+
+def _ceiling(value: float, significance: float = 1) -> float:
+    return math.ceil(value / significance) * significance if significance else 0.0
+
+
+def _floor(value: float, significance: float = 1) -> float:
+    return math.floor(value / significance) * significance if significance else 0.0
+
+
+def _average(*args: Any) -> float:
+    values = _numbers(args)
+    return sum(values) / len(values)
+
+
+def _sumproduct(*arrays: List[Any]) -> float:
+    total = 0.0
+    for items in zip(*(_flatten([array]) for array in arrays)):
+        product = 1.0
+        for item in items:
+            product *= item if isinstance(item, (int, float)) else 0.0
+        total += product
+    return total
+
+
+def _power(base: float, exponent: float) -> float:
+    # 与 Excel 一致：负数的非整数次幂为 #NUM!（Python 的 ** 会得到复数），0 的负数次幂为 #DIV/0!
+    if base == 0 and exponent < 0:
+        raise ZeroDivisionError("0 的负数次幂")
+    return math.pow(base, exponent)
+
+
+def _log(value: float, base: float = 10) -> float:
+    return math.log(value, base)
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return "" if value is None else str(value)
+
+
+# Excel 函数名 -> Python 实现；IF/AND/OR 等需要短路的在翻译时特殊处理
+EXCEL_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "SUM": lambda *args: float(sum(_numbers(args))),
+    "AVERAGE": _average,
+    "MIN": lambda *args: min(_numbers(args)),
+    "MAX": lambda *args: max(_numbers(args)),
+    "COUNT": lambda *args: len(_numbers(args)),
+    "PRODUCT": lambda *args: math.prod(_numbers(args)),
+    "SUMPRODUCT": _sumproduct,
+    "ABS": abs,
+    "SQRT": math.sqrt,
+    "PI": lambda: math.pi,
+    "SIN": math.sin,
+    "COS": math.cos,
+    "TAN": math.tan,
+    "ASIN": math.asin,
+    "ACOS": math.acos,
+    "ATAN": math.atan,
+    "ATAN2": lambda x, y: math.atan2(y, x),
+    "SINH": math.sinh,
+    "COSH": math.cosh,
+    "TANH": math.tanh,
+    "RADIANS": math.radians,
+    "DEGREES": math.degrees,
+    "EXP": math.exp,
+    "LN": math.log,
+    "LOG": _log,
+    "LOG10": math.log10,
+    "POWER": _power,
+    "MOD": lambda value, divisor: value - divisor * math.floor(value / divisor),
+    "INT": lambda value: float(math.floor(value)),
+    "TRUNC": lambda value, digits=0: _round_down(value, digits),
+    "ROUND": _round,
+    "ROUNDUP": _round_up,
+    "ROUNDDOWN": _round_down,
+    "CEILING": _ceiling,
+    "FLOOR": _floor,
+    "SIGN": lambda value: float((value > 0) - (value < 0)),
+    "NOT": lambda value: not value,
+    "CONCATENATE": lambda *args: "".join(_text(arg) for arg in args),
+}
+
+_COMPARISONS = {"=": "==", "<>": "!=", "<": "<", ">": ">", "<=": "<=", ">=": ">="}
+
+
+class UnsupportedFormula(ValueError):
+    """公式中包含引擎不支持的语法或函数"""
+
+
+def normalize_ref(ref: str, default_sheet: str) -> str:
+    """把单元格引用规范化为 "工作表!A1" 形式（去掉 $ 与引号）"""
+    ref = ref.replace("$", "")
+    if "!" in ref:
+        sheet, cell = ref.rsplit("!", 1)
+        sheet = sheet.strip("'").replace("''", "'")
+    else:
+        sheet, cell = default_sheet, ref
+    return f"{sheet}!{cell.upper()}"
+
+
+class _FormulaTranslator:
+    """把 openpyxl 分词结果按 Excel 运算符优先级翻译为 Python 表达式源码"""
+
+    def __init__(self, formula: str, sheet: str, sheet_bounds: Mapping[str, Tuple[int, int]]):
+        tokenizer = Tokenizer(formula)
+        self.tokens = [token for token in tokenizer.items if token.type != Token.WSPACE]
+        self.pos = 0
+        self.sheet = sheet
+        self.sheet_bounds = sheet_bounds
+        self.references: Set[str] = set()
+
+    def translate(self) -> str:
+        source = self._comparison()
+        if self.pos != len(self.tokens):
+            raise UnsupportedFormula(f"无法解析的内容: {self.tokens[self.pos].value}")
+        return source
+
+    def _peek(self) -> Optional[Token]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _is_infix(self, *values: str) -> bool:
+        token = self._peek()
+        return token is not None and token.type == Token.OP_IN and token.value in values
+
+    def _comparison(self) -> str:
+        left = self._concat()
+        while self._is_infix(*_COMPARISONS):
+            op = _COMPARISONS[self.tokens[self.pos].value]
+            self.pos += 1
+            left = f"({left} {op} {self._concat()})"
+        return left
+
+    def _concat(self) -> str:
+        left = self._additive()
+        while self._is_infix("&"):
+            self.pos += 1
+            left = f"(T({left}) + T({self._additive()}))"
+        return left
+
+    def _additive(self) -> str:
+        left = self._term()
+        while self._is_infix("+", "-"):
+            op = self.tokens[self.pos].value
+            self.pos += 1
+            left = f"({left} {op} {self._term()})"
+        return left
+
+    def _term(self) -> str:
+        left = self._power()
+        while self._is_infix("*", "/"):
+            op = self.tokens[self.pos].value
+            self.pos += 1
+            left = f"({left} {op} {self._power()})"
+        return left
+
+    def _power(self) -> str:
+        # Excel 的乘方为左结合：2^3^2 = (2^3)^2
+        left = self._unary()
+        while self._is_infix("^"):
+            self.pos += 1
+            left = f"F['POWER']({left}, {self._unary()})"
+        return left
+
+    def _unary(self) -> str:
+        token = self._peek()
+        if token is not None and token.type == Token.OP_PRE:
+            self.pos += 1
+            operand = self._unary()
+            return f"(-{operand})" if token.value == "-" else operand
+        return self._postfix()
+
+    def _postfix(self) -> str:
+        operand = self._primary()
+        while (token := self._peek()) is not None and token.type == Token.OP_POST:
+            self.pos += 1
+            operand = f"({operand} / 100)"
+        return operand
+
+    def _primary(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise UnsupportedFormula("公式意外结束")
+        self.pos += 1
+
+        if token.type == Token.OPERAND:
+            return self._operand(token)
+        if token.type == Token.PAREN and token.subtype == Token.OPEN:
+            inner = self._comparison()
+            self._expect(Token.PAREN)
+            return inner
+        if token.type == Token.FUNC and token.subtype == Token.OPEN:
+            return self._function(token.value[:-1].upper())
+        raise UnsupportedFormula(f"无法解析的内容: {token.value}")
+
+    def _expect(self, token_type: str) -> None:
+        token = self._peek()
+        if token is None or token.type != token_type or token.subtype != Token.CLOSE:
+            raise UnsupportedFormula("括号不匹配")
+        self.pos += 1
+
+    def _operand(self, token: Token) -> str:
+        if token.subtype == Token.NUMBER:
+            return repr(float(token.value))
+        if token.subtype == Token.TEXT:
+            return repr(token.value[1:-1].replace('""', '"'))
+        if token.subtype == Token.LOGICAL:
+            return "True" if token.value.upper() == "TRUE" else "False"
+        if token.subtype == Token.ERROR:
+            return f"E({token.value!r})"
+        return self._reference(token.value)
+
+    def _reference(self, value: str) -> str:
+        ref = normalize_ref(value, self.sheet)
+        sheet, area = ref.rsplit("!", 1)
+        if ":" not in area:
+            if not area[:1].isalpha() or not area[-1:].isdigit():
+                raise UnsupportedFormula(f"不支持的名称引用: {value}")
+            self.references.add(ref)
+            return f"v({ref!r})"
+
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(area)
+        except ValueError as exc:
+            raise UnsupportedFormula(f"不支持的区域引用: {value}") from exc
+        # 整列/整行引用按工作表实际使用范围截断
+        max_used_row, max_used_col = self.sheet_bounds.get(sheet, (1, 1))
+        min_col, min_row = min_col or 1, min_row or 1
+        max_col, max_row = max_col or max_used_col, max_row or max_used_row
+        cells = tuple(
+            f"{sheet}!{get_column_letter(col)}{row}"
+            for row in range(min_row, max_row + 1)
+            for col in range(min_col, max_col + 1)
+        )
+        self.references.update(cells)
+        return f"r({cells!r})"
+
+    def _arguments(self) -> List[str]:
+        args: List[str] = []
+        token = self._peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.pos += 1
+            return args
+        while True:
+            args.append(self._comparison())
+            token = self._peek()
+            if token is None:
+                raise UnsupportedFormula("函数参数列表未闭合")
+            self.pos += 1
+            if token.type == Token.SEP and token.subtype == Token.ARG:
+                continue
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            raise UnsupportedFormula(f"无法解析的内容: {token.value}")
+
+    def _function(self, name: str) -> str:
+        args = self._arguments()
+        if name == "IF":
+            if not 2 <= len(args) <= 3:
+                raise UnsupportedFormula("IF 需要 2 或 3 个参数")
+            otherwise = args[2] if len(args) == 3 else "False"
+            return f"({args[1]} if {args[0]} else {otherwise})"
+        if name == "IFERROR":
+            return f"IFERROR(lambda: {args[0]}, lambda: {args[1]})"
+        if name in ("AND", "OR"):
+            joiner = " and " if name == "AND" else " or "
+            return f"bool({joiner.join(f'({arg})' for arg in args)})"
+        if name not in EXCEL_FUNCTIONS:
+            raise UnsupportedFormula(f"不支持的函数: {name}")
+        return f"F[{name!r}]({', '.join(args)})"
+
+
+def translate_formula(
+    formula: str, sheet: str, sheet_bounds: Optional[Mapping[str, Tuple[int, int]]] = None
+) -> Tuple[str, Set[str]]:
+    """
+    把 Excel 公式翻译为 Python 表达式
+
+    Args:
+        formula: 以 "=" 开头的公式文本
+        sheet: 公式所在工作表（用于补全无表名的引用）
+        sheet_bounds: 工作表名 -> (最大行, 最大列)，用于截断整行/整列引用
+
+    Returns:
+        tuple: (Python 表达式源码, 引用的单元格集合)
+
+    Raises:
+        UnsupportedFormula: 公式含不支持的语法或函数
+    """
+    translator = _FormulaTranslator(formula, sheet, sheet_bounds or {})
+    return translator.translate(), translator.references
+
+
+def _file_fingerprint(path: Path, sheets: Optional[Sequence[str]]) -> str:
+    stat = path.stat()
+    key = f"{CACHE_VERSION}|{sys.version_info[:2]}|{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{sheets}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+class ExcelWorkbookModel:
+    """
+    工作簿计算模型
+
+    每个公式单元格编译为一个 Python 函数；依赖图按拓扑序排列，
+    set_inputs 只把被修改单元格的下游标记为脏，recalculate 按拓扑序重算脏单元格。
+    """
+
+    def __init__(
+        self,
+        constants: Dict[str, Any],
+        formulas: Dict[str, str],
+        sources: Dict[str, str],
+        dependencies: Dict[str, Tuple[str, ...]],
+        unsupported: Dict[str, str],
+        code: Any,
+        default_sheet: str,
+    ):
+        self.default_sheet = default_sheet
+        self.formulas = formulas
+        self.sources = sources
+        self.dependencies = dependencies
+        self.unsupported = unsupported
+        self.values: Dict[str, Any] = dict(constants)
+        self._initial_constants = constants
+
+        self.dependents: Dict[str, List[str]] = {}
+        for cell, refs in dependencies.items():
+            for ref in refs:
+                self.dependents.setdefault(ref, []).append(cell)
+
+        self.order = self._topological_order()
+        self.position = {cell: index for index, cell in enumerate(self.order)}
+
+        # 生成的代码只会用到 bool（AND/OR 的翻译）
+        namespace: Dict[str, Any] = {"__builtins__": {"bool": bool}}
+        exec(code, namespace)
+        self._functions: Dict[str, Callable[..., Any]] = {
+            cell: namespace[f"c{index}"] for index, cell in enumerate(sorted(sources))
+        }
+        self._dirty: Set[str] = set(self.order)
+        self.recalculated = 0
+
+    def _topological_order(self) -> List[str]:
+        """Kahn 拓扑排序；循环引用中的单元格追加在末尾并记为不支持"""
+        indegree = {
+            cell: sum(1 for ref in refs if ref in self.dependencies) for cell, refs in self.dependencies.items()
+        }
+        queue = deque(sorted(cell for cell, degree in indegree.items() if degree == 0))
+        order: List[str] = []
+        while queue:
+            cell = queue.popleft()
+            order.append(cell)
+            for dependent in self.dependents.get(cell, ()):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) < len(self.dependencies):
+            placed = set(order)
+            for cell in sorted(self.dependencies):
+                if cell not in placed:
+                    self.unsupported.setdefault(cell, "循环引用")
+                    order.append(cell)
+        return order
+
+    def _value(self, ref: str) -> Any:
+        value = self.values.get(ref)
+        if value is None:
+            return 0.0
+        if isinstance(value, CellError):
+            raise _Propagate(value)
+        return value
+
+    def _range(self, refs: Tuple[str, ...]) -> List[Any]:
+        values = []
+        for ref in refs:
+            value = self.values.get(ref)
+            if isinstance(value, CellError):
+                raise _Propagate(value)
+            values.append(value)
+        return values
+
+    @staticmethod
+    def _if_error(value: Callable[[], Any], fallback: Callable[[], Any]) -> Any:
+        try:
+            result = value()
+        except (_Propagate, ArithmeticError, TypeError, ValueError):
+            return fallback()
+        return fallback() if isinstance(result, CellError) else result
+
+    def _evaluate_cell(self, cell: str) -> Any:
+        if cell in self.unsupported:
+            return CellError("#N/A")
+        try:
+            return self._functions[cell](
+                self._value, self._range, EXCEL_FUNCTIONS, _text, _error_literal, self._if_error
+            )
+        except _Propagate as exc:
+            return exc.error
+        except ZeroDivisionError:
+            return CellError("#DIV/0!")
+        except (ValueError, OverflowError):
+            return CellError("#NUM!")
+        except TypeError:
+            return CellError("#VALUE!")
+
+    def _mark_dirty(self, cells: Iterable[str]) -> None:
+        stack = list(cells)
+        dirty = self._dirty
+        while stack:
+            cell = stack.pop()
+            for dependent in self.dependents.get(cell, ()):
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    stack.append(dependent)
+
+    def set_inputs(self, inputs: Mapping[str, Any], sheet: Optional[str] = None) -> None:
+        """
+        修改输入单元格并标记下游为脏
+
+        Args:
+            inputs: 单元格引用 -> 新值，引用可省略工作表名（此时使用 sheet 参数）
+            sheet: 默认工作表名
+
+        Raises:
+            ValueError: 试图覆盖公式单元格
+        """
+        default_sheet = sheet or self.default_sheet
+        changed = []
+        for ref, value in inputs.items():
+            cell = normalize_ref(ref, default_sheet)
+            if cell in self.dependencies:
+                raise ValueError(f"单元格 {cell} 是公式单元格，不能作为输入")
+            if self.values.get(cell) != value:
+                self.values[cell] = value
+                changed.append(cell)
+        self._mark_dirty(changed)
+
+    def recalculate(self) -> int:
+        """按拓扑序重算全部脏单元格，返回重算的单元格数"""
+        dirty = self._dirty
+        if not dirty:
+            return 0
+        if len(dirty) * 4 < len(self.order):
+            cells = sorted(dirty, key=self.position.__getitem__)
+        else:
+            cells = [cell for cell in self.order if cell in dirty]
+        values = self.values
+        for cell in cells:
+            values[cell] = self._evaluate_cell(cell)
+        dirty.clear()
+        self.recalculated = len(cells)
+        return len(cells)
+
+    def get(self, ref: str, sheet: Optional[str] = None) -> Any:
+        """读取单元格的当前值（必要时先重算）"""
+        if self._dirty:
+            self.recalculate()
+        return self.values.get(normalize_ref(ref, sheet or self.default_sheet))
+
+    def evaluate(
+        self, inputs: Mapping[str, Any], outputs: Sequence[str], sheet: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """设置输入并返回指定输出单元格的值"""
+        self.set_inputs(inputs, sheet)
+        return {ref: self.get(ref, sheet) for ref in outputs}
+
+    def reset(self) -> None:
+        """恢复工作簿中的原始输入值"""
+        self.values = dict(self._initial_constants)
+        self._dirty = set(self.order)
+
+
+# 读取结果：(工作表名列表, 各表 (最大行, 最大列), 常量单元格, 公式单元格, 无法读取的公式单元格 -> 原因)
+_WorkbookContents = Tuple[List[str], Dict[str, Tuple[int, int]], Dict[str, Any], Dict[str, str], Dict[str, str]]
+
+
+def _read_xlsx(path: Path, sheets: Optional[Sequence[str]]) -> _WorkbookContents:
+    """用 openpyxl 读取 .xlsx/.xlsm 的常量与公式"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, data_only=False, read_only=False)
+    names = list(sheets) if sheets else workbook.sheetnames
+    for name in names:
+        if name not in workbook.sheetnames:
+            raise ValueError(f"工作簿中不存在工作表: {name}")
+    bounds = {ws.title: (ws.max_row, ws.max_column) for ws in workbook.worksheets}
+
+    constants: Dict[str, Any] = {}
+    formulas: Dict[str, str] = {}
+    for name in names:
+        for row in workbook[name].iter_rows():
+            for cell in row:
+                if cell.value is None:
+                    continue
+                ref = f"{name}!{cell.coordinate}"
+                if cell.data_type == "f" and isinstance(cell.value, str):
+                    formulas[ref] = cell.value
+                elif cell.data_type == "e":
+                    constants[ref] = CellError(str(cell.value))
+                else:
+                    constants[ref] = cell.value
+    return names, bounds, constants, formulas, {}
+
+
+def _parse_workbook(path: Path, sheets: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """读取工作簿公式并翻译，返回可缓存的中间结果"""
+    if path.suffix.lower() == ".xls":
+        from app.services.xls_reader import read_xls
+
+        names, bounds, constants, formulas, unreadable = read_xls(path, sheets)
+    else:
+        names, bounds, constants, formulas, unreadable = _read_xlsx(path, sheets)
+
+    sources: Dict[str, str] = {}
+    dependencies: Dict[str, Tuple[str, ...]] = {ref: () for ref in unreadable}
+    unsupported: Dict[str, str] = dict(unreadable)
+    for ref, formula in formulas.items():
+        sheet = ref.rsplit("!", 1)[0]
+        try:
+            source, references = translate_formula(formula, sheet, bounds)
+        except UnsupportedFormula as exc:
+            unsupported[ref] = str(exc)
+            dependencies[ref] = ()
+            continue
+        sources[ref] = source
+        dependencies[ref] = tuple(sorted(references))
+
+    # 所有公式编译进同一个模块代码对象，便于整体 marshal 缓存
+    lines = [
+        f"def c{index}(v, r, F, T, E, IFERROR):\n    return {sources[ref]}"
+        for index, ref in enumerate(sorted(sources))
+    ]
+    code = compile("\n".join(lines) or "pass", str(path), "exec")
+    return {
+        "default_sheet": names[0],
+        "constants": constants,
+        "formulas": formulas,
+        "sources": sources,
+        "dependencies": dependencies,
+        "unsupported": unsupported,
+        "code": marshal.dumps(code),
+    }
+
+
+def load_workbook_model(
+    path: Path,
+    sheets: Optional[Sequence[str]] = None,
+    cache_dir: Optional[Path] = CACHE_DIR,
+) -> ExcelWorkbookModel:
+    """
+    加载工作簿计算模型，优先使用磁盘缓存
+
+    Args:
+        path: .xlsx/.xlsm 文件路径，或 .xls 文件路径（需要安装 xlrd）
+        sheets: 需要加载的工作表，默认全部
+        cache_dir: 缓存目录，None 表示不使用缓存
+
+    Returns:
+        ExcelWorkbookModel: 计算模型
+
+    Raises:
+        ValueError: 文件格式不支持、工作表不存在或读取 .xls 时未安装 xlrd
+    """
+    path = Path(path)
+    if path.suffix.lower() not in (".xlsx", ".xlsm", ".xls"):
+        raise ValueError(f"仅支持 .xlsx/.xlsm/.xls 工作簿: {path.name}")
+    if not path.exists():
+        raise ValueError(f"工作簿不存在: {path}")
+
+    parsed: Optional[Dict[str, Any]] = None
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / f"{_file_fingerprint(path, sheets)}.pickle"
+        if cache_path.exists():
+            try:
+                with cache_path.open("rb") as f:
+                    parsed = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                parsed = None
+
+    if parsed is None:
+        parsed = _parse_workbook(path, sheets)
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with tmp_path.open("wb") as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(cache_path)
+
+    return ExcelWorkbookModel(
+        constants=parsed["constants"],
+        formulas=parsed["formulas"],
+        sources=parsed["sources"],
+        dependencies=parsed["dependencies"],
+        unsupported=dict(parsed["unsupported"]),
+        code=marshal.loads(parsed["code"]),
+        default_sheet=parsed["default_sheet"],
+    )
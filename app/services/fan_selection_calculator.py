@@ -3,15 +3,22 @@
 """
 import math
 from typing import Dict, Any, List, Optional
+import numpy as np
+
 from app.models.schemas import CurrentCalcResponse
-from app.db.database import get_fan_performance
+from app.db.database import find_fan_candidates
+from app.db.fan_envelope import (
+    SUCTION_FACTORS, compressibility_factor, fan_pressure, flow_factor, pressure_factor, tip_speed,
+)
+from app.db.fan_store import get_fan_curve
 
 
 class FanSelectionCalculator:
     """风机选型计算器"""
     
     SCENARIO_NAMES = {
-        "fan_selection": "风机选型计算"
+        "fan_selection": "风机选型计算",
+        "fan_search": "风机型号搜索"
     }
     
     def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
@@ -27,6 +34,8 @@ class FanSelectionCalculator:
         """
         if scenario == "fan_selection":
             return self._calculate_fan_selection(params)
+        elif scenario == "fan_search":
+            return self._calculate_fan_search(params)
         else:
             raise ValueError(f"未知的计算场景: {scenario}")
     
@@ -82,8 +91,7 @@ class FanSelectionCalculator:
         P_total = P_atm + P_inlet
         if P_total <= 0:
             raise ValueError("当地大气压与进口压力之和必须大于0")
-        pressure_ratio = P / P_total
-        Z = (k / (k - 1)) * (((1 + pressure_ratio) ** ((k - 1) / k)) - 1) * (pressure_ratio ** (-1))
+        Z = compressibility_factor(P, P_total, k)
         intermediate_results["Z"] = Z
         formula_parts.append(f"<br>压缩性系数: Z = (k/(k-1)) × ((1 + P/(P<sub>atm</sub> + P<sub>inlet</sub>))^((k-1)/k) - 1) × (P/(P<sub>atm</sub> + P<sub>inlet</sub>))^(-1)<br>")
         formula_parts.append(f"  = ({k}/({k}-1)) × ((1 + {P}/({P_atm:.2f} + {P_inlet}))^(({k}-1)/{k}) - 1) × ({P}/({P_atm:.2f} + {P_inlet}))^(-1) = {Z:.6f}")
@@ -99,10 +107,10 @@ class FanSelectionCalculator:
             # 使用用户提供的性能点
             points = performance_points
         else:
-            # 从SQLite数据库查询
-            db_points = get_fan_performance(fan_type)
-            if db_points and len(db_points) > 0:
-                points = db_points
+            # 从内存中的性能曲线缓存读取（启动时由SQLite数据库加载）
+            curve = get_fan_curve(fan_type)
+            if curve is not None and len(curve) > 0:
+                points = curve.points
             else:
                 raise ValueError(f"未找到风机型号 {fan_type} 的性能数据，请提供性能点数据或确保数据库中已导入该型号的数据")
         
@@ -131,12 +139,8 @@ class FanSelectionCalculator:
             Q_point = phi * (math.pi / 4) * (D ** 2) * math.pi * D * n / 60 * 3600 * suction_factor
             intermediate_results[f"Q_{idx}"] = Q_point
             
-            # 计算全压
-            # 对于BB24和BB50型号，需要特殊处理
-            if fan_type in ["BB24", "BB50"]:
-                P_point = psi_p * rho_working * (u ** 2) / Z * 0.9784
-            else:
-                P_point = psi_p * rho_working * (u ** 2)
+            # 计算全压（BB24和BB50型号按压缩性修正，与型号搜索共用同一公式）
+            P_point = fan_pressure(fan_type, psi_p, rho_working, u, Z)
             intermediate_results[f"P_{idx}"] = P_point
             
             # 计算内功率 P_internal = Q/3600 × P / eta / 10
@@ -160,7 +164,8 @@ class FanSelectionCalculator:
             })
             
             formula_parts.append(f"<br>点{idx}: Q = {phi} × π/4 × {D}² × π × {D} × {n}/60 × 3600 × {suction_factor} = {Q_point:.2f} m³/h")
-            formula_parts.append(f"<br>  P = {psi_p} × {rho_working:.6f} × {u:.2f}² = {P_point:.2f} Pa")
+            correction = f" / {Z:.6f} × 0.9784" if pressure_factor(fan_type, Z) != 1 else ""
+            formula_parts.append(f"<br>  P = {psi_p} × {rho_working:.6f} × {u:.2f}²{correction} = {P_point:.2f} Pa")
             formula_parts.append(f"<br>  P<sub>internal</sub> = {Q_point:.2f}/3600 × {P_point:.2f} / ({eta}/100) / 10 = {P_internal:.2f} kW")
             formula_parts.append(f"<br>  P<sub>shaft</sub> = {P_internal:.2f}/0.98 × {'1.15' if T < 200 else '1.3'} = {P_shaft:.2f} kW")
         
@@ -199,3 +204,104 @@ class FanSelectionCalculator:
             scenario_name=self.SCENARIO_NAMES["fan_selection"]
         )
 
+    @staticmethod
+    def _evaluate_curve_at(curve, Q: float, rho: float, D: float, n: float, suction_factor: int, Z: float):
+        """
+        在给定机号与转速下，按所需流量在性能曲线上插值
+
+        全压与风机选型计算相同，由 fan_pressure 计算（含 BB24/BB50 的压缩性修正）。
+
+        Returns:
+            tuple: (phi, psi_p, eta, 可提供的全压)，流量超出曲线范围时返回 None
+        """
+        phi = Q / flow_factor(D, n, suction_factor)
+        if not curve.phi.min() <= phi <= curve.phi.max():
+            return None
+        order = np.argsort(curve.phi)
+        psi_p = float(np.interp(phi, curve.phi[order], curve.psi_p[order]))
+        eta = float(np.interp(phi, curve.phi[order], curve.eta[order]))
+        return phi, psi_p, eta, fan_pressure(curve.fan_type, psi_p, rho, tip_speed(D, n), Z)
+
+    def _calculate_fan_search(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+        """风机型号搜索：用性能包络索引筛选候选方案，再按性能曲线逐个校核"""
+        Q = params.get("Q")  # 流量(m³/h)
+        P = params.get("P")  # 全压(Pa)
+        H = params.get("H", 0)  # 海拔高度(m)
+        P_inlet = params.get("P_inlet", 0)  # 进口压力(Pa)
+        T = params.get("T")  # 工作温度(℃)
+        k = params.get("k", 1.4)  # 绝热指数
+        suction_type = params.get("suction_type", "单吸")  # 单吸/双吸
+        rho_standard = params.get("rho_standard", 1.2)  # 标准密度(kg/m³)
+        pressure_margin = params.get("pressure_margin", 0.15)  # 允许的全压富余比例
+        limit = int(params.get("limit", 10))  # 返回的方案数
+
+        if Q is None or Q <= 0:
+            raise ValueError("流量Q必须大于0")
+        if P is None or P <= 0:
+            raise ValueError("全压P必须大于0")
+        if T is None:
+            raise ValueError("工作温度T必须提供")
+        if suction_type not in SUCTION_FACTORS:
+            raise ValueError(f"吸入方式必须为: {', '.join(SUCTION_FACTORS)}")
+        if pressure_margin < 0:
+            raise ValueError("全压富余比例不能小于0")
+        if k <= 1:
+            raise ValueError("绝热指数k必须大于1")
+
+        # 工况密度与压缩性系数（与风机选型计算相同）
+        P_atm = 101325 * ((1 - 0.02257 * H / 1000) ** 5.256)
+        rho_working = (273 / (T + 273)) * ((P_atm + P_inlet) / 101325) * rho_standard
+        if P_atm + P_inlet <= 0:
+            raise ValueError("当地大气压与进口压力之和必须大于0")
+        Z = compressibility_factor(P, P_atm + P_inlet, k)
+
+        candidates = find_fan_candidates(Q, P, rho_working, suction_type, pressure_margin, Z)
+        suction_factor = SUCTION_FACTORS[suction_type]
+
+        matches = []
+        for fan_type, size_no, n in candidates:
+            curve = get_fan_curve(fan_type)
+            if curve is None or len(curve) < 2:
+                continue
+            D = size_no / 10
+            point = self._evaluate_curve_at(curve, Q, rho_working, D, n, suction_factor, Z)
+            if point is None:
+                continue
+            phi, psi_p, eta, P_available = point
+            if not P <= P_available <= P * (1 + pressure_margin):
+                continue
+            # 内功率与轴功率沿用风机选型计算的公式
+            P_internal = (Q / 3600) * P_available / (eta / 100) / 10
+            P_shaft = P_internal / 0.98 * (1.15 if T < 200 else 1.3)
+            matches.append({
+                "fan_model": f"{fan_type}№{size_no:g}",
+                "fan_type": fan_type,
+                "D": D,
+                "n": n,
+                "phi": round(phi, 4),
+                "psi_p": round(psi_p, 4),
+                "eta": round(eta, 1),
+                "P_available": round(P_available, 2),
+                "P_internal": round(P_internal, 2),
+                "P_shaft": round(P_shaft, 2),
+            })
+        matches.sort(key=lambda item: (-item["eta"], item["P_shaft"]))
+
+        formula = (
+            f"工况密度: ρ<sub>working</sub> = {rho_working:.6f} kg/m³<br>"
+            f"性能包络筛选: {len(candidates)} 个候选方案（型号 × 机号 × 转速）<br>"
+            f"校核: φ = Q / (π/4 × D² × π × D × n/60 × 3600)，"
+            f"P ≤ ψ<sub>p</sub>(φ) × ρ × u²（BB24/BB50 再 / Z × 0.9784，Z = {Z:.6f}）≤ P × (1 + {pressure_margin})<br>"
+            f"满足要求的方案: {len(matches)} 个，按内效率排序"
+        )
+        return CurrentCalcResponse(
+            result={
+                "rho_working": round(rho_working, 6),
+                "Z": round(Z, 6),
+                "candidates": len(candidates),
+                "matches": matches[:limit],
+            },
+            unit="",
+            formula=formula,
+            scenario_name=self.SCENARIO_NAMES["fan_search"]
+        )
@@ -0,0 +1,523 @@
+"""
+配置公式编译器
+将 configs/tools/*.yaml 中各场景的 formula 字符串（如 I = P / (U × cosφ)）
+按安全的算术文法解析为语法树，进行常量折叠后编译为 Python 函数，
+使简单工具无需手写计算器即可通过配置定义。
+"""
+import ast
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from app.models.schemas import CurrentCalcResponse
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# 语法树节点：("num", 值) / ("var", 符号) / ("neg", 子节点) /
+# ("bin", 运算符, 左, 右) / ("call", 函数名, [参数...])
+Node = Tuple[Any, ...]
+
+# 参数校验项：(参数名, 显示名, 最小值, 最大值)
+Bound = Tuple[str, str, Optional[float], Optional[float]]
+
+CONSTANTS = {"π": math.pi, "pi": math.pi}
+
+FUNCTIONS: Dict[str, Callable[..., float]] = {
+    "sqrt": math.sqrt,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "exp": math.exp,
+    "ln": math.log,
+    "log10": math.log10,
+    "abs": abs,
+    "min": min,
+    "max": max,
+}
+
+SUPERSCRIPTS = {"⁰": "0", "¹": "1", "²": "2", "³": "3", "⁴": "4", "⁵": "5",
+                "⁶": "6", "⁷": "7", "⁸": "8", "⁹": "9", "⁻": "-"}
+
+OPERATOR_ALIASES = {"×": "*", "·": "*", "÷": "/", "−": "-", "**": "^"}
+
+_TOKEN_RE = re.compile(
+    r"\s*(?:"
+    r"(?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)"
+    r"|(?P<sup>[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+)"
+    r"|(?P<name>[^\W\d⁰¹²³⁴⁵⁶⁷⁸⁹][^\W⁰¹²³⁴⁵⁶⁷⁸⁹]*)"
+    r"|(?P<op>\*\*|[-+*/^×·÷−(),=√])"
+    r")"
+)
+
+_BINARY_OPS = {
+    "+": ast.Add,
+    "-": ast.Sub,
+    "*": ast.Mult,
+    "/": ast.Div,
+    "^": ast.Pow,
+}
+
+
+class FormulaSyntaxError(ValueError):
+    """公式无法按安全文法解析。"""
+
+
+def tokenize(text: str) -> List[Tuple[str, str]]:
+    """将公式切分为 (类型, 值) 记号列表"""
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            raise FormulaSyntaxError(f"无法识别的字符: {text[position:]!r}")
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "op":
+            value = OPERATOR_ALIASES.get(value, value)
+        elif kind == "sup":
+            value = "".join(SUPERSCRIPTS[char] for char in value)
+        tokens.append((kind, value))
+    return tokens
+
+
+class _Parser:
+    """
+    递归下降解析器
+
+    expr    := term (('+' | '-') term)*
+    term    := unary (('*' | '/') unary | 相邻隐式乘法)*
+    unary   := ('-' | '+') unary | power
+    power   := postfix ('^' unary)?
+    postfix := primary 上标指数*
+    primary := 数字 | 符号 | 函数 '(' 参数 ')' | '(' expr ')' | '√' postfix
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.index = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise FormulaSyntaxError("公式意外结束")
+        self.index += 1
+        return token
+
+    def expect(self, value: str) -> None:
+        kind, actual = self.take()
+        if kind != "op" or actual != value:
+            raise FormulaSyntaxError(f"期望 {value!r}，实际为 {actual!r}")
+
+    def at_op(self, *values: str) -> bool:
+        token = self.peek()
+        return token is not None and token[0] == "op" and token[1] in values
+
+    def starts_primary(self) -> bool:
+        token = self.peek()
+        if token is None:
+            return False
+        return token[0] in ("number", "name") or (token[0] == "op" and token[1] in ("(", "√"))
+
+    def parse(self) -> Node:
+        node = self.expr()
+        if self.peek() is not None:
+            raise FormulaSyntaxError(f"多余的内容: {self.peek()[1]!r}")
+        return node
+
+    def expr(self) -> Node:
+        node = self.term()
+        while self.at_op("+", "-"):
+            op = self.take()[1]
+            node = ("bin", op, node, self.term())
+        return node
+
+    def term(self) -> Node:
+        node = self.unary()
+        while True:
+            if self.at_op("*", "/"):
+                op = self.take()[1]
+                node = ("bin", op, node, self.unary())
+            elif self.starts_primary():
+                node = ("bin", "*", node, self.power())
+            else:
+                return node
+
+    def unary(self) -> Node:
+        if self.at_op("-"):
+            self.take()
+            return ("neg", self.unary())
+        if self.at_op("+"):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self) -> Node:
+        node = self.postfix()
+        if self.at_op("^"):
+            self.take()
+            node = ("bin", "^", node, self.unary())
+        return node
+
+    def postfix(self) -> Node:
+        node = self.primary()
+        while self.peek() is not None and self.peek()[0] == "sup":
+            exponent = self.take()[1]
+            try:
+                node = ("bin", "^", node, ("num", float(int(exponent))))
+            except ValueError as exc:
+                raise FormulaSyntaxError(f"无效的上标指数: {exponent!r}") from exc
+        return node
+
+    def primary(self) -> Node:
+        kind, value = self.take()
+        if kind == "number":
+            return ("num", float(value))
+        if kind == "op" and value == "(":
+            node = self.expr()
+            self.expect(")")
+            return node
+        if kind == "op" and value == "√":
+            return ("call", "sqrt", [self.postfix()])
+        if kind == "name":
+            if value in FUNCTIONS and self.at_op("("):
+                self.take()
+                args = [self.expr()]
+                while self.at_op(","):
+                    self.take()
+                    args.append(self.expr())
+                self.expect(")")
+                return ("call", value, args)
+            if value in CONSTANTS:
+                return ("num", CONSTANTS[value])
+            return ("var", value)
+        raise FormulaSyntaxError(f"意外的记号: {value!r}")
+
+
+def parse_formula(text: str) -> Tuple[Optional[str], Node]:
+    """
+    解析公式字符串
+
+    Args:
+        text: 公式，例如 "I = P / (U × cosφ)"；等号左侧为输出名，可省略
+
+    Returns:
+        tuple: (输出名或None, 右侧表达式语法树)
+    """
+    tokens = tokenize(text)
+    output = None
+    if len(tokens) >= 2 and tokens[0][0] == "name" and tokens[1] == ("op", "="):
+        output = tokens[0][1]
+        tokens = tokens[2:]
+    if any(token == ("op", "=") for token in tokens):
+        raise FormulaSyntaxError("公式只能包含一个等号")
+    if not tokens:
+        raise FormulaSyntaxError("公式表达式为空")
+    return output, _Parser(tokens).parse()
+
+
+def _evaluate_constant(op: str, left: float, right: float) -> float:
+    if op == "+":
+        return left + right
+    if op == "-":
+        return left - right
+    if op == "*":
+        return left * right
+    if op == "/":
+        return left / right
+    return left ** right
+
+
+def fold_constants(node: Node) -> Node:
+    """常量折叠：把不含变量的子树预先计算为数字"""
+    kind = node[0]
+    if kind in ("num", "var"):
+        return node
+    if kind == "neg":
+        child = fold_constants(node[1])
+        if child[0] == "num":
+            return ("num", -child[1])
+        return ("neg", child)
+    if kind == "bin":
+        left = fold_constants(node[2])
+        right = fold_constants(node[3])
+        if left[0] == "num" and right[0] == "num":
+            try:
+                return ("num", _evaluate_constant(node[1], left[1], right[1]))
+            except (ZeroDivisionError, OverflowError, ValueError):
+                pass
+        return ("bin", node[1], left, right)
+    args = [fold_constants(arg) for arg in node[2]]
+    if all(arg[0] == "num" for arg in args):
+        try:
+            return ("num", float(FUNCTIONS[node[1]](*[arg[1] for arg in args])))
+        except (ValueError, OverflowError):
+            pass
+    return ("call", node[1], args)
+
+
+def collect_symbols(node: Node) -> List[str]:
+    """按首次出现顺序列出语法树中的变量符号"""
+    symbols: List[str] = []
+
+    def visit(current: Node) -> None:
+        if current[0] == "var":
+            if current[1] not in symbols:
+                symbols.append(current[1])
+        elif current[0] == "neg":
+            visit(current[1])
+        elif current[0] == "bin":
+            visit(current[2])
+            visit(current[3])
+        elif current[0] == "call":
+            for arg in current[2]:
+                visit(arg)
+
+    visit(node)
+    return symbols
+
+
+def _to_python_ast(node: Node, names: Dict[str, str]) -> ast.expr:
+    kind = node[0]
+    if kind == "num":
+        return ast.Constant(node[1])
+    if kind == "var":
+        return ast.Name(id=names[node[1]], ctx=ast.Load())
+    if kind == "neg":
+        return ast.UnaryOp(op=ast.USub(), operand=_to_python_ast(node[1], names))
+    if kind == "bin":
+        return ast.BinOp(
+            left=_to_python_ast(node[2], names),
+            op=_BINARY_OPS[node[1]](),
+            right=_to_python_ast(node[3], names),
+        )
+    return ast.Call(
+        func=ast.Name(id=f"_f_{node[1]}", ctx=ast.Load()),
+        args=[_to_python_ast(arg, names) for arg in node[2]],
+        keywords=[],
+    )
+
+
+@dataclass
+class CompiledFormula:
+    """编译后的场景公式"""
+
+    source: str  # 原始公式字符串
+    output: Optional[str]  # 输出名（等号左侧）
+    parameters: List[str]  # 函数按位置接收的参数名（与配置中的 parameter name 一致）
+    tree: Node  # 常量折叠后的语法树
+    func: Callable[..., float] = field(repr=False)  # 按 parameters 顺序接收位置参数
+
+    def evaluate(self, params: Dict[str, Any], bounds: Optional[List[Bound]] = None) -> float:
+        """
+        从参数字典中取值并计算
+
+        Args:
+            params: 参数字典
+            bounds: 按 parameters 顺序的 (参数名, 显示名, 最小值, 最大值)，默认只检查是否提供
+
+        Returns:
+            float: 计算结果
+
+        Raises:
+            ValueError: 参数缺失、不是数值或超出范围，以及除以0、定义域错误、溢出或结果为复数
+        """
+        if bounds is None:
+            bounds = [(name, f"参数{name}", None, None) for name in self.parameters]
+        values = []
+        for name, label, minimum, maximum in bounds:
+            value = params.get(name)
+            if value is None:
+                raise ValueError(f"{label}必须提供")
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"{label}必须是数值")
+            if minimum is not None and value < minimum:
+                raise ValueError(f"{label}不能小于{minimum}")
+            if maximum is not None and value > maximum:
+                raise ValueError(f"{label}不能大于{maximum}")
+            values.append(value)
+        try:
+            result = self.func(*values)
+        except ZeroDivisionError as exc:
+            raise ValueError(f"公式 {self.source} 计算时出现除以0") from exc
+        except OverflowError as exc:
+            raise ValueError(f"公式 {self.source} 计算结果溢出") from exc
+        except ValueError as exc:
+            # math 函数的定义域错误，如 sqrt(-1)
+            raise ValueError(f"公式 {self.source} 计算时超出定义域: {exc}") from exc
+        if isinstance(result, complex):
+            # 负数的非整数次幂
+            raise ValueError(f"公式 {self.source} 的计算结果不是实数")
+        try:
+            # 整数参数的乘方可能得到超出浮点范围的大整数
+            return float(result)
+        except OverflowError as exc:
+            raise ValueError(f"公式 {self.source} 计算结果溢出") from exc
+
+
+def compile_formula(text: str, symbols: Optional[Dict[str, str]] = None) -> CompiledFormula:
+    """
+    编译公式为 Python 函数
+
+    Args:
+        text: 公式字符串
+        symbols: 公式符号 -> 参数名 的映射；未映射的符号按同名参数处理
+
+    Returns:
+        CompiledFormula: 编译结果
+
+    Raises:
+        FormulaSyntaxError: 公式不符合安全文法
+    """
+    symbols = symbols or {}
+    output, tree = parse_formula(text)
+    tree = fold_constants(tree)
+
+    parameters: List[str] = []
+    names: Dict[str, str] = {}
+    for symbol in collect_symbols(tree):
+        parameter = symbols.get(symbol, symbol)
+        if parameter not in parameters:
+            parameters.append(parameter)
+        names[symbol] = f"_p{parameters.index(parameter)}"
+
+    lambda_node = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=f"_p{index}") for index in range(len(parameters))],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=_to_python_ast(tree, names),
+        )
+    )
+    ast.fix_missing_locations(lambda_node)
+    code = compile(lambda_node, f"<formula {text}>", "eval")
+    namespace: Dict[str, Any] = {"__builtins__": {}}
+    namespace.update({f"_f_{name}": func for name, func in FUNCTIONS.items()})
+    func = eval(code, namespace)  # noqa: S307 - 代码由白名单语法树生成
+
+    return CompiledFormula(source=text, output=output, parameters=parameters, tree=tree, func=func)
+
+
+def split_output(output: str) -> Tuple[str, str]:
+    """拆分 outputs 中的 "current(A)" 写法为 (名称, 单位)"""
+    match = re.match(r"^\s*([^()]+?)\s*\(([^()]*)\)\s*$", output)
+    if match:
+        return match.group(1), match.group(2)
+    return output.strip(), ""
+
+
+class FormulaCalculator:
+    """
+    基于配置公式的计算器
+
+    由工具 YAML 配置构建，实现与手写计算器相同的 calculate(scenario, params) 接口。
+    公式引用了场景参数之外符号的场景不会被编译，记录在 skipped 中。
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.tool_id = config.get("id", "")
+        parameters = config.get("parameters") or []
+        self.parameter_specs = {param["name"]: param for param in parameters}
+        symbols = {param["symbol"]: param["name"] for param in parameters if param.get("symbol")}
+
+        self.SCENARIO_NAMES: Dict[str, str] = {}
+        self.formulas: Dict[str, CompiledFormula] = {}
+        self.units: Dict[str, str] = {}
+        self.skipped: Dict[str, str] = {}
+        self._bounds: Dict[str, List[Bound]] = {}
+
+        for scenario in config.get("scenarios") or []:
+            scenario_id = scenario["id"]
+            try:
+                compiled = compile_formula(scenario["formula"], symbols)
+            except FormulaSyntaxError as exc:
+                self.skipped[scenario_id] = str(exc)
+                continue
+            allowed = set(scenario.get("parameters") or [])
+            unknown = [name for name in compiled.parameters if name not in allowed]
+            if unknown:
+                self.skipped[scenario_id] = f"公式引用了场景参数之外的符号: {', '.join(unknown)}"
+                continue
+            outputs = scenario.get("outputs") or []
+            self.units[scenario_id] = split_output(outputs[0])[1] if outputs else ""
+            self.SCENARIO_NAMES[scenario_id] = scenario.get("title", scenario_id)
+            self.formulas[scenario_id] = compiled
+            self._bounds[scenario_id] = [
+                (
+                    name,
+                    self.parameter_specs.get(name, {}).get("label", name),
+                    self.parameter_specs.get(name, {}).get("minimum"),
+                    self.parameter_specs.get(name, {}).get("maximum"),
+                )
+                for name in compiled.parameters
+            ]
+
+    def evaluate(self, scenario: str, params: Dict[str, Any]) -> float:
+        """只返回数值结果的快速路径（含配置中的取值范围校验）"""
+        compiled = self.formulas.get(scenario)
+        if compiled is None:
+            raise ValueError(f"未知的计算场景: {scenario}")
+        return compiled.evaluate(params, self._bounds[scenario])
+
+    def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
+        """根据场景计算"""
+        result = self.evaluate(scenario, params)
+        return CurrentCalcResponse(
+            result=round(result, 4),
+            unit=self.units.get(scenario, ""),
+            formula=self.formulas[scenario].source,
+            scenario_name=self.SCENARIO_NAMES[scenario],
+        )
+
+
+def resolve_config_path(path: str) -> Path:
+    """相对路径按项目根目录解析"""
+    config_path = Path(path)
+    if not config_path.is_absolute():
+        config_path = BASE_DIR / config_path
+    return config_path
+
+
+_calculators: Dict[Path, FormulaCalculator] = {}
+_calculators_lock = threading.Lock()
+
+
+def load_formula_calculator(path: str) -> FormulaCalculator:
+    """读取工具 YAML 配置并编译全部场景公式（按路径缓存）"""
+    config_path = resolve_config_path(path)
+    calculator = _calculators.get(config_path)
+    if calculator is not None:
+        return calculator
+    with _calculators_lock:
+        if config_path not in _calculators:
+            if not config_path.exists():
+                raise FileNotFoundError(f"公式配置文件不存在: {config_path}")
+            with config_path.open("r", encoding="utf-8") as f:
+                raw = yaml.safe_load(f) or {}
+            _calculators[config_path] = FormulaCalculator(raw)
+        return _calculators[config_path]
+
+
+def invalidate_formula_calculator(path: Optional[str] = None) -> None:
+    """配置文件变化后丢弃缓存的计算器；path 为 None 时全部丢弃"""
+    with _calculators_lock:
+        if path is None:
+            _calculators.clear()
+        else:
+            _calculators.pop(resolve_config_path(path), None)
@@ -0,0 +1,309 @@
+"""
+计算历史记录
+请求路径只把原始对象放入有界内存队列，后台线程完成 JSON 序列化并按批在一个事务内写入
+calculation_history 表，避免序列化与同步写库增加请求延迟。
+
+历史表保存在单独的运行时数据库（默认 data/history.db，不纳入版本管理，可用环境变量
+HISTORY_DB_PATH 指定），只保留最新的 HISTORY_MAX_ROWS 条记录，更早的记录在每次批量写入后删除。
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.db.database import BASE_DIR, get_read_connection, get_write_connection
+
+logger = logging.getLogger(__name__)
+
+CREATE_HISTORY_SQL = """
+    CREATE TABLE IF NOT EXISTS calculation_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at REAL NOT NULL,
+        tool TEXT NOT NULL,
+        scenario TEXT,
+        params TEXT NOT NULL,
+        result TEXT,
+        status TEXT NOT NULL,
+        error TEXT,
+        latency_ms REAL NOT NULL
+    )
+"""
+CREATE_HISTORY_INDEXES_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_history_created ON calculation_history(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_history_tool ON calculation_history(tool, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_history_scenario ON calculation_history(scenario, created_at)",
+)
+INSERT_HISTORY_SQL = """
+    INSERT INTO calculation_history
+    (created_at, tool, scenario, params, result, status, error, latency_ms)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# AUTOINCREMENT 的 id 单调递增，按 id 删除即保留最新的记录，只走主键
+PRUNE_HISTORY_SQL = "DELETE FROM calculation_history WHERE id <= (SELECT MAX(id) FROM calculation_history) - ?"
+
+HISTORY_DB_PATH = Path(os.environ.get("HISTORY_DB_PATH") or BASE_DIR / "data" / "history.db")
+# 保留的最大记录数，0 表示不限制
+MAX_HISTORY_ROWS = int(os.environ.get("HISTORY_MAX_ROWS", "100000"))
+
+MAX_PAGE_SIZE = 200
+
+
+def ensure_history_schema(db_path: Optional[Path] = None) -> None:
+    """创建历史表及索引（db_path 为空时使用 HISTORY_DB_PATH）"""
+    path = Path(db_path or HISTORY_DB_PATH)
+    os.makedirs(path.parent, exist_ok=True)
+    conn = get_write_connection(path)
+    with conn:
+        conn.execute(CREATE_HISTORY_SQL)
+        for sql in CREATE_HISTORY_INDEXES_SQL:
+            conn.execute(sql)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if hasattr(value, "model_dump"):
+        value = value.model_dump()
+    elif hasattr(value, "dict"):
+        value = value.dict()
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+class HistoryRecorder:
+    """
+    写后（write-behind）历史记录器
+
+    Args:
+        max_queue: 队列容量；队列满时丢弃新记录并计数，不阻塞请求
+        batch_size: 每个事务最多写入的记录数
+        flush_interval: 两次批量写入之间的间隔（秒）
+        max_rows: 保留的最大记录数，默认 MAX_HISTORY_ROWS，0 表示不限制
+        db_path: 数据库路径，默认使用 HISTORY_DB_PATH
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        batch_size: int = 1000,
+        flush_interval: float = 0.2,
+        max_rows: Optional[int] = None,
+        db_path: Optional[Path] = None,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_rows = MAX_HISTORY_ROWS if max_rows is None else max_rows
+        self.db_path = Path(db_path) if db_path else None
+        self._queue: "queue.Queue[Optional[Tuple[Any, ...]]]" = queue.Queue(maxsize=max_queue)
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """清空写入、丢弃与清理计数（fork 后子进程从 0 开始）"""
+        self._counts_lock = threading.Lock()
+        self.dropped = 0
+        self.written = 0
+        self.pruned = 0
+
+    def _count(self, name: str, value: int) -> None:
+        with self._counts_lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def path(self) -> Path:
+        """历史数据库路径"""
+        return Path(self.db_path or HISTORY_DB_PATH)
+
+    @property
+    def pending(self) -> int:
+        """尚未写入数据库的记录数"""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """创建表结构并启动后台写入线程"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        ensure_history_schema(self.path)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """写完队列中剩余的记录后停止"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(
+        self,
+        tool: str,
+        scenario: Optional[str],
+        params: Dict[str, Any],
+        result: Any = None,
+        latency_ms: float = 0.0,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        记录一次计算（非阻塞）
+
+        params 与 result 原样入队，由后台线程序列化，入队后调用方不能再修改它们。
+
+        Returns:
+            bool: 是否入队；未启动或队列已满时返回False
+        """
+        if self._thread is None:
+            return False
+        entry = (time.time(), tool, scenario, params, result, error, latency_ms)
+        try:
+            self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            self._count("dropped", 1)
+            return False
+
+    def _drain(self, first: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                self._stopping.set()
+                break
+            batch.append(entry)
+        return batch
+
+    def _write(self, batch: List[Tuple[Any, ...]]) -> None:
+        try:
+            rows = [
+                (created_at, tool, scenario, _to_json(params), _to_json(result),
+                 "error" if error else "ok", error, latency_ms)
+                for created_at, tool, scenario, params, result, error, latency_ms in batch
+            ]
+            conn = get_write_connection(self.path)
+            with conn:
+                conn.executemany(INSERT_HISTORY_SQL, rows)
+                pruned = conn.execute(PRUNE_HISTORY_SQL, (self.max_rows,)).rowcount if self.max_rows else 0
+            self._count("written", len(batch))
+            self._count("pruned", pruned)
+        except Exception:  # pragma: no cover - 写库失败不能影响后台线程
+            logger.exception("写入计算历史失败，丢弃 %d 条记录", len(batch))
+            self._count("dropped", len(batch))
+
+    def _run(self) -> None:
+        while True:
+            try:
+                entry = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+            if entry is not None and not self._stopping.is_set():
+                # 攒一段时间再写，持续请求下每个事务写入一批而不是一两条
+                self._stopping.wait(self.flush_interval)
+            # 每次唤醒都把队列写空，写入能力不受 batch_size 限制
+            while entry is not None:
+                self._write(self._drain(entry))
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if self._stopping.is_set() and self._queue.empty():
+                return
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """等待队列中已有的记录写入（用于测试与基准）"""
+        deadline = time.monotonic() + timeout
+        while not self._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        time.sleep(self.flush_interval * 1.5)
+
+
+_recorder = HistoryRecorder()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_recorder.reset_counters)
+
+
+def get_history_recorder() -> HistoryRecorder:
+    """进程级共享的历史记录器"""
+    return _recorder
+
+
+def query_history(
+    tool: Optional[str] = None,
+    scenario: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    page: int = 1,
+    page_size: int = 50,
+) -> Dict[str, Any]:
+    """
+    分页查询计算历史（按时间倒序）
+
+    Args:
+        tool: 工具标识
+        scenario: 场景标识
+        since: 起始时间（Unix 时间戳，含）
+        until: 截止时间（Unix 时间戳，不含）
+        page: 页码，从1开始
+        page_size: 每页条数，最大 MAX_PAGE_SIZE
+
+    Returns:
+        dict: {"total", "page", "page_size", "items"}
+    """
+    if page < 1:
+        raise ValueError("页码必须从1开始")
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"每页条数必须在1~{MAX_PAGE_SIZE}之间")
+
+    conditions, args = [], []
+    for column, value in (("tool", tool), ("scenario", scenario)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            args.append(value)
+    if since is not None:
+        conditions.append("created_at >= ?")
+        args.append(since)
+    if until is not None:
+        conditions.append("created_at < ?")
+        args.append(until)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    conn = get_read_connection(HISTORY_DB_PATH)
+    total = conn.execute(f"SELECT COUNT(*) FROM calculation_history {where}", args).fetchone()[0]
+    rows = conn.execute(
+        f"""
+        SELECT id, created_at, tool, scenario, params, result, status, error, latency_ms
+        FROM calculation_history {where}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """,
+        [*args, page_size, (page - 1) * page_size],
+    ).fetchall()
+    items = [
+        {
+            "id": row["id"],
+            "created_at": row["created_at"],
+            "tool": row["tool"],
+            "scenario": row["scenario"],
+            "params": json.loads(row["params"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "status": row["status"],
+            "error": row["error"],
+            "latency_ms": row["latency_ms"],
+        }
+        for row in rows
+    ]
+    return {"total": total, "page": page, "page_size": page_size, "items": items}
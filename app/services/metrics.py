@@ -0,0 +1,475 @@
+"""
+运行指标（Prometheus 文本格式）
+计算接口按工具、场景统计请求数、错误数与耗时直方图，并记录各工具进行中的请求数；
+缓存与数据库计数在导出时从各模块已有的计数器读取，不增加请求路径的开销。
+
+请求路径上每次计算只做一次加锁的字典更新，不访问文件。多进程部署时每个 worker 由后台线程
+按 METRICS_FLUSH_INTERVAL 把本进程的快照写入 METRICS_DIR/<pid>.json，/metrics 合并本进程的
+实时数据与其他 worker 的快照：计数器与直方图累加（已退出的 worker 保留其计数），
+仪表只累加仍在运行的进程。
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR_ENV = "METRICS_DIR"
+METRICS_FLUSH_INTERVAL_ENV = "METRICS_FLUSH_INTERVAL"
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 计算耗时直方图的桶上限（秒）：多数场景在 1 ms 以内，查库、插值类场景在几十毫秒
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# 场景名来自请求体：只有工具声明的场景和计算成功过的场景作为标签值，其余归入 "other"，
+# 防止任意输入产生无限多的时间序列
+MAX_SCENARIOS_PER_TOOL = 64
+OTHER_SCENARIO = "other"
+NO_SCENARIO = "none"
+
+# 错误类型：计算器抛出 ValueError（400）、处理函数拒绝的请求（如缺少 scenario，400）、其他异常（500）、
+# 请求体未通过请求模型校验（422，不进入处理函数）
+ERROR_VALUE = "value_error"
+ERROR_BAD_REQUEST = "bad_request"
+ERROR_INTERNAL = "internal"
+ERROR_VALIDATION = "validation_error"
+ERROR_STATUS = {ERROR_VALUE: "400", ERROR_BAD_REQUEST: "400", ERROR_INTERNAL: "500", ERROR_VALIDATION: "422"}
+
+Labels = Tuple[str, ...]
+Sample = Tuple[str, Labels, float]
+
+
+class MetricFamily(NamedTuple):
+    """指标定义：名称、类型（counter/gauge/histogram）、说明与标签名"""
+
+    name: str
+    kind: str
+    help: str
+    labels: Tuple[str, ...] = ()
+
+
+REQUESTS = MetricFamily(
+    "tool_requests_total", "counter", "计算接口请求数（按状态码）", ("tool", "scenario", "status")
+)
+ERRORS = MetricFamily(
+    "tool_errors_total", "counter",
+    "计算接口错误数（value_error/bad_request 为 400，internal 为 500，validation_error 为 422）",
+    ("tool", "scenario", "error"),
+)
+LATENCY = MetricFamily(
+    "tool_request_duration_seconds", "histogram", "计算接口处理耗时（秒，不含请求体校验与响应序列化）",
+    ("tool", "scenario"),
+)
+IN_PROGRESS = MetricFamily("tool_requests_in_progress", "gauge", "进行中的计算请求数", ("tool",))
+FAN_CURVE_LOOKUPS = MetricFamily(
+    "fan_curve_cache_lookups_total", "counter", "风机性能曲线缓存查询次数（miss 为型号不存在）", ("result",)
+)
+FAN_CURVE_RELOADS = MetricFamily("fan_curve_cache_reloads_total", "counter", "风机性能曲线缓存从数据库加载的次数")
+UNIT_CACHE_LOOKUPS = MetricFamily(
+    "unit_conversion_cache_lookups_total", "counter", "单位换算系数缓存查询次数", ("result",)
+)
+DB_QUERIES = MetricFamily("db_queries_total", "counter", "数据库读写函数调用次数", ("operation",))
+DB_CONNECTIONS = MetricFamily("db_connections_opened_total", "counter", "新建的复用数据库连接数", ("mode",))
+HISTORY_RECORDS = MetricFamily(
+    "history_records_total", "counter", "计算历史记录数（written 已写入，dropped 队列满或写库失败丢弃）", ("result",)
+)
+HISTORY_PENDING = MetricFamily("history_queue_pending", "gauge", "等待写入数据库的计算历史记录数")
+WORKERS = MetricFamily("metrics_workers", "gauge", "参与汇总的运行中进程数")
+
+FAMILIES: Dict[str, MetricFamily] = {
+    family.name: family
+    for family in (
+        REQUESTS, ERRORS, LATENCY, IN_PROGRESS, FAN_CURVE_LOOKUPS, FAN_CURVE_RELOADS, UNIT_CACHE_LOOKUPS,
+        DB_QUERIES, DB_CONNECTIONS, HISTORY_RECORDS, HISTORY_PENDING, WORKERS,
+    )
+}
+
+
+def _builtin_samples() -> Iterable[Sample]:
+    """从各模块已有的计数器读取缓存、数据库与计算历史指标"""
+    from app.db import database
+    from app.db.fan_store import get_fan_curve_store
+    from app.services.history import get_history_recorder
+    from app.services.units import conversion_cache_counts
+
+    store = get_fan_curve_store()
+    yield FAN_CURVE_LOOKUPS.name, ("hit",), store.hits
+    yield FAN_CURVE_LOOKUPS.name, ("miss",), store.misses
+    yield FAN_CURVE_RELOADS.name, (), store.reloads
+    hits, misses = conversion_cache_counts()
+    yield UNIT_CACHE_LOOKUPS.name, ("hit",), hits
+    yield UNIT_CACHE_LOOKUPS.name, ("miss",), misses
+    for operation, count in database.query_counts().items():
+        yield DB_QUERIES.name, (operation,), count
+    for mode, count in database.connection_counts().items():
+        yield DB_CONNECTIONS.name, (mode,), count
+    recorder = get_history_recorder()
+    yield HISTORY_RECORDS.name, ("written",), recorder.written
+    yield HISTORY_RECORDS.name, ("dropped",), recorder.dropped
+    yield HISTORY_PENDING.name, (), recorder.pending
+
+
+class MetricsRegistry:
+    """
+    进程内的指标注册表
+
+    Args:
+        buckets: 耗时直方图的桶上限（秒，升序）
+        collectors: 导出时调用的函数，返回 (指标名, 标签值, 数值) 样本
+    """
+
+    def __init__(
+        self,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+        collectors: Optional[List[Callable[[], Iterable[Sample]]]] = None,
+    ):
+        self.buckets = tuple(buckets)
+        self.collectors = list(collectors or [])
+        # 为 False 时计算接口不做统计（基准测试对照用）
+        self.enabled = True
+        self.reset()
+
+    def reset(self) -> None:
+        """清空全部数据（fork 后的子进程不继承父进程的计数）"""
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, Labels], float] = {}
+        # 每个桶的计数（最后一个为 +Inf）与总和
+        self._histograms: Dict[Tuple[str, Labels], List[float]] = {}
+        self._scenarios: Dict[str, Set[str]] = {}
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1.0) -> None:
+        """计数器或仪表加上 value"""
+        key = (name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        """直方图记录一个观测值"""
+        with self._lock:
+            self._observe((name, labels), value)
+
+    def _observe(self, key: Tuple[str, Labels], value: float) -> None:
+        counts = self._histograms.get(key)
+        if counts is None:
+            counts = self._histograms[key] = [0.0] * (len(self.buckets) + 2)
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def _scenario_label(self, tool_id: str, declared: Iterable[str], scenario: Optional[str], ok: bool) -> str:
+        if not scenario:
+            return NO_SCENARIO
+        known = self._scenarios.get(tool_id)
+        if known is None:
+            known = self._scenarios[tool_id] = set(declared)
+        if scenario in known:
+            return scenario
+        # 计算成功说明计算器认识这个场景
+        if ok and len(known) < MAX_SCENARIOS_PER_TOOL:
+            known.add(scenario)
+            return scenario
+        return OTHER_SCENARIO
+
+    def start_calculation(self, tool_id: str) -> None:
+        """计算请求开始：进行中的请求数加一"""
+        if self.enabled:
+            self.inc(IN_PROGRESS.name, (tool_id,))
+
+    def finish_calculation(
+        self,
+        tool_id: str,
+        declared_scenarios: Iterable[str],
+        scenario: Optional[str],
+        error: Optional[str],
+        seconds: float,
+    ) -> None:
+        """
+        计算请求结束：记录请求数、错误数与耗时
+
+        Args:
+            tool_id: 工具标识
+            declared_scenarios: 工具配置中声明的场景
+            scenario: 请求中的场景名
+            error: 错误类型（ERROR_*），成功时为None
+            seconds: 处理耗时（秒）
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            label = self._scenario_label(tool_id, declared_scenarios, scenario, error is None)
+            values = self._values
+            key = (IN_PROGRESS.name, (tool_id,))
+            values[key] = values.get(key, 0.0) - 1
+            key = (REQUESTS.name, (tool_id, label, ERROR_STATUS.get(error or "", "200")))
+            values[key] = values.get(key, 0.0) + 1
+            if error:
+                key = (ERRORS.name, (tool_id, label, error))
+                values[key] = values.get(key, 0.0) + 1
+            self._observe((LATENCY.name, (tool_id, label)), seconds)
+
+    def reject_request(self, tool_id: str, declared_scenarios: Iterable[str], scenario: Optional[str]) -> None:
+        """
+        请求体未通过请求模型校验（422）：记录请求数与错误数，未进入处理函数，不计入耗时直方图
+
+        Args:
+            tool_id: 工具标识
+            declared_scenarios: 工具配置中声明的场景
+            scenario: 请求体中的场景名（不是字符串时为None）
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            label = self._scenario_label(tool_id, declared_scenarios, scenario, False)
+            values = self._values
+            key = (REQUESTS.name, (tool_id, label, ERROR_STATUS[ERROR_VALIDATION]))
+            values[key] = values.get(key, 0.0) + 1
+            key = (ERRORS.name, (tool_id, label, ERROR_VALIDATION))
+            values[key] = values.get(key, 0.0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        当前进程的全部指标（可 JSON 序列化）
+
+        Returns:
+            dict: {"pid", "values": [[名称, 标签值, 数值]], "histograms": [[名称, 标签值, 桶计数与总和]]}
+        """
+        with self._lock:
+            values = [[name, list(labels), value] for (name, labels), value in self._values.items()]
+            histograms = [[name, list(labels), list(counts)] for (name, labels), counts in self._histograms.items()]
+        for collector in self.collectors:
+            try:
+                values.extend([name, list(labels), float(value)] for name, labels, value in collector())
+            except Exception:  # pragma: no cover - 导出指标不能影响服务
+                logger.exception("读取指标失败: %r", collector)
+        return {"pid": os.getpid(), "buckets": list(self.buckets), "values": values, "histograms": histograms}
+
+
+_registry = MetricsRegistry(collectors=[_builtin_samples])
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry.reset)
+
+
+def get_metrics() -> MetricsRegistry:
+    """进程级共享的指标注册表"""
+    return _registry
+
+
+def metrics_dir_from_env() -> Optional[Path]:
+    """多进程汇总使用的快照目录（METRICS_DIR），未设置时只导出本进程的指标"""
+    value = os.environ.get(METRICS_DIR_ENV, "").strip()
+    return Path(value) if value else None
+
+
+def prepare_metrics_dir() -> Tuple[Path, bool]:
+    """
+    多进程启动前准备快照目录：未设置 METRICS_DIR 时创建临时目录并写入环境变量（worker 继承），
+    已设置时清除上次运行留下的快照
+
+    Returns:
+        tuple: (目录, 是否为新建的临时目录)，新建的目录由调用方在退出时删除
+    """
+    directory = metrics_dir_from_env()
+    if directory is None:
+        directory = Path(tempfile.mkdtemp(prefix="tool-metrics-"))
+        os.environ[METRICS_DIR_ENV] = str(directory)
+        return directory, True
+    directory.mkdir(parents=True, exist_ok=True)
+    for path in directory.glob("*.json"):
+        path.unlink(missing_ok=True)
+    return directory, False
+
+
+def write_snapshot(directory: Path, registry: Optional[MetricsRegistry] = None) -> None:
+    """把本进程的快照原子写入 directory/<pid>.json"""
+    snapshot = (registry or _registry).snapshot()
+    path = directory / f"{snapshot['pid']}.json"
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(snapshot, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_snapshots(directory: Path, exclude_pid: Optional[int] = None) -> List[Dict[str, Any]]:
+    """读取其他进程的快照，并标记进程是否仍在运行"""
+    snapshots = []
+    for path in sorted(directory.glob("*.json")):
+        try:
+            snapshot = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # 只会在写入途中被替换或删除时发生，跳过这一次
+            continue
+        if snapshot.get("pid") == exclude_pid:
+            continue
+        snapshot["alive"] = _pid_alive(snapshot["pid"])
+        snapshots.append(snapshot)
+    return snapshots
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    合并多个进程的快照
+
+    计数器与直方图直接累加；仪表只累加仍在运行的进程（进行中的请求数不能计入已退出的 worker）。
+    桶上限不同的直方图快照（如升级期间）无法合并，跳过。
+    """
+    values: Dict[Tuple[str, Labels], float] = {}
+    histograms: Dict[Tuple[str, Labels], List[float]] = {}
+    buckets: Optional[List[float]] = None
+    workers = 0
+    for snapshot in snapshots:
+        alive = snapshot.get("alive", True)
+        workers += 1 if alive else 0
+        for name, labels, value in snapshot["values"]:
+            family = FAMILIES.get(name)
+            if family is None or (family.kind == "gauge" and not alive):
+                continue
+            key = (name, tuple(labels))
+            values[key] = values.get(key, 0.0) + value
+        if buckets is None:
+            buckets = snapshot["buckets"]
+        if snapshot["buckets"] != buckets:
+            continue
+        for name, labels, counts in snapshot["histograms"]:
+            key = (name, tuple(labels))
+            merged = histograms.get(key)
+            if merged is None:
+                histograms[key] = list(counts)
+            else:
+                histograms[key] = [a + b for a, b in zip(merged, counts)]
+    values[(WORKERS.name, ())] = workers
+    return {"buckets": buckets or list(LATENCY_BUCKETS), "values": values, "histograms": histograms}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return f"{{{','.join(parts)}}}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_metrics(merged: Dict[str, Any]) -> str:
+    """按 Prometheus 文本格式（0.0.4）输出合并后的指标"""
+    by_family: Dict[str, List[Tuple[Labels, Any]]] = {}
+    for (name, labels), value in merged["values"].items():
+        by_family.setdefault(name, []).append((labels, value))
+    for (name, labels), counts in merged["histograms"].items():
+        by_family.setdefault(name, []).append((labels, counts))
+
+    bounds = [_format_value(bound) for bound in merged["buckets"]] + ["+Inf"]
+    lines: List[str] = []
+    for family in FAMILIES.values():
+        samples = by_family.get(family.name)
+        if not samples:
+            continue
+        lines.append(f"# HELP {family.name} {family.help}")
+        lines.append(f"# TYPE {family.name} {family.kind}")
+        for labels, value in sorted(samples, key=lambda sample: sample[0]):
+            if family.kind != "histogram":
+                lines.append(f"{family.name}{_format_labels(family.labels, labels)} {_format_value(value)}")
+                continue
+            cumulative = 0.0
+            for bound, count in zip(bounds, value[:-1]):
+                cumulative += count
+                le = _format_labels(family.labels, labels, f'le="{bound}"')
+                lines.append(f"{family.name}_bucket{le} {_format_value(cumulative)}")
+            plain = _format_labels(family.labels, labels)
+            lines.append(f"{family.name}_sum{plain} {_format_value(value[-1])}")
+            lines.append(f"{family.name}_count{plain} {_format_value(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+def collect_metrics(directory: Optional[Path] = None) -> str:
+    """
+    汇总本进程与其他 worker 的指标
+
+    Args:
+        directory: 快照目录，默认取 METRICS_DIR；为空时只导出本进程
+
+    Returns:
+        str: Prometheus 文本格式
+    """
+    directory = directory or metrics_dir_from_env()
+    snapshots = [_registry.snapshot()]
+    if directory is not None and directory.is_dir():
+        snapshots.extend(read_snapshots(directory, exclude_pid=os.getpid()))
+    return render_metrics(merge_snapshots(snapshots))
+
+
+class MetricsWriter:
+    """
+    定期把本进程的快照写入快照目录的后台线程
+
+    Args:
+        directory: 快照目录
+        interval: 写入间隔（秒）
+    """
+
+    def __init__(self, directory: Path, interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.directory = Path(directory)
+        self.interval = interval
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _flush(self) -> None:
+        try:
+            write_snapshot(self.directory)
+        except OSError:
+            logger.exception("写入指标快照失败: %s", self.directory)
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            self._flush()
+
+    def start(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._flush()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """停止并写入最后一次快照（退出的 worker 的计数保留在汇总中）"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join(self.interval + 1.0)
+        self._thread = None
+        self._flush()
+
+
+def start_metrics_writer() -> Optional[MetricsWriter]:
+    """设置了 METRICS_DIR 时启动快照写入线程"""
+    directory = metrics_dir_from_env()
+    if directory is None:
+        return None
+    interval = float(os.environ.get(METRICS_FLUSH_INTERVAL_ENV, DEFAULT_FLUSH_INTERVAL))
+    if interval <= 0:
+        raise ValueError(f"{METRICS_FLUSH_INTERVAL_ENV} 必须大于 0: {interval}")
+    writer = MetricsWriter(directory, interval)
+    writer.start()
+    return writer
@@ -0,0 +1,196 @@
+"""
+页面预渲染
+工具页与首页的输出只取决于 ToolSpec、模板和静态资源指纹清单，因此可在构建时
+渲染为静态 HTML。运行时若预渲染结果与当前模板/清单/配置一致，直接返回内存中的
+页面字节并带上缓存头；开发模式或结果过期时退回实时渲染。
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+from fastapi.templating import Jinja2Templates
+
+from app.services.client_evaluators import evaluator_sources
+from app.services.registry import ToolSpec
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+PRERENDER_DIR = BASE_DIR / "prerendered"
+BUILD_INFO_NAME = "build.json"
+
+# 设置为 1 时始终实时渲染（修改模板后无需重新构建）
+DEV_MODE_ENV = "APP_DEV_MODE"
+
+# 页面本身没有指纹，缓存时间不宜过长；过期后凭 ETag 协商，内容不变时返回 304
+PAGE_CACHE_CONTROL = "public, max-age=600, stale-while-revalidate=86400"
+
+INDEX_PAGE = "index"
+
+# 工具页的脚本（打包后为页面 bundle）通过 Link 头预加载：浏览器收到响应头即可开始下载，
+# 不必等解析到页面末尾的 <script>
+PRELOAD_SCRIPT_RE = re.compile(r'<script[^>]*\ssrc="(/static/js/(?:tools|bundles)/[^"]+)"')
+
+
+def is_dev_mode() -> bool:
+    return os.environ.get(DEV_MODE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def tool_page_key(tool_id: str) -> str:
+    return f"tools/{tool_id}"
+
+
+def index_context(tool_specs: Mapping[str, ToolSpec]) -> Dict[str, Any]:
+    """首页模板上下文"""
+    return {
+        "tools": [
+            {"id": spec.id, "name": spec.display_name, "description": spec.description or ""}
+            for spec in tool_specs.values()
+        ]
+    }
+
+
+def render_page(templates: Jinja2Templates, template: str, context: Dict[str, Any]) -> str:
+    """不依赖请求对象渲染模板（模板中不使用 request）"""
+    return templates.get_template(template).render({"request": None, **context})
+
+
+def preload_links(html: str) -> Optional[str]:
+    """页面专用脚本的 Link: preload 响应头，没有时返回None"""
+    sources = dict.fromkeys(PRELOAD_SCRIPT_RE.findall(html))
+    if not sources:
+        return None
+    return ", ".join(f"<{source}>; rel=preload; as=script" for source in sources)
+
+
+def live_response(templates: Jinja2Templates, request: Request, template: str, context: Dict[str, Any]) -> Response:
+    """实时渲染页面，与预渲染使用同一渲染路径，保证输出一致"""
+    html = render_page(templates, template, {**context, "request": request})
+    link = preload_links(html)
+    return HTMLResponse(html, headers={"Link": link} if link else None)
+
+
+def build_fingerprint(template_dir: Path, manifest: Mapping[str, str], tool_specs: Mapping[str, ToolSpec]) -> str:
+    """
+    模板内容、静态资源清单与工具配置的联合指纹，任一变化都使预渲染结果失效
+
+    工具页内联了由公式配置或计算器模块生成的浏览器端计算函数，这些源文件也计入指纹。
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(template_dir).rglob("*.html")):
+        digest.update(str(path.relative_to(template_dir)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    digest.update(json.dumps(dict(manifest), sort_keys=True).encode("utf-8"))
+    for tool_id in sorted(tool_specs):
+        digest.update(json.dumps(tool_specs[tool_id].dict(), sort_keys=True, default=str).encode("utf-8"))
+        for path in evaluator_sources(tool_specs[tool_id]):
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def prerender_pages(
+    templates: Jinja2Templates,
+    tool_specs: Mapping[str, ToolSpec],
+    fingerprint: str,
+    output_dir: Path = PRERENDER_DIR,
+) -> Dict[str, Path]:
+    """
+    预渲染首页和全部工具页
+
+    Args:
+        templates: 与应用相同配置的模板环境
+        tool_specs: 工具注册表
+        fingerprint: build_fingerprint 的结果，写入 build.json 供运行时校验
+        output_dir: 输出目录
+
+    Returns:
+        dict: {页面键: 文件路径}
+    """
+    output_dir = Path(output_dir)
+    pages = {INDEX_PAGE: render_page(templates, "index.html", index_context(tool_specs))}
+    for spec in tool_specs.values():
+        pages[tool_page_key(spec.id)] = render_page(templates, spec.template, {"tool": spec})
+
+    written: Dict[str, Path] = {}
+    files: Dict[str, Dict[str, str]] = {}
+    for key, html in pages.items():
+        path = output_dir / f"{key}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = html.encode("utf-8")
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        written[key] = path
+        files[key] = {"path": f"{key}.html", "etag": hashlib.sha256(data).hexdigest()[:16]}
+
+    # build.json 最后写入：运行时以它为准，中途失败的构建不会被采用
+    info_path = output_dir / BUILD_INFO_NAME
+    tmp_info = info_path.with_suffix(".tmp")
+    tmp_info.write_text(json.dumps({"fingerprint": fingerprint, "pages": files}, indent=2), encoding="utf-8")
+    tmp_info.replace(info_path)
+    return written
+
+
+class PrerenderedPage:
+    """内存中的预渲染页面"""
+
+    __slots__ = ("body", "etag", "link")
+
+    def __init__(self, body: bytes, etag: str):
+        self.body = body
+        self.etag = f'"{etag}"'
+        self.link = preload_links(body.decode("utf-8"))
+
+    def response(self, request: Request) -> Response:
+        headers = {"Cache-Control": PAGE_CACHE_CONTROL, "ETag": self.etag}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        if self.link:
+            headers["Link"] = self.link
+        return HTMLResponse(self.body, headers=headers)
+
+
+def load_prerendered_pages(
+    fingerprint: str,
+    keys: Optional[Iterable[str]] = None,
+    output_dir: Path = PRERENDER_DIR,
+) -> Dict[str, PrerenderedPage]:
+    """
+    读取预渲染页面
+
+    Args:
+        fingerprint: 当前模板/清单/配置的指纹
+        keys: 需要的页面键，默认 build.json 中的全部
+        output_dir: 预渲染目录
+
+    Returns:
+        dict: {页面键: PrerenderedPage}；开发模式、未构建或指纹不一致时为空
+    """
+    if is_dev_mode():
+        return {}
+    info_path = Path(output_dir) / BUILD_INFO_NAME
+    if not info_path.exists():
+        return {}
+    try:
+        info = json.loads(info_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if info.get("fingerprint") != fingerprint:
+        logger.warning("预渲染页面与当前模板或配置不一致，改为实时渲染；请重新运行 scripts/prerender_pages.py")
+        return {}
+
+    pages: Dict[str, PrerenderedPage] = {}
+    wanted = set(keys) if keys is not None else None
+    for key, entry in info.get("pages", {}).items():
+        if wanted is not None and key not in wanted:
+            continue
+        path = Path(output_dir) / entry["path"]
+        if path.exists():
+            pages[key] = PrerenderedPage(path.read_bytes(), entry["etag"])
+    return pages
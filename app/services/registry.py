@@ -2,14 +2,40 @@ from __future__ import annotations
 
 """
 工具注册表定义与配置加载
+校验后的工具规格与请求模型字段定义按配置文件指纹缓存为二进制快照，
+配置未变化时 worker 启动直接读取快照，不再解析 YAML 和做 Pydantic 校验。
 """
+import hashlib
+import os
+import pickle
+import sys
 from importlib import import_module
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
+import pydantic
 import yaml
 from pydantic import BaseModel, Field, ValidationError, create_model
 
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+SNAPSHOT_DIR = BASE_DIR / ".cache" / "registry"
+
+# 快照格式版本；ToolSpec 字段或快照内容变化时递增，使旧快照失效
+SNAPSHOT_VERSION = 2
+
+# 优先使用 libyaml 的 C 解析器
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+PYDANTIC_V2 = pydantic.VERSION.startswith("2")
+
+REQUEST_TYPE_MAPPING = {"float": float, "int": int, "str": str, "bool": bool}
+
+# 工具 id -> 请求模型字段定义，由 load_tool_specs 填充
+_REQUEST_FIELDS: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+
+# 配置目录 -> {配置文件名: 工具 id}，供配置热加载定位被修改或删除的工具
+_SPEC_SOURCES: Dict[Path, Dict[str, str]] = {}
+
 
 class ToolSpec(BaseModel):
     """工具规格说明"""
@@ -21,31 +47,48 @@ class ToolSpec(BaseModel):
     parameter_schema: Dict[str, Dict[str, Any]] = Field(
         default_factory=dict, description="参数schema定义，用于生成请求模型"
     )
-    calculator: str = Field(..., description="计算器类的导入路径，例如 app.services.xxx.ClassName")
+    calculator: Optional[str] = Field(None, description="计算器类的导入路径，例如 app.services.xxx.ClassName")
+    formula_config: Optional[str] = Field(
+        None, description="公式配置文件路径（如 configs/tools/xxx.yaml），设置后由配置公式编译出计算器"
+    )
     template: str = Field(..., description="模板相对路径，例如 tools/example.html")
     static_dir: Optional[str] = Field(None, description="静态资源目录")
 
     def get_calculator_class(self) -> Type[Any]:
         """根据配置的导入路径获取计算器类"""
+        if not self.calculator:
+            raise ValueError(f"工具 {self.id} 未配置计算器导入路径")
         module_path, class_name = self.calculator.rsplit(".", 1)
         module = import_module(module_path)
         return getattr(module, class_name)
 
     def create_calculator(self) -> Any:
         """实例化计算器"""
+        if self.formula_config:
+            from app.services.formula_compiler import load_formula_calculator
+
+            return load_formula_calculator(self.formula_config)
         return self.get_calculator_class()()
 
+    def request_field_definitions(self) -> Dict[str, Tuple[str, Any]]:
+        """请求模型字段定义 {字段名: (类型名, 默认值)}，可序列化，随注册表快照缓存"""
+        return {
+            name: (spec.get("type", "str"), spec.get("default", None))
+            for name, spec in self.parameter_schema.items()
+        }
+
     def build_request_model(self) -> Type[BaseModel]:
         """根据参数schema动态生成请求模型"""
+        definitions = _REQUEST_FIELDS.get(self.id) or self.request_field_definitions()
         field_definitions: Dict[str, Any] = {"scenario": (str, ...)}
-        type_mapping = {"float": float, "int": int, "str": str, "bool": bool}
-        for name, spec in self.parameter_schema.items():
-            raw_type = spec.get("type", "str")
-            python_type = type_mapping.get(raw_type, str)
-            default = spec.get("default", None)
+        for name, (raw_type, default) in definitions.items():
+            python_type = REQUEST_TYPE_MAPPING.get(raw_type, str)
             field_definitions[name] = (Optional[python_type], default)
 
-        config = type("Config", (), {"extra": "allow"})
+        if PYDANTIC_V2:
+            config: Any = pydantic.ConfigDict(extra="allow")
+        else:
+            config = type("Config", (), {"extra": "allow"})
         model = create_model(
             f"{self.id.replace('-', '_').title()}Request", __config__=config, **field_definitions
         )
@@ -58,21 +101,137 @@ class ToolConfig(BaseModel):
     tools: List[ToolSpec]
 
 
-def load_tool_specs(config_dir: Path) -> Dict[str, ToolSpec]:
-    """从目录加载所有工具配置"""
-    specs: Dict[str, ToolSpec] = {}
-    yaml_files = sorted(config_dir.glob("*.yml")) + sorted(config_dir.glob("*.yaml"))
+def _config_files(config_dir: Path) -> List[Path]:
+    return sorted(config_dir.glob("*.yml")) + sorted(config_dir.glob("*.yaml"))
 
-    for file_path in yaml_files:
-        with file_path.open("r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f) or {}
-        try:
-            tool_spec = ToolSpec(**raw)
-        except ValidationError as exc:
-            raise ValueError(f"配置文件 {file_path.name} 校验失败: {exc}") from exc
 
-        specs[tool_spec.id] = tool_spec
+def _file_stats(files: Iterable[Path]) -> List[Tuple[str, int, int]]:
+    stats = []
+    for file_path in files:
+        stat = file_path.stat()
+        stats.append((file_path.name, stat.st_mtime_ns, stat.st_size))
+    return stats
+
+
+def _file_hashes(files: Iterable[Path]) -> List[Tuple[str, str]]:
+    return [(file_path.name, hashlib.sha256(file_path.read_bytes()).hexdigest()) for file_path in files]
 
+
+def _snapshot_environment() -> Tuple[Any, ...]:
+    # 本模块或依赖版本变化后快照中的对象可能不再兼容
+    return (SNAPSHOT_VERSION, sys.version_info[:2], pydantic.VERSION, Path(__file__).stat().st_mtime_ns)
+
+
+def _snapshot_path(config_dir: Path, snapshot_dir: Path) -> Path:
+    digest = hashlib.sha1(str(config_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return snapshot_dir / f"{digest}.pickle"
+
+
+def _read_snapshot(path: Path) -> Optional[Dict[str, Any]]:
+    if not path.exists():
+        return None
+    try:
+        with path.open("rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        # 损坏或由不兼容版本写入的快照视为不存在
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("environment") != _snapshot_environment():
+        return None
+    return snapshot
+
+
+def _write_snapshot(path: Path, snapshot: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 多个 worker 可能同时写入，各自写临时文件后原子替换
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+    except OSError:
+        pass
+
+
+def load_tool_spec_file(file_path: Path) -> ToolSpec:
+    """
+    解析并校验单个工具配置文件
+
+    Raises:
+        ValueError: 配置校验失败
+    """
+    with Path(file_path).open("r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=YAML_LOADER) or {}
+    try:
+        tool_spec = ToolSpec(**raw)
+    except ValidationError as exc:
+        raise ValueError(f"配置文件 {Path(file_path).name} 校验失败: {exc}") from exc
+    if not tool_spec.calculator and not tool_spec.formula_config:
+        raise ValueError(f"配置文件 {Path(file_path).name} 必须提供 calculator 或 formula_config")
+    _REQUEST_FIELDS[tool_spec.id] = tool_spec.request_field_definitions()
+    return tool_spec
+
+
+def _parse_tool_specs(files: Iterable[Path]) -> Tuple[Dict[str, ToolSpec], Dict[str, str]]:
+    specs: Dict[str, ToolSpec] = {}
+    sources: Dict[str, str] = {}
+    for file_path in files:
+        tool_spec = load_tool_spec_file(file_path)
+        specs[tool_spec.id] = tool_spec
+        sources[file_path.name] = tool_spec.id
+    return specs, sources
+
+
+def get_tool_spec_sources(config_dir: Path) -> Dict[str, str]:
+    """最近一次 load_tool_specs 得到的 {配置文件名: 工具 id}"""
+    return dict(_SPEC_SOURCES.get(Path(config_dir).resolve(), {}))
+
+
+def load_tool_specs(config_dir: Path, snapshot_dir: Optional[Path] = SNAPSHOT_DIR) -> Dict[str, ToolSpec]:
+    """
+    从目录加载所有工具配置
+
+    Args:
+        config_dir: 工具配置目录
+        snapshot_dir: 注册表快照目录，None 表示不使用快照
+
+    Returns:
+        dict: {工具 id: ToolSpec}
+    """
+    config_dir = Path(config_dir)
+    files = _config_files(config_dir)
+    snapshot_path = _snapshot_path(config_dir, Path(snapshot_dir)) if snapshot_dir is not None else None
+    stats = _file_stats(files)
+
+    snapshot = _read_snapshot(snapshot_path) if snapshot_path is not None else None
+    if snapshot is not None:
+        if snapshot["stats"] == stats:
+            _REQUEST_FIELDS.update(snapshot["fields"])
+            _SPEC_SOURCES[config_dir.resolve()] = snapshot["sources"]
+            return snapshot["specs"]
+        # 只有修改时间变化（如重新检出）而内容不变时沿用快照，并更新记录的修改时间
+        hashes = _file_hashes(files)
+        if snapshot["hashes"] == hashes:
+            snapshot["stats"] = stats
+            _write_snapshot(snapshot_path, snapshot)
+            _REQUEST_FIELDS.update(snapshot["fields"])
+            _SPEC_SOURCES[config_dir.resolve()] = snapshot["sources"]
+            return snapshot["specs"]
+    else:
+        hashes = _file_hashes(files) if snapshot_path is not None else []
+
+    specs, sources = _parse_tool_specs(files)
+    fields = {tool_id: spec.request_field_definitions() for tool_id, spec in specs.items()}
+    _SPEC_SOURCES[config_dir.resolve()] = sources
+    if snapshot_path is not None:
+        _write_snapshot(snapshot_path, {
+            "environment": _snapshot_environment(),
+            "stats": stats,
+            "hashes": hashes,
+            "specs": specs,
+            "fields": fields,
+            "sources": sources,
+        })
     return specs
 
 
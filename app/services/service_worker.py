@@ -0,0 +1,131 @@
+"""
+Service Worker 入口
+Service Worker 的作用域不能超出脚本所在路径，因此由应用在根路径 /sw.js 提供一个很小的入口脚本：
+写入版本号、预缓存列表和缓存上限，再 importScripts 指纹化的 static/js/service_worker.js。
+版本号取构建指纹（模板、静态资源清单与工具配置），任一变化时浏览器安装新的 worker，
+旧版本的页面缓存和计算结果缓存随之失效。计算结果另有结果版本号，还计入计算器源码与
+风机曲线数据的指纹：只改计算代码或导入新曲线时，浏览器中旧的计算结果同样失效。
+"""
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping
+
+from fastapi import Request
+from fastapi.responses import Response
+
+SERVICE_WORKER_SCRIPT = "js/service_worker.js"
+
+# 入口脚本不能长期缓存：浏览器每次检查更新都要拿到当前版本
+SERVICE_WORKER_CACHE_CONTROL = "no-cache"
+
+# IndexedDB 中最多保留的计算结果条数（按最近使用淘汰），以及单条响应的大小上限（字节）
+CALC_CACHE_MAX_ENTRIES = 500
+CALC_CACHE_MAX_BYTES = 64 * 1024
+# 计算结果的最长保存时间（秒），超过后不再返回，重新请求服务器
+CALC_CACHE_MAX_AGE = 7 * 24 * 3600
+# 页面缓存最多保留的页面数
+PAGE_CACHE_MAX_ENTRIES = 50
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+# 计算结果依赖的源码（相对项目根目录的 glob）
+RESULT_SOURCES = (
+    "app/services/*_calculator.py",
+    "app/services/formula_compiler.py",
+    "app/services/units.py",
+    "app/db/fan_envelope.py",
+)
+
+
+@lru_cache(maxsize=1)
+def calculator_sources_digest() -> str:
+    """计算器相关源码的联合摘要（进程内不变，修改代码需要重启服务）"""
+    digest = hashlib.sha256()
+    for pattern in RESULT_SOURCES:
+        for path in sorted(BASE_DIR.glob(pattern)):
+            digest.update(str(path.relative_to(BASE_DIR)).encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def results_version(version: str, data_version: str) -> str:
+    """
+    计算结果缓存的版本号
+
+    Args:
+        version: 构建版本号（模板、静态资源与工具配置）
+        data_version: 风机曲线数据的指纹
+
+    Returns:
+        str: 16 位十六进制版本号
+    """
+    digest = hashlib.sha256(f"{version}\n{calculator_sources_digest()}\n{data_version}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def precache_urls(manifest: Mapping[str, str]) -> List[str]:
+    """
+    安装时预缓存的资源
+
+    已生成页面 bundle 时，工具页不再单独加载 js/tools/ 下的脚本，不预缓存它们。
+
+    Args:
+        manifest: 静态资源指纹映射 {原路径: 指纹化路径}
+
+    Returns:
+        list: 指纹化资源的 URL
+    """
+    bundled = any(source.startswith("js/bundles/") for source in manifest)
+    return [
+        f"/static/{hashed}"
+        for source, hashed in manifest.items()
+        if source != SERVICE_WORKER_SCRIPT and not (bundled and source.startswith("js/tools/"))
+    ]
+
+
+def render_service_worker(
+    manifest: Mapping[str, str], version: str, static_asset: Callable[[str], str], data_version: str = ""
+) -> str:
+    """
+    生成 /sw.js 入口脚本
+
+    Args:
+        manifest: 静态资源指纹映射
+        version: 缓存版本号
+        static_asset: 静态资源路径函数（返回带指纹的 URL）
+        data_version: 风机曲线数据的指纹，计入计算结果的版本号
+
+    Returns:
+        str: JavaScript 源码
+    """
+    config: Dict[str, object] = {
+        "version": version,
+        "resultsVersion": results_version(version, data_version),
+        "precache": precache_urls(manifest),
+        "calcCacheMaxEntries": CALC_CACHE_MAX_ENTRIES,
+        "calcCacheMaxBytes": CALC_CACHE_MAX_BYTES,
+        "calcCacheMaxAgeMs": CALC_CACHE_MAX_AGE * 1000,
+        "pageCacheMaxEntries": PAGE_CACHE_MAX_ENTRIES,
+    }
+    return (
+        f"self.SW_CONFIG = {json.dumps(config, ensure_ascii=False)};\n"
+        f"importScripts({json.dumps(static_asset(SERVICE_WORKER_SCRIPT))});\n"
+    )
+
+
+class ServiceWorkerScript:
+    """内存中的 /sw.js 入口脚本"""
+
+    __slots__ = ("body", "etag", "version")
+
+    def __init__(self, source: str, version: str):
+        self.body = source.encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:16]}"'
+        self.version = version
+
+    def response(self, request: Request) -> Response:
+        headers = {"Cache-Control": SERVICE_WORKER_CACHE_CONTROL, "ETag": self.etag}
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/javascript", headers=headers)
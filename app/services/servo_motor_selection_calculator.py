@@ -4,6 +4,7 @@
 import math
 from typing import Dict, Any
 from app.models.schemas import CurrentCalcResponse
+from app.services.duty_cycle import evaluate_duty_cycles, pack_segments, rms_value
 
 
 class ServoMotorSelectionCalculator:
@@ -11,7 +12,8 @@ class ServoMotorSelectionCalculator:
     
     SCENARIO_NAMES = {
         "linear_motor": "直线电机选型计算",
-        "rotary_motor": "旋转电机选型计算"
+        "rotary_motor": "旋转电机选型计算",
+        "duty_cycle": "多段工作周期有效值校核"
     }
     
     def calculate(self, scenario: str, params: Dict[str, Any]) -> CurrentCalcResponse:
@@ -19,7 +21,7 @@ class ServoMotorSelectionCalculator:
         根据场景计算伺服电机选型
         
         Args:
-            scenario: 计算场景 (linear_motor 或 rotary_motor)
+            scenario: 计算场景 (linear_motor、rotary_motor 或 duty_cycle)
             params: 参数字典
             
         Returns:
@@ -29,6 +31,8 @@ class ServoMotorSelectionCalculator:
             return self._calculate_linear_motor(params)
         elif scenario == "rotary_motor":
             return self._calculate_rotary_motor(params)
+        elif scenario == "duty_cycle":
+            return self._calculate_duty_cycle(params)
         else:
             raise ValueError(f"未知的计算场景: {scenario}")
     
@@ -80,7 +84,7 @@ class ServoMotorSelectionCalculator:
         formula_parts.append(f"<br>峰值推力: F<sub>p</sub> = F<sub>a</sub> × 1.2 = {Fa:.2f} × 1.2 = {Fp:.2f} N<br>")
         
         # 6. 有效推力 Fc = sqrt((Fa²*t1 + Fv²*t2 + Fa²*t1)/(t1+t1+t2)) * 1.2
-        Fc = math.sqrt((Fa * Fa * t1 + Fv * Fv * t2 + Fa * Fa * t1) / (t1 + t1 + t2)) * 1.2
+        Fc = rms_value([t1, t2, t1], [Fa, Fv, Fa], safety_factor=1.2)
         intermediate_results["Fc"] = Fc
         formula_parts.append(f"有效推力: F<sub>c</sub> = √((F<sub>a</sub>²×t<sub>1</sub> + F<sub>v</sub>²×t<sub>2</sub> + F<sub>a</sub>²×t<sub>1</sub>)/(t<sub>1</sub>+t<sub>1</sub>+t<sub>2</sub>)) × 1.2<br>")
         formula_parts.append(f"  = √(({Fa:.2f}²×{t1:.6f} + {Fv:.2f}²×{t2:.6f} + {Fa:.2f}²×{t1:.6f})/({t1:.6f}+{t1:.6f}+{t2:.6f})) × 1.2 = {Fc:.6f} N<br>")
@@ -188,7 +192,7 @@ class ServoMotorSelectionCalculator:
         formula_parts.append(f"<br>峰值扭矩: T<sub>max</sub> = (T<sub>A</sub>+T<sub>B</sub>)×1.2 = ({TA:.6f}+{TB:.6f})×1.2 = {Tmax:.6f} N·m<br>")
         
         # 10. 时效扭矩 Trmsx = sqrt((TA²*t1 + TB²*t2 + TC²*t1)/(t1+t1+t2))
-        Trmsx = math.sqrt((TA * TA * t1 + TB * TB * t2 + TC * TC * t1) / (t1 + t1 + t2))
+        Trmsx = rms_value([t1, t2, t1], [TA, TB, TC])
         intermediate_results["Trmsx"] = Trmsx
         formula_parts.append(f"时效扭矩: T<sub>rmsx</sub> = √((T<sub>A</sub>²×t<sub>1</sub> + T<sub>B</sub>²×t<sub>2</sub> + T<sub>C</sub>²×t<sub>1</sub>)/(t<sub>1</sub>+t<sub>1</sub>+t<sub>2</sub>))<br>")
         formula_parts.append(f"  = √(({TA:.6f}²×{t1:.6f} + {TB:.6f}²×{t2:.6f} + {TC:.6f}²×{t1:.6f})/({t1:.6f}+{t1:.6f}+{t2:.6f})) = {Trmsx:.6f} N·m<br>")
@@ -228,4 +232,53 @@ class ServoMotorSelectionCalculator:
             formula=formula,
             scenario_name=self.SCENARIO_NAMES["rotary_motor"]
         )
-
+    
+    def _calculate_duty_cycle(self, params: Dict[str, Any]) -> CurrentCalcResponse:
+        """多段工作周期有效转矩/推力校核"""
+        # 获取输入参数
+        segments = params.get("segments")  # 分段列表，每段包含 t(s)、v、F 或 T
+        rated = params.get("rated")  # 电机额定转矩 (N·m) 或额定推力 (N)
+        peak_limit = params.get("peak_limit")  # 电机最大转矩 (N·m) 或峰值推力 (N)
+        safety_factor = params.get("safety_factor", 1.0)  # 安全系数
+        load_unit = params.get("load_unit", "N·m")  # 负载单位
+        
+        if not segments:
+            raise ValueError("参数segments必须提供，且至少包含一个分段")
+        
+        packed = pack_segments([segments])
+        cycle = evaluate_duty_cycles(
+            packed["times"],
+            packed["loads"],
+            speeds=packed["speeds"],
+            rated=rated,
+            peak_limit=peak_limit,
+            safety_factor=safety_factor,
+        ).row(0)
+        
+        times = packed["times"][0]
+        loads = packed["loads"][0]
+        terms = " + ".join(f"{load:.4g}²×{t:.4g}" for t, load in zip(times, loads))
+        formula = f"有效值: X<sub>rms</sub> = √(Σ X<sub>i</sub>²×t<sub>i</sub> / Σ t<sub>i</sub>) × K<br>"
+        formula += f"  = √(({terms}) / {cycle['cycle_time']:.6f}) × {safety_factor} = {cycle['rms']:.6f} {load_unit}<br>"
+        formula += f"峰值: X<sub>peak</sub> = max|X<sub>i</sub>| × K = {cycle['peak']:.6f} {load_unit}<br>"
+        formula += f"平均速度: v<sub>avg</sub> = Σ |v<sub>i</sub>|×t<sub>i</sub> / Σ t<sub>i</sub> = {cycle['average_speed']:.6f}<br>"
+        if cycle["thermal_margin"] is not None:
+            formula += f"热裕量: 1 - X<sub>rms</sub>/X<sub>rated</sub> = 1 - {cycle['rms']:.6f}/{rated} = {cycle['thermal_margin']:.4f}<br>"
+        if cycle["peak_margin"] is not None:
+            formula += f"峰值裕量: 1 - X<sub>peak</sub>/X<sub>max</sub> = 1 - {cycle['peak']:.6f}/{peak_limit} = {cycle['peak_margin']:.4f}<br>"
+        
+        result = {
+            "cycle_time": round(cycle["cycle_time"], 6),
+            "rms": round(cycle["rms"], 6),
+            "peak": round(cycle["peak"], 6),
+            "average_speed": round(cycle["average_speed"], 6),
+            "thermal_margin": None if cycle["thermal_margin"] is None else round(cycle["thermal_margin"], 4),
+            "peak_margin": None if cycle["peak_margin"] is None else round(cycle["peak_margin"], 4),
+        }
+        
+        return CurrentCalcResponse(
+            result=result,
+            unit=load_unit,
+            formula=formula,
+            scenario_name=self.SCENARIO_NAMES["duty_cycle"]
+        )
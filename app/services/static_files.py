@@ -0,0 +1,172 @@
+"""
+静态资源服务
+scripts/fingerprint_static.py 为文本资源生成 .br/.gz 压缩副本；这里按请求的
+Accept-Encoding 直接返回最合适的压缩副本，设置 Content-Encoding 与 Vary，
+运行时不做任何压缩。没有压缩副本或客户端不接受压缩时返回原文件。
+
+manifest.json 中的指纹化文件内容永不变化，以一年的 immutable 缓存返回；
+其他文件只短时缓存，并带基于内容的强 ETag，过期后通过 If-None-Match 协商返回 304。
+"""
+import hashlib
+import os
+import stat
+from mimetypes import guess_type
+from typing import Collection, Dict, Mapping, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=300"
+
+# 同等 q 值时的优先顺序
+ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+Variants = Dict[str, Tuple[str, os.stat_result]]
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    解析 Accept-Encoding
+
+    Args:
+        header: 请求头的值，如 "gzip, deflate, br;q=0.8"
+
+    Returns:
+        dict: {编码: q 值}，编码名为小写
+    """
+    accepted: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+def choose_encoding(header: str, available: Collection[str]) -> Optional[str]:
+    """
+    在可用的压缩副本中选出客户端可接受且 q 值最高的编码
+
+    Returns:
+        str: "br"/"gzip"，不应压缩时返回None
+    """
+    accepted = parse_accept_encoding(header)
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding, _ in ENCODINGS:
+        if encoding not in available:
+            continue
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    优先返回预压缩副本的静态文件服务
+
+    压缩副本比原文件旧（原文件在生成后又被修改）时忽略，避免返回过期内容。
+    副本的查找结果按原文件的修改时间和大小缓存。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._variants: Dict[str, Tuple[int, int, Variants]] = {}
+
+    def _find_variants(self, full_path: str, stat_result: os.stat_result) -> Variants:
+        cached = self._variants.get(full_path)
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            return cached[2]
+        variants: Variants = {}
+        for encoding, suffix in ENCODINGS:
+            try:
+                variant_stat = os.stat(full_path + suffix)
+            except OSError:
+                continue
+            if variant_stat.st_mtime_ns >= stat_result.st_mtime_ns:
+                variants[encoding] = (full_path + suffix, variant_stat)
+        self._variants[full_path] = (stat_result.st_mtime_ns, stat_result.st_size, variants)
+        return variants
+
+    def cache_headers(self, full_path: str, stat_result: os.stat_result, encoding: Optional[str]) -> Dict[str, str]:
+        """缓存相关的响应头，由子类提供"""
+        return {}
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        variants = self._find_variants(str(full_path), stat_result)
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""), variants) if variants else None
+        # 同一 URL 的响应随 Accept-Encoding 变化，缓存必须区分
+        headers = {"vary": "Accept-Encoding"} if variants else {}
+        headers.update(self.cache_headers(str(full_path), stat_result, encoding))
+        media_type = guess_type(str(full_path))[0] or "text/plain"
+        if encoding is not None:
+            headers["content-encoding"] = encoding
+            full_path, stat_result = variants[encoding]
+
+        response = FileResponse(
+            full_path, status_code=status_code, headers=headers, media_type=media_type, stat_result=stat_result
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class FingerprintedStaticFiles(PrecompressedStaticFiles):
+    """
+    区分指纹化文件的静态文件服务
+
+    Args:
+        manifest: 静态资源指纹映射 {原路径: 指纹化路径}，指纹化路径长期缓存
+    """
+
+    def __init__(self, *args, manifest: Optional[Mapping[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        directory = os.path.realpath(str(self.directory)) if self.directory else ""
+        self.immutable_paths = frozenset(os.path.join(directory, path) for path in (manifest or {}).values())
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+
+    def _content_digest(self, full_path: str, stat_result: os.stat_result) -> str:
+        cached = self._digests.get(full_path)
+        if cached is not None and cached[:2] == (stat_result.st_mtime_ns, stat_result.st_size):
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(full_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()[:32]
+        self._digests[full_path] = (stat_result.st_mtime_ns, stat_result.st_size, value)
+        return value
+
+    def lookup_path(self, path: str) -> Tuple[str, Optional[os.stat_result]]:
+        full_path, stat_result = super().lookup_path(path)
+        # lookup_path 在线程池中执行：在这里计算内容摘要，不阻塞事件循环
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            self._content_digest(full_path, stat_result)
+        return full_path, stat_result
+
+    def cache_headers(self, full_path: str, stat_result: os.stat_result, encoding: Optional[str]) -> Dict[str, str]:
+        digest = self._content_digest(full_path, stat_result)
+        # 压缩副本与原文件是不同的表示，ETag 也要不同
+        etag = f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+        cache_control = IMMUTABLE_CACHE_CONTROL if full_path in self.immutable_paths else REVALIDATE_CACHE_CONTROL
+        return {"cache-control": cache_control, "etag": etag}
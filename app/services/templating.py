@@ -0,0 +1,71 @@
+"""
+模板环境与字节码缓存
+Jinja2 首次加载模板时要把源码编译为 Python 代码，冷启动的 worker 在每个模板的
+第一次渲染时都会出现延迟尖峰。这里为模板环境配置持久化的文件字节码缓存，
+打包时预先编译全部模板（scripts/precompile_templates.py），启动时再预热一遍，
+用户请求不再承担编译开销。
+"""
+from pathlib import Path
+from typing import Optional
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+TEMPLATE_DIR = BASE_DIR / "templates"
+JINJA_CACHE_DIR = BASE_DIR / ".cache" / "jinja"
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    以模板名作为缓存键的字节码缓存
+
+    Jinja2 默认把模板的绝对路径计入缓存键，打包后部署到其他目录时预编译结果全部失效；
+    模板目录是固定的，只用模板名即可。源码是否变化仍由缓存桶中的校验和判断，
+    Jinja2/Python 版本不一致的缓存也会被自动忽略。
+    """
+
+    def get_cache_key(self, name: str, filename: Optional[str] = None) -> str:
+        return super().get_cache_key(name)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        # 缓存目录只读（如只读部署）时照常渲染，只是不写缓存
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def create_templates(directory: Path = TEMPLATE_DIR, cache_dir: Optional[Path] = JINJA_CACHE_DIR) -> Jinja2Templates:
+    """
+    创建应用使用的模板环境
+
+    Args:
+        directory: 模板目录
+        cache_dir: 字节码缓存目录，None 表示不缓存
+
+    Returns:
+        Jinja2Templates: 模板环境
+    """
+    templates = Jinja2Templates(directory=str(directory))
+    if cache_dir is not None:
+        try:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return templates
+        templates.env.bytecode_cache = TemplateBytecodeCache(str(cache_dir))
+    return templates
+
+
+def warm_templates(env: Environment) -> int:
+    """
+    加载（必要时编译）全部 HTML 模板
+
+    Returns:
+        int: 模板数量
+    """
+    names = env.list_templates(filter_func=lambda name: name.endswith(".html"))
+    for name in names:
+        env.get_template(name)
+    return len(names)
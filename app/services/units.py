@@ -0,0 +1,324 @@
+"""
+单位换算服务
+以工具 YAML 配置中的 unit 字段为计算器的标准单位，预先计算换算系数表，
+批量/扫描计算时对整列数组一次完成换算，客户端可使用自己的输入输出单位。
+"""
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+from app.services.formula_compiler import split_output
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+TOOL_METADATA_DIR = BASE_DIR / "configs" / "tools"
+
+# 单位 -> (量纲, 换算到国际单位制的比例, 偏移)：SI = 值 × 比例 + 偏移
+UNIT_TABLE: Dict[str, Tuple[str, float, float]] = {
+    # 无量纲
+    "": ("dimensionless", 1.0, 0.0),
+    "无": ("dimensionless", 1.0, 0.0),
+    "%": ("dimensionless", 0.01, 0.0),
+    # 长度
+    "m": ("length", 1.0, 0.0),
+    "km": ("length", 1e3, 0.0),
+    "cm": ("length", 1e-2, 0.0),
+    "mm": ("length", 1e-3, 0.0),
+    "μm": ("length", 1e-6, 0.0),
+    # 质量
+    "kg": ("mass", 1.0, 0.0),
+    "g": ("mass", 1e-3, 0.0),
+    "t": ("mass", 1e3, 0.0),
+    # 时间
+    "s": ("time", 1.0, 0.0),
+    "ms": ("time", 1e-3, 0.0),
+    "min": ("time", 60.0, 0.0),
+    "h": ("time", 3600.0, 0.0),
+    # 速度
+    "m/s": ("velocity", 1.0, 0.0),
+    "m/min": ("velocity", 1 / 60, 0.0),
+    "mm/s": ("velocity", 1e-3, 0.0),
+    "km/h": ("velocity", 1 / 3.6, 0.0),
+    # 加速度
+    "m/s²": ("acceleration", 1.0, 0.0),
+    "mm/s²": ("acceleration", 1e-3, 0.0),
+    # 转速 / 角度
+    "rpm": ("rotational_speed", 1.0, 0.0),
+    "r/min": ("rotational_speed", 1.0, 0.0),
+    "rev/min": ("rotational_speed", 1.0, 0.0),
+    "r/s": ("rotational_speed", 60.0, 0.0),
+    "rad/s": ("rotational_speed", 60 / (2 * np.pi), 0.0),
+    "rad": ("angle", 1.0, 0.0),
+    "°": ("angle", np.pi / 180, 0.0),
+    # 功率
+    "W": ("power", 1.0, 0.0),
+    "kW": ("power", 1e3, 0.0),
+    "MW": ("power", 1e6, 0.0),
+    "HP": ("power", 745.7, 0.0),
+    # 电压 / 电流 / 电阻
+    "V": ("voltage", 1.0, 0.0),
+    "mV": ("voltage", 1e-3, 0.0),
+    "kV": ("voltage", 1e3, 0.0),
+    "A": ("current", 1.0, 0.0),
+    "mA": ("current", 1e-3, 0.0),
+    "kA": ("current", 1e3, 0.0),
+    "Ω": ("resistance", 1.0, 0.0),
+    "mΩ": ("resistance", 1e-3, 0.0),
+    "kΩ": ("resistance", 1e3, 0.0),
+    # 力 / 转矩
+    "N": ("force", 1.0, 0.0),
+    "kN": ("force", 1e3, 0.0),
+    "kgf": ("force", 9.80665, 0.0),
+    "N·m": ("torque", 1.0, 0.0),
+    "N·cm": ("torque", 1e-2, 0.0),
+    "N·mm": ("torque", 1e-3, 0.0),
+    "kN·m": ("torque", 1e3, 0.0),
+    # 转动惯量
+    "kg·m²": ("inertia", 1.0, 0.0),
+    "kg·cm²": ("inertia", 1e-4, 0.0),
+    "kg·mm²": ("inertia", 1e-6, 0.0),
+    "g·cm²": ("inertia", 1e-7, 0.0),
+    # 密度
+    "kg/m³": ("density", 1.0, 0.0),
+    "g/cm³": ("density", 1e3, 0.0),
+    # 压力
+    "Pa": ("pressure", 1.0, 0.0),
+    "kPa": ("pressure", 1e3, 0.0),
+    "MPa": ("pressure", 1e6, 0.0),
+    "bar": ("pressure", 1e5, 0.0),
+    # 流量
+    "m³/s": ("flow", 1.0, 0.0),
+    "m³/min": ("flow", 1 / 60, 0.0),
+    "m³/h": ("flow", 1 / 3600, 0.0),
+    "L/min": ("flow", 1e-3 / 60, 0.0),
+    # 温度
+    "K": ("temperature", 1.0, 0.0),
+    "℃": ("temperature", 1.0, 273.15),
+}
+
+# 常见的书写变体 -> 标准写法
+UNIT_ALIASES: Dict[str, str] = {
+    "Nm": "N·m",
+    "N.m": "N·m",
+    "N*m": "N·m",
+    "kg.m2": "kg·m²",
+    "kg*m^2": "kg·m²",
+    "kg·m2": "kg·m²",
+    "kgm2": "kg·m²",
+    "kg.cm2": "kg·cm²",
+    "kg*cm^2": "kg·cm²",
+    "kg·cm2": "kg·cm²",
+    "kg/m3": "kg/m³",
+    "kg/m^3": "kg/m³",
+    "m/s2": "m/s²",
+    "m/s^2": "m/s²",
+    "m3/h": "m³/h",
+    "m3/s": "m³/s",
+    "m3/min": "m³/min",
+    "°C": "℃",
+    "deg": "°",
+    "ohm": "Ω",
+    "um": "μm",
+    "hp": "HP",
+    "pa": "Pa",
+}
+
+
+def normalize_unit(unit: Optional[str]) -> str:
+    """把单位写法规范化为 UNIT_TABLE 中的键"""
+    if unit is None:
+        return ""
+    unit = unit.strip()
+    return UNIT_ALIASES.get(unit, unit)
+
+
+@lru_cache(maxsize=None)
+def conversion_factor(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """
+    计算单位换算的线性系数
+
+    Args:
+        from_unit: 原单位
+        to_unit: 目标单位
+
+    Returns:
+        tuple: (比例, 偏移)，目标值 = 原值 × 比例 + 偏移
+
+    Raises:
+        ValueError: 单位未知或量纲不一致
+    """
+    source = normalize_unit(from_unit)
+    target = normalize_unit(to_unit)
+    if source == target:
+        return 1.0, 0.0
+    for unit in (source, target):
+        if unit not in UNIT_TABLE:
+            raise ValueError(f"未知的单位: {unit}")
+    source_dim, source_scale, source_offset = UNIT_TABLE[source]
+    target_dim, target_scale, target_offset = UNIT_TABLE[target]
+    if source_dim != target_dim:
+        raise ValueError(f"单位量纲不一致，无法换算: {from_unit} -> {to_unit}")
+    scale = source_scale / target_scale
+    offset = (source_offset - target_offset) / target_scale
+    return scale, offset
+
+
+# fork 后子进程继承已缓存的系数及其命中计数，计数减去 fork 时的基线，只统计本进程的查询
+_cache_baseline = (0, 0)
+
+
+def _record_cache_baseline() -> None:
+    global _cache_baseline
+    info = conversion_factor.cache_info()
+    _cache_baseline = (info.hits, info.misses)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_record_cache_baseline)
+
+
+def conversion_cache_counts() -> Tuple[int, int]:
+    """本进程内换算系数缓存的 (命中, 未命中) 次数（/metrics 导出）"""
+    info = conversion_factor.cache_info()
+    return info.hits - _cache_baseline[0], info.misses - _cache_baseline[1]
+
+
+def convert(value: Any, from_unit: str, to_unit: str) -> Any:
+    """换算标量或数组"""
+    scale, offset = conversion_factor(from_unit, to_unit)
+    if isinstance(value, (list, tuple)):
+        value = np.asarray(value, dtype=float)
+    if offset:
+        return value * scale + offset
+    return value * scale
+
+
+class UnitConverter:
+    """
+    单个工具的单位换算器
+
+    标准单位取自工具配置：参数的 unit 字段与场景 outputs 中括号内的单位。
+    换算计划（系数数组）按 (列, 客户端单位) 缓存，之后每次调用只有一次数组乘加。
+    """
+
+    def __init__(self, config: Mapping[str, Any]):
+        self.tool_id = config.get("id", "")
+        self.parameter_units: Dict[str, str] = {
+            param["name"]: normalize_unit(param.get("unit"))
+            for param in config.get("parameters") or []
+            if param.get("type", "number") in ("number", "integer")
+        }
+        self.output_units: Dict[str, Dict[str, str]] = {}
+        for scenario in config.get("scenarios") or []:
+            outputs = dict(split_output(item) for item in scenario.get("outputs") or [])
+            self.output_units[scenario["id"]] = {name: normalize_unit(unit) for name, unit in outputs.items()}
+        self._plans: Dict[Tuple[Any, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _plan(
+        self,
+        tag: str,
+        columns: Sequence[str],
+        canonical: Mapping[str, str],
+        units: Mapping[str, str],
+        to_client: bool,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        key = (tag, tuple(columns), tuple(sorted(units.items())))
+        plan = self._plans.get(key)
+        if plan is None:
+            scales = np.ones(len(columns))
+            offsets = np.zeros(len(columns))
+            for index, column in enumerate(columns):
+                client_unit = units.get(column)
+                if client_unit is None or column not in canonical:
+                    continue
+                if to_client:
+                    scales[index], offsets[index] = conversion_factor(canonical[column], client_unit)
+                else:
+                    scales[index], offsets[index] = conversion_factor(client_unit, canonical[column])
+            plan = (scales, offsets)
+            self._plans[key] = plan
+        return plan
+
+    def inputs_to_canonical(
+        self, values: np.ndarray, columns: Sequence[str], input_units: Mapping[str, str]
+    ) -> np.ndarray:
+        """
+        把客户端单位的输入矩阵换算为配置标准单位
+
+        Args:
+            values: 形状 (n_rows, n_columns) 的输入矩阵，或单行 (n_columns,)
+            columns: 每一列对应的参数名
+            input_units: 参数名 -> 客户端单位，未列出的列保持不变
+
+        Returns:
+            np.ndarray: 换算后的矩阵
+        """
+        scales, offsets = self._plan("inputs", columns, self.parameter_units, input_units, to_client=False)
+        return np.asarray(values, dtype=float) * scales + offsets
+
+    def outputs_to_client(
+        self, values: np.ndarray, scenario: str, columns: Sequence[str], output_units: Mapping[str, str]
+    ) -> np.ndarray:
+        """把配置标准单位的输出矩阵换算为客户端单位（参数同 inputs_to_canonical）"""
+        canonical = self.output_units.get(scenario, {})
+        scales, offsets = self._plan(f"outputs:{scenario}", columns, canonical, output_units, to_client=True)
+        return np.asarray(values, dtype=float) * scales + offsets
+
+    def convert_inputs(
+        self, table: Mapping[str, Iterable[float]], input_units: Mapping[str, str]
+    ) -> Dict[str, np.ndarray]:
+        """按列换算批量/扫描输入，返回 参数名 -> 数组"""
+        columns = list(table)
+        if not columns:
+            return {}
+        matrix = np.column_stack([np.asarray(table[column], dtype=float) for column in columns])
+        converted = self.inputs_to_canonical(matrix, columns, input_units)
+        return {column: converted[:, index] for index, column in enumerate(columns)}
+
+    def convert_params(self, params: Dict[str, Any], input_units: Mapping[str, str]) -> Dict[str, Any]:
+        """换算单次请求的参数字典，非数值参数原样保留"""
+        converted = dict(params)
+        for name, unit in input_units.items():
+            value = params.get(name)
+            if name in self.parameter_units and isinstance(value, (int, float)) and not isinstance(value, bool):
+                scale, offset = conversion_factor(unit, self.parameter_units[name])
+                converted[name] = value * scale + offset
+        return converted
+
+    def output_unit(self, scenario: str, name: str) -> Optional[str]:
+        """查询场景输出的标准单位"""
+        return self.output_units.get(scenario, {}).get(name)
+
+
+_converters: Dict[Tuple[str, Path], Optional[UnitConverter]] = {}
+
+
+def load_unit_converter(tool_id: str, config_dir: Path = TOOL_METADATA_DIR) -> Optional[UnitConverter]:
+    """按工具标识加载单位换算器（按工具缓存）；没有对应配置文件时返回None"""
+    key = (tool_id, config_dir)
+    if key in _converters:
+        return _converters[key]
+    converter = None
+    candidates: List[Path] = []
+    for name in {tool_id, tool_id.replace("-", "_")}:
+        candidates.extend([config_dir / f"{name}.yaml", config_dir / f"{name}.yml"])
+    for path in candidates:
+        if path.exists():
+            with path.open("r", encoding="utf-8") as f:
+                converter = UnitConverter(yaml.safe_load(f) or {})
+            break
+    _converters[key] = converter
+    return converter
+
+
+def invalidate_unit_converter(tool_id: Optional[str] = None) -> None:
+    """工具配置变化后丢弃缓存的单位换算器；tool_id 为 None 时全部丢弃"""
+    if tool_id is None:
+        _converters.clear()
+        return
+    names = {tool_id, tool_id.replace("-", "_"), tool_id.replace("_", "-")}
+    for key in [key for key in _converters if key[0] in names]:
+        _converters.pop(key, None)
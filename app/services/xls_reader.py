@@ -0,0 +1,295 @@
+"""
+.xls（BIFF8）工作簿读取
+xlrd 只提供单元格的缓存值，不还原公式文本；这里从工作表的 FORMULA/SHRFMLA 记录取出
+公式的逆波兰记号（ptg 序列），按记录中的 tParen 原样还原括号，生成 Excel 公式文本，
+供 excel_engine 与 .xlsx 公式走同一套翻译。需要安装 xlrd。
+"""
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from openpyxl.utils.cell import get_column_letter
+
+from app.services.excel_engine import CellError
+
+# 二元运算符 ptg -> Excel 运算符
+_BINARY_OPS = {
+    0x03: "+", 0x04: "-", 0x05: "*", 0x06: "/", 0x07: "^", 0x08: "&",
+    0x09: "<", 0x0A: "<=", 0x0B: "=", 0x0C: ">=", 0x0D: ">", 0x0E: "<>",
+}
+
+_ERROR_CODES = {0x00: "#NULL!", 0x07: "#DIV/0!", 0x0F: "#VALUE!", 0x17: "#REF!", 0x1D: "#NAME?", 0x24: "#NUM!",
+                0x2A: "#N/A"}
+
+# 只影响显示或计算调度、不改变公式含义的 tAttr 类型
+_ATTR_SUM = 0x10
+_ATTR_CHOOSE = 0x04
+
+
+class XlsFormulaError(ValueError):
+    """.xls 公式含无法还原的记号（外部引用、名称、数组常量等）"""
+
+
+def _cell_name(row: int, col: int, row_rel: bool, col_rel: bool) -> str:
+    return f"{'' if col_rel else '$'}{get_column_letter(col + 1)}{'' if row_rel else '$'}{row + 1}"
+
+
+def _signed(value: int, bits: int) -> int:
+    return value - (1 << bits) if value >= 1 << (bits - 1) else value
+
+
+class _Decompiler:
+    """把一个公式的 ptg 序列还原为 Excel 公式文本"""
+
+    def __init__(self, book: Any, sheet_names: List[str]):
+        from xlrd.formula import func_defs, get_externsheet_local_range
+
+        self.book = book
+        self.sheet_names = sheet_names
+        self.func_defs = func_defs
+        self.local_range = get_externsheet_local_range
+
+    def _sheet_prefix(self, ixti: int) -> str:
+        first, last = self.local_range(self.book, ixti)
+        if first < 0 or first != last:
+            raise XlsFormulaError("引用了外部工作簿或多个工作表")
+        name = self.sheet_names[first].replace("'", "''")
+        return f"'{name}'!"
+
+    def _ref(self, data: bytes, pos: int, base: Optional[Tuple[int, int]]) -> str:
+        row, col_field = struct.unpack_from("<HH", data, pos)
+        return self._address(row, col_field, base)
+
+    def _address(self, row: int, col_field: int, base: Optional[Tuple[int, int]]) -> str:
+        row_rel, col_rel = bool(col_field & 0x8000), bool(col_field & 0x4000)
+        col = col_field & 0xFF
+        if base is not None:
+            # tRefN/tAreaN（共享公式）：相对部分是相对于所在单元格的偏移
+            if row_rel:
+                row = (base[0] + _signed(row, 16)) % 65536
+            if col_rel:
+                col = (base[1] + _signed(col, 8)) % 256
+        return _cell_name(row, col, row_rel, col_rel)
+
+    def _area(self, data: bytes, pos: int, base: Optional[Tuple[int, int]]) -> str:
+        row1, row2, col1, col2 = struct.unpack_from("<HHHH", data, pos)
+        return f"{self._address(row1, col1, base)}:{self._address(row2, col2, base)}"
+
+    def decompile(self, data: bytes, row: int, col: int) -> str:
+        """
+        Args:
+            data: ptg 序列（rgce）
+            row, col: 公式所在单元格（0 起），用于还原共享公式中的相对引用
+
+        Returns:
+            str: 以 "=" 开头的公式文本
+
+        Raises:
+            XlsFormulaError: 含无法还原的记号
+        """
+        stack: List[str] = []
+        pos = 0
+        end = len(data)
+        while pos < end:
+            op = data[pos]
+            base = op & 0x1F if op >= 0x20 else op
+            ptg = (op & 0x1F) | 0x20 if op >= 0x20 else op
+            pos += 1
+            if op in _BINARY_OPS:
+                right = stack.pop()
+                stack.append(f"{stack.pop()}{_BINARY_OPS[op]}{right}")
+            elif op == 0x12:
+                stack.append(f"+{stack.pop()}")
+            elif op == 0x13:
+                stack.append(f"-{stack.pop()}")
+            elif op == 0x14:
+                stack.append(f"{stack.pop()}%")
+            elif op == 0x15:
+                stack.append(f"({stack.pop()})")
+            elif op == 0x16:
+                stack.append("")
+            elif op == 0x17:
+                length, flags = data[pos], data[pos + 1]
+                pos += 2
+                if flags & 0x01:
+                    text = data[pos:pos + 2 * length].decode("utf-16-le")
+                    pos += 2 * length
+                else:
+                    text = data[pos:pos + length].decode("latin-1")
+                    pos += length
+                stack.append('"' + text.replace('"', '""') + '"')
+            elif op == 0x19:
+                attr = data[pos]
+                if attr & _ATTR_CHOOSE:
+                    (cases,) = struct.unpack_from("<H", data, pos + 1)
+                    pos += 3 + 2 * (cases + 1)
+                else:
+                    pos += 3
+                if attr & _ATTR_SUM:
+                    stack.append(f"SUM({stack.pop()})")
+            elif op == 0x1C:
+                stack.append(_ERROR_CODES.get(data[pos], "#VALUE!"))
+                pos += 1
+            elif op == 0x1D:
+                stack.append("TRUE" if data[pos] else "FALSE")
+                pos += 1
+            elif op == 0x1E:
+                stack.append(str(struct.unpack_from("<H", data, pos)[0]))
+                pos += 2
+            elif op == 0x1F:
+                stack.append(repr(struct.unpack_from("<d", data, pos)[0]))
+                pos += 8
+            elif ptg in (0x21, 0x22):
+                if ptg == 0x21:
+                    (index,) = struct.unpack_from("<H", data, pos)
+                    pos += 2
+                    definition = self.func_defs.get(index)
+                    if definition is None:
+                        raise XlsFormulaError(f"未知的函数编号: {index}")
+                    count = definition[1]
+                else:
+                    count = data[pos] & 0x7F
+                    (index,) = struct.unpack_from("<H", data, pos + 1)
+                    pos += 3
+                    definition = self.func_defs.get(index & 0x7FFF)
+                    if definition is None or index & 0x8000 or index == 255:
+                        raise XlsFormulaError("不支持宏函数或加载项函数")
+                args = stack[len(stack) - count:] if count else []
+                del stack[len(stack) - count:]
+                stack.append(f"{definition[0]}({','.join(args)})")
+            elif ptg == 0x24:
+                stack.append(self._ref(data, pos, None))
+                pos += 4
+            elif ptg == 0x25:
+                stack.append(self._area(data, pos, None))
+                pos += 8
+            elif ptg in (0x26, 0x27, 0x28):
+                # tMemArea/tMemErr/tMemNoMem：后面紧跟子表达式，本身不产生操作数
+                pos += 6
+            elif ptg == 0x29:
+                pos += 2
+            elif ptg == 0x2A:
+                stack.append("#REF!")
+                pos += 4
+            elif ptg == 0x2B:
+                stack.append("#REF!")
+                pos += 8
+            elif ptg == 0x2C:
+                stack.append(self._ref(data, pos, (row, col)))
+                pos += 4
+            elif ptg == 0x2D:
+                stack.append(self._area(data, pos, (row, col)))
+                pos += 8
+            elif ptg == 0x3A:
+                (ixti,) = struct.unpack_from("<H", data, pos)
+                stack.append(self._sheet_prefix(ixti) + self._ref(data, pos + 2, None))
+                pos += 6
+            elif ptg == 0x3B:
+                (ixti,) = struct.unpack_from("<H", data, pos)
+                stack.append(self._sheet_prefix(ixti) + self._area(data, pos + 2, None))
+                pos += 10
+            elif ptg in (0x3C, 0x3D):
+                stack.append("#REF!")
+                pos += 6 if ptg == 0x3C else 10
+            else:
+                raise XlsFormulaError(f"不支持的公式记号: 0x{base:02X}")
+        if len(stack) != 1:
+            raise XlsFormulaError("公式记号不完整")
+        return "=" + stack[0]
+
+
+def read_xls(
+    path: Path, sheets: Optional[Sequence[str]] = None
+) -> Tuple[List[str], Dict[str, Tuple[int, int]], Dict[str, Any], Dict[str, str], Dict[str, str]]:
+    """
+    读取 .xls 工作簿的常量与公式
+
+    Args:
+        path: .xls 文件路径
+        sheets: 需要读取的工作表，默认全部
+
+    Returns:
+        tuple: (工作表名列表, 各表 (最大行, 最大列), 常量单元格, 公式单元格, 无法还原的公式单元格 -> 原因)
+
+    Raises:
+        ValueError: 未安装 xlrd 或工作表不存在
+    """
+    try:
+        import xlrd
+        from xlrd.biffh import XL_ARRAY, XL_EOF, XL_FORMULA, XL_SHRFMLA
+    except ImportError as exc:
+        raise ValueError("读取 .xls 需要安装 xlrd: pip install xlrd") from exc
+
+    book = xlrd.open_workbook(str(path), on_demand=True)
+    try:
+        sheet_names = book.sheet_names()
+        names = list(sheets) if sheets else sheet_names
+        for name in names:
+            if name not in sheet_names:
+                raise ValueError(f"工作簿中不存在工作表: {name}")
+
+        bounds: Dict[str, Tuple[int, int]] = {}
+        constants: Dict[str, Any] = {}
+        for index, name in enumerate(sheet_names):
+            sheet = book.sheet_by_index(index)
+            bounds[name] = (sheet.nrows, sheet.ncols)
+            if name in names:
+                for row in range(sheet.nrows):
+                    for col, cell in enumerate(sheet.row(row)):
+                        if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+                            continue
+                        ref = f"{name}!{get_column_letter(col + 1)}{row + 1}"
+                        if cell.ctype == xlrd.XL_CELL_ERROR:
+                            constants[ref] = CellError(xlrd.error_text_from_code.get(cell.value, "#VALUE!"))
+                        elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                            constants[ref] = bool(cell.value)
+                        else:
+                            constants[ref] = cell.value
+            book.unload_sheet(index)
+
+        decompiler = _Decompiler(book, sheet_names)
+        formulas: Dict[str, str] = {}
+        unsupported: Dict[str, str] = {}
+
+        def decompile(ref: str, rgce: bytes, row: int, col: int) -> None:
+            try:
+                formulas[ref] = decompiler.decompile(rgce, row, col)
+            except (XlsFormulaError, IndexError, struct.error) as exc:
+                unsupported[ref] = f"无法还原 .xls 公式: {exc}"
+
+        for name in names:
+            # 共享公式：首个单元格 (行, 列) -> rgce；使用共享/数组公式的单元格 -> 首个单元格
+            shared: Dict[Tuple[int, int], bytes] = {}
+            arrays: Set[Tuple[int, int]] = set()
+            pending: Dict[Tuple[int, int], Tuple[int, int]] = {}
+            book._position = book._sh_abs_posn[sheet_names.index(name)]
+            while True:
+                code, _, data = book.get_record_parts()
+                if code == XL_EOF:
+                    break
+                if code == XL_FORMULA:
+                    row, col = struct.unpack("<HH", data[:4])
+                    (cce,) = struct.unpack("<H", data[20:22])
+                    rgce = data[22:22 + cce]
+                    if rgce[:1] == b"\x01":  # tExp
+                        pending[(row, col)] = struct.unpack("<HH", rgce[1:5])
+                    else:
+                        decompile(f"{name}!{get_column_letter(col + 1)}{row + 1}", rgce, row, col)
+                elif code == XL_SHRFMLA:
+                    first_row, _, first_col = struct.unpack("<HHB", data[:5])
+                    (cce,) = struct.unpack("<H", data[8:10])
+                    shared[(first_row, first_col)] = data[10:10 + cce]
+                elif code == XL_ARRAY:
+                    first_row, _, first_col = struct.unpack("<HHB", data[:5])
+                    arrays.add((first_row, first_col))
+            for (row, col), first in pending.items():
+                ref = f"{name}!{get_column_letter(col + 1)}{row + 1}"
+                if first in shared:
+                    decompile(ref, shared[first], row, col)
+                else:
+                    unsupported[ref] = "数组公式" if first in arrays else "找不到共享公式记录"
+        for ref in list(formulas) + list(unsupported):
+            constants.pop(ref, None)
+        return names, bounds, constants, formulas, unsupported
+    finally:
+        book.release_resources()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+工具配置热加载基准测试
+在临时目录生成一组工具配置（一半使用配置公式），比较修改单个配置文件后：
+重新加载全部配置并重建全部路由（原先只能重启 worker）与增量热加载的耗时，
+并检查未变化工具的路由对象与公式计算器实例被保留、替换路由表期间处理中的请求
+正常完成、配置有误时继续使用原路由表。
+
+用法:
+    python scripts/bench_config_reload.py --tools 40 --runs 20
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+
+from app.routers.tool_routes import ToolRouteTable
+from app.routers.tools import build_tools_router
+from app.routers.tools_api import build_tools_api_router
+from app.services.config_watcher import ToolConfigWatcher
+from app.services.formula_compiler import invalidate_formula_calculator, load_formula_calculator
+from app.services.registry import load_tool_specs
+from app.services.templating import TEMPLATE_DIR, create_templates
+
+ROOT = Path(__file__).resolve().parent.parent
+FORMULA_CONFIG = ROOT / "configs" / "tools" / "current_calc.yaml"
+
+
+def write_configs(config_dir: Path, metadata_dir: Path, tools: int) -> None:
+    shutil.copy(FORMULA_CONFIG, metadata_dir / "shared_formulas.yaml")
+    for index in range(tools):
+        config = {
+            "id": f"tool-{index}",
+            "display_name": f"工具 {index}",
+            "description": "热加载基准测试生成的配置",
+            "scenarios": ["pure_resistor", "inductive"],
+            "parameter_schema": {
+                "scenario": {"type": "str"},
+                "power": {"type": "float"},
+                "voltage": {"type": "float"},
+                "cos_phi": {"type": "float"},
+            },
+            "template": "tools/current_calc.html",
+        }
+        if index % 2:
+            config["formula_config"] = str(metadata_dir / f"formulas_{index}.yaml")
+            shutil.copy(FORMULA_CONFIG, metadata_dir / f"formulas_{index}.yaml")
+        else:
+            config["calculator"] = "app.services.current_calculator.CurrentCalculator"
+        write_yaml(config_dir / f"tool_{index}.yaml", config)
+
+
+def write_yaml(path: Path, data: dict) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        yaml.safe_dump(data, f, allow_unicode=True, sort_keys=False)
+    # 保证修改时间变化（部分文件系统的 mtime 精度较低）
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def touch_spec(path: Path, revision: int) -> None:
+    config = yaml.safe_load(path.read_text(encoding="utf-8"))
+    config["display_name"] = f"工具（第 {revision} 版）"
+    write_yaml(path, config)
+
+
+def make_build_routes(templates):
+    def build_routes(spec):
+        return [
+            *build_tools_router({spec.id: spec}, templates).routes,
+            *build_tools_api_router({spec.id: spec}).routes,
+        ]
+    return build_routes
+
+
+def full_reload(config_dir: Path, build_routes) -> ToolRouteTable:
+    invalidate_formula_calculator()
+    specs = load_tool_specs(config_dir, snapshot_dir=None)
+    for spec in specs.values():
+        if spec.formula_config:
+            spec.create_calculator()
+    return ToolRouteTable(build_routes, specs)
+
+
+async def request(app, method: str, path: str, body: bytes = b"", pause: float = 0.0):
+    messages = []
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            # 模拟慢速客户端：请求体到达前路由已经匹配完成
+            await asyncio.sleep(pause)
+            return {"type": "http.request", "body": body, "more_body": False}
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    status = next(m["status"] for m in messages if m["type"] == "http.response.start")
+    payload = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    return status, payload
+
+
+async def check_requests(app, table: ToolRouteTable, config_dir: Path, watcher: ToolConfigWatcher) -> None:
+    body = json.dumps({"scenario": "pure_resistor", "power": 2200, "voltage": 220}).encode()
+    status, payload = await request(app, "POST", "/api/tools/tool-1/calculate", body)
+    assert status == 200, payload
+    status, _ = await request(app, "GET", "/tools/tool-1")
+    assert status == 200
+    status, _ = await request(app, "GET", "/api/tools/tool-1/calculate")
+    assert status == 405, "方法不匹配时应返回 405"
+
+    # 请求已匹配旧路由、尚未读完请求体时替换路由表（删除该工具）
+    in_flight = asyncio.ensure_future(request(app, "POST", "/api/tools/tool-2/calculate", body, pause=0.05))
+    await asyncio.sleep(0.01)
+    moved = config_dir / "tool_2.yaml"
+    moved.rename(config_dir / "tool_2.yaml.bak")
+    report = watcher.check()
+    assert report is not None and report.tools == ["tool-2"] and "tool-2" not in table.specs
+    status, payload = await in_flight
+    assert status == 200, payload
+    status, _ = await request(app, "POST", "/api/tools/tool-2/calculate", body)
+    assert status == 404
+    (config_dir / "tool_2.yaml.bak").rename(moved)
+    watcher.check()
+    status, _ = await request(app, "POST", "/api/tools/tool-2/calculate", body)
+    assert status == 200
+
+
+def main():
+    parser = argparse.ArgumentParser(description="工具配置热加载基准测试")
+    parser.add_argument("--tools", type=int, default=40)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    # 错误配置回退检查会记录预期内的错误日志
+    logging.disable(logging.ERROR)
+
+    work_dir = Path(tempfile.mkdtemp())
+    config_dir, metadata_dir = work_dir / "tools", work_dir / "configs"
+    config_dir.mkdir()
+    metadata_dir.mkdir()
+    try:
+        write_configs(config_dir, metadata_dir, args.tools)
+        templates = create_templates(TEMPLATE_DIR, None)
+        templates.env.globals["static_asset"] = lambda path: "/static/" + path
+        templates.env.globals["page_bundle"] = lambda tool: None
+        templates.env.globals["client_evaluators"] = lambda tool: ""
+        build_routes = make_build_routes(templates)
+        target = config_dir / "tool_3.yaml"
+
+        full_samples = []
+        for run in range(args.runs):
+            touch_spec(target, run)
+            start = time.perf_counter()
+            full_reload(config_dir, build_routes)
+            full_samples.append((time.perf_counter() - start) * 1000)
+
+        table = full_reload(config_dir, build_routes)
+        watcher = ToolConfigWatcher(table, config_dir, metadata_dir)
+        kept_routes = {tool_id: table.routes_for(tool_id) for tool_id in table.specs}
+        kept_calculator = load_formula_calculator(table.specs["tool-1"].formula_config)
+
+        hot_samples = []
+        for run in range(args.runs):
+            touch_spec(target, args.runs + run)
+            report = watcher.check()
+            assert report is not None and report.error is None and report.tools == ["tool-3"], report
+            hot_samples.append(report.elapsed_ms)
+
+        assert table.specs["tool-3"].display_name.endswith(f"第 {2 * args.runs - 1} 版）")
+        assert all(
+            table.routes_for(tool_id) is kept_routes[tool_id] for tool_id in table.specs if tool_id != "tool-3"
+        ), "未变化工具的路由应保留"
+        assert load_formula_calculator(table.specs["tool-1"].formula_config) is kept_calculator
+
+        # 公式配置变化只重建引用它的工具
+        formulas = metadata_dir / "formulas_5.yaml"
+        write_yaml(formulas, yaml.safe_load(formulas.read_text(encoding="utf-8")))
+        report = watcher.check()
+        assert report is not None and report.tools == ["tool-5"], report
+        assert load_formula_calculator(table.specs["tool-1"].formula_config) is kept_calculator
+
+        # 配置有误时保留原路由表
+        before = table.routes
+        valid = yaml.safe_load(target.read_text(encoding="utf-8"))
+        target.write_text("id: tool-3\ndisplay_name: [未闭合\n", encoding="utf-8")
+        report = watcher.check()
+        assert report is not None and report.error is not None and table.routes == before
+        duplicate = yaml.safe_load((config_dir / "tool_4.yaml").read_text(encoding="utf-8"))
+        duplicate["id"] = "tool-0"
+        write_yaml(config_dir / "tool_4.yaml", duplicate)
+        report = watcher.check()
+        assert report is not None and report.error is not None and table.routes == before
+        write_yaml(target, valid)
+        duplicate["id"] = "tool-4"
+        write_yaml(config_dir / "tool_4.yaml", duplicate)
+        report = watcher.check()
+        assert report is not None and report.error is None and report.tools == ["tool-3", "tool-4"], report
+
+        app = FastAPI()
+        app.router.routes.append(table)
+        asyncio.run(check_requests(app, table, config_dir, watcher))
+
+        full, hot = statistics.median(full_samples), statistics.median(hot_samples)
+        print(f"{args.tools} 个工具，修改 1 个配置文件，{args.runs} 次中位数")
+        print(f"{'方式':<20}{'耗时(ms)':>10}")
+        print(f"{'全部重新加载':<20}{full:>10.1f}")
+        print(f"{'增量热加载':<20}{hot:>10.1f}")
+        print(f"加速比: {full / hot:.1f}x；路由/计算器保留、处理中请求、错误配置回退检查通过")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
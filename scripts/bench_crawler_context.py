@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+履带机器人全场景计算基准测试
+对比逐场景重新解析通用参数（引入计算上下文之前的做法）与共享计算上下文的耗时
+
+用法:
+    python scripts/bench_crawler_context.py --rounds 2000 --batch 500
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.crawler_robot_force_calculator import (
+    CrawlerEvaluationContext,
+    CrawlerRobotForceCalculator,
+)
+
+BASE_PARAMS = {"m1": 50, "m2": 50, "D": 120, "slope_percent": 55, "obstacle_height": 80,
+               "T_gear_large": 60, "T_gear_small": 40}
+
+
+def per_scenario(calculator, rows):
+    # 不传通用参数块：每个场景重新解析（引入上下文之前的行为）
+    for row in rows:
+        for method_name in calculator.SCENARIO_METHODS.values():
+            getattr(calculator, method_name)(row)
+
+
+def with_context(calculator, rows):
+    calculator.calculate_batch(rows, context=CrawlerEvaluationContext())
+
+
+def common_only_naive(calculator, rows):
+    for row in rows:
+        for _ in calculator.SCENARIO_METHODS:
+            calculator._get_common_params(row)
+
+
+def common_only_context(calculator, rows):
+    # 与 calculate_all 一致：每行查找一次上下文，各场景共享结果
+    context = CrawlerEvaluationContext()
+    for row in rows:
+        context.get_common_params(calculator, row)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="履带机器人计算上下文基准测试")
+    parser.add_argument("--rounds", type=int, default=2000, help="单组参数全场景计算的重复次数")
+    parser.add_argument("--batch", type=int, default=500, help="批量行数（车体参数相同，加速度/电流/速度逐行不同）")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最快一次")
+    args = parser.parse_args()
+
+    calculator = CrawlerRobotForceCalculator()
+    n_scenarios = len(calculator.SCENARIO_METHODS)
+    same_rows = [dict(BASE_PARAMS)] * args.rounds
+    batch_rows = [
+        dict(BASE_PARAMS, a=0.2 + 0.001 * (i % 200), I_actual=6 + 0.01 * (i % 300), v_rated=0.3 + 0.001 * (i % 100))
+        for i in range(args.batch)
+    ]
+
+    print("=" * 64)
+    print(f"履带机器人全场景基准（{n_scenarios} 个场景）")
+    print("=" * 64)
+    cases = [
+        ("同一参数组 × 全场景", same_rows),
+        ("共享车体参数、运行参数各不相同的批量行", batch_rows),
+    ]
+    for title, rows in cases:
+        naive = best_of(lambda: per_scenario(calculator, rows), args.repeat)
+        shared = best_of(lambda: with_context(calculator, rows), args.repeat)
+        print(f"{title}（{len(rows)} 行）")
+        print(f"  逐场景调用:   {naive * 1000:9.2f} ms  ({naive / len(rows) * 1e6:7.1f} µs/行)")
+        print(f"  共享上下文:   {shared * 1000:9.2f} ms  ({shared / len(rows) * 1e6:7.1f} µs/行)")
+        print(f"  加速比:       {naive / shared:9.2f} x")
+
+    naive = best_of(lambda: common_only_naive(calculator, same_rows), args.repeat)
+    shared = best_of(lambda: common_only_context(calculator, same_rows), args.repeat)
+    print("仅通用参数块（不含公式字符串拼接）")
+    print(f"  逐场景解析:   {naive * 1000:9.2f} ms")
+    print(f"  上下文复用:   {shared * 1000:9.2f} ms")
+    print(f"  加速比:       {naive / shared:9.2f} x")
+
+
+if __name__ == "__main__":
+    main()
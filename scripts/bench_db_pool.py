@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+风机数据库连接池并发基准测试
+对比每次查询新建连接（原实现）与线程复用的只读连接在多线程下的每秒读取次数
+
+用法:
+    python scripts/bench_db_pool.py --threads 8 --seconds 2
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db import database
+from app.db.database import get_fan_performance
+
+
+def connect_per_call(fan_type):
+    """原实现：每次调用打开连接、建游标、关闭"""
+    conn = sqlite3.connect(str(database.DB_PATH))
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT point_index, phi, psi_p, eta
+        FROM fan_performance
+        WHERE fan_type = ?
+        ORDER BY point_index ASC
+    """, (fan_type,))
+    results = cursor.fetchall()
+    conn.close()
+    return [{"phi": row["phi"], "psi_p": row["psi_p"], "eta": row["eta"]} for row in results]
+
+
+def pooled(fan_type):
+    return get_fan_performance(fan_type)
+
+
+def run(func, threads, seconds, fan_type):
+    counts = [0] * threads
+    stop = threading.Event()
+
+    def worker(index):
+        count = 0
+        while not stop.is_set():
+            func(fan_type)
+            count += 1
+        counts[index] = count
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in workers:
+        thread.join()
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="风机数据库连接池基准测试")
+    parser.add_argument("--threads", type=int, default=8, help="并发线程数")
+    parser.add_argument("--seconds", type=float, default=2.0, help="每种方式的运行时间")
+    parser.add_argument("--fan-type", default="4-68", help="查询的风机型号")
+    args = parser.parse_args()
+
+    if connect_per_call(args.fan_type) != pooled(args.fan_type):
+        raise SystemExit("两种方式的查询结果不一致")
+
+    print("=" * 60)
+    print(f"风机性能查询并发基准: {args.threads} 线程 × {args.seconds:.1f} s")
+    print("=" * 60)
+    before = run(connect_per_call, args.threads, args.seconds, args.fan_type)
+    after = run(pooled, args.threads, args.seconds, args.fan_type)
+    print(f"每次新建连接: {before:12.0f} 次/秒")
+    print(f"复用只读连接: {after:12.0f} 次/秒")
+    print(f"提升:         {after / before:12.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+多段工作周期引擎基准测试
+对比逐周期Python循环与一次向量化调用评估大量候选周期的耗时
+
+用法:
+    python scripts/bench_duty_cycle.py --cycles 10000 --segments 12
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from app.services.duty_cycle import evaluate_duty_cycles
+
+
+def python_loop(times, loads, speeds, rated):
+    """逐周期逐分段的纯Python实现，作为对照"""
+    results = []
+    for t_row, f_row, v_row in zip(times, loads, speeds):
+        total = sum(t_row)
+        rms = math.sqrt(sum(f * f * t for f, t in zip(f_row, t_row)) / total)
+        avg_v = sum(abs(v) * t for v, t in zip(v_row, t_row)) / total
+        results.append((rms, avg_v, 1 - rms / rated))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="工作周期引擎基准测试")
+    parser.add_argument("--cycles", type=int, default=10000, help="候选周期数")
+    parser.add_argument("--segments", type=int, default=12, help="每个周期的分段数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数，取最快一次")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    times = rng.uniform(0.01, 2.0, size=(args.cycles, args.segments))
+    loads = rng.uniform(-50.0, 50.0, size=(args.cycles, args.segments))
+    speeds = rng.uniform(-3000.0, 3000.0, size=(args.cycles, args.segments))
+    rated = 40.0
+
+    times_list, loads_list, speeds_list = times.tolist(), loads.tolist(), speeds.tolist()
+
+    loop_best = min(
+        _timed(lambda: python_loop(times_list, loads_list, speeds_list, rated)) for _ in range(args.repeat)
+    )
+    vector_best = min(
+        _timed(lambda: evaluate_duty_cycles(times, loads, speeds=speeds, rated=rated)) for _ in range(args.repeat)
+    )
+
+    reference = python_loop(times_list, loads_list, speeds_list, rated)
+    vectorized = evaluate_duty_cycles(times, loads, speeds=speeds, rated=rated)
+    max_error = max(abs(ref[0] - rms) / ref[0] for ref, rms in zip(reference, vectorized.rms))
+
+    print("=" * 60)
+    print(f"工作周期基准: {args.cycles} 个周期 × {args.segments} 个分段")
+    print("=" * 60)
+    print(f"Python循环:   {loop_best * 1000:10.2f} ms")
+    print(f"向量化调用:   {vector_best * 1000:10.2f} ms")
+    print(f"加速比:       {loop_best / vector_best:10.1f} x")
+    print(f"有效值最大相对误差: {max_error:.2e}")
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    main()
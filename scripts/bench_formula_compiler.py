@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+配置公式编译器基准测试
+对比 configs/tools/current_calc.yaml 编译出的公式与 CurrentCalculator 手写方法的结果与耗时
+
+用法:
+    python scripts/bench_formula_compiler.py --rounds 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.current_calculator import CurrentCalculator
+from app.services.formula_compiler import invalidate_formula_calculator, load_formula_calculator
+
+CONFIG_PATH = "configs/tools/current_calc.yaml"
+
+PARAMS = {
+    "pure_resistor": {"power": 2200, "voltage": 220},
+    "inductive": {"power": 2200, "voltage": 220, "cos_phi": 0.85},
+    "single_phase_motor": {"power": 1500, "voltage": 220, "efficiency": 0.875, "cos_phi": 0.89},
+    "three_phase_motor": {"power": 5000, "voltage": 380, "efficiency": 0.9, "cos_phi": 0.85},
+}
+
+HAND_WRITTEN_RAW = {
+    "pure_resistor": lambda p: p["power"] / p["voltage"],
+    "inductive": lambda p: p["power"] / (p["voltage"] * p["cos_phi"]),
+    "single_phase_motor": lambda p: p["power"] / (p["voltage"] * p["efficiency"] * p["cos_phi"]),
+    "three_phase_motor": lambda p: p["power"] / (3 ** 0.5 * p["voltage"] * p["efficiency"] * p["cos_phi"]),
+}
+
+
+def timed(func, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="配置公式编译器基准测试")
+    parser.add_argument("--rounds", type=int, default=100000, help="每个场景的调用次数")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    invalidate_formula_calculator()
+    compiled = load_formula_calculator(CONFIG_PATH)
+    compile_ms = (time.perf_counter() - start) * 1000
+    hand = CurrentCalculator()
+
+    print("=" * 92)
+    print(f"配置公式编译（读取YAML + 解析 + 编译 {len(compiled.formulas)} 个场景）: {compile_ms:.2f} ms")
+    for scenario, reason in compiled.skipped.items():
+        print(f"  跳过 {scenario}: {reason}")
+    print("=" * 92)
+    print(f"{'场景':<22}{'一致':<6}{'编译函数':>12}{'手写表达式':>12}{'编译calculate':>16}{'手写calculate':>16}  (µs/次)")
+    for scenario, params in PARAMS.items():
+        formula = compiled.formulas[scenario]
+        positional = [params[name] for name in formula.parameters]
+        same_value = formula.func(*positional) == HAND_WRITTEN_RAW[scenario](params)
+        same_response = compiled.calculate(scenario, params).result == hand.calculate(scenario, params).result
+
+        raw_compiled = timed(lambda: formula.func(*positional), args.rounds)
+        raw_hand = timed(lambda: HAND_WRITTEN_RAW[scenario](params), args.rounds)
+        full_rounds = max(args.rounds // 10, 1)
+        full_compiled = timed(lambda: compiled.calculate(scenario, params), full_rounds)
+        full_hand = timed(lambda: hand.calculate(scenario, params), full_rounds)
+        ok = "是" if same_value and same_response else "否"
+        print(f"{scenario:<22}{ok:<6}{raw_compiled:>12.3f}{raw_hand:>12.3f}{full_compiled:>16.3f}{full_hand:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
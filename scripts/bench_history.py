@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+计算历史记录开销基准测试
+在临时历史数据库上对电流计算接口的处理函数分别测量：不记录历史、请求内同步序列化并写库、
+写后队列（后台线程序列化并批量写入）三种方式的单次请求延迟 p50/p99
+
+用法:
+    python scripts/bench_history.py --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from pydantic import ConfigDict, create_model
+
+from app.db import database
+from app.routers import tools_api
+from app.services import history
+from app.services.registry import ToolSpec
+
+PAYLOAD = {"scenario": "pure_resistor", "power": 2200.0, "voltage": 220.0}
+
+
+class SyncRecorder:
+    """对照组：每个请求在处理函数内直接写一行并提交"""
+
+    def __init__(self):
+        self.pending = 0
+        self.dropped = 0
+
+    def record(self, tool, scenario, params, result=None, latency_ms=0.0, error=None):
+        row = (time.time(), tool, scenario, history._to_json(params), history._to_json(result),
+               "error" if error else "ok", error, latency_ms)
+        conn = database.get_write_connection(history.HISTORY_DB_PATH)
+        with conn:
+            conn.execute(history.INSERT_HISTORY_SQL, row)
+        return True
+
+
+def build_handler():
+    spec = ToolSpec(
+        id="current-calc",
+        display_name="电流计算",
+        calculator="app.services.current_calculator.CurrentCalculator",
+        template="tools/current_calc.html",
+    )
+    model = create_model("BenchRequest", __config__=ConfigDict(extra="allow"), scenario=(str, ...))
+    return tools_api._build_handler(spec, model), model
+
+
+def measure(handler, model, recorder, requests):
+    tools_api.get_history_recorder = lambda: recorder
+    loop = asyncio.new_event_loop()
+    payload = model(**PAYLOAD)
+    for _ in range(200):
+        loop.run_until_complete(handler(payload))
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        loop.run_until_complete(handler(payload))
+        samples.append((time.perf_counter() - start) * 1e6)
+    loop.close()
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="计算历史记录开销基准测试")
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    history.HISTORY_DB_PATH = workdir / "history.db"
+    history.ensure_history_schema()
+    handler, model = build_handler()
+
+    try:
+        class NullRecorder:
+            def record(self, *args, **kwargs):
+                return False
+
+        results = {"不记录": measure(handler, model, NullRecorder(), args.requests)}
+        results["同步写库"] = measure(handler, model, SyncRecorder(), args.requests)
+
+        recorder = history.HistoryRecorder(max_rows=0)
+        recorder.start()
+        results["写后队列"] = measure(handler, model, recorder, args.requests)
+        recorder.stop()
+
+        base_p50, base_p99 = results["不记录"]
+        print(f"{'方式':<8}{'p50(µs)':>10}{'p99(µs)':>10}{'p99增加(µs)':>14}")
+        for name, (p50, p99) in results.items():
+            print(f"{name:<8}{p50:>10.1f}{p99:>10.1f}{p99 - base_p99:>14.1f}")
+
+        conn = sqlite3.connect(str(history.HISTORY_DB_PATH))
+        rows = conn.execute("SELECT COUNT(*) FROM calculation_history").fetchone()[0]
+        conn.close()
+        print(f"历史表行数: {rows}（同步 {args.requests} + 写后 {recorder.written}），丢弃 {recorder.dropped}")
+
+        start = time.perf_counter()
+        page = history.query_history(tool="current-calc", page=3, page_size=50)
+        print(f"分页查询 (total={page['total']}, 第3页): {(time.perf_counter() - start) * 1000:.2f} ms")
+    finally:
+        database.close_connections()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
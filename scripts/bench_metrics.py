@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+运行指标基准测试与多进程汇总验证
+1. 开销：通过 ASGI 接口反复调用计算接口，比较开启与关闭指标统计时每个请求的耗时，
+   并单独测量一次统计（start_calculation + finish_calculation）的耗时；
+2. 多进程：以 app.server 启动多个 worker（METRICS_DIR 指向临时目录），每个请求新建连接（由内核分配到不同 worker），
+   按已知比例发送成功、ValueError（400）、未知场景、缺少单位配置与缺少 scenario（请求体校验失败，422）的请求，
+   等待快照写出后多次请求 /metrics，检查无论由哪个 worker 响应，汇总的请求数、错误数、直方图计数都与发送的一致，
+   进行中的请求数为 0、参与汇总的进程数等于 worker 数，且主进程预加载时的风机曲线缓存计数没有被各 worker 重复计入。
+
+用法:
+    python scripts/bench_metrics.py --requests 20000 --workers 4 --http-requests 400
+"""
+import argparse
+import asyncio
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+
+from app.routers.tools_api import build_tools_api_router
+from app.services.metrics import REQUESTS, get_metrics, read_snapshots
+from app.services.registry import ToolSpec
+
+ROOT = Path(__file__).resolve().parent.parent
+READY_LINE = "Application startup complete"
+# 没有单位配置的工具 id：带 output_units 的请求被处理函数拒绝（bad_request）
+TOOL_ID = "current-bench"
+SCENARIOS = ["pure_resistor", "inductive", "three_phase_motor"]
+TOOL_CONFIG = {
+    "id": TOOL_ID,
+    "display_name": "电流计算",
+    "scenarios": SCENARIOS,
+    "calculator": "app.services.current_calculator.CurrentCalculator",
+    "template": "tools/current_calc.html",
+}
+
+# (请求体, 指标中的场景标签, 状态码, 错误类型)
+REQUEST_MIX = [
+    (b'{"scenario":"pure_resistor","power":1000,"voltage":220}', "pure_resistor", "200", None),
+    (b'{"scenario":"inductive","power":1500,"voltage":220,"cos_phi":0.85}', "inductive", "200", None),
+    (b'{"scenario":"three_phase_motor","power":7500,"voltage":380,"cos_phi":0.85,"efficiency":0.9}',
+     "three_phase_motor", "200", None),
+    (b'{"scenario":"pure_resistor","power":1000,"voltage":0}', "pure_resistor", "400", "value_error"),
+    (b'{"scenario":"no_such_scenario","power":1}', "other", "400", "value_error"),
+    (b'{"scenario":"pure_resistor","power":1,"voltage":1,"output_units":{"result":"mA"}}',
+     "pure_resistor", "400", "bad_request"),
+    (b'{"power":1}', "none", "422", "validation_error"),
+]
+
+SAMPLE_LINE = re.compile(r'^([a-z_]+)(\{[^}]*\})? (-?[0-9.e+]+|\+Inf)$')
+
+
+async def post(app: FastAPI, path: str, body: bytes) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status = None
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure_requests(app: FastAPI, requests: int) -> float:
+    path = f"/api/tools/{TOOL_ID}/calculate"
+    bodies = [mix[0] for mix in REQUEST_MIX[:3]]
+    start = time.perf_counter()
+    for index in range(requests):
+        await post(app, path, bodies[index % len(bodies)])
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def bench_overhead(requests: int, rounds: int = 5) -> None:
+    app = FastAPI()
+    app.include_router(build_tools_api_router({TOOL_ID: ToolSpec(**TOOL_CONFIG)}))
+    metrics = get_metrics()
+    asyncio.run(measure_requests(app, 500))
+
+    timings: Dict[bool, List[float]] = {True: [], False: []}
+    for _ in range(rounds):
+        for enabled in (False, True):
+            metrics.enabled = enabled
+            timings[enabled].append(asyncio.run(measure_requests(app, requests // rounds)))
+    metrics.enabled = True
+
+    count = 200000
+    start = time.perf_counter()
+    for _ in range(count):
+        metrics.start_calculation(TOOL_ID)
+        metrics.finish_calculation(TOOL_ID, SCENARIOS, "pure_resistor", None, 0.0003)
+    single = (time.perf_counter() - start) / count * 1e6
+
+    off, on = min(timings[False]), min(timings[True])
+    print(f"计算接口（ASGI，{requests} 次请求，取 {rounds} 轮最小值）")
+    print(f"  关闭统计 {off:8.1f} µs/请求")
+    print(f"  开启统计 {on:8.1f} µs/请求（+{on - off:.1f} µs，{(on - off) / off:+.1%}）")
+    print(f"  单次统计 {single:8.2f} µs（start_calculation + finish_calculation）")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def http(port: int, method: str, path: str, body: bytes = b"") -> Tuple[int, bytes]:
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        head = f"{method} {path} HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n"
+        if body:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+        sock.sendall(head.encode() + b"\r\n" + body)
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    header, _, payload = data.partition(b"\r\n\r\n")
+    return int(header.split(b" ", 2)[1]), payload
+
+
+def parse_metrics(text: str) -> Dict[str, float]:
+    """解析 Prometheus 文本，返回 {名称{标签}: 数值}；格式不对时报错"""
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("# HELP ") or line.startswith("# TYPE "):
+            continue
+        match = SAMPLE_LINE.match(line)
+        if match is None:
+            raise SystemExit(f"无法解析的指标行: {line!r}")
+        samples[f"{match.group(1)}{match.group(2) or ''}"] = float(match.group(3))
+    return samples
+
+
+def check_multiprocess(workers: int, http_requests: int, flush_interval: float) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = Path(tmp) / "tools"
+        config_dir.mkdir()
+        with (config_dir / "current_bench.yaml").open("w", encoding="utf-8") as f:
+            yaml.safe_dump(TOOL_CONFIG, f, allow_unicode=True, sort_keys=False)
+        port = free_port()
+        metrics_dir = Path(tmp) / "metrics"
+        env = {
+            **os.environ, "TOOLS_CONFIG_DIR": str(config_dir), "METRICS_DIR": str(metrics_dir),
+            "METRICS_FLUSH_INTERVAL": str(flush_interval),
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "app.server", "--workers", str(workers), "--port", str(port),
+             "--log-level", "info"],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        )
+        ready = threading.Semaphore(0)
+
+        def read_log():
+            for line in process.stderr:
+                if READY_LINE in line:
+                    ready.release()
+
+        threading.Thread(target=read_log, daemon=True).start()
+        try:
+            for _ in range(workers):
+                if not ready.acquire(timeout=60):
+                    raise SystemExit("worker 启动超时")
+            failures = verify(port, workers, http_requests, flush_interval)
+            per_worker = {
+                snapshot["pid"]: sum(value for name, _, value in snapshot["values"] if name == REQUESTS.name)
+                for snapshot in read_snapshots(metrics_dir)
+            }
+            print("各 worker 处理的请求数: " + "，".join(f"{pid}: {count:g}" for pid, count in per_worker.items()))
+            return failures
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+
+def verify(port: int, workers: int, http_requests: int, flush_interval: float) -> int:
+    expected: Counter = Counter()
+    for index in range(http_requests):
+        body, scenario, status, error = REQUEST_MIX[index % len(REQUEST_MIX)]
+        got, payload = http(port, "POST", f"/api/tools/{TOOL_ID}/calculate", body)
+        if str(got) != status:
+            raise SystemExit(f"请求 {body!r} 返回 {got}（期望 {status}）：{payload!r}")
+        labels = f'tool="{TOOL_ID}",scenario="{scenario}"'
+        expected[f'tool_requests_total{{{labels},status="{status}"}}'] += 1
+        if status != "422":
+            # 请求体校验失败时不进入处理函数，不计入耗时直方图
+            expected[f"tool_request_duration_seconds_count{{{labels}}}"] += 1
+        if error:
+            expected[f'tool_errors_total{{{labels},error="{error}"}}'] += 1
+    expected[f'tool_requests_in_progress{{tool="{TOOL_ID}"}}'] = 0
+    # 曲线在 fork 前由主进程加载，worker 的计数从 0 开始
+    expected["fan_curve_cache_reloads_total"] = 0
+    expected['fan_curve_cache_lookups_total{result="hit"}'] = 0
+    expected["metrics_workers"] = workers
+
+    time.sleep(flush_interval * 2 + 0.5)
+    failures = 0
+    for attempt in range(workers * 2):
+        status, payload = http(port, "GET", "/metrics")
+        samples = parse_metrics(payload.decode("utf-8"))
+        wrong = {key: (samples.get(key), value) for key, value in expected.items() if samples.get(key) != value}
+        if wrong:
+            failures += 1
+            print(f"第 {attempt + 1} 次 /metrics 与发送的请求不一致（实际, 期望）: {wrong}")
+    print(f"{workers} 个 worker，{http_requests} 次请求，{workers * 2} 次 /metrics 汇总"
+          f"{'全部一致' if not failures else f'有 {failures} 次不一致'}")
+    for key, value in sorted(expected.items()):
+        print(f"  {key} {value:g}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="运行指标开销与多进程汇总验证")
+    parser.add_argument("--requests", type=int, default=20000, help="开销测量的请求数")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--http-requests", type=int, default=400, help="多进程验证发送的请求数")
+    parser.add_argument("--flush-interval", type=float, default=0.5, help="worker 写出快照的间隔（秒）")
+    args = parser.parse_args()
+
+    bench_overhead(args.requests)
+    if check_multiprocess(args.workers, args.http_requests, args.flush_interval):
+        sys.exit("多进程汇总结果不一致")
+
+
+if __name__ == "__main__":
+    main()
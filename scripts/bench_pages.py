@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+工具页渲染基准测试
+用 templates/tools 下的全部模板构造工具注册表，直接通过 ASGI 接口调用页面路由，
+对比实时渲染与预渲染页面的每秒请求数，并检查两者输出一致
+
+用法:
+    python scripts/bench_pages.py --seconds 3
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.templating import Jinja2Templates
+
+from app.routers.tools import build_tools_router
+from app.services import pages as pages_module
+from app.services.registry import ToolSpec
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = BASE_DIR / "templates"
+
+
+def build_specs():
+    specs = {}
+    for template in sorted((TEMPLATE_DIR / "tools").glob("*.html")):
+        tool_id = template.stem.replace("_", "-")
+        specs[tool_id] = ToolSpec(
+            id=tool_id,
+            display_name=template.stem,
+            calculator="app.services.current_calculator.CurrentCalculator",
+            template=f"tools/{template.name}",
+        )
+    return specs
+
+
+def build_app(specs, templates, page_map):
+    app = FastAPI()
+    app.include_router(build_tools_router(specs, templates, page_map))
+    return app
+
+
+async def request(app, path, headers=()):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench")] + [(k.encode(), v.encode()) for k, v in headers],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status, body = None, []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(body)
+
+
+async def throughput(app, paths, seconds):
+    for path in paths:
+        await request(app, path)
+    count, deadline = 0, time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for path in paths:
+            await request(app, path)
+        count += len(paths)
+    return count / seconds
+
+
+async def run(seconds):
+    specs = build_specs()
+    templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+    templates.env.globals["static_asset"] = lambda path: f"/static/{path}"
+    templates.env.globals["page_bundle"] = lambda tool: None
+    templates.env.globals["client_evaluators"] = lambda tool: ""
+    paths = [f"/tools/{tool_id}" for tool_id in specs]
+
+    workdir = Path(tempfile.mkdtemp())
+    try:
+        fingerprint = pages_module.build_fingerprint(TEMPLATE_DIR, {}, specs)
+        start = time.perf_counter()
+        pages_module.prerender_pages(templates, specs, fingerprint, workdir)
+        build_ms = (time.perf_counter() - start) * 1000
+        page_map = pages_module.load_prerendered_pages(fingerprint, output_dir=workdir)
+
+        live_app = build_app(specs, templates, None)
+        static_app = build_app(specs, templates, page_map)
+        for path in paths:
+            _, live = await request(live_app, path)
+            _, cached = await request(static_app, path)
+            assert live == cached, f"{path} 预渲染输出与实时渲染不一致"
+
+        etag = page_map[pages_module.tool_page_key(next(iter(specs)))].etag
+        status, _ = await request(static_app, paths[0], [("if-none-match", etag)])
+
+        live_rps = await throughput(live_app, paths, seconds)
+        static_rps = await throughput(static_app, paths, seconds)
+        print(f"{len(paths)} 个工具页，预渲染耗时 {build_ms:.0f} ms，输出与实时渲染一致，If-None-Match -> {status}")
+        print(f"实时渲染: {live_rps:8.0f} 请求/秒")
+        print(f"预渲染:   {static_rps:8.0f} 请求/秒 ({static_rps / live_rps:.1f}x)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="工具页渲染基准测试")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(run(args.seconds))
+
+
+if __name__ == "__main__":
+    main()
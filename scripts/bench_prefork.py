@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+多进程启动基准测试
+分别以“各 worker 独立初始化”和“主进程预加载后 fork”两种方式启动 app.server，
+测量全部 worker 就绪的耗时，以及处理若干请求后每个 worker 的独占内存（USS，
+Private_Clean + Private_Dirty）与按比例分摊的内存（PSS）。
+
+用法:
+    python scripts/bench_prefork.py --workers 4 --runs 3
+"""
+import argparse
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.calculator import CALCULATOR_PATHS
+
+ROOT = Path(__file__).resolve().parent.parent
+READY_LINE = "Application startup complete"
+
+
+def write_configs(config_dir: Path) -> None:
+    for tool, import_path in CALCULATOR_PATHS.items():
+        tool_id = tool.replace("_", "-")
+        config = {
+            "id": tool_id,
+            "display_name": tool,
+            "scenarios": [],
+            "parameter_schema": {f"param_{n}": {"type": "float"} for n in range(8)},
+            "calculator": import_path,
+            "template": "tools/current_calc.html",
+        }
+        with (config_dir / f"{tool}.yaml").open("w", encoding="utf-8") as f:
+            yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def http_get(port: int, path: str) -> int:
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(f"GET {path} HTTP/1.1\r\nHost: bench\r\nConnection: close\r\n\r\n".encode())
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+    return int(data.split(b" ", 2)[1])
+
+
+def memory(pid: int) -> tuple:
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return (fields["Private_Clean"] + fields["Private_Dirty"]) / 1024, fields["Pss"] / 1024
+
+
+def children(pid: int) -> list:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def run_once(preload: bool, workers: int, config_dir: Path, requests: int) -> tuple:
+    port = free_port()
+    command = [sys.executable, "-m", "app.server", "--port", str(port), "--workers", str(workers)]
+    if not preload:
+        command.append("--no-preload")
+    env = {**os.environ, "TOOLS_CONFIG_DIR": str(config_dir), "CALCULATOR_WARMUP": "all"}
+
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    ready = threading.Semaphore(0)
+    log = []
+
+    def read_log():
+        for line in process.stderr:
+            log.append(line)
+            if READY_LINE in line:
+                ready.release()
+
+    threading.Thread(target=read_log, daemon=True).start()
+    try:
+        for _ in range(workers):
+            if not ready.acquire(timeout=120):
+                raise RuntimeError("worker 启动超时:\n" + "".join(log))
+        boot_ms = (time.perf_counter() - start) * 1000
+
+        for index in range(requests):
+            path = ("/", "/openapi.json", "/api/history")[index % 3]
+            status = http_get(port, path)
+            assert status == 200, (path, status)
+
+        samples = [memory(pid) for pid in children(process.pid)]
+        master_uss, _ = memory(process.pid)
+        uss = statistics.mean(sample[0] for sample in samples)
+        pss = sum(sample[1] for sample in samples) + memory(process.pid)[1]
+        return boot_ms, uss, pss, master_uss
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="多进程启动基准测试")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=60, help="测量内存前发送的请求数")
+    args = parser.parse_args()
+
+    config_dir = Path(tempfile.mkdtemp())
+    try:
+        write_configs(config_dir)
+        results = {}
+        for name, preload in (("各 worker 独立初始化", False), ("主进程预加载后 fork", True)):
+            samples = [run_once(preload, args.workers, config_dir, args.requests) for _ in range(args.runs)]
+            results[name] = tuple(statistics.median(column) for column in zip(*samples))
+
+        print(f"{len(CALCULATOR_PATHS)} 个工具，{args.workers} 个 worker，{args.runs} 次中位数")
+        print(f"{'方式':<20}{'全部就绪(ms)':>14}{'worker USS(MB)':>16}{'总 PSS(MB)':>12}{'主进程 USS(MB)':>16}")
+        for name, (boot, uss, pss, master) in results.items():
+            print(f"{name:<20}{boot:>14.0f}{uss:>16.1f}{pss:>12.1f}{master:>16.1f}")
+    finally:
+        shutil.rmtree(config_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
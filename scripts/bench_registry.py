@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+工具注册表快照基准测试
+在临时目录生成一组工具配置，分别在新进程中测量：纯 Python YAML 解析（原实现）、
+libyaml C 解析、读取注册表快照三种方式加载全部工具规格、生成请求模型的耗时，
+以及连同 import 的 worker 启动总耗时
+
+用法:
+    python scripts/bench_registry.py --tools 22 --params 12 --runs 5
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.calculator import CALCULATOR_PATHS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WORKER = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import yaml
+from app.services import registry
+imported = time.perf_counter()
+if {mode!r} == "pure":
+    registry.YAML_LOADER = yaml.SafeLoader
+snapshot_dir = None if {mode!r} != "snapshot" else {snapshot_dir!r}
+specs = registry.load_tool_specs(registry.Path({config_dir!r}), snapshot_dir=snapshot_dir)
+loaded = time.perf_counter()
+models = [spec.build_request_model() for spec in specs.values()]
+done = time.perf_counter()
+print((loaded - imported) * 1000, (done - imported) * 1000, (done - start) * 1000)
+"""
+
+
+def write_configs(config_dir: Path, tools: int, params: int) -> None:
+    names = list(CALCULATOR_PATHS.items())
+    for index in range(tools):
+        tool, import_path = names[index % len(names)]
+        tool_id = f"{tool.replace('_', '-')}-{index}"
+        config = {
+            "id": tool_id,
+            "display_name": f"工具 {index}",
+            "description": "注册表快照基准测试生成的配置",
+            "scenarios": [f"scenario_{n}" for n in range(6)],
+            "parameter_schema": {
+                f"param_{n}": {"type": ("float", "int", "str", "bool")[n % 4], "default": None,
+                               "label": f"参数 {n}", "unit": "mm", "minimum": 0, "maximum": 1000}
+                for n in range(params)
+            },
+            "calculator": import_path,
+            "template": f"tools/{tool}.html",
+        }
+        with (config_dir / f"{tool_id}.yaml").open("w", encoding="utf-8") as f:
+            yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+
+
+def run(mode: str, config_dir: Path, snapshot_dir: Path, runs: int):
+    code = WORKER.format(root=str(ROOT), mode=mode, config_dir=str(config_dir), snapshot_dir=str(snapshot_dir))
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append(tuple(map(float, output.split())))
+    return tuple(statistics.median(column) for column in zip(*samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="工具注册表快照基准测试")
+    parser.add_argument("--tools", type=int, default=22)
+    parser.add_argument("--params", type=int, default=12)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    config_dir, snapshot_dir = workdir / "tools", workdir / "snapshot"
+    config_dir.mkdir()
+    try:
+        write_configs(config_dir, args.tools, args.params)
+        # 先写入快照，之后的运行都命中快照
+        run("snapshot", config_dir, snapshot_dir, 1)
+        results = {
+            "纯 Python YAML": run("pure", config_dir, snapshot_dir, args.runs),
+            "libyaml C 解析": run("c", config_dir, snapshot_dir, args.runs),
+            "注册表快照": run("snapshot", config_dir, snapshot_dir, args.runs),
+        }
+        print(f"{args.tools} 个工具，每个 {args.params} 个参数；新进程 {args.runs} 次中位数")
+        print(f"{'方式':<14}{'加载规格(ms)':>14}{'含请求模型(ms)':>16}{'含 import(ms)':>16}")
+        for name, (load_ms, models_ms, total_ms) in results.items():
+            print(f"{name:<14}{load_ms:>14.1f}{models_ms:>16.1f}{total_ms:>16.1f}")
+        for entry in os.listdir(snapshot_dir):
+            print(f"快照文件: {entry} ({(snapshot_dir / entry).stat().st_size} 字节)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
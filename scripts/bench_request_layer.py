@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+请求层基准测试
+按随机种子生成典型的工具页面使用会话（填写参数后计算、双击计算按钮、连续微调参数并重复点击、
+切换场景后用相同参数再算一次、偶尔输入服务器会拒绝的参数），在 Node.js 中以虚拟时钟回放：
+分别用不带防抖/缓存的原始 apiRequest（逐次 fetch）和 static/js/common.js 的请求层（calculateTool）
+发送计算请求，模拟服务器按随机延迟返回（响应回显请求参数，并遵守 AbortSignal），比较：
+
+- 到达服务器的请求数（请求层中被中止的请求也计入，服务器可能已经收到）；
+- 过期结果：页面显示的结果不是该场景最后一次点击的参数（原始方式下慢响应会覆盖后发的快响应）；
+- 请求层的缓存命中、并发合并、被取代与中止的次数。
+
+请求层下每个场景最后一次点击必须得到与其参数一致的结果，且不显示任何过期结果，否则以非零状态退出。
+
+用法:
+    python scripts/bench_request_layer.py --sessions 200 --seed 1
+"""
+import argparse
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+COMMON_JS = BASE_DIR / "static" / "js" / "common.js"
+
+TOOLS = {
+    "screw-horizontal": ["scenario1", "scenario2", "scenario3"],
+    "inertia-calc": ["cylinder", "rectangular", "hollow_cylinder"],
+    "fan-selection": ["select"],
+}
+
+NODE_HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [commonPath, sessionsPath] = process.argv.slice(2);
+
+// 原始 apiRequest：每次调用一次 fetch，无防抖、缓存与取消
+const BASELINE = `
+async function baselineRequest(url, method = 'GET', data = null) {
+    const options = { method: method, headers: { 'Content-Type': 'application/json' } };
+    if (data && method !== 'GET') {
+        options.body = JSON.stringify(data);
+    }
+    const response = await fetch(url, options);
+    const result = await response.json();
+    if (!response.ok) {
+        throw new Error(result.detail || '请求失败');
+    }
+    return result;
+}`;
+
+function replay(session, mode) {
+    let now = 0;
+    let seq = 0;
+    const timers = new Map();
+    const counters = { fetches: 0, aborted: 0 };
+    const setTimeout = (fn, ms) => { const id = ++seq; timers.set(id, { at: now + (ms || 0), seq: id, fn }); return id; };
+    const clearTimeout = id => { timers.delete(id); };
+    const FakeDate = { now: () => now };
+    let latencyIndex = 0;
+    const fetch = (url, options) => new Promise((resolve, reject) => {
+        counters.fetches += 1;
+        const body = JSON.parse(options.body);
+        const latency = session.latencies[latencyIndex++ % session.latencies.length];
+        const id = setTimeout(() => {
+            const ok = !body.invalid;
+            const text = JSON.stringify(ok ? { echo: body } : { detail: '参数无效' });
+            resolve({ ok, status: ok ? 200 : 400, text: async () => text, json: async () => JSON.parse(text) });
+        }, latency);
+        if (options.signal) {
+            options.signal.addEventListener('abort', () => {
+                clearTimeout(id);
+                counters.aborted += 1;
+                reject(new DOMException('aborted', 'AbortError'));
+            });
+        }
+    });
+    const context = { window: {}, console, fetch, setTimeout, clearTimeout, AbortController, DOMException, Date: FakeDate };
+    vm.createContext(context);
+    vm.runInContext(fs.readFileSync(commonPath, 'utf8') + BASELINE, context);
+
+    // 每个通道（工具+场景）当前显示的结果与最后一次点击
+    const shown = new Map();
+    const last = new Map();
+    let stale = 0;
+    let settled = 0;
+    for (const action of session.actions) {
+        timers.set(++seq, { at: action.at, seq, fn: () => {
+            const channel = `${action.tool}:${action.params.scenario}`;
+            last.set(channel, action.params);
+            const promise = mode === 'baseline'
+                ? context.baselineRequest(`/api/tools/${action.tool}/calculate`, 'POST', action.params)
+                : context.calculateTool(action.tool, action.params);
+            promise.then(result => {
+                settled += 1;
+                if (JSON.stringify(result.echo) !== JSON.stringify(last.get(channel))) stale += 1;
+                shown.set(channel, result.echo);
+            }, error => {
+                settled += 1;
+                if (!last.get(channel).invalid) stale += 1;
+                shown.set(channel, { error: error.message });
+            });
+        } });
+    }
+    return (async () => {
+        while (timers.size) {
+            const next = [...timers.values()].reduce((a, b) => (a.at < b.at || (a.at === b.at && a.seq < b.seq) ? a : b));
+            timers.delete(next.seq);
+            now = Math.max(now, next.at);
+            next.fn();
+            // 让 Promise 回调（含 fetch 响应的解析）在下一个定时器之前执行完
+            for (let i = 0; i < 10; i++) await new Promise(resolve => setImmediate(resolve));
+        }
+        let wrongFinal = 0;
+        for (const [channel, params] of last) {
+            const result = shown.get(channel);
+            const expected = params.invalid ? { error: '参数无效' } : params;
+            if (JSON.stringify(result) !== JSON.stringify(expected)) wrongFinal += 1;
+        }
+        const stats = mode === 'baseline' ? {} : { ...vm.runInContext('requestLayer.stats', context) };
+        return { triggers: session.actions.length, settled, stale, wrongFinal, ...counters, stats };
+    })();
+}
+
+(async () => {
+    const sessions = JSON.parse(fs.readFileSync(sessionsPath, 'utf8'));
+    const out = [];
+    for (const session of sessions) {
+        out.push({ baseline: await replay(session, 'baseline'), layer: await replay(session, 'layer') });
+    }
+    process.stdout.write(JSON.stringify(out));
+})();
+"""
+
+
+def random_params(rng: random.Random, scenario: str) -> Dict[str, Any]:
+    return {"scenario": scenario, "a": round(rng.uniform(1, 500), rng.randint(0, 2)), "b": rng.randint(1, 100)}
+
+
+def generate_session(rng: random.Random) -> Dict[str, Any]:
+    """一次访问一个工具页面，在几个场景之间切换计算"""
+    tool = rng.choice(list(TOOLS))
+    scenarios = TOOLS[tool]
+    history: Dict[str, List[Dict[str, Any]]] = {scenario: [] for scenario in scenarios}
+    actions: List[Dict[str, Any]] = []
+    at = 0.0
+
+    def click(params: Dict[str, Any], gap: float) -> None:
+        nonlocal at
+        at += gap
+        actions.append({"at": round(at), "tool": tool, "params": dict(params)})
+
+    for _ in range(rng.randint(4, 12)):
+        scenario = rng.choice(scenarios)
+        roll = rng.random()
+        if roll < 0.15 and history[scenario]:
+            # 切换回之前算过的参数再算一次
+            params = rng.choice(history[scenario])
+        else:
+            params = random_params(rng, scenario)
+            if rng.random() < 0.08:
+                params["invalid"] = True
+        click(params, rng.uniform(2000, 20000))
+        history[scenario].append(params)
+        if rng.random() < 0.3:
+            # 双击或等不及结果再次点击
+            for _ in range(rng.randint(1, 2)):
+                click(params, rng.uniform(60, 400))
+        if rng.random() < 0.3:
+            # 连续微调一个参数，每次都点击计算
+            for _ in range(rng.randint(2, 6)):
+                params = dict(params, b=params["b"] + rng.choice([-1, 1]))
+                click(params, rng.uniform(150, 700))
+            history[scenario].append(params)
+    latencies = [round(rng.lognormvariate(5.3, 0.6)) for _ in range(64)]
+    return {"actions": actions, "latencies": latencies}
+
+
+def run_node(sessions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("未找到 node：基准测试需要 Node.js")
+    with tempfile.TemporaryDirectory() as tmp:
+        harness = Path(tmp) / "harness.js"
+        sessions_path = Path(tmp) / "sessions.json"
+        harness.write_text(NODE_HARNESS, encoding="utf-8")
+        sessions_path.write_text(json.dumps(sessions), encoding="utf-8")
+        result = subprocess.run(
+            [node, str(harness), str(COMMON_JS), str(sessions_path)], capture_output=True, text=True, check=True,
+        )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="请求层（防抖、取消、缓存、合并）的请求数基准测试")
+    parser.add_argument("--sessions", type=int, default=200, help="模拟的会话数")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sessions = [generate_session(rng) for _ in range(args.sessions)]
+    results = run_node(sessions)
+
+    def total(mode: str, key: str) -> int:
+        return sum(result[mode][key] for result in results)
+
+    def stat(key: str) -> int:
+        return sum(result["layer"]["stats"][key] for result in results)
+
+    triggers = total("baseline", "triggers")
+    baseline_fetches = total("baseline", "fetches")
+    layer_fetches = total("layer", "fetches")
+    print(f"{args.sessions} 个会话，{triggers} 次点击计算（平均每会话 {triggers / args.sessions:.1f} 次）")
+    print(f"{'方式':<12}{'服务器请求':>10}{'每会话':>8}{'中止':>6}{'过期结果':>10}{'最终结果错误':>12}")
+    for name, mode in (("原始请求", "baseline"), ("请求层", "layer")):
+        fetches = total(mode, "fetches")
+        print(
+            f"{name:<12}{fetches:>10}{fetches / args.sessions:>8.1f}{total(mode, 'aborted'):>6}"
+            f"{total(mode, 'stale'):>10}{total(mode, 'wrongFinal'):>12}"
+        )
+    print(f"服务器请求减少 {1 - layer_fetches / baseline_fetches:.1%}")
+    print(
+        f"请求层：缓存命中 {stat('cacheHits')}，并发合并 {stat('deduped')}，"
+        f"被取代 {stat('superseded')}，中止 {stat('aborted')}"
+    )
+    if total("layer", "stale") or total("layer", "wrongFinal"):
+        sys.exit("请求层显示了过期结果或最终结果错误")
+
+
+if __name__ == "__main__":
+    main()
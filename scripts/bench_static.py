@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+静态资源压缩基准测试
+对 manifest.json 中的全部指纹化资源，通过 ASGI 接口比较三种服务方式的每秒请求数
+与传输字节数：原文件（StaticFiles）、运行时压缩（StaticFiles + GZipMiddleware）、
+预压缩副本（FingerprintedStaticFiles），并检查压缩响应解压后与原文件一致、
+指纹化文件带 immutable 缓存头、未指纹化文件短时缓存并可协商返回 304。
+需先运行 scripts/fingerprint_static.py 生成 .gz/.br 副本。
+
+用法:
+    python scripts/bench_static.py --seconds 3
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from app.services.static_files import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, FingerprintedStaticFiles
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+ACCEPT_ENCODING = "gzip, deflate, br"
+
+
+def build_app(static_files, middleware=()):
+    return Starlette(routes=[Mount("/static", static_files)], middleware=list(middleware))
+
+
+async def request(app, path, headers=()):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench")] + [(k.encode(), v.encode()) for k, v in headers],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status, response_headers, body = None, {}, []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode(), v.decode()) for k, v in message["headers"])
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(body)
+
+
+def decode(headers, body):
+    encoding = headers.get("content-encoding")
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br":
+        return brotli.decompress(body)
+    return body
+
+
+async def measure(app, paths, seconds):
+    headers = [("accept-encoding", ACCEPT_ENCODING)]
+    transferred = 0
+    for path in paths:
+        transferred += len((await request(app, path, headers))[2])
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for path in paths:
+            await request(app, path, headers)
+        count += len(paths)
+    return count / seconds, transferred
+
+
+async def check(app, manifest):
+    paths = [f"/static/{hashed}" for hashed in manifest.values()]
+    for path in paths:
+        original = (STATIC_DIR / path[len("/static/"):]).read_bytes()
+        status, headers, body = await request(app, path, [("accept-encoding", ACCEPT_ENCODING)])
+        assert status == 200 and decode(headers, body) == original, path
+        assert headers.get("vary") == "Accept-Encoding", path
+        assert headers.get("cache-control") == IMMUTABLE_CACHE_CONTROL, path
+        status, headers, body = await request(app, path)
+        assert status == 200 and "content-encoding" not in headers and body == original, path
+        status, headers, body = await request(app, path, [("accept-encoding", "br;q=0, gzip;q=0.5")])
+        assert headers.get("content-encoding") in (None, "gzip"), path
+        etag = (await request(app, path, [("accept-encoding", "gzip")]))[1]["etag"]
+        status, _, _ = await request(app, path, [("accept-encoding", "gzip"), ("if-none-match", etag)])
+        assert status == 304, path
+
+    for source in manifest:
+        path = f"/static/{source}"
+        status, headers, _ = await request(app, path)
+        assert status == 200 and headers.get("cache-control") == REVALIDATE_CACHE_CONTROL, path
+        status, _, _ = await request(app, path, [("if-none-match", headers["etag"])])
+        assert status == 304, path
+
+
+async def main_async(seconds):
+    manifest = json.loads((STATIC_DIR / "manifest.json").read_text(encoding="utf-8"))
+    paths = [f"/static/{hashed}" for hashed in manifest.values()]
+    await check(build_app(FingerprintedStaticFiles(directory=str(STATIC_DIR), manifest=manifest)), manifest)
+
+    apps = {
+        "原文件": build_app(StaticFiles(directory=str(STATIC_DIR))),
+        "运行时 gzip": build_app(
+            StaticFiles(directory=str(STATIC_DIR)), [Middleware(GZipMiddleware, minimum_size=500, compresslevel=9)]
+        ),
+        "预压缩副本": build_app(FingerprintedStaticFiles(directory=str(STATIC_DIR), manifest=manifest)),
+    }
+    print(f"{len(paths)} 个资源，Accept-Encoding: {ACCEPT_ENCODING}，brotli: {'有' if brotli else '未安装'}")
+    print(f"{'方式':<14}{'请求/秒':>10}{'传输(KB)':>12}")
+    for name, app in apps.items():
+        rate, transferred = await measure(app, paths, seconds)
+        print(f"{name:<14}{rate:>10.0f}{transferred / 1024:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="静态资源压缩基准测试")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.seconds))
+
+
+if __name__ == "__main__":
+    main()
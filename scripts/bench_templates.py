@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+模板冷启动基准测试
+每种方式都在新进程中测量每个模板第一次渲染的耗时：无字节码缓存（原实现）、
+预编译字节码缓存、启动时预热后（请求时不再加载模板）
+
+用法:
+    python scripts/bench_templates.py --runs 5
+"""
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.templating import TEMPLATE_DIR, create_templates, warm_templates
+
+ROOT = Path(__file__).resolve().parent.parent
+
+WORKER = """
+import sys, time
+sys.path.insert(0, {root!r})
+from app.services.templating import TEMPLATE_DIR, create_templates, warm_templates
+cache_dir = {cache_dir!r}
+templates = create_templates(TEMPLATE_DIR, cache_dir)
+templates.env.globals["static_asset"] = lambda path: "/static/" + path
+templates.env.globals["page_bundle"] = lambda tool: None
+templates.env.globals["client_evaluators"] = lambda tool: ""
+start = time.perf_counter()
+if {warm!r}:
+    warm_templates(templates.env)
+startup = time.perf_counter() - start
+names = ["index.html"] + sorted(n for n in templates.env.list_templates() if n.startswith("tools/"))
+samples = []
+for name in names:
+    start = time.perf_counter()
+    templates.get_template(name).render({{"request": None, "tools": [], "tool": None}})
+    samples.append(time.perf_counter() - start)
+print(startup * 1000, sum(samples) * 1000, max(samples) * 1000, len(names))
+"""
+
+
+def run(cache_dir, warm, runs):
+    code = WORKER.format(root=str(ROOT), cache_dir=str(cache_dir) if cache_dir else None, warm=warm)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        samples.append(tuple(map(float, output.split())))
+    return tuple(statistics.median(column) for column in zip(*samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="模板冷启动基准测试")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cache_dir = Path(tempfile.mkdtemp())
+    try:
+        count = warm_templates(create_templates(TEMPLATE_DIR, cache_dir).env)
+        results = {
+            "无字节码缓存": run(None, False, args.runs),
+            "预编译字节码": run(cache_dir, False, args.runs),
+            "字节码 + 启动预热": run(cache_dir, True, args.runs),
+        }
+        pages = int(results["无字节码缓存"][3])
+        print(f"{count} 个模板已预编译；新进程中 {pages} 个页面首次渲染，{args.runs} 次中位数")
+        print(f"{'方式':<16}{'启动预热(ms)':>14}{'首次渲染合计(ms)':>18}{'单页最大(ms)':>14}")
+        for name, (startup, total, worst, _) in results.items():
+            print(f"{name:<16}{startup:>14.1f}{total:>18.1f}{worst:>14.1f}")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+单位换算层基准测试
+对比逐值Python换算与按列预计算系数、整表一次换算的耗时
+
+用法:
+    python scripts/bench_units.py --rows 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from app.services.units import conversion_factor, load_unit_converter
+
+INPUT_UNITS = {"d0": "m", "d1": "m", "L": "cm", "rho": "g/cm³"}
+
+
+def per_value(converter, table):
+    """逐值查表换算，作为对照"""
+    converted = {}
+    for column, values in table.items():
+        target = converter.parameter_units[column]
+        unit = INPUT_UNITS.get(column, target)
+        out = []
+        for value in values:
+            scale, offset = conversion_factor(unit, target)
+            out.append(value * scale + offset)
+        converted[column] = out
+    return converted
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="单位换算层基准测试")
+    parser.add_argument("--rows", type=int, default=100000, help="扫描行数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数，取最快一次")
+    args = parser.parse_args()
+
+    converter = load_unit_converter("inertia_calc")
+    rng = np.random.default_rng(0)
+    arrays = {
+        "d0": rng.uniform(0.01, 0.5, args.rows),
+        "d1": rng.uniform(0.0, 0.01, args.rows),
+        "L": rng.uniform(1.0, 100.0, args.rows),
+        "rho": rng.uniform(2.0, 9.0, args.rows),
+    }
+    lists = {column: values.tolist() for column, values in arrays.items()}
+
+    loop = best_of(lambda: per_value(converter, lists), args.repeat)
+    vector = best_of(lambda: converter.convert_inputs(arrays, INPUT_UNITS), args.repeat)
+
+    reference = per_value(converter, lists)
+    converted = converter.convert_inputs(arrays, INPUT_UNITS)
+    max_error = max(float(np.max(np.abs(np.asarray(reference[c]) - converted[c]))) for c in arrays)
+
+    print("=" * 60)
+    print(f"单位换算基准: {args.rows} 行 × {len(arrays)} 列（inertia_calc）")
+    print("=" * 60)
+    print(f"逐值换算:     {loop * 1000:10.2f} ms")
+    print(f"整表换算:     {vector * 1000:10.2f} ms")
+    print(f"加速比:       {loop / vector:10.1f} x")
+    print(f"最大绝对误差: {max_error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
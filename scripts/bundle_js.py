@@ -0,0 +1,321 @@
+"""Build one minified JavaScript bundle per tool page.
+
+Every tool page used to load ``static/js/common.js`` from ``base.html`` and its
+own ``static/js/tools/<tool>.js`` from the page template: two requests, both
+unminified. For each template under ``templates/tools/`` this script
+concatenates ``common.js`` with the tool scripts the template references,
+minifies the result and writes ``static/js/bundles/<template>.js``.
+``scripts/fingerprint_static.py`` then fingerprints the bundles like any other
+asset; when the manifest has a bundle for a page, ``base.html`` skips the
+separate ``common.js`` and the page loads only its bundle.
+
+The minifier is deliberately conservative (no renaming, no rewriting): it
+drops comments and whitespace while keeping strings, template literals and
+regular expressions byte-for-byte, and keeps a line break wherever removing it
+could change automatic semicolon insertion. Each result is checked against the
+input token stream, and with ``--check`` also parsed by ``node --check``.
+
+Usage:
+    python scripts/bundle_js.py            # build bundles and print the size report
+    python scripts/bundle_js.py --check    # also syntax-check every bundle with node
+"""
+
+import argparse
+import gzip
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+STATIC_DIR = BASE_DIR / "static"
+TEMPLATE_DIR = BASE_DIR / "templates"
+COMMON_SCRIPT = "js/common.js"
+BUNDLE_DIR = "js/bundles"
+
+TOOL_SCRIPT_RE = re.compile(r"""static_asset\(\s*['"](js/tools/[^'"]+\.js)['"]\s*\)""")
+
+# A ``/`` after one of these starts a regular expression, otherwise it is a division
+REGEX_PRECEDING_PUNCT = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_PRECEDING_WORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else",
+    "yield", "await",
+}
+# A line break after these (or before CONTINUATION_START) never ends a statement, so it can go
+CONTINUATION_END = set("{([,;=:?&|*%<>!~^")
+CONTINUATION_START = set(")]},;.?:")
+
+
+class Token(NamedTuple):
+    kind: str  # "word", "punct", "string", "template", "regex" or "space"
+    text: str
+    newline: bool = False  # only for "space": the whitespace/comments contained a line break
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in "_$\\" or ord(char) > 127
+
+
+def _skip_string(src: str, i: int) -> int:
+    quote = src[i]
+    i += 1
+    while src[i] != quote:
+        i += 2 if src[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_template(src: str, i: int) -> int:
+    i += 1
+    while src[i] != "`":
+        if src[i] == "\\":
+            i += 2
+        elif src.startswith("${", i):
+            i = _skip_braces(src, i + 2)
+        else:
+            i += 1
+    return i + 1
+
+
+def _skip_braces(src: str, i: int) -> int:
+    """Index after the ``}`` closing a template substitution that starts at ``i``."""
+    depth = 0
+    while True:
+        char = src[i]
+        if char in "'\"":
+            i = _skip_string(src, i)
+        elif char == "`":
+            i = _skip_template(src, i)
+        elif char == "{":
+            depth += 1
+            i += 1
+        elif char == "}":
+            if depth == 0:
+                return i + 1
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+
+
+def _skip_regex(src: str, i: int) -> int:
+    i += 1
+    in_class = False
+    while True:
+        char = src[i]
+        if char == "\n":
+            raise ValueError(f"unterminated regular expression at offset {i}")
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            break
+        i += 1
+    i += 1
+    while i < len(src) and _is_word_char(src[i]):
+        i += 1
+    return i
+
+
+def tokenize(src: str) -> Iterator[Token]:
+    """Split JavaScript source into tokens; comments are folded into "space" tokens."""
+    i, n = 0, len(src)
+    previous = None  # last significant token
+    while i < n:
+        char = src[i]
+        start = i
+        if char.isspace() or src.startswith("//", i) or src.startswith("/*", i):
+            newline = False
+            while i < n:
+                if src[i].isspace():
+                    newline = newline or src[i] in "\n\r\u2028\u2029"
+                    i += 1
+                elif src.startswith("//", i):
+                    end = src.find("\n", i)
+                    i = n if end < 0 else end
+                elif src.startswith("/*", i):
+                    end = src.index("*/", i + 2) + 2
+                    newline = newline or "\n" in src[i:end]
+                    i = end
+                else:
+                    break
+            yield Token("space", src[start:i], newline)
+            continue
+        if char in "'\"":
+            i = _skip_string(src, i)
+            kind = "string"
+        elif char == "`":
+            i = _skip_template(src, i)
+            kind = "template"
+        elif char == "/" and (
+            previous is None
+            or (previous.kind == "punct" and previous.text in REGEX_PRECEDING_PUNCT)
+            or (previous.kind == "word" and previous.text in REGEX_PRECEDING_WORDS)
+        ):
+            i = _skip_regex(src, i)
+            kind = "regex"
+        elif _is_word_char(char) or (char == "." and i + 1 < n and src[i + 1].isdigit()):
+            number = not _is_word_char(char) or char.isdigit()
+            while i < n:
+                if _is_word_char(src[i]):
+                    # Exponents such as 1e-6 keep their sign
+                    if number and src[i] in "eE" and i + 1 < n and src[i + 1] in "+-":
+                        i += 1
+                elif not (number and src[i] == "." and "." not in src[start:i]):
+                    break
+                i += 1
+            kind = "word"
+        else:
+            i += 1
+            kind = "punct"
+        token = Token(kind, src[start:i])
+        previous = token
+        yield token
+
+
+def _needs_space(left: str, right: str) -> bool:
+    """Whether two adjacent tokens would merge into something else without a space."""
+    a, b = left[-1], right[0]
+    if _is_word_char(a) and _is_word_char(b):
+        return True
+    if a == b and a in "+-":
+        return True
+    if a == "/" and b in "/*":
+        return True
+    # 1 .toFixed() must not become 1.toFixed()
+    return left[0].isdigit() and b == "."
+
+
+def minify(src: str) -> str:
+    """Remove comments and redundant whitespace from JavaScript source."""
+    out: List[str] = []
+    pending_newline = pending_space = False
+    for token in tokenize(src):
+        if token.kind == "space":
+            pending_space = True
+            pending_newline = pending_newline or token.newline
+            continue
+        if out:
+            last = out[-1]
+            keep_newline = (
+                pending_newline
+                # a++ / a-- followed by a line break is a restricted production
+                and not (last[-1] in CONTINUATION_END and not "".join(out[-2:]).endswith(("++", "--")))
+                and token.text[0] not in CONTINUATION_START
+            )
+            if keep_newline:
+                out.append("\n")
+            elif (pending_space or pending_newline) and _needs_space(last, token.text):
+                out.append(" ")
+        out.append(token.text)
+        pending_newline = pending_space = False
+    return "".join(out) + "\n"
+
+
+def _significant(src: str) -> List[Tuple[str, str]]:
+    return [(token.kind, token.text) for token in tokenize(src) if token.kind != "space"]
+
+
+def verify_minified(original: str, minified: str) -> None:
+    """Raise ValueError unless the minified code has exactly the original tokens."""
+    if _significant(original) != _significant(minified):
+        raise ValueError("minified output does not match the source token stream")
+
+
+def node_check(sources: Dict[str, str]) -> None:
+    """Syntax-check each bundle with ``node --check``; raise ValueError on failure."""
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("node not found: --check needs Node.js")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, source in sources.items():
+            path = Path(tmp) / Path(name).name
+            path.write_text(source, encoding="utf-8")
+            result = subprocess.run([node, "--check", str(path)], capture_output=True, text=True)
+            if result.returncode != 0:
+                raise ValueError(f"{name}: {result.stderr.strip()}")
+
+
+def page_scripts(template_dir: Path = TEMPLATE_DIR) -> Dict[str, List[str]]:
+    """{bundle path: [static paths it contains]} for every tool template that loads a tool script."""
+    pages: Dict[str, List[str]] = {}
+    for template in sorted((template_dir / "tools").glob("*.html")):
+        scripts = list(dict.fromkeys(TOOL_SCRIPT_RE.findall(template.read_text(encoding="utf-8"))))
+        if scripts:
+            pages[f"{BUNDLE_DIR}/{template.stem}.js"] = [COMMON_SCRIPT] + scripts
+    return pages
+
+
+def build_bundles(
+    static_dir: Path = STATIC_DIR, template_dir: Path = TEMPLATE_DIR, check: bool = False
+) -> Dict[str, List[str]]:
+    """Write ``static/js/bundles/*.js``; unchanged bundles keep their mtime, stale ones are removed."""
+    pages = page_scripts(template_dir)
+    minified: Dict[str, str] = {}
+    sources: Dict[str, str] = {}
+    for path in sorted({script for scripts in pages.values() for script in scripts}):
+        sources[path] = (static_dir / path).read_text(encoding="utf-8")
+        minified[path] = minify(sources[path])
+        verify_minified(sources[path], minified[path])
+
+    # Scripts are concatenated: a ";" keeps one file's last statement from running into the next
+    bundles = {bundle: ";".join(minified[script] for script in scripts) for bundle, scripts in pages.items()}
+    if check:
+        node_check(bundles)
+
+    bundle_dir = static_dir / BUNDLE_DIR
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    for bundle, content in bundles.items():
+        path = static_dir / bundle
+        data = content.encode("utf-8")
+        if not path.exists() or path.read_bytes() != data:
+            path.write_bytes(data)
+    expected = {static_dir / bundle for bundle in bundles}
+    for path in bundle_dir.glob("*.js"):
+        if path not in expected and not re.search(r"\.[0-9a-f]{12}\.js$", path.name):
+            path.unlink()
+    return pages
+
+
+def _sizes(data: bytes) -> Tuple[int, int]:
+    return len(data), len(gzip.compress(data, compresslevel=9, mtime=0))
+
+
+def report(pages: Dict[str, List[str]], static_dir: Path = STATIC_DIR) -> None:
+    """Print bytes (raw/gzip) and same-origin script requests per page before and after bundling."""
+    print(f"{'page':<32}{'before: req':>12}{'raw':>9}{'gzip':>8}{'after: req':>12}{'raw':>9}{'gzip':>8}")
+    totals = [0] * 6
+    for bundle, scripts in pages.items():
+        before = [_sizes((static_dir / script).read_bytes()) for script in scripts]
+        after = _sizes((static_dir / bundle).read_bytes())
+        row = [len(scripts), sum(raw for raw, _ in before), sum(gz for _, gz in before), 1, *after]
+        totals = [total + value for total, value in zip(totals, row)]
+        print(f"{Path(bundle).stem:<32}{row[0]:>12}{row[1]:>9}{row[2]:>8}{row[3]:>12}{row[4]:>9}{row[5]:>8}")
+    print(
+        f"{'total':<32}{totals[0]:>12}{totals[1]:>9}{totals[2]:>8}{totals[3]:>12}{totals[4]:>9}{totals[5]:>8}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build per-page JavaScript bundles")
+    parser.add_argument("--check", action="store_true", help="syntax-check every bundle with node --check")
+    parser.add_argument("-q", "--quiet", action="store_true", help="skip the size report")
+    args = parser.parse_args()
+
+    try:
+        pages = build_bundles(check=args.check)
+    except ValueError as exc:
+        sys.exit(f"Bundling failed: {exc}")
+    if not args.quiet:
+        report(pages)
+    print(f"{len(pages)} bundles written to static/{BUNDLE_DIR}/ (run fingerprint_static.py to publish them)")
+
+
+if __name__ == "__main__":
+    main()
@@ -43,17 +43,7 @@ async function submit{class_name}() {{
   const payload = {{ scenario: "default" }};
 
   try {{
-    const response = await fetch('/api/tools/{slug}', {{
-      method: 'POST',
-      headers: {{ 'Content-Type': 'application/json' }},
-      body: JSON.stringify(payload),
-    }});
-
-    if (!response.ok) {{
-      throw new Error(`请求失败: ${{response.status}}`);
-    }}
-
-    const data = await response.json();
+    const data = await calculateTool('{slug}', payload);
     render{class_name}Result(data);
   }} catch (error) {{
     console.error('调用接口失败', error);
@@ -96,7 +86,7 @@ HTML_TEMPLATE = '''{{% extends "base.html" %}}
 {{% endblock %}}
 
 {{% block extra_js %}}
-<script src="{{{{ static_asset('js/tools/{slug}.js') }}}}"></script>
+<script src="{{{{ page_bundle(tool) or static_asset('js/tools/{slug}.js') }}}}"></script>
 {{% endblock %}}
 '''
 
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+浏览器端计算函数交叉验证
+为每个可在浏览器端计算的场景生成随机请求参数（含整数、二进制精确的小数、0、负数、极大/极小值、
+缺失与非数字参数），分别交给 Node.js 中运行的生成函数（static/js/common.js 的 evaluateLocally）
+与服务器计算接口（按 JSON.stringify 的请求体走完整的 FastAPI 请求模型、计算器与响应序列化）：
+
+- 浏览器端给出结果时，服务器必须返回 200 且响应逐字段、逐位相同（包括 -0 与公式说明字符串）；
+- 服务器返回错误的请求，浏览器端必须返回 null（改为请求服务器，由服务器给出错误提示）。
+
+覆盖配置公式工具（configs/tools/current_calc.yaml）与声明了 CLIENT_FORMULAS 的手写计算器，
+每个计算器分别按未声明参数类型（整数参数在服务器端为 int）和声明 float/int 类型两种请求模型生成。
+
+用法:
+    python scripts/crosscheck_client_evaluators.py --cases 2000 --seed 1
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+
+from app.routers.tools_api import build_tools_api_router
+from app.services.client_evaluators import build_client_evaluators, render_client_evaluators
+from app.services.formula_compiler import load_formula_calculator
+from app.services.registry import ToolSpec
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+COMMON_JS = BASE_DIR / "static" / "js" / "common.js"
+
+CURRENT = "app.services.current_calculator.CurrentCalculator"
+BELT = "app.services.belt_intermittent_calculator.BeltIntermittentCalculator"
+
+# 交叉验证用的工具规格：同一计算器的不同请求模型，参数的 Python 类型（int/float）与默认值不同
+TOOL_SPECS = [
+    ToolSpec(id="current-untyped", display_name="电流计算", calculator=CURRENT, template="tools/x.html"),
+    ToolSpec(
+        id="current-typed", display_name="电流计算", calculator=CURRENT, template="tools/x.html",
+        parameter_schema={
+            "power": {"type": "float"},
+            "voltage": {"type": "float", "default": 220},
+            "cos_phi": {"type": "float"},
+            "efficiency": {"type": "float", "default": 0.9},
+        },
+    ),
+    ToolSpec(
+        id="current-formulas", display_name="电流计算", formula_config="configs/tools/current_calc.yaml",
+        template="tools/x.html", parameter_schema={"power": {"type": "float"}},
+    ),
+    ToolSpec(id="belt-untyped", display_name="皮带轮间歇运动", calculator=BELT, template="tools/x.html"),
+    ToolSpec(
+        id="belt-typed", display_name="皮带轮间歇运动", calculator=BELT, template="tools/x.html",
+        parameter_schema={
+            "t": {"type": "float"},
+            "A": {"type": "float", "default": 0.25},
+            "L": {"type": "float"},
+            "D": {"type": "float"},
+            "t0": {"type": "float"},
+            "i": {"type": "int", "default": 10},
+        },
+    ),
+]
+
+NODE_HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [commonPath, scriptsPath, casesPath] = process.argv.slice(2);
+const context = { window: {}, console };
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(commonPath, 'utf8'), context);
+const evaluators = {};
+for (const script of Object.values(JSON.parse(fs.readFileSync(scriptsPath, 'utf8')))) {
+    vm.runInContext(script, context);
+    Object.assign(evaluators, context.window.CLIENT_EVALUATORS);
+}
+context.window.CLIENT_EVALUATORS = evaluators;
+// -0 在 JSON 中会丢失符号，单独标记
+const keepSign = (key, value) => (Object.is(value, -0) ? '-0' : value);
+const out = [];
+for (const line of fs.readFileSync(casesPath, 'utf8').split('\n')) {
+    if (!line) continue;
+    const { tool, payload } = JSON.parse(line);
+    const local = context.evaluateLocally(tool, payload);
+    out.push(JSON.stringify({ body: JSON.stringify(payload), local: JSON.stringify(local, keepSign) }));
+}
+process.stdout.write(out.join('\n'));
+"""
+
+MISSING = object()
+
+
+def scenario_inputs(spec: ToolSpec, scenario: str) -> List[str]:
+    if spec.formula_config:
+        return load_formula_calculator(spec.formula_config).formulas[scenario].parameters
+    return list(spec.get_calculator_class().CLIENT_FORMULAS[scenario]["inputs"])
+
+
+def random_value(rng: random.Random) -> Any:
+    """表单中常见的数值为主，混入边界值与服务器会拒绝的值"""
+    roll = rng.random()
+    if roll < 0.30:
+        return round(rng.uniform(0, 1000), rng.randint(0, 6))
+    if roll < 0.45:
+        return rng.randint(0, 2000)
+    if roll < 0.55:
+        return rng.uniform(0, 1)
+    if roll < 0.65:
+        # 二进制精确的小数：结果与格式化时容易恰好落在舍入的中点
+        return rng.randint(1, 256) / rng.choice([2, 8, 32, 64, 1024])
+    if roll < 0.70:
+        return rng.choice([0, 0.0, -0.0, 1, 1.0])
+    if roll < 0.75:
+        return -rng.uniform(0, 100)
+    if roll < 0.82:
+        return 10 ** rng.uniform(-12, 18)
+    if roll < 0.84:
+        return rng.choice([2 ** 53, 2 ** 53 + 2, 1e21, 1e300])
+    if roll < 0.90:
+        return rng.choice([MISSING, None])
+    if roll < 0.93:
+        return rng.choice(["12", "abc", True, False, [1]])
+    return rng.choice([0.1, 0.5, 0.85, 0.99, 1e-05, 1e-07, 123456789.125])
+
+
+def generate_cases(specs: List[ToolSpec], cases: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    generated = []
+    for spec in specs:
+        for scenario in build_client_evaluators(spec).scenarios:
+            names = scenario_inputs(spec, scenario)
+            for _ in range(cases):
+                payload: Dict[str, Any] = {"scenario": scenario}
+                for name in names:
+                    value = random_value(rng)
+                    if value is not MISSING:
+                        payload[name] = value
+                if "t" in payload and "t0" in payload and rng.random() < 0.1:
+                    payload["t0"] = payload["t"]
+                if rng.random() < 0.02:
+                    payload["output_units"] = {"result": "mA"}
+                generated.append({"tool": spec.id, "payload": payload})
+    return generated
+
+
+def run_node(scripts: Dict[str, str], cases: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    node = shutil.which("node")
+    if node is None:
+        raise SystemExit("未找到 node：交叉验证需要 Node.js")
+    with tempfile.TemporaryDirectory() as tmp:
+        harness = Path(tmp) / "harness.js"
+        scripts_path = Path(tmp) / "scripts.json"
+        cases_path = Path(tmp) / "cases.jsonl"
+        harness.write_text(NODE_HARNESS, encoding="utf-8")
+        scripts_path.write_text(json.dumps(scripts, ensure_ascii=False), encoding="utf-8")
+        cases_path.write_text("\n".join(json.dumps(case, ensure_ascii=False) for case in cases), encoding="utf-8")
+        result = subprocess.run(
+            [node, str(harness), str(COMMON_JS), str(scripts_path), str(cases_path)],
+            capture_output=True, text=True, check=True,
+        )
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+async def post(app: FastAPI, path: str, body: bytes) -> Tuple[int, bytes]:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"crosscheck"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("crosscheck", 80),
+    }
+    status, chunks = None, []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+def same(local: Any, server: Any) -> bool:
+    """逐位比较：数值必须相等且 0 的符号相同，int/float 只是 JSON 写法不同"""
+    if local == "-0":
+        return isinstance(server, float) and server == 0 and math.copysign(1, server) < 0
+    if isinstance(local, dict) and isinstance(server, dict):
+        return local.keys() == server.keys() and all(same(local[key], server[key]) for key in local)
+    if isinstance(local, bool) or isinstance(server, bool):
+        return local is server
+    if isinstance(local, (int, float)) and isinstance(server, (int, float)):
+        return local == server and math.copysign(1, local) == math.copysign(1, server)
+    return local == server
+
+
+async def crosscheck(cases: List[Dict[str, Any]], outputs: List[Dict[str, str]]) -> int:
+    app = FastAPI()
+    app.include_router(build_tools_api_router({spec.id: spec for spec in TOOL_SPECS}))
+    stats: Dict[Tuple[str, str], Counter] = {}
+    failures = 0
+    for case, output in zip(cases, outputs):
+        key = (case["tool"], case["payload"]["scenario"])
+        counter = stats.setdefault(key, Counter())
+        status, body = await post(app, f"/api/tools/{case['tool']}/calculate", output["body"].encode("utf-8"))
+        local = json.loads(output["local"])
+        counter["server_ok" if status == 200 else "server_error"] += 1
+        if local is None:
+            counter["fallback"] += 1
+            continue
+        counter["local"] += 1
+        server = json.loads(body)
+        if status != 200 or not same(local, server):
+            failures += 1
+            if failures <= 10:
+                print(f"不一致 {key} 请求 {output['body']}\n  浏览器端: {local}\n  服务器({status}): {server}")
+
+    print(f"{'工具':<18}{'场景':<22}{'用例':>8}{'服务器成功':>12}{'浏览器端计算':>14}{'回退服务器':>12}")
+    for (tool, scenario), counter in stats.items():
+        total = counter["server_ok"] + counter["server_error"]
+        print(f"{tool:<18}{scenario:<22}{total:>8}{counter['server_ok']:>12}{counter['local']:>14}{counter['fallback']:>12}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="浏览器端计算函数与服务器计算结果的随机交叉验证")
+    parser.add_argument("--cases", type=int, default=2000, help="每个场景的随机用例数")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+    args = parser.parse_args()
+
+    for spec in TOOL_SPECS:
+        skipped = build_client_evaluators(spec).skipped
+        for scenario, reason in skipped.items():
+            print(f"{spec.id}/{scenario}: 由服务器计算（{reason}）")
+    scripts = {spec.id: render_client_evaluators(spec) for spec in TOOL_SPECS}
+    cases = generate_cases(TOOL_SPECS, args.cases, args.seed)
+    outputs = run_node(scripts, cases)
+    failures = asyncio.run(crosscheck(cases, outputs))
+    if failures:
+        sys.exit(f"{failures} 个用例浏览器端与服务器结果不一致")
+    print(f"{len(cases)} 个用例全部一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+计算器随机差分测试
+按 configs/tools/*.yaml 中的参数取值范围（或下方为场景单独给出的输入区间）为每个场景
+生成大量随机参数，在进程池中并行对比手写计算器与独立参考实现，汇总每个输出的最大相对误差。
+参考实现有两种：本脚本中按教科书形式另行编写的解析公式（analytic），以及配置中的场景公式
+经公式编译器编译后的结果（formula）；两者都不调用被测计算器。
+tests/test_diff_calculators.py 以固定种子和较少样本运行同一流程。
+
+用法:
+    python scripts/diff_test_calculators.py --samples 2000
+    python scripts/diff_test_calculators.py --tool inertia_calc --reference analytic
+"""
+import argparse
+import math
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import yaml
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+TOOLS_DIR = BASE_DIR / "configs" / "tools"
+
+# 工具配置 id -> 手写计算器
+CALCULATORS = {
+    "current_calc": "app.services.current_calculator.CurrentCalculator",
+    "inertia_calc": "app.services.inertia_calculator.InertiaCalculator",
+}
+
+# 参数间约束：参数 -> (参照参数, 下限比例, 上限比例)，如内径取外径的 0~90%
+RELATIVE_PARAMS = {
+    "inertia_calc": {"d1": ("d0", 0.0, 0.9)},
+}
+
+# 计算器响应中输出名的别名（配置 outputs 名 -> 响应字段）
+OUTPUT_ALIASES = {"m": "mass"}
+
+
+def _hollow_cylinder_mass(p):
+    """空心圆柱质量 m = ρ·π·(R² - r²)·L（SI 单位）"""
+    return p["rho"] * math.pi * ((p["d0"] / 2000) ** 2 - (p.get("d1", 0) / 2000) ** 2) * p["L"] / 1000
+
+
+def _cylinder_parallel(p):
+    # 空心圆柱绕自身轴线 J = m(R² + r²)/2，再按平行轴定理加 m·e²
+    m = _hollow_cylinder_mass(p)
+    j = m * ((p["d0"] / 2000) ** 2 + (p.get("d1", 0) / 2000) ** 2) / 2 + m * (p.get("e", 0) / 1000) ** 2
+    return {"J": j * 1e4, "m": m}
+
+
+def _cylinder_perpendicular(p):
+    # 空心圆柱绕过质心且垂直于轴线的轴 J = m(3(R² + r²) + L²)/12
+    m = _hollow_cylinder_mass(p)
+    radii = (p["d0"] / 2000) ** 2 + (p.get("d1", 0) / 2000) ** 2
+    j = m * (3 * radii + (p["L"] / 1000) ** 2) / 12 + m * (p.get("e", 0) / 1000) ** 2
+    return {"J": j * 1e4, "m": m}
+
+
+def _rectangular(p):
+    # 长方体绕平行于高度方向的质心轴 J = m(a² + b²)/12
+    m = p["rho"] * p["x"] * p["y"] * p["z"] / 1e9
+    j = m * ((p["x"] / 1000) ** 2 + (p["y"] / 1000) ** 2) / 12 + m * (p.get("e", 0) / 1000) ** 2
+    return {"J": j * 1e4, "m": m}
+
+
+def _disk(p):
+    # 实心圆盘 J = m·R²/2
+    m = p["rho"] * math.pi * (p["d"] / 2000) ** 2 * p["h"] / 1000
+    j = m * (p["d"] / 2000) ** 2 / 2 + m * (p.get("e", 0) / 1000) ** 2
+    return {"J": j * 1e4, "m": m}
+
+
+def _linear_motion(p):
+    # 导程 A 的直线运动折算：每弧度位移 A/2π，J = m·(A/2π)²
+    return {"J": p["m"] * (p["A"] / 1000 / (2 * math.pi)) ** 2 * 1e4}
+
+
+def _direct_inertia(p):
+    # 平行轴定理 J1 = J0 + m·e²（kg·cm²，e 换算为 cm）
+    return {"J": p["J0"] + p["m"] * (p["e"] / 10) ** 2, "m": p["m"]}
+
+
+# 解析参考：工具 -> 场景 -> {"reference": 参考函数, "inputs": 参数 -> (下限, 上限)}
+# 配置中的场景参数与计算器实际读取的参数不一致（或配置未列出该场景）时用 inputs 指定采样区间，
+# 下限大于0时按对数均匀采样，否则均匀采样
+ANALYTIC_REFERENCES = {
+    "inertia_calc": {
+        "cylinder_parallel": {"reference": _cylinder_parallel},
+        "cylinder_perpendicular": {"reference": _cylinder_perpendicular},
+        "rectangular": {
+            "reference": _rectangular,
+            "inputs": {"x": (1.0, 2000.0), "y": (1.0, 2000.0), "z": (1.0, 2000.0), "rho": (100.0, 20000.0),
+                       "e": (0.0, 500.0)},
+        },
+        "disk": {
+            "reference": _disk,
+            "inputs": {"d": (1.0, 2000.0), "h": (0.5, 500.0), "rho": (100.0, 20000.0), "e": (0.0, 500.0)},
+        },
+        "linear_motion": {
+            "reference": _linear_motion,
+            "inputs": {"A": (0.5, 2000.0), "m": (0.01, 10000.0)},
+        },
+        "direct_inertia": {
+            "reference": _direct_inertia,
+            "inputs": {"J0": (0.01, 1e5), "m": (0.01, 10000.0), "e": (0.0, 1000.0)},
+        },
+    },
+}
+
+# 计算器结果保留4位小数，扣除半个末位的舍入误差后再计算相对误差
+ROUNDING = 5e-5 * (1 + 1e-9)
+
+
+def load_tool_configs(tool_ids=None):
+    configs = {}
+    for path in sorted(TOOLS_DIR.glob("*.yaml")):
+        with path.open("r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+        tool_id = config.get("id", path.stem)
+        if tool_id in CALCULATORS and (not tool_ids or tool_id in tool_ids):
+            configs[tool_id] = config
+    return configs
+
+
+def parameter_range(spec):
+    """由配置的 minimum/maximum 推出采样区间；无上限时按对数均匀采样到 1e4 量级"""
+    low = spec.get("minimum", 0.0)
+    high = spec.get("maximum")
+    if high is not None:
+        span = high - low
+        return low + span * 0.01, high, False
+    low = max(low, 1e-2)
+    return low, max(low * 10, 1e4), True
+
+
+def generate_params(config, scenario, samples, seed):
+    """生成一个场景的随机参数，返回参数字典列表"""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    inputs = ANALYTIC_REFERENCES.get(config["id"], {}).get(scenario["id"], {}).get("inputs")
+    if inputs is not None:
+        for name, (low, high) in inputs.items():
+            if low > 0:
+                columns[name] = np.exp(rng.uniform(math.log(low), math.log(high), samples))
+            else:
+                columns[name] = rng.uniform(low, high, samples)
+        return [dict(zip(columns, row)) for row in zip(*(values.tolist() for values in columns.values()))]
+
+    specs = {param["name"]: param for param in config.get("parameters") or []}
+    relative = RELATIVE_PARAMS.get(config["id"], {})
+    names = scenario.get("parameters") or []
+    for name in names:
+        if name in relative:
+            continue
+        low, high, logarithmic = parameter_range(specs.get(name, {}))
+        if logarithmic:
+            columns[name] = np.exp(rng.uniform(math.log(low), math.log(high), samples))
+        else:
+            columns[name] = rng.uniform(low, high, samples)
+    for name in names:
+        if name in relative:
+            reference, low, high = relative[name]
+            columns[name] = columns[reference] * rng.uniform(low, high, samples)
+    return [dict(zip(columns, row)) for row in zip(*(values.tolist() for values in columns.values()))]
+
+
+def tool_scenarios(config):
+    """配置中的场景，加上只有解析参考（配置未列出）的场景"""
+    scenarios = list(config.get("scenarios") or [])
+    listed = {scenario["id"] for scenario in scenarios}
+    for scenario_id in ANALYTIC_REFERENCES.get(config["id"], {}):
+        if scenario_id not in listed:
+            scenarios.append({"id": scenario_id})
+    return scenarios
+
+
+def output_names(scenario):
+    from app.services.formula_compiler import split_output
+
+    return [split_output(item)[0] for item in scenario.get("outputs") or []]
+
+
+def extract_outputs(response, names):
+    """按配置 outputs 名从计算器响应中取值：首个输出对应 result"""
+    values = {}
+    data = response.model_dump() if hasattr(response, "model_dump") else response.dict()
+    result = data.get("result")
+    for index, name in enumerate(names):
+        if isinstance(result, dict) and name in result:
+            values[name] = result[name]
+        elif index == 0 and isinstance(result, (int, float)):
+            values[name] = result
+        elif (data.get("extra") or {}).get(name) is not None:
+            values[name] = data["extra"][name]
+        elif data.get(OUTPUT_ALIASES.get(name, name)) is not None:
+            values[name] = data[OUTPUT_ALIASES.get(name, name)]
+    return values
+
+
+class _Reference:
+    """进程内参考实现"""
+
+    def __init__(self, kind, config, scenario):
+        self.kind = kind
+        self.scenario_id = scenario["id"]
+        if kind == "analytic":
+            self.function = ANALYTIC_REFERENCES[config["id"]][self.scenario_id]["reference"]
+        else:
+            from app.services.formula_compiler import FormulaCalculator
+
+            self.formula = FormulaCalculator(config)
+            self.name = output_names(scenario)[0]
+
+    def evaluate(self, params):
+        if self.kind == "analytic":
+            return self.function(params)
+        return {self.name: self.formula.evaluate(self.scenario_id, params)}
+
+
+def _run_chunk(task):
+    """工作进程：计算一批参数并返回误差统计"""
+    import importlib
+
+    module_name, class_name = CALCULATORS[task["tool"]].rsplit(".", 1)
+    calculator = getattr(importlib.import_module(module_name), class_name)()
+    scenario = task["scenario"]
+    rows = generate_params(task["config"], scenario, task["samples"], task["seed"])
+    reference = _Reference(task["kind"], task["config"], scenario)
+
+    stats = {"count": 0, "calc_errors": 0, "ref_errors": 0, "mismatches": 0, "first_error": None,
+             "outputs": {}}
+    for params in rows:
+        try:
+            expected = reference.evaluate(params)
+        except Exception:
+            stats["ref_errors"] += 1
+            continue
+        try:
+            actual = extract_outputs(calculator.calculate(scenario["id"], params), list(expected))
+        except Exception as exc:  # 计算器拒绝的参数单独计数
+            stats["calc_errors"] += 1
+            stats["first_error"] = stats["first_error"] or f"{type(exc).__name__}: {exc}"
+            continue
+        stats["count"] += 1
+        mismatch = False
+        for name, value in expected.items():
+            if name not in actual or not isinstance(value, (int, float)):
+                continue
+            error = max(abs(actual[name] - value) - ROUNDING, 0.0)
+            relative = error / abs(value) if value else error
+            current = stats["outputs"].setdefault(name, {"max_rel": 0.0, "params": None})
+            if relative > current["max_rel"]:
+                current["max_rel"], current["params"] = relative, params
+            if relative > task["rtol"]:
+                mismatch = True
+        stats["mismatches"] += mismatch
+    return task["tool"], scenario["id"], task["kind"], stats
+
+
+def _merge(total, part):
+    for key in ("count", "calc_errors", "ref_errors", "mismatches"):
+        total[key] += part[key]
+    total["first_error"] = total["first_error"] or part["first_error"]
+    for name, item in part["outputs"].items():
+        current = total["outputs"].setdefault(name, {"max_rel": 0.0, "params": None})
+        if item["max_rel"] >= current["max_rel"]:
+            current.update(item)
+
+
+def reference_kind(requested, tool_id, scenario_id, formula_scenarios):
+    """选择参考实现：auto 优先使用解析参考，其次使用配置公式"""
+    available = {
+        "analytic": scenario_id in ANALYTIC_REFERENCES.get(tool_id, {}),
+        "formula": scenario_id in formula_scenarios,
+    }
+    if requested != "auto":
+        return requested if available[requested] else None
+    for kind in ("analytic", "formula"):
+        if available[kind]:
+            return kind
+    return None
+
+
+def _scenario_seed(seed, tool_id, scenario_id, chunk):
+    return [seed, zlib.crc32(f"{tool_id}/{scenario_id}".encode("utf-8")), chunk]
+
+
+def run_diff(tool_ids=None, samples=2000, seed=20240601, reference="auto", rtol=1e-6, workers=None, chunk=500):
+    """
+    运行差分测试
+
+    Args:
+        tool_ids: 只测试的工具，默认全部
+        samples: 每个场景的随机参数组数
+        seed: 随机种子
+        reference: 参考实现 auto/analytic/formula
+        rtol: 相对误差阈值
+        workers: 进程数，为1时在当前进程内运行
+        chunk: 每个任务的参数组数
+
+    Returns:
+        tuple: ({(工具, 场景, 参考): 统计}, 无参考的场景列表, 任务数)
+    """
+    from app.services.formula_compiler import FormulaCalculator
+
+    configs = load_tool_configs(tool_ids)
+    tasks, skipped = [], []
+    for tool_id, config in configs.items():
+        formula_scenarios = set(FormulaCalculator(config).formulas)
+        for scenario in tool_scenarios(config):
+            kind = reference_kind(reference, tool_id, scenario["id"], formula_scenarios)
+            if kind is None:
+                skipped.append(f"{tool_id}/{scenario['id']}")
+                continue
+            for index, offset in enumerate(range(0, samples, chunk)):
+                tasks.append({"tool": tool_id, "config": config, "scenario": scenario, "kind": kind, "rtol": rtol,
+                              "samples": min(chunk, samples - offset),
+                              "seed": _scenario_seed(seed, tool_id, scenario["id"], index)})
+
+    results = {}
+    if workers == 1:
+        outcomes = map(_run_chunk, tasks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        outcomes = pool.map(_run_chunk, tasks)
+    try:
+        for tool_id, scenario_id, kind, stats in outcomes:
+            key = (tool_id, scenario_id, kind)
+            if key not in results:
+                results[key] = stats
+            else:
+                _merge(results[key], stats)
+    finally:
+        if workers != 1:
+            pool.shutdown()
+    return results, skipped, len(tasks)
+
+
+def failed_scenarios(results, rtol=1e-6):
+    """不一致、计算器全部报错或参考实现报错的场景"""
+    return [
+        f"{tool_id}/{scenario_id}"
+        for (tool_id, scenario_id, _), stats in sorted(results.items())
+        if stats["mismatches"] or stats["ref_errors"] or stats["count"] == 0
+        or any(item["max_rel"] > rtol for item in stats["outputs"].values())
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="计算器随机差分测试")
+    parser.add_argument("--tool", action="append", help="只测试指定工具，可重复")
+    parser.add_argument("--samples", type=int, default=2000, help="每个场景的随机参数组数")
+    parser.add_argument("--seed", type=int, default=20240601, help="随机种子")
+    parser.add_argument("--reference", choices=["auto", "analytic", "formula"], default="auto")
+    parser.add_argument("--rtol", type=float, default=1e-6, help="相对误差阈值")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="进程数")
+    parser.add_argument("--chunk", type=int, default=500, help="每个任务的参数组数")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results, skipped, task_count = run_diff(
+        args.tool, args.samples, args.seed, args.reference, args.rtol, args.workers, args.chunk
+    )
+    elapsed = time.perf_counter() - start
+
+    print("=" * 100)
+    print(f"差分测试: {len(results)} 个场景，{task_count} 个任务，{args.workers} 个进程，耗时 {elapsed:.2f} s")
+    print("=" * 100)
+    print(f"{'工具/场景':<40}{'参考':<9}{'样本':>7}{'计算器报错':>10}{'不一致':>8}  各输出最大相对误差")
+    for (tool_id, scenario_id, kind), stats in sorted(results.items()):
+        errors = "  ".join(f"{name}={item['max_rel']:.2e}" for name, item in stats["outputs"].items()) or "-"
+        print(f"{tool_id + '/' + scenario_id:<40}{kind:<9}{stats['count']:>7}{stats['calc_errors']:>10}"
+              f"{stats['mismatches']:>8}  {errors}")
+        if stats["first_error"]:
+            print(f"{'':<40}计算器报错示例: {stats['first_error']}")
+        for name, item in stats["outputs"].items():
+            if item["max_rel"] > args.rtol and item["params"]:
+                print(f"{'':<40}{name} 最大误差参数: {item['params']}")
+    for name in skipped:
+        print(f"{name:<40}{'无参考':<9}（没有解析参考，配置公式也未编译）")
+    return 1 if failed_scenarios(results, args.rtol) or skipped else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
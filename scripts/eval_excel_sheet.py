@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+用 Excel 公式引擎计算工作表
+列出公式及其翻译结果、修改输入单元格并输出指定单元格的值，便于对照手写计算器或接入新表
+
+用法:
+    python scripts/eval_excel_sheet.py data/钣金预冲孔.xlsx --sheet Sheet1 --list
+    python scripts/eval_excel_sheet.py data/钣金预冲孔.xlsx --set B3=2 --get F3 C3
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.excel_engine import load_workbook_model
+
+
+def parse_assignment(text):
+    ref, _, raw = text.partition("=")
+    try:
+        value = float(raw)
+    except ValueError:
+        value = raw
+    return ref.strip(), value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Excel 公式引擎命令行")
+    parser.add_argument("workbook", help=".xlsx/.xls 工作簿路径（.xls 需要安装 xlrd）")
+    parser.add_argument("--sheet", action="append", help="只加载指定工作表，可重复")
+    parser.add_argument("--list", action="store_true", help="列出公式与翻译结果")
+    parser.add_argument("--set", nargs="*", default=[], metavar="CELL=VALUE", help="修改输入单元格")
+    parser.add_argument("--get", nargs="*", default=[], metavar="CELL", help="输出单元格的值")
+    parser.add_argument("--no-cache", action="store_true", help="不读写磁盘缓存")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    load_kwargs = {"cache_dir": None} if args.no_cache else {}
+    model = load_workbook_model(Path(args.workbook), sheets=args.sheet, **load_kwargs)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    full = model.recalculate()
+    full_ms = (time.perf_counter() - start) * 1000
+    print(f"加载: {load_ms:.2f} ms，公式 {len(model.formulas)} 个，不支持 {len(model.unsupported)} 个")
+    print(f"全量计算: {full} 个单元格，{full_ms:.2f} ms")
+
+    if args.list:
+        for cell in model.order:
+            print(f"  {cell:<16} {model.formulas.get(cell, '')}")
+            print(f"  {'':<16} -> {model.sources.get(cell) or model.unsupported.get(cell)}")
+
+    if args.set:
+        model.set_inputs(dict(parse_assignment(item) for item in args.set))
+        start = time.perf_counter()
+        count = model.recalculate()
+        print(f"增量重算: {count} 个单元格，{(time.perf_counter() - start) * 1000:.3f} ms")
+
+    for ref in args.get:
+        print(f"{ref} = {model.get(ref)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,60 +1,292 @@
-"""Fingerprint tool JavaScript assets and emit a manifest for templating."""
+"""Fingerprint every static asset and emit a manifest for templating.
 
+Each file under ``static/`` gets a content-hashed copy (``style.css`` ->
+``style.3f2a9c0d1b7e.css``). Hashes are cached by mtime/size in
+``.cache/static_hashes.json`` so only changed files are re-read. ``url(...)``
+and ``@import`` references inside CSS are rewritten to the hashed names, and
+the CSS fingerprint covers the rewritten content, so a changed image also
+changes the stylesheet that uses it. The manifest is replaced atomically.
+
+Text assets also get ``.gz`` (level 9) and, when the optional ``brotli``
+package is installed, ``.br`` (quality 11) siblings of their hashed copies,
+served by ``app.services.static_files.PrecompressedStaticFiles`` so nothing is
+compressed at request time.
+"""
+
+import argparse
+import gzip
 import hashlib
 import json
+import os
+import re
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are produced
+    brotli = None
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "static"
-TOOLS_JS_DIR = STATIC_DIR / "js" / "tools"
 MANIFEST_PATH = STATIC_DIR / "manifest.json"
+HASH_CACHE_PATH = BASE_DIR / ".cache" / "static_hashes.json"
 
+HASH_LENGTH = 12
+HASHED_NAME_RE = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{%d})(?P<suffix>\.[^.]+)$" % HASH_LENGTH)
+CSS_REFERENCE_RE = re.compile(
+    r"""url\(\s*(?P<q1>['"]?)(?P<url1>[^'")]+?)(?P=q1)\s*\)|@import\s+(?P<q2>['"])(?P<url2>[^'"]+)(?P=q2)"""
+)
+EXTERNAL_PREFIXES = ("data:", "http:", "https:", "//", "#", "about:")
 
-def _hash_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return digest.hexdigest()[:12]
+COMPRESSIBLE_SUFFIXES = {".js", ".mjs", ".css", ".svg", ".json", ".html", ".txt", ".xml", ".map"}
+# Keep a variant only if it saves at least this fraction of the original size
+MIN_COMPRESSION_SAVING = 0.05
 
 
-def _write_hashed_copy(source: Path, hashed_name: str) -> Path:
-    hashed_path = source.with_name(hashed_name)
-    if not hashed_path.exists() or hashed_path.read_bytes() != source.read_bytes():
-        hashed_path.write_bytes(source.read_bytes())
-    return hashed_path
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the output reproducible
+    return gzip.compress(data, compresslevel=9, mtime=0)
 
 
-def _cleanup_old_hashes(source: Path, keep_name: str) -> None:
-    stem = source.stem
-    suffix = source.suffix
-    for candidate in source.parent.glob(f"{stem}.*{suffix}"):
-        if candidate.name != keep_name:
-            candidate.unlink()
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {".gz": _gzip}
+if brotli is not None:
+    COMPRESSORS[".br"] = lambda data: brotli.compress(data, quality=11)
+VARIANT_SUFFIXES = (".gz", ".br")
+
+
+def _hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def _hashed_name(path: Path, asset_hash: str) -> str:
+    return f"{path.stem}.{asset_hash}{path.suffix}"
+
+
+def _source_of(path: Path) -> Optional[Path]:
+    """The file a hashed copy or compressed variant was made from, or None for source assets."""
+    if path.suffix in VARIANT_SUFFIXES and HASHED_NAME_RE.match(path.stem):
+        return path.with_suffix("")
+    match = HASHED_NAME_RE.match(path.name)
+    return path.with_name(f"{match['stem']}{match['suffix']}") if match else None
+
+
+def _write_variants(hashed_path: Path, data: Optional[bytes] = None) -> int:
+    """Write missing compressed siblings of a hashed copy; returns how many were written."""
+    if hashed_path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return 0
+    written = 0
+    for suffix, compress in COMPRESSORS.items():
+        variant = hashed_path.with_name(hashed_path.name + suffix)
+        # Content-addressed like the copy itself, so an existing variant is current; it must not be
+        # older than the copy though (e.g. after a checkout), or the static handler ignores it
+        if variant.exists() and variant.stat().st_mtime_ns >= hashed_path.stat().st_mtime_ns:
+            continue
+        if data is None:
+            data = hashed_path.read_bytes()
+        compressed = compress(data)
+        if len(compressed) <= len(data) * (1 - MIN_COMPRESSION_SAVING):
+            _atomic_write(variant, compressed)
+            written += 1
+    return written
+
+
+def _iter_files(static_dir: Path) -> Iterator[Path]:
+    for path in sorted(static_dir.rglob("*")):
+        if not path.is_file() or path == static_dir / MANIFEST_PATH.name:
+            continue
+        if any(part.startswith(".") for part in path.relative_to(static_dir).parts):
+            continue
+        yield path
+
+
+def iter_assets(static_dir: Path = STATIC_DIR) -> Iterator[Path]:
+    """Source assets under ``static_dir``: everything except the manifest, hashed copies and dotfiles."""
+    return (path for path in _iter_files(static_dir) if _source_of(path) is None)
+
+
+def _load_cache(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
 
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
 
-def generate_manifest() -> Dict[str, str]:
-    if not TOOLS_JS_DIR.exists():
-        raise SystemExit(f"Tools JS directory not found: {TOOLS_JS_DIR}")
 
+def _css_references(text: str, css_rel: str) -> List[Tuple[re.Match, str, str]]:
+    """(match, url, target relpath) for each local reference in a stylesheet."""
+    references = []
+    for match in CSS_REFERENCE_RE.finditer(text):
+        url = match["url1"] or match["url2"]
+        if url.startswith(EXTERNAL_PREFIXES):
+            continue
+        path_part = re.split(r"[?#]", url, maxsplit=1)[0]
+        if path_part.startswith("/static/"):
+            target = path_part[len("/static/"):]
+        elif path_part.startswith("/"):
+            continue
+        else:
+            target = os.path.normpath(os.path.join(os.path.dirname(css_rel), path_part)).replace(os.sep, "/")
+        references.append((match, url, target))
+    return references
+
+
+def _rewrite_css(text: str, css_rel: str, manifest: Dict[str, str]) -> Tuple[str, Dict[str, Optional[str]]]:
+    """Replace local references with hashed names; returns the new text and the dependencies used."""
+    parts: List[str] = []
+    deps: Dict[str, Optional[str]] = {}
+    last = 0
+    for match, url, target in _css_references(text, css_rel):
+        # Missing targets are recorded too, so the sheet is rehashed once they appear
+        hashed = deps[target] = manifest.get(target)
+        if hashed is None:
+            continue
+        path_part = re.split(r"[?#]", url, maxsplit=1)[0]
+        new_path = path_part[: len(path_part) - len(target.rsplit("/", 1)[-1])] + hashed.rsplit("/", 1)[-1]
+        start, end = match.span("url1") if match["url1"] else match.span("url2")
+        parts.append(text[last:start])
+        parts.append(new_path + url[len(path_part):])
+        last = end
+    parts.append(text[last:])
+    return "".join(parts), deps
+
+
+def _css_order(css_files: List[Path], static_dir: Path, cache: Dict[str, dict]) -> List[Path]:
+    """Stylesheets ordered so that ``@import``-ed sheets are fingerprinted first."""
+    by_rel = {path.relative_to(static_dir).as_posix(): path for path in css_files}
+    ordered: List[Path] = []
+    state: Dict[str, int] = {}
+
+    def visit(rel: str) -> None:
+        if state.get(rel) == 2:
+            return
+        if state.get(rel) == 1:
+            raise SystemExit(f"Circular CSS import involving {rel}")
+        state[rel] = 1
+        stat = by_rel[rel].stat()
+        entry = cache.get(rel)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            # Unchanged sheet: its local dependencies are already recorded in the cache
+            targets = list(entry.get("deps", {}))
+        else:
+            targets = [target for _, _, target in _css_references(by_rel[rel].read_text(encoding="utf-8"), rel)]
+        for target in targets:
+            if target in by_rel:
+                visit(target)
+        state[rel] = 2
+        ordered.append(by_rel[rel])
+
+    for rel in sorted(by_rel):
+        visit(rel)
+    return ordered
+
+
+def generate_manifest(
+    static_dir: Path = STATIC_DIR, cache_path: Optional[Path] = HASH_CACHE_PATH, stats: Optional[Dict[str, int]] = None
+) -> Dict[str, str]:
+    """Fingerprint all assets under ``static_dir`` and write ``manifest.json`` next to them."""
+    if not static_dir.exists():
+        raise SystemExit(f"Static directory not found: {static_dir}")
+
+    cache = _load_cache(cache_path) if cache_path else {}
+    new_cache: Dict[str, dict] = {}
     manifest: Dict[str, str] = {}
-    for script_path in sorted(TOOLS_JS_DIR.glob("*.js")):
-        asset_hash = _hash_file(script_path)
-        hashed_name = f"{script_path.stem}.{asset_hash}{script_path.suffix}"
-        _write_hashed_copy(script_path, hashed_name)
-        _cleanup_old_hashes(script_path, keep_name=hashed_name)
-        manifest[f"js/tools/{script_path.name}"] = f"js/tools/{hashed_name}"
-
-    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+    counts = stats if stats is not None else {}
+    counts.update(hashed=0, cached=0, written=0, compressed=0, removed=0)
+
+    assets = list(iter_assets(static_dir))
+    css_files = [path for path in assets if path.suffix == ".css"]
+    ordered = [path for path in assets if path.suffix != ".css"] + _css_order(css_files, static_dir, cache)
+
+    for path in ordered:
+        rel = path.relative_to(static_dir).as_posix()
+        stat = path.stat()
+        entry = cache.get(rel)
+        fresh = (
+            entry is not None
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+            and all(manifest.get(dep) == hashed for dep, hashed in entry.get("deps", {}).items())
+        )
+        hashed_path = path.with_name(_hashed_name(path, entry["hash"])) if fresh else None
+        data: Optional[bytes] = None
+        if fresh and hashed_path.exists():
+            counts["cached"] += 1
+            asset_hash, deps = entry["hash"], entry.get("deps", {})
+        else:
+            data = path.read_bytes()
+            deps = {}
+            if path.suffix == ".css":
+                text, deps = _rewrite_css(data.decode("utf-8"), rel, manifest)
+                data = text.encode("utf-8")
+            asset_hash = _hash_bytes(data)
+            hashed_path = path.with_name(_hashed_name(path, asset_hash))
+            counts["hashed"] += 1
+            if not hashed_path.exists():
+                # The name is content-addressed: an existing copy already has these bytes
+                _atomic_write(hashed_path, data)
+                counts["written"] += 1
+        counts["compressed"] += _write_variants(hashed_path, data)
+
+        new_cache[rel] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": asset_hash}
+        if deps:
+            new_cache[rel]["deps"] = deps
+        counts["removed"] += _cleanup_old_hashes(path, keep_name=hashed_path.name)
+        manifest[rel] = hashed_path.relative_to(static_dir).as_posix()
+
+    # Hashed copies whose source asset was deleted
+    for path in list(_iter_files(static_dir)):
+        source = _source_of(path)
+        if source is not None and not source.exists():
+            path.unlink()
+            counts["removed"] += 1
+
+    manifest_path = static_dir / MANIFEST_PATH.name
+    content = (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    if not manifest_path.exists() or manifest_path.read_bytes() != content:
+        _atomic_write(manifest_path, content)
+    if cache_path:
+        _atomic_write(cache_path, json.dumps(new_cache, indent=1, sort_keys=True).encode("utf-8"))
     return manifest
 
 
+def _cleanup_old_hashes(source: Path, keep_name: str) -> int:
+    removed = 0
+    for candidate in source.parent.glob(f"{source.stem}.*{source.suffix}"):
+        match = HASHED_NAME_RE.match(candidate.name)
+        if match and match["stem"] == source.stem and candidate.name != keep_name:
+            candidate.unlink()
+            removed += 1
+    return removed
+
+
 def main() -> None:
-    manifest = generate_manifest()
-    print("Generated manifest:")
-    for original, hashed in manifest.items():
-        print(f"  {original} -> {hashed}")
+    parser = argparse.ArgumentParser(description="Fingerprint static assets")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the mtime/size hash cache")
+    parser.add_argument("-q", "--quiet", action="store_true", help="only print the summary")
+    args = parser.parse_args()
+
+    stats: Dict[str, int] = {}
+    start = time.perf_counter()
+    manifest = generate_manifest(cache_path=None if args.no_cache else HASH_CACHE_PATH, stats=stats)
+    elapsed = (time.perf_counter() - start) * 1000
+    if not args.quiet:
+        print("Generated manifest:")
+        for original, hashed in manifest.items():
+            print(f"  {original} -> {hashed}")
+    print(
+        f"{len(manifest)} assets in {elapsed:.1f} ms: {stats['hashed']} hashed, {stats['cached']} from cache, "
+        f"{stats['written']} copies written, {stats['compressed']} compressed variants written "
+        f"({', '.join(COMPRESSORS)}), {stats['removed']} stale files removed"
+    )
 
 
 if __name__ == "__main__":
     main()
-
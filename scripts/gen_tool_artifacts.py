@@ -198,8 +198,7 @@ def generate_template(tool: ToolConfig) -> str:
 {{% endblock %}}
 
 {{% block extra_js %}}
-<script src=\"{{{{ static_asset('js/common.js') }}}}\"></script>
-<script src=\"{{{{ static_asset('js/tools/{tool.name}.js') }}}}\"></script>
+<script src=\"{{{{ page_bundle(tool) or static_asset('js/tools/{tool.name}.js') }}}}\"></script>
 {{% endblock %}}
 """
 
@@ -240,7 +239,7 @@ if ({tool.name}Form) {{
         }}
 
         try {{
-            const response = await apiRequest({tool.name}Endpoint, "POST", payload);
+            const response = await apiRequest({tool.name}Endpoint, "POST", payload, {{ channel: {tool.name}Endpoint }});
             renderResult({tool.name}Result, {tool.name}ResultContent, response);
         }} catch (error) {{
             showError(error.message || "请求失败");
@@ -1,8 +1,9 @@
 """
 从Excel导入风机性能数据到SQLite数据库
 """
+import argparse
 import sys
-import os
+import time
 from pathlib import Path
 
 # 添加项目根目录到路径
@@ -10,38 +11,219 @@ BASE_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(BASE_DIR))
 
 from openpyxl import load_workbook
-from app.db.database import init_db, insert_fan_performance
+from app.db.database import bulk_insert_fan_performance, init_db
 
 
-def import_from_excel(excel_path: str, fan_type: str, sheet_name: str = None):
+# 数据库字段 -> 表头候选（按顺序匹配，忽略大小写与空白）
+DEFAULT_COLUMN_MAPPING = {
+    "fan_type": ["fan_type", "型号", "风机型号"],
+    "point_index": ["point_index", "序号", "点号", "性能点"],
+    "phi": ["phi", "φ", "流量系数"],
+    "psi_p": ["psi_p", "ψp", "ψ_p", "全压系数", "压力系数"],
+    "eta": ["eta", "η", "效率", "内效率"],
+}
+
+REQUIRED_FIELDS = ("fan_type", "phi", "psi_p", "eta")
+
+
+class ImportReport:
+    """导入统计：有效行数、无效行及原因"""
+
+    def __init__(self):
+        self.valid = 0
+        self.errors = []
+        self.omitted = 0
+        self.written = 0
+        self.fan_types = set()
+
+    def add_error(self, row_number, message, limit=50):
+        if len(self.errors) < limit:
+            self.errors.append(f"第{row_number}行: {message}")
+        else:
+            # 超出上限的只计数，不保存信息
+            self.omitted += 1
+
+    @property
+    def error_count(self):
+        return len(self.errors) + self.omitted
+
+
+class InvalidRowsError(Exception):
+    """存在无效行，整个导入事务回滚"""
+
+
+def abort_on_errors(records, report):
     """
-    从Excel文件导入风机性能数据
-    
+    逐条转发有效行，全部行校验完后若有无效行则抛出 InvalidRowsError
+
+    在 bulk_insert_fan_performance 的事务内迭代，异常使已写入的批次一并回滚，
+    保持流式读取的同时做到要么全部写入、要么一行不写。
+    """
+    yield from records
+    if report.error_count:
+        raise InvalidRowsError(f"{report.error_count} 行数据无效")
+
+
+def iter_sheet_rows(excel_path, sheet_name=None):
+    """
+    流式读取工作表的行（值元组）
+
+    .xlsx/.xlsm 使用 openpyxl 只读模式逐行读取；.xls 需要安装 xlrd。
+    """
+    path = Path(excel_path)
+    suffix = path.suffix.lower()
+    if suffix in (".xlsx", ".xlsm"):
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+            yield from ws.iter_rows(values_only=True)
+        finally:
+            wb.close()
+    elif suffix == ".xls":
+        try:
+            import xlrd
+        except ImportError as exc:
+            raise ValueError("读取 .xls 需要安装 xlrd: pip install xlrd") from exc
+        book = xlrd.open_workbook(str(path), on_demand=True)
+        try:
+            sheet = book.sheet_by_name(sheet_name) if sheet_name else book.sheet_by_index(0)
+            for index in range(sheet.nrows):
+                yield tuple(sheet.row_values(index))
+        finally:
+            book.release_resources()
+    else:
+        raise ValueError(f"不支持的文件格式: {path.suffix}")
+
+
+def resolve_columns(header, mapping=None):
+    """
+    根据表头确定各字段所在列
+
     Args:
-        excel_path: Excel文件路径
-        fan_type: 风机型号，如 "4-68"
+        header: 表头行
+        mapping: 字段 -> 表头名称（或候选列表），覆盖默认映射
+
+    Returns:
+        dict: 字段 -> 列序号，point_index 可缺省
+    """
+    candidates = {field: list(names) for field, names in DEFAULT_COLUMN_MAPPING.items()}
+    for field, names in (mapping or {}).items():
+        if field not in candidates:
+            raise ValueError(f"未知的字段: {field}")
+        candidates[field] = [names] if isinstance(names, str) else list(names)
+
+    normalized = ["" if cell is None else str(cell).strip().lower().replace(" ", "") for cell in header]
+    columns = {}
+    for field, names in candidates.items():
+        for name in names:
+            key = str(name).strip().lower().replace(" ", "")
+            if key in normalized:
+                columns[field] = normalized.index(key)
+                break
+    missing = [field for field in REQUIRED_FIELDS if field not in columns]
+    if missing:
+        raise ValueError(f"表头中找不到字段: {', '.join(missing)}（表头: {list(header)}）")
+    return columns
+
+
+def parse_rows(rows, columns, report, header_row=1):
+    """
+    校验并转换数据行，生成 (fan_type, point_index, phi, psi_p, eta)
+
+    型号为空时沿用上一行（合并单元格的常见写法）；缺少序号列时按型号内出现顺序编号。
+    """
+    current_type = None
+    counters = {}
+    index_column = columns.get("point_index")
+    for row_number, row in enumerate(rows, start=header_row + 1):
+        if not row or all(cell is None or cell == "" for cell in row):
+            continue
+        raw_type = row[columns["fan_type"]] if columns["fan_type"] < len(row) else None
+        if raw_type not in (None, ""):
+            current_type = str(raw_type).strip()
+        if not current_type:
+            report.add_error(row_number, "缺少风机型号")
+            continue
+        try:
+            phi, psi_p, eta = (float(row[columns[field]]) for field in ("phi", "psi_p", "eta"))
+        except (TypeError, ValueError, IndexError):
+            report.add_error(row_number, "phi/psi_p/eta 不是数值")
+            continue
+        if phi <= 0 or psi_p <= 0 or not 0 < eta <= 100:
+            report.add_error(row_number, f"数值超出范围: phi={phi}, psi_p={psi_p}, eta={eta}")
+            continue
+
+        if index_column is not None and index_column < len(row) and row[index_column] not in (None, ""):
+            try:
+                point_index = int(row[index_column])
+            except (TypeError, ValueError):
+                report.add_error(row_number, f"序号不是整数: {row[index_column]}")
+                continue
+        else:
+            point_index = counters.get(current_type, 0) + 1
+        counters[current_type] = max(counters.get(current_type, 0), point_index)
+
+        report.valid += 1
+        report.fan_types.add(current_type)
+        yield current_type, point_index, phi, psi_p, eta
+
+
+def import_from_excel(excel_path: str, fan_type: str = None, sheet_name: str = None, mapping: dict = None,
+                      dry_run: bool = False, replace: bool = False, header_row: int = 1,
+                      batch_size: int = 5000):
+    """
+    从Excel文件流式导入风机性能数据
+
+    Args:
+        excel_path: Excel文件路径（.xlsx/.xlsm/.xls）
+        fan_type: 只导入该型号，None 表示导入全部
         sheet_name: 工作表名称，如果为None则使用第一个工作表
+        mapping: 字段 -> 表头名称，覆盖 DEFAULT_COLUMN_MAPPING
+        dry_run: 只校验不写入
+        replace: 导入前删除同型号的已有性能点；存在无效行时不写入任何数据（含删除）
+        header_row: 表头所在行号（从1开始）
+        batch_size: 每批写入行数
+
+    Returns:
+        ImportReport: 导入统计，written 为实际写入行数
     """
-    print(f"正在从 {excel_path} 导入 {fan_type} 型号的数据...")
-    
-    wb = load_workbook(excel_path, data_only=True)
-    
-    if sheet_name:
-        ws = wb[sheet_name]
+    print(f"正在从 {excel_path} 导入风机性能数据{'（仅校验）' if dry_run else ''}...")
+    start = time.perf_counter()
+
+    rows = iter_sheet_rows(excel_path, sheet_name)
+    for _ in range(header_row - 1):
+        next(rows, None)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("工作表为空")
+    columns = resolve_columns(header, mapping)
+
+    report = ImportReport()
+    records = parse_rows(rows, columns, report, header_row)
+    if fan_type:
+        records = (record for record in records if record[0] == fan_type)
+
+    if dry_run:
+        for _ in records:
+            pass
     else:
-        ws = wb.active
-    
-    print(f"使用工作表: {ws.title}")
-    print(f"行数: {ws.max_row}, 列数: {ws.max_column}")
-    
-    # 这里需要根据实际的Excel结构来解析数据
-    # 示例：假设数据在特定位置
-    # 实际使用时需要根据Excel文件的具体结构调整
-    
-    print("注意：需要根据实际Excel文件结构来解析数据")
-    print("请修改此脚本以匹配您的Excel文件格式")
-    
-    wb.close()
+        try:
+            report.written = bulk_insert_fan_performance(
+                abort_on_errors(records, report), replace=replace, batch_size=batch_size
+            )
+        except InvalidRowsError:
+            report.written = 0
+
+    elapsed = time.perf_counter() - start
+    print(f"有效性能点: {report.valid}，型号: {len(report.fan_types)}，无效行: {report.error_count}")
+    for message in report.errors:
+        print(f"  {message}")
+    if report.omitted:
+        print(f"  ...（另有 {report.omitted} 行无效已省略）")
+    if report.error_count and not dry_run:
+        print("存在无效行，未写入任何数据")
+    print(f"写入: {report.written} 行，耗时 {elapsed:.2f} s")
+    return report
 
 
 def import_from_calculated_data():
@@ -63,14 +245,10 @@ def import_from_calculated_data():
         {"point_index": 7, "phi": 0.285, "psi_p": 0.350073, "eta": 84.7},
     ]
     
+    bulk_insert_fan_performance(
+        (fan_type, point["point_index"], point["phi"], point["psi_p"], point["eta"]) for point in performance_data
+    )
     for point in performance_data:
-        insert_fan_performance(
-            fan_type=fan_type,
-            point_index=point["point_index"],
-            phi=point["phi"],
-            psi_p=point["psi_p"],
-            eta=point["eta"]
-        )
         print(f"  导入点{point['point_index']}: φ={point['phi']}, ψ_p={point['psi_p']}, η={point['eta']}%")
     
     print(f"✓ 成功导入 {len(performance_data)} 个性能点")
@@ -86,23 +264,58 @@ def import_from_builtin_data():
     pass
 
 
-if __name__ == "__main__":
-    # 初始化数据库
+def parse_mapping(items):
+    mapping = {}
+    for item in items or []:
+        field, _, header = item.partition("=")
+        if not header:
+            raise ValueError(f"列映射格式应为 字段=表头: {item}")
+        mapping[field.strip()] = header.strip()
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description="风机性能数据导入工具")
+    parser.add_argument("--excel", help="风机样本 Excel 文件，不指定时导入内置的4-68数据")
+    parser.add_argument("--sheet", help="工作表名称，默认第一个")
+    parser.add_argument("--fan-type", help="只导入指定型号")
+    parser.add_argument("--map", action="append", metavar="字段=表头",
+                        help="列映射，字段为 fan_type/point_index/phi/psi_p/eta，可重复")
+    parser.add_argument("--header-row", type=int, default=1, help="表头所在行号")
+    parser.add_argument("--batch-size", type=int, default=5000, help="每批写入行数")
+    parser.add_argument("--replace", action="store_true", help="导入前删除同型号的已有性能点")
+    parser.add_argument("--dry-run", action="store_true", help="只校验，不写入数据库")
+    args = parser.parse_args()
+
     print("=" * 80)
     print("风机性能数据导入工具")
     print("=" * 80)
-    
-    init_db()
-    
-    # 导入反推数据
-    import_from_calculated_data()
-    
-    # 如果有Excel文件，可以导入
-    # excel_path = "data/电机电力电气计算表.xlsx"
-    # if os.path.exists(excel_path):
-    #     import_from_excel(excel_path, "4-68", "风机选型计算 ")
-    
+
+    if not args.dry_run:
+        init_db()
+
+    if args.excel:
+        report = import_from_excel(
+            args.excel,
+            fan_type=args.fan_type,
+            sheet_name=args.sheet,
+            mapping=parse_mapping(args.map),
+            dry_run=args.dry_run,
+            replace=args.replace,
+            header_row=args.header_row,
+            batch_size=args.batch_size,
+        )
+        if report.error_count:
+            return 1
+    else:
+        # 导入反推数据
+        import_from_calculated_data()
+
     print("\n" + "=" * 80)
     print("数据导入完成！")
     print("=" * 80)
+    return 0
 
+
+if __name__ == "__main__":
+    sys.exit(main())
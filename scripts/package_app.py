@@ -3,20 +3,27 @@
 Usage:
     python scripts/package_app.py --output dist/tool-app.zip
 
-The bundle includes source code, templates, static assets, tool configs, and
-metadata files required to run the application.
+The bundle includes source code, templates, precompiled template bytecode,
+static assets, tool configs, and metadata files required to run the application.
 """
 from __future__ import annotations
 
 import argparse
 from pathlib import Path
+import sys
 import zipfile
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bundle_js import build_bundles
+from fingerprint_static import generate_manifest
+from precompile_templates import precompile
+
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_OUTPUT = ROOT / "dist" / "tool-app.zip"
 
 # Directories and files to include in the bundle (relative to repo root)
-INCLUDE_DIRS = ["app", "static", "templates", "tools", "data"]
+INCLUDE_DIRS = ["app", "static", "templates", "tools", "data", "prerendered", ".cache/jinja"]
 INCLUDE_FILES = ["requirements.txt", "README.md"]
 EXCLUDE_SUFFIXES = {".pyc"}
 EXCLUDE_NAMES = {"__pycache__"}
@@ -47,6 +54,15 @@ def iter_included_paths(base: Path):
 
 
 def create_bundle(output: Path) -> None:
+    # One minified script per tool page (common.js + tool script), fingerprinted below
+    pages = build_bundles(check=True)
+    print(f"Built {len(pages)} page script bundles")
+    # Fingerprint assets and emit their .gz/.br variants (not kept in git)
+    manifest = generate_manifest()
+    print(f"Fingerprinted {len(manifest)} static assets")
+    # Compile every template so workers in the bundle never compile on a request
+    count = precompile(ROOT / ".cache" / "jinja", clear=True)
+    print(f"Precompiled {count} templates")
     output.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for path in iter_included_paths(ROOT):
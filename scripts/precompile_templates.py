@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+预编译全部 Jinja2 模板到字节码缓存
+打包前运行（scripts/package_app.py 会自动调用），部署后 worker 直接加载字节码，
+首次渲染不再编译模板。
+
+用法:
+    python scripts/precompile_templates.py [--output .cache/jinja] [--clear]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.services.templating import JINJA_CACHE_DIR, TEMPLATE_DIR, create_templates, warm_templates
+
+
+def precompile(output: Path = JINJA_CACHE_DIR, clear: bool = False) -> int:
+    """编译全部模板并写入字节码缓存，返回模板数量"""
+    templates = create_templates(TEMPLATE_DIR, output)
+    if clear:
+        templates.env.bytecode_cache.clear()
+    return warm_templates(templates.env)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预编译 Jinja2 模板")
+    parser.add_argument("--output", type=Path, default=JINJA_CACHE_DIR, help="字节码缓存目录")
+    parser.add_argument("--clear", action="store_true", help="先清空已有缓存")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = precompile(args.output, args.clear)
+    print(f"已编译 {count} 个模板到 {args.output}（{(time.perf_counter() - start) * 1000:.0f} ms）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+预渲染首页与全部工具页为静态 HTML
+应在生成静态资源指纹清单（scripts/fingerprint_static.py）之后、打包之前运行；
+模板、清单或工具配置变化后需重新运行，否则应用会退回实时渲染。
+
+用法:
+    python scripts/prerender_pages.py [--output prerendered]
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.main import TEMPLATE_DIR, TOOL_SPECS, load_asset_manifest, templates
+from app.services.pages import PRERENDER_DIR, build_fingerprint, prerender_pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预渲染首页与工具页")
+    parser.add_argument("--output", type=Path, default=PRERENDER_DIR, help="输出目录")
+    args = parser.parse_args()
+
+    fingerprint = build_fingerprint(TEMPLATE_DIR, load_asset_manifest(), TOOL_SPECS)
+    written = prerender_pages(templates, TOOL_SPECS, fingerprint, args.output)
+    total = sum(path.stat().st_size for path in written.values())
+    print(f"已预渲染 {len(written)} 个页面（{total / 1024:.1f} KB）到 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
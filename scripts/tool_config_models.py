@@ -20,6 +20,7 @@ class ParameterSpec(BaseModel):
     description: str = Field(..., description="Short explanation of the parameter")
     type: ParameterType = Field(..., description="Data type used for validation and UI rendering")
     unit: Optional[str] = Field(None, description="Measurement unit (if applicable)")
+    symbol: Optional[str] = Field(None, description="Symbol used for this parameter in scenario formulas")
     required: bool = Field(True, description="Whether the parameter must be provided")
     minimum: Optional[float] = Field(None, description="Minimum accepted value for numeric parameters")
     maximum: Optional[float] = Field(None, description="Maximum accepted value for numeric parameters")
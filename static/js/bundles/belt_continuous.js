@@ -0,0 +1,120 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;function switchSubTab(tabName){const tabContents=document.querySelectorAll('.tab-content');tabContents.forEach(content=>{content.classList.remove('active');});const subTabs=document.querySelectorAll('.sub-tab');subTabs.forEach(tab=>{tab.classList.remove('active');});const targetContent=document.getElementById(tabName);if(targetContent){targetContent.classList.add('active');}
+subTabs.forEach(tab=>{const onclick=tab.getAttribute('onclick');if(onclick&&onclick.includes(tabName)){tab.classList.add('active');}});}
+async function calculateMotorSpeed(){const VInput=document.getElementById('ms_V').value.trim();const DInput=document.getElementById('ms_D').value.trim();const iInput=document.getElementById('ms_i').value.trim();if(VInput===''){showError('请输入皮带速度');return;}
+const V=parseFloat(VInput);if(isNaN(V)||V<=0){showError('皮带速度必须大于0');return;}
+if(DInput===''){showError('请输入滚筒直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('滚筒直径必须大于0');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+const params={scenario:'motor_speed',V:V,D:D,i:i};try{const result=await calculateTool('belt-continuous',params);if(result.extra&&result.extra.N){document.getElementById('ms_N_value').textContent=formatNumber(result.extra.N,2);}
+document.getElementById('ms_result_value').textContent=formatNumber(result.result,2);document.getElementById('ms_result_unit').textContent=result.unit;renderFormula('ms_result_formula',result.formula);document.getElementById('ms_result').style.display='block';document.getElementById('ms_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateLoadTorque(){const FAInput=document.getElementById('lt_FA').value.trim();const mLInput=document.getElementById('lt_mL').value.trim();const aInput=document.getElementById('lt_a').value.trim();const muInput=document.getElementById('lt_mu').value.trim();const DInput=document.getElementById('lt_D').value.trim();const etaInput=document.getElementById('lt_eta').value.trim();const iInput=document.getElementById('lt_i').value.trim();const etaGInput=document.getElementById('lt_etaG').value.trim();const FA=FAInput===''?0:parseFloat(FAInput);if(isNaN(FA)||FA<0){showError('外力必须大于等于0');return;}
+if(mLInput===''){showError('请输入皮带与工作物总质量');return;}
+const mL=parseFloat(mLInput);if(isNaN(mL)||mL<=0){showError('皮带与工作物总质量必须大于0');return;}
+const a=aInput===''?0:parseFloat(aInput);if(isNaN(a)||a<-90||a>90){showError('移动方向与水平轴夹角应在-90°到90°之间');return;}
+const mu=muInput===''?0.3:parseFloat(muInput);if(isNaN(mu)||mu<0){showError('滑动面摩擦系数不能为负数');return;}
+if(DInput===''){showError('请输入滚筒直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('滚筒直径必须大于0');return;}
+const eta=etaInput===''?0.9:parseFloat(etaInput);if(isNaN(eta)||eta<=0||eta>1){showError('传送带和滚筒的机械效率应在0-1之间');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+const etaG=etaGInput===''?0.7:parseFloat(etaGInput);if(isNaN(etaG)||etaG<=0||etaG>1){showError('减速机机械效率应在0-1之间');return;}
+const params={scenario:'load_torque',FA:FA,mL:mL,a:a,mu:mu,D:D,eta:eta,i:i,etaG:etaG};try{const result=await calculateTool('belt-continuous',params);if(result.extra){if(result.extra.F!==undefined){document.getElementById('lt_F_value').textContent=formatNumber(result.extra.F,4);}
+if(result.extra.TL!==undefined){document.getElementById('lt_TL_value').textContent=formatNumber(result.extra.TL,6);}}
+document.getElementById('lt_result_value').textContent=formatNumber(result.result,6);document.getElementById('lt_result_unit').textContent=result.unit;renderFormula('lt_result_formula',result.formula);document.getElementById('lt_result').style.display='block';document.getElementById('lt_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateInertiaConversion(){const mLInput=document.getElementById('ic_mL').value.trim();const DInput=document.getElementById('ic_D').value.trim();const m2Input=document.getElementById('ic_m2').value.trim();if(mLInput===''){showError('请输入皮带与工作物总质量');return;}
+const mL=parseFloat(mLInput);if(isNaN(mL)||mL<=0){showError('皮带与工作物总质量必须大于0');return;}
+if(DInput===''){showError('请输入滚筒直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('滚筒直径必须大于0');return;}
+if(m2Input===''){showError('请输入滚筒质量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<=0){showError('滚筒质量必须大于0');return;}
+const params={scenario:'inertia_conversion',mL:mL,D:D,m2:m2};try{const result=await calculateTool('belt-continuous',params);if(result.extra){if(result.extra.JM1!==undefined){document.getElementById('ic_JM1_value').textContent=formatNumber(result.extra.JM1,6);}
+if(result.extra.JM2!==undefined){document.getElementById('ic_JM2_value').textContent=formatNumber(result.extra.JM2,6);}}
+document.getElementById('ic_result_value').textContent=formatNumber(result.result,6);document.getElementById('ic_result_unit').textContent=result.unit;renderFormula('ic_result_formula',result.formula);document.getElementById('ic_result').style.display='block';document.getElementById('ic_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateRequiredTorque(){const TLMInput=document.getElementById('rt_TLM').value.trim();const SInput=document.getElementById('rt_S').value.trim();if(TLMInput===''){showError('请输入电机轴负载转矩');return;}
+const TLM=parseFloat(TLMInput);if(isNaN(TLM)||TLM<0){showError('电机轴负载转矩必须大于等于0');return;}
+const S=SInput===''?1.5:parseFloat(SInput);if(isNaN(S)||S<=0){showError('安全系数必须大于0');return;}
+const params={scenario:'required_torque',TLM:TLM,S:S};try{const result=await calculateTool('belt-continuous',params);document.getElementById('rt_result_value').textContent=formatNumber(result.result,6);document.getElementById('rt_result_unit').textContent=result.unit;renderFormula('rt_result_formula',result.formula);document.getElementById('rt_result').style.display='block';document.getElementById('rt_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateInertiaRatio(){const JLInput=document.getElementById('ir_JL').value.trim();const iInput=document.getElementById('ir_i').value.trim();const JMInput=document.getElementById('ir_JM').value.trim();if(JLInput===''){showError('请输入折算到减速机轴的负载惯量');return;}
+const JL=parseFloat(JLInput);if(isNaN(JL)||JL<=0){showError('折算到减速机轴的负载惯量必须大于0');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+if(JMInput===''){showError('请输入电机惯量');return;}
+const JM=parseFloat(JMInput);if(isNaN(JM)||JM<=0){showError('电机惯量必须大于0');return;}
+const params={scenario:'inertia_ratio',JL:JL,i:i,JM:JM};try{const result=await calculateTool('belt-continuous',params);document.getElementById('ir_result_value').textContent=formatNumber(result.result,2);renderFormula('ir_result_formula',result.formula);const warningDiv=document.getElementById('ir_warning');if(result.result>5){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>惯量比大于5，建议重新选择电机或调整减速比，以确保系统具有良好的动态响应性能。';}else if(result.result>3){warningDiv.style.display='block';warningDiv.style.background='#d1ecf1';warningDiv.style.border='1px solid #bee5eb';warningDiv.style.color='#0c5460';warningDiv.innerHTML='<strong>提示：</strong>惯量比在3-5之间，系统动态响应性能可接受，但建议优化到3以下以获得更好的性能。';}else{warningDiv.style.display='none';}
+document.getElementById('ir_result').style.display='block';document.getElementById('ir_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
@@ -0,0 +1,244 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;function switchSubTab(tabName){const tabContents=document.querySelectorAll('.tab-content');tabContents.forEach(content=>{content.classList.remove('active');});const subTabs=document.querySelectorAll('.sub-tab');subTabs.forEach(tab=>{tab.classList.remove('active');});const targetContent=document.getElementById(tabName);if(targetContent){targetContent.classList.add('active');}
+subTabs.forEach(tab=>{const onclick=tab.getAttribute('onclick');if(onclick&&onclick.includes(tabName)){tab.classList.add('active');}});}
+async function calculatePower(){const fInput=document.getElementById('pc_f').value.trim();const m1Input=document.getElementById('pc_m1').value.trim();const m2Input=document.getElementById('pc_m2').value.trim();const vRatedInput=document.getElementById('pc_v_rated').value.trim();const slopePercentInput=document.getElementById('pc_slope_percent').value.trim();const nEffectiveInput=document.getElementById('pc_n_effective').value.trim();const PMotorInput=document.getElementById('pc_P_motor').value.trim();if(fInput===''){showError('请输入滚动摩擦系数');return;}
+const f=parseFloat(fInput);if(isNaN(f)||f<0){showError('滚动摩擦系数必须大于等于0');return;}
+if(m1Input===''){showError('请输入车体重量');return;}
+const m1=parseFloat(m1Input);if(isNaN(m1)||m1<=0){showError('车体重量必须大于0');return;}
+if(m2Input===''){showError('请输入负载重量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<0){showError('负载重量必须大于等于0');return;}
+if(vRatedInput===''){showError('请输入平地车体额定速度');return;}
+const v_rated=parseFloat(vRatedInput);if(isNaN(v_rated)||v_rated<=0){showError('平地车体额定速度必须大于0');return;}
+if(slopePercentInput===''){showError('请输入轨道坡度');return;}
+const slope_percent=parseFloat(slopePercentInput);if(isNaN(slope_percent)||slope_percent<0){showError('轨道坡度必须大于等于0');return;}
+if(nEffectiveInput===''){showError('请输入有效电机数');return;}
+const n_effective=parseFloat(nEffectiveInput);if(isNaN(n_effective)||n_effective<=0){showError('有效电机数必须大于0');return;}
+if(PMotorInput===''){showError('请输入电机功率');return;}
+const P_motor=parseFloat(PMotorInput);if(isNaN(P_motor)||P_motor<=0){showError('电机功率必须大于0');return;}
+const params={scenario:'power_calc',f:f,m1:m1,m2:m2,v_rated:v_rated,slope_percent:slope_percent,n_effective:n_effective,P_motor:P_motor};try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.P1!==undefined){document.getElementById('pc_P1_value').textContent=formatNumber(result.extra.P1,2);}
+if(result.extra.P2!==undefined){document.getElementById('pc_P2_value').textContent=formatNumber(result.extra.P2,2);}
+if(result.extra.P3!==undefined){document.getElementById('pc_P3_value').textContent=formatNumber(result.extra.P3,2);}}
+document.getElementById('pc_result_value').textContent=formatNumber(result.result,2);renderFormula('pc_result_formula',result.formula);const warningDiv=document.getElementById('pc_warning');if(result.result<1.2){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>行走功率安全系数小于1.2，建议重新选择电机或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('pc_result').style.display='block';document.getElementById('pc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateTorque(){const fInput=document.getElementById('tc_f').value.trim();const m1Input=document.getElementById('tc_m1').value.trim();const m2Input=document.getElementById('tc_m2').value.trim();const DInput=document.getElementById('tc_D').value.trim();const slopePercentInput=document.getElementById('tc_slope_percent').value.trim();const IActualInput=document.getElementById('tc_I_actual').value.trim();const INoLoadInput=document.getElementById('tc_I_no_load').value.trim();const IRatedInput=document.getElementById('tc_I_rated').value.trim();const TRatedInput=document.getElementById('tc_T_rated').value.trim();const iTotalInput=document.getElementById('tc_i_total').value.trim();const nEffectiveInput=document.getElementById('tc_n_effective').value.trim();if(fInput===''){showError('请输入滚动摩擦系数');return;}
+const f=parseFloat(fInput);if(isNaN(f)||f<0){showError('滚动摩擦系数必须大于等于0');return;}
+if(m1Input===''){showError('请输入车体重量');return;}
+const m1=parseFloat(m1Input);if(isNaN(m1)||m1<=0){showError('车体重量必须大于0');return;}
+if(m2Input===''){showError('请输入负载重量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<0){showError('负载重量必须大于等于0');return;}
+if(DInput===''){showError('请输入履带轮子直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('履带轮子直径必须大于0');return;}
+if(slopePercentInput===''){showError('请输入轨道坡度');return;}
+const slope_percent=parseFloat(slopePercentInput);if(isNaN(slope_percent)||slope_percent<0){showError('轨道坡度必须大于等于0');return;}
+if(IActualInput===''){showError('请输入实际电流(平均)');return;}
+const I_actual=parseFloat(IActualInput);if(isNaN(I_actual)||I_actual<=0){showError('实际电流(平均)必须大于0');return;}
+if(INoLoadInput===''){showError('请输入空转电流');return;}
+const I_no_load=parseFloat(INoLoadInput);if(isNaN(I_no_load)||I_no_load<0){showError('空转电流必须大于等于0');return;}
+if(IRatedInput===''){showError('请输入额定电流');return;}
+const I_rated=parseFloat(IRatedInput);if(isNaN(I_rated)||I_rated<=0){showError('额定电流必须大于0');return;}
+if(TRatedInput===''){showError('请输入额定扭矩');return;}
+const T_rated=parseFloat(TRatedInput);if(isNaN(T_rated)||T_rated<=0){showError('额定扭矩必须大于0');return;}
+if(iTotalInput===''){showError('请输入总减速比');return;}
+const i_total=parseFloat(iTotalInput);if(isNaN(i_total)||i_total<=0){showError('总减速比必须大于0');return;}
+if(nEffectiveInput===''){showError('请输入有效电机数');return;}
+const n_effective=parseFloat(nEffectiveInput);if(isNaN(n_effective)||n_effective<=0){showError('有效电机数必须大于0');return;}
+const params={scenario:'torque_calc',f:f,m1:m1,m2:m2,D:D,slope_percent:slope_percent,I_actual:I_actual,I_no_load:I_no_load,I_rated:I_rated,T_rated:T_rated,i_total:i_total,n_effective:n_effective};try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.T1!==undefined){document.getElementById('tc_T1_value').textContent=formatNumber(result.extra.T1,4);}
+if(result.extra.T2!==undefined){document.getElementById('tc_T2_value').textContent=formatNumber(result.extra.T2,4);}
+if(result.extra.T3!==undefined){document.getElementById('tc_T3_value').textContent=formatNumber(result.extra.T3,4);}}
+document.getElementById('tc_result_value').textContent=formatNumber(result.result,2);renderFormula('tc_result_formula',result.formula);const warningDiv=document.getElementById('tc_warning');if(result.result<1.2){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>行走额定扭矩安全系数小于1.2，建议重新选择电机或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('tc_result').style.display='block';document.getElementById('tc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateAccelerationTorque(){const fInput=document.getElementById('atc_f').value.trim();const m1Input=document.getElementById('atc_m1').value.trim();const m2Input=document.getElementById('atc_m2').value.trim();const DInput=document.getElementById('atc_D').value.trim();const slopePercentInput=document.getElementById('atc_slope_percent').value.trim();const aInput=document.getElementById('atc_a').value.trim();const aSlopeInput=document.getElementById('atc_a_slope').value.trim();const TMaxInput=document.getElementById('atc_T_max').value.trim();const iTotalInput=document.getElementById('atc_i_total').value.trim();const nEffectiveInput=document.getElementById('atc_n_effective').value.trim();if(fInput===''){showError('请输入滚动摩擦系数');return;}
+const f=parseFloat(fInput);if(isNaN(f)||f<0){showError('滚动摩擦系数必须大于等于0');return;}
+if(m1Input===''){showError('请输入车体重量');return;}
+const m1=parseFloat(m1Input);if(isNaN(m1)||m1<=0){showError('车体重量必须大于0');return;}
+if(m2Input===''){showError('请输入负载重量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<0){showError('负载重量必须大于等于0');return;}
+if(DInput===''){showError('请输入履带轮子直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('履带轮子直径必须大于0');return;}
+if(slopePercentInput===''){showError('请输入轨道坡度');return;}
+const slope_percent=parseFloat(slopePercentInput);if(isNaN(slope_percent)||slope_percent<0){showError('轨道坡度必须大于等于0');return;}
+if(aInput===''){showError('请输入运行加速度');return;}
+const a=parseFloat(aInput);if(isNaN(a)||a<0){showError('运行加速度必须大于等于0');return;}
+if(aSlopeInput===''){showError('请输入坡道加速度');return;}
+const a_slope=parseFloat(aSlopeInput);if(isNaN(a_slope)||a_slope<0){showError('坡道加速度必须大于等于0');return;}
+if(TMaxInput===''){showError('请输入最大扭矩');return;}
+const T_max=parseFloat(TMaxInput);if(isNaN(T_max)||T_max<=0){showError('最大扭矩必须大于0');return;}
+if(iTotalInput===''){showError('请输入总减速比');return;}
+const i_total=parseFloat(iTotalInput);if(isNaN(i_total)||i_total<=0){showError('总减速比必须大于0');return;}
+if(nEffectiveInput===''){showError('请输入有效电机数');return;}
+const n_effective=parseFloat(nEffectiveInput);if(isNaN(n_effective)||n_effective<=0){showError('有效电机数必须大于0');return;}
+const params={scenario:'acceleration_torque_calc',f:f,m1:m1,m2:m2,D:D,slope_percent:slope_percent,a:a,a_slope:a_slope,T_max:T_max,i_total:i_total,n_effective:n_effective};try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.T4!==undefined){document.getElementById('atc_T4_value').textContent=formatNumber(result.extra.T4,4);}
+if(result.extra.T5!==undefined){document.getElementById('atc_T5_value').textContent=formatNumber(result.extra.T5,4);}
+if(result.extra.T6!==undefined){document.getElementById('atc_T6_value').textContent=formatNumber(result.extra.T6,4);}}
+document.getElementById('atc_result_value').textContent=formatNumber(result.result,2);renderFormula('atc_result_formula',result.formula);const warningDiv=document.getElementById('atc_warning');if(result.result<1.2){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>加速最大扭矩安全系数小于1.2，建议重新选择电机或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('atc_result').style.display='block';document.getElementById('atc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateObstacle(){const m1Input=document.getElementById('oc_m1').value.trim();const m2Input=document.getElementById('oc_m2').value.trim();const DInput=document.getElementById('oc_D').value.trim();const obstacleHeightInput=document.getElementById('oc_obstacle_height').value.trim();const fInput=document.getElementById('oc_f').value.trim();const slopePercentInput=document.getElementById('oc_slope_percent').value.trim();const aSlopeInput=document.getElementById('oc_a_slope').value.trim();const peakAttachmentInput=document.getElementById('oc_peak_attachment').value.trim();const TMaxInput=document.getElementById('oc_T_max').value.trim();const iTotalInput=document.getElementById('oc_i_total').value.trim();const nEffectiveInput=document.getElementById('oc_n_effective').value.trim();if(m1Input===''){showError('请输入车体重量');return;}
+const m1=parseFloat(m1Input);if(isNaN(m1)||m1<=0){showError('车体重量必须大于0');return;}
+if(m2Input===''){showError('请输入负载重量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<0){showError('负载重量必须大于等于0');return;}
+if(DInput===''){showError('请输入履带轮子直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('履带轮子直径必须大于0');return;}
+if(fInput===''){showError('请输入滚动摩擦系数');return;}
+const f=parseFloat(fInput);if(isNaN(f)||f<0){showError('滚动摩擦系数必须大于等于0');return;}
+if(slopePercentInput===''){showError('请输入轨道坡度');return;}
+const slope_percent=parseFloat(slopePercentInput);if(isNaN(slope_percent)||slope_percent<0){showError('轨道坡度必须大于等于0');return;}
+if(aSlopeInput===''){showError('请输入坡道加速度');return;}
+const a_slope=parseFloat(aSlopeInput);if(isNaN(a_slope)||a_slope<0){showError('坡道加速度必须大于等于0');return;}
+if(peakAttachmentInput===''){showError('请输入地面峰值附着系数');return;}
+const peak_attachment=parseFloat(peakAttachmentInput);if(isNaN(peak_attachment)||peak_attachment<=0){showError('地面峰值附着系数必须大于0');return;}
+if(TMaxInput===''){showError('请输入最大扭矩');return;}
+const T_max=parseFloat(TMaxInput);if(isNaN(T_max)||T_max<=0){showError('最大扭矩必须大于0');return;}
+if(iTotalInput===''){showError('请输入总减速比');return;}
+const i_total=parseFloat(iTotalInput);if(isNaN(i_total)||i_total<=0){showError('总减速比必须大于0');return;}
+if(nEffectiveInput===''){showError('请输入有效电机数');return;}
+const n_effective=parseFloat(nEffectiveInput);if(isNaN(n_effective)||n_effective<=0){showError('有效电机数必须大于0');return;}
+const params={scenario:'obstacle_calc',m1:m1,m2:m2,D:D,f:f,slope_percent:slope_percent,a_slope:a_slope,peak_attachment:peak_attachment,T_max:T_max,i_total:i_total,n_effective:n_effective};if(obstacleHeightInput!==''){const obstacle_height=parseFloat(obstacleHeightInput);if(!isNaN(obstacle_height)&&obstacle_height>=0){params.obstacle_height=obstacle_height;}}
+try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.T7!==undefined){document.getElementById('oc_T7_value').textContent=formatNumber(result.extra.T7,4);}
+if(result.extra.T8!==undefined){document.getElementById('oc_T8_value').textContent=formatNumber(result.extra.T8,4);}
+if(result.extra.T9!==undefined){document.getElementById('oc_T9_value').textContent=formatNumber(result.extra.T9,4);}
+if(result.extra.T_road!==undefined){document.getElementById('oc_T_road_value').textContent=formatNumber(result.extra.T_road,4);}
+if(result.extra.K_road!==undefined){document.getElementById('oc_K_road_value').textContent=formatNumber(result.extra.K_road,2);}}
+document.getElementById('oc_result_value').textContent=formatNumber(result.result,2);renderFormula('oc_result_formula',result.formula);const warningDiv=document.getElementById('oc_warning');let warnings=[];if(result.result<1.2){warnings.push('越障最大扭矩安全系数小于1.2');}
+if(result.extra&&result.extra.K_road<1.2){warnings.push('路面提供扭矩安全系数小于1.2');}
+if(warnings.length>0){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>'+warnings.join('，')+'，建议重新选择电机或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('oc_result').style.display='block';document.getElementById('oc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateRotation(){const m1Input=document.getElementById('rc_m1').value.trim();const m2Input=document.getElementById('rc_m2').value.trim();const fInput=document.getElementById('rc_f').value.trim();const uInput=document.getElementById('rc_u').value.trim();const LInput=document.getElementById('rc_L').value.trim();const BInput=document.getElementById('rc_B').value.trim();const IActualInput=document.getElementById('rc_I_actual').value.trim();const INoLoadInput=document.getElementById('rc_I_no_load').value.trim();const IRatedInput=document.getElementById('rc_I_rated').value.trim();const TRatedInput=document.getElementById('rc_T_rated').value.trim();const iTotalInput=document.getElementById('rc_i_total').value.trim();const DDriveInput=document.getElementById('rc_D_drive').value.trim();if(m1Input===''){showError('请输入车体重量');return;}
+const m1=parseFloat(m1Input);if(isNaN(m1)||m1<=0){showError('车体重量必须大于0');return;}
+if(m2Input===''){showError('请输入负载重量');return;}
+const m2=parseFloat(m2Input);if(isNaN(m2)||m2<0){showError('负载重量必须大于等于0');return;}
+if(fInput===''){showError('请输入滚动摩擦系数');return;}
+const f=parseFloat(fInput);if(isNaN(f)||f<0){showError('滚动摩擦系数必须大于等于0');return;}
+if(uInput===''){showError('请输入滑动摩擦系数');return;}
+const u=parseFloat(uInput);if(isNaN(u)||u<0){showError('滑动摩擦系数必须大于等于0');return;}
+if(LInput===''){showError('请输入接地长度（前后）');return;}
+const L=parseFloat(LInput);if(isNaN(L)||L<=0){showError('接地长度（前后）必须大于0');return;}
+if(BInput===''){showError('请输入履带间距（左右）');return;}
+const B=parseFloat(BInput);if(isNaN(B)||B<=0){showError('履带间距（左右）必须大于0');return;}
+if(IActualInput===''){showError('请输入实际电流(平均)');return;}
+const I_actual=parseFloat(IActualInput);if(isNaN(I_actual)||I_actual<=0){showError('实际电流(平均)必须大于0');return;}
+if(INoLoadInput===''){showError('请输入空转电流');return;}
+const I_no_load=parseFloat(INoLoadInput);if(isNaN(I_no_load)||I_no_load<0){showError('空转电流必须大于等于0');return;}
+if(IRatedInput===''){showError('请输入额定电流');return;}
+const I_rated=parseFloat(IRatedInput);if(isNaN(I_rated)||I_rated<=0){showError('额定电流必须大于0');return;}
+if(TRatedInput===''){showError('请输入额定扭矩');return;}
+const T_rated=parseFloat(TRatedInput);if(isNaN(T_rated)||T_rated<=0){showError('额定扭矩必须大于0');return;}
+if(iTotalInput===''){showError('请输入总减速比');return;}
+const i_total=parseFloat(iTotalInput);if(isNaN(i_total)||i_total<=0){showError('总减速比必须大于0');return;}
+if(DDriveInput===''){showError('请输入履带驱动轮直径');return;}
+const D_drive=parseFloat(DDriveInput);if(isNaN(D_drive)||D_drive<=0){showError('履带驱动轮直径必须大于0');return;}
+const params={scenario:'rotation_calc',m1:m1,m2:m2,f:f,u:u,L:L,B:B,I_actual:I_actual,I_no_load:I_no_load,I_rated:I_rated,T_rated:T_rated,i_total:i_total,D_drive:D_drive};try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.F1!==undefined){document.getElementById('rc_F1_value').textContent=formatNumber(result.extra.F1,2);}
+if(result.extra.F2!==undefined){document.getElementById('rc_F2_value').textContent=formatNumber(result.extra.F2,2);}}
+document.getElementById('rc_result_value').textContent=formatNumber(result.result,2);renderFormula('rc_result_formula',result.formula);const warningDiv=document.getElementById('rc_warning');if(result.result<1.2){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>原地回转扭矩安全系数小于1.2，建议重新选择电机或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('rc_result').style.display='block';document.getElementById('rc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateReducerCheck(){const IActualInput=document.getElementById('rch_I_actual').value.trim();const INoLoadInput=document.getElementById('rch_I_no_load').value.trim();const IRatedInput=document.getElementById('rch_I_rated').value.trim();const TRatedInput=document.getElementById('rch_T_rated').value.trim();const iReducerInput=document.getElementById('rch_i_reducer').value.trim();const iCustomInput=document.getElementById('rch_i_custom').value.trim();const TGearLargeInput=document.getElementById('rch_T_gear_large').value.trim();const TGearSmallInput=document.getElementById('rch_T_gear_small').value.trim();const TReducerRatedInput=document.getElementById('rch_T_reducer_rated').value.trim();if(IActualInput===''){showError('请输入实际电流(平均)');return;}
+const I_actual=parseFloat(IActualInput);if(isNaN(I_actual)||I_actual<=0){showError('实际电流(平均)必须大于0');return;}
+if(INoLoadInput===''){showError('请输入空转电流');return;}
+const I_no_load=parseFloat(INoLoadInput);if(isNaN(I_no_load)||I_no_load<0){showError('空转电流必须大于等于0');return;}
+if(IRatedInput===''){showError('请输入额定电流');return;}
+const I_rated=parseFloat(IRatedInput);if(isNaN(I_rated)||I_rated<=0){showError('额定电流必须大于0');return;}
+if(TRatedInput===''){showError('请输入额定扭矩');return;}
+const T_rated=parseFloat(TRatedInput);if(isNaN(T_rated)||T_rated<=0){showError('额定扭矩必须大于0');return;}
+if(iReducerInput===''){showError('请输入减速器减速比');return;}
+const i_reducer=parseFloat(iReducerInput);if(isNaN(i_reducer)||i_reducer<=0){showError('减速器减速比必须大于0');return;}
+if(iCustomInput===''){showError('请输入自制减速比');return;}
+const i_custom=parseFloat(iCustomInput);if(isNaN(i_custom)||i_custom<=0){showError('自制减速比必须大于0');return;}
+if(TReducerRatedInput===''){showError('请输入减速器额定扭矩');return;}
+const T_reducer_rated=parseFloat(TReducerRatedInput);if(isNaN(T_reducer_rated)||T_reducer_rated<=0){showError('减速器额定扭矩必须大于0');return;}
+const T_gear_large=TGearLargeInput===''?null:parseFloat(TGearLargeInput);if(TGearLargeInput!==''&&(isNaN(T_gear_large)||T_gear_large<=0)){showError('大齿轮许用扭矩必须大于0');return;}
+const T_gear_small=TGearSmallInput===''?null:parseFloat(TGearSmallInput);if(TGearSmallInput!==''&&(isNaN(T_gear_small)||T_gear_small<=0)){showError('小齿轮许用扭矩必须大于0');return;}
+const params={scenario:'reducer_check',I_actual:I_actual,I_no_load:I_no_load,I_rated:I_rated,T_rated:T_rated,i_reducer:i_reducer,i_custom:i_custom,T_reducer_rated:T_reducer_rated};if(T_gear_large!==null){params.T_gear_large=T_gear_large;}
+if(T_gear_small!==null){params.T_gear_small=T_gear_small;}
+try{const result=await calculateTool('crawler-robot-force',params);if(result.extra){if(result.extra.T_gear_large_out!==undefined){document.getElementById('rch_T_gear_large_out_value').textContent=formatNumber(result.extra.T_gear_large_out,4);}
+if(result.extra.T_gear_small_out!==undefined){document.getElementById('rch_T_gear_small_out_value').textContent=formatNumber(result.extra.T_gear_small_out,4);}
+if(result.extra.T_reducer_out!==undefined){document.getElementById('rch_T_reducer_out_value').textContent=formatNumber(result.extra.T_reducer_out,4);}
+if(result.extra.K_gear_large!==undefined){document.getElementById('rch_K_gear_large_value').textContent=formatNumber(result.extra.K_gear_large,2);}
+if(result.extra.K_gear_small!==undefined){document.getElementById('rch_K_gear_small_value').textContent=formatNumber(result.extra.K_gear_small,2);}}
+document.getElementById('rch_result_value').textContent=formatNumber(result.result,2);renderFormula('rch_result_formula',result.formula);const warningDiv=document.getElementById('rch_warning');let warnings=[];if(result.result<1.2){warnings.push('减速器安全系数小于1.2');}
+if(result.extra&&result.extra.K_gear_large!==undefined&&result.extra.K_gear_large<1.2){warnings.push('大齿轮安全系数小于1.2');}
+if(result.extra&&result.extra.K_gear_small!==undefined&&result.extra.K_gear_small<1.2){warnings.push('小齿轮安全系数小于1.2');}
+if(warnings.length>0){warningDiv.style.display='block';warningDiv.style.background='#fff3cd';warningDiv.style.border='1px solid #ffc107';warningDiv.style.color='#856404';warningDiv.innerHTML='<strong>警告：</strong>'+warnings.join('，')+'，建议重新选择减速器或调整参数，以确保系统可靠运行。';}else{warningDiv.style.display='none';}
+document.getElementById('rch_result').style.display='block';document.getElementById('rch_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateSpeed(){const nRatedInput=document.getElementById('sc_n_rated').value.trim();const nMaxInput=document.getElementById('sc_n_max').value.trim();const iTotalInput=document.getElementById('sc_i_total').value.trim();const DInput=document.getElementById('sc_D').value.trim();if(nRatedInput===''){showError('请输入额定转速');return;}
+const n_rated=parseFloat(nRatedInput);if(isNaN(n_rated)||n_rated<=0){showError('额定转速必须大于0');return;}
+if(nMaxInput===''){showError('请输入最高转速');return;}
+const n_max=parseFloat(nMaxInput);if(isNaN(n_max)||n_max<=0){showError('最高转速必须大于0');return;}
+if(iTotalInput===''){showError('请输入总减速比');return;}
+const i_total=parseFloat(iTotalInput);if(isNaN(i_total)||i_total<=0){showError('总减速比必须大于0');return;}
+if(DInput===''){showError('请输入履带轮子直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('履带轮子直径必须大于0');return;}
+const params={scenario:'speed_calc',n_rated:n_rated,n_max:n_max,i_total:i_total,D:D};try{const result=await calculateTool('crawler-robot-force',params);if(result.extra&&result.extra.v_max_calc!==undefined){document.getElementById('sc_v_max_calc_value').textContent=formatNumber(result.extra.v_max_calc,4);}
+document.getElementById('sc_result_value').textContent=formatNumber(result.result,4);document.getElementById('sc_result_unit').textContent=result.unit;renderFormula('sc_result_formula',result.formula);document.getElementById('sc_result').style.display='block';document.getElementById('sc_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
@@ -0,0 +1,205 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;const tabGroupMapping={'pure_resistor':'current','inductive':'current','single_phase_motor':'current','three_phase_motor':'current','residential':'current','wire_resistance':'resistance','busbar_resistance':'resistance','wire_current_3phase':'wire_current','wire_current_1phase':'wire_current','voltage_loss':'other','voltage_loss_end_load':'other','voltage_loss_line_voltage':'other','voltage_loss_percent_formula':'other','energy_meter':'other','power_3phase':'other','power_1phase':'other','air_conditioner_home':'other','air_conditioner_large':'other','refrigeration_unit_convert':'other'};function switchMainTab(mainTabId){const mainTabs=document.querySelectorAll('.main-tab');mainTabs.forEach(tab=>{tab.classList.remove('active');});const targetMainTab=document.querySelector(`.main-tab[data-tab-id="${mainTabId}"]`);if(targetMainTab){targetMainTab.classList.add('active');}
+const subTabsGroups=document.querySelectorAll('.sub-tabs');subTabsGroups.forEach(group=>{group.classList.remove('active');});const targetSubTabs=document.getElementById(`sub-tabs-${mainTabId}`);if(targetSubTabs){targetSubTabs.classList.add('active');const firstSubTab=targetSubTabs.querySelector('.sub-tab');if(firstSubTab){const onclick=firstSubTab.getAttribute('onclick');if(onclick){const match=onclick.match(/switchSubTab\('([^']+)'\)/);if(match&&match[1]){switchSubTab(match[1]);}}}}}
+function switchSubTab(tabName){const tabContents=document.querySelectorAll('.tab-content');tabContents.forEach(content=>{content.classList.remove('active');});const subTabs=document.querySelectorAll('.sub-tab');subTabs.forEach(tab=>{tab.classList.remove('active');});const targetContent=document.getElementById(tabName);if(targetContent){targetContent.classList.add('active');}
+subTabs.forEach(tab=>{const onclick=tab.getAttribute('onclick');if(onclick&&onclick.includes(tabName)){tab.classList.add('active');}});const mainTabId=tabGroupMapping[tabName];if(mainTabId){const mainTabs=document.querySelectorAll('.main-tab');mainTabs.forEach(tab=>{tab.classList.remove('active');});const targetMainTab=document.querySelector(`.main-tab[data-tab-id="${mainTabId}"]`);if(targetMainTab){targetMainTab.classList.add('active');}
+const subTabsGroups=document.querySelectorAll('.sub-tabs');subTabsGroups.forEach(group=>{group.classList.remove('active');});const targetSubTabs=document.getElementById(`sub-tabs-${mainTabId}`);if(targetSubTabs){targetSubTabs.classList.add('active');}}}
+function switchTab(tabName){switchSubTab(tabName);}
+function calculatePureResistor(){const power=parseFloat(document.getElementById('pr_power').value);const voltage=parseFloat(document.getElementById('pr_voltage').value);if(!power||power<=0){showError('请输入有效的功率值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+const result=power/voltage;document.getElementById('pr_result_value').textContent=formatNumber(result);document.getElementById('pr_result_unit').textContent='A';document.getElementById('pr_result_formula').textContent='公式: I = P / U';document.getElementById('pr_result').style.display='block';}
+function calculateInductive(){const power=parseFloat(document.getElementById('ind_power').value);const voltage=parseFloat(document.getElementById('ind_voltage').value);const cosPhi=parseFloat(document.getElementById('ind_cos_phi').value);if(!power||power<=0){showError('请输入有效的功率值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数 (0-1之间)');return;}
+const result=power/(voltage*cosPhi);document.getElementById('ind_result_value').textContent=formatNumber(result);document.getElementById('ind_result_unit').textContent='A';document.getElementById('ind_result_formula').textContent='公式: I = P / (U × cosφ)';document.getElementById('ind_result').style.display='block';}
+function calculateSinglePhaseMotor(){const power=parseFloat(document.getElementById('spm_power').value);const voltage=parseFloat(document.getElementById('spm_voltage').value);let efficiency=parseFloat(document.getElementById('spm_efficiency').value);const cosPhi=parseFloat(document.getElementById('spm_cos_phi').value);if(!power||power<=0){showError('请输入有效的功率值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(isNaN(efficiency)||efficiency<=0||efficiency>1){if(isNaN(efficiency)||efficiency===0){efficiency=0.875;}else{showError('效率值必须在0-1之间');return;}}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数 (0-1之间)');return;}
+const result=power/(voltage*efficiency*cosPhi);document.getElementById('spm_result_value').textContent=formatNumber(result);document.getElementById('spm_result_unit').textContent='A';document.getElementById('spm_result_formula').textContent='公式: I = P / (U × η × cosφ)';document.getElementById('spm_result').style.display='block';}
+async function calculateThreePhaseMotor(){const power=parseFloat(document.getElementById('tpm_power').value);const voltage=parseFloat(document.getElementById('tpm_voltage').value);let efficiency=parseFloat(document.getElementById('tpm_efficiency').value);const cosPhi=parseFloat(document.getElementById('tpm_cos_phi').value);if(!power||power<=0){showError('请输入有效的功率值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(isNaN(efficiency)||efficiency<=0||efficiency>1){if(isNaN(efficiency)||efficiency===0){efficiency=0.875;}else{showError('效率值必须在0-1之间');return;}}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数 (0-1之间)');return;}
+try{const result=await calculateTool('current-calc',{scenario:'three_phase_motor',power:power,voltage:voltage,efficiency:efficiency,cos_phi:cosPhi});document.getElementById('tpm_result_value').textContent=formatNumber(result.result);document.getElementById('tpm_result_unit').textContent=result.unit;renderFormula('tpm_result_formula',result.formula);document.getElementById('tpm_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateResidential(){const totalPower=parseFloat(document.getElementById('res_total_power').value);const kc=parseFloat(document.getElementById('res_kc').value);const voltage=parseFloat(document.getElementById('res_voltage').value);const cosPhi=parseFloat(document.getElementById('res_cos_phi').value);if(!totalPower||totalPower<=0){showError('请输入有效的总功率值');return;}
+if(!kc||kc<=0||kc>1){showError('请输入有效的同期系数 (0-1之间)');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数 (0-1之间)');return;}
+try{const result=await calculateTool('current-calc',{scenario:'residential',total_power:totalPower,kc:kc,voltage:voltage,cos_phi:cosPhi});document.getElementById('res_result_value').textContent=formatNumber(result.result);document.getElementById('res_result_unit').textContent=result.unit;renderFormula('res_result_formula',result.formula);document.getElementById('res_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleWireResistanceType(){const calcType=document.getElementById('wr_calc_type').value;const basicDiv=document.getElementById('wr_basic');const tempDiv=document.getElementById('wr_temperature');if(calcType==='basic'){basicDiv.style.display='block';tempDiv.style.display='none';}else{basicDiv.style.display='none';tempDiv.style.display='block';}}
+async function calculateWireResistance(){const calcType=document.getElementById('wr_calc_type').value;let params={};if(calcType==='basic'){const rho=parseFloat(document.getElementById('wr_rho').value);const area=parseFloat(document.getElementById('wr_area').value);if(!rho||rho<=0){showError('请输入有效的电阻率');return;}
+if(!area||area<=0){showError('请输入有效的截面积');return;}
+params={scenario:'wire_resistance',rho:rho,area:area};}else{const r20=parseFloat(document.getElementById('wr_r20').value);const a20=parseFloat(document.getElementById('wr_a20').value);const temperature=parseFloat(document.getElementById('wr_temperature').value);if(!r20||r20<=0){showError('请输入有效的20℃时的电阻值');return;}
+if(!a20){showError('请输入有效的温度系数');return;}
+if(!temperature){showError('请输入有效的温度值');return;}
+params={scenario:'wire_resistance',r20:r20,a20:a20,temperature:temperature};}
+try{const result=await calculateTool('current-calc',params);document.getElementById('wr_result_value').textContent=formatNumber(result.result,6);document.getElementById('wr_result_unit').textContent=result.unit;renderFormula('wr_result_formula',result.formula);document.getElementById('wr_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateBusbarResistance(){const conductivity=parseFloat(document.getElementById('br_conductivity').value);const area=parseFloat(document.getElementById('br_area').value);if(!area||area<=0){showError('请输入有效的截面积');return;}
+try{const result=await calculateTool('current-calc',{scenario:'busbar_resistance',conductivity:conductivity,area:area});document.getElementById('br_result_value').textContent=formatNumber(result.result);document.getElementById('br_result_unit').textContent=result.unit;renderFormula('br_result_formula',result.formula);document.getElementById('br_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleWireCurrent3Type(){const calcType=document.getElementById('wc3_type').value;const powerDiv=document.getElementById('wc3_power');const apparentDiv=document.getElementById('wc3_apparent');const cosPhiGroup=document.getElementById('wc3_cos_phi_group');if(calcType==='power'){powerDiv.style.display='block';apparentDiv.style.display='none';cosPhiGroup.style.display='block';}else{powerDiv.style.display='none';apparentDiv.style.display='block';cosPhiGroup.style.display='none';}}
+async function calculateWireCurrent3Phase(){const calcType=document.getElementById('wc3_type').value;const voltageInput=document.getElementById('wc3_voltage').value.trim();const voltage=parseFloat(voltageInput);let params={scenario:'wire_current_3phase',voltage:voltage};if(calcType==='power'){const powerInput=document.getElementById('wc3_power_input').value.trim();const power=parseFloat(powerInput);const cosPhiInput=document.getElementById('wc3_cos_phi').value.trim();const cosPhi=parseFloat(cosPhiInput);if(isNaN(power)||power<=0||powerInput===''){showError('请输入有效的功率值');return;}
+if(isNaN(cosPhi)||cosPhi<=0||cosPhi>1||cosPhiInput===''){showError('请输入有效的功率因数');return;}
+params.power=power;params.cos_phi=cosPhi;}else{const apparentPowerInput=document.getElementById('wc3_apparent_power').value.trim();const apparentPower=parseFloat(apparentPowerInput);if(isNaN(apparentPower)||apparentPower<=0||apparentPowerInput===''){showError('请输入有效的视在功率值');return;}
+params.apparent_power=apparentPower;}
+if(isNaN(voltage)||voltage<=0||voltageInput===''){showError('请输入有效的电压值');return;}
+try{const result=await calculateTool('current-calc',params);document.getElementById('wc3_result_value').textContent=formatNumber(result.result);document.getElementById('wc3_result_unit').textContent=result.unit;renderFormula('wc3_result_formula',result.formula);document.getElementById('wc3_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleWireCurrent1Type(){const calcType=document.getElementById('wc1_type').value;const powerDiv=document.getElementById('wc1_power');const apparentDiv=document.getElementById('wc1_apparent');const cosPhiGroup=document.getElementById('wc1_cos_phi_group');if(calcType==='power'){powerDiv.style.display='block';apparentDiv.style.display='none';cosPhiGroup.style.display='block';}else{powerDiv.style.display='none';apparentDiv.style.display='block';cosPhiGroup.style.display='none';}}
+async function calculateWireCurrent1Phase(){const calcType=document.getElementById('wc1_type').value;const voltageInput=document.getElementById('wc1_voltage').value.trim();const voltage=parseFloat(voltageInput);let params={scenario:'wire_current_1phase',voltage:voltage};if(calcType==='power'){const powerInput=document.getElementById('wc1_power_input').value.trim();const power=parseFloat(powerInput);const cosPhiInput=document.getElementById('wc1_cos_phi').value.trim();const cosPhi=parseFloat(cosPhiInput);if(isNaN(power)||power<=0||powerInput===''){showError('请输入有效的功率值');return;}
+if(isNaN(cosPhi)||cosPhi<=0||cosPhi>1||cosPhiInput===''){showError('请输入有效的功率因数');return;}
+params.power=power;params.cos_phi=cosPhi;}else{const apparentPowerInput=document.getElementById('wc1_apparent_power').value.trim();const apparentPower=parseFloat(apparentPowerInput);if(isNaN(apparentPower)||apparentPower<=0||apparentPowerInput===''){showError('请输入有效的视在功率值');return;}
+params.apparent_power=apparentPower;}
+if(isNaN(voltage)||voltage<=0||voltageInput===''){showError('请输入有效的电压值');return;}
+try{const result=await calculateTool('current-calc',params);document.getElementById('wc1_result_value').textContent=formatNumber(result.result);document.getElementById('wc1_result_unit').textContent=result.unit;renderFormula('wc1_result_formula',result.formula);document.getElementById('wc1_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleVoltageLossType(){const calcType=document.getElementById('vl_type').value;const ueGroup=document.getElementById('vl_ue_group');if(calcType==='percent'){ueGroup.style.display='block';}else{ueGroup.style.display='none';}}
+async function calculateVoltageLoss(){const calcType=document.getElementById('vl_type').value;const u1=parseFloat(document.getElementById('vl_u1').value);const u2=parseFloat(document.getElementById('vl_u2').value);if(!u1){showError('请输入有效的送电端电压');return;}
+if(!u2){showError('请输入有效的受电端电压');return;}
+let params={scenario:calcType==='percent'?'voltage_loss_percent':'voltage_loss',u1:u1,u2:u2};if(calcType==='percent'){const ue=parseFloat(document.getElementById('vl_ue').value);if(!ue||ue<=0){showError('请输入有效的线路额定电压');return;}
+params.ue=ue;}
+try{const result=await calculateTool('current-calc',params);document.getElementById('vl_result_value').textContent=formatNumber(result.result);document.getElementById('vl_result_unit').textContent=result.unit;renderFormula('vl_result_formula',result.formula);document.getElementById('vl_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateEnergyMeter(){const kta=parseFloat(document.getElementById('em_kta').value);const ktae=parseFloat(document.getElementById('em_ktae').value)||1;const ktv=parseFloat(document.getElementById('em_ktv').value);const ktve=parseFloat(document.getElementById('em_ktve').value)||1;const kj=parseFloat(document.getElementById('em_kj').value)||1;if(!kta||kta<=0){showError('请输入有效的实际电流互感器变比');return;}
+if(!ktv||ktv<=0){showError('请输入有效的实际电压互感器变比');return;}
+if(!ktae||ktae<=0){showError('电能表铭牌电流互感器变比必须大于0');return;}
+if(!ktve||ktve<=0){showError('电能表铭牌电压互感器变比必须大于0');return;}
+if(!kj||kj<=0){showError('计能器倍率必须大于0');return;}
+try{const result=await calculateTool('current-calc',{scenario:'energy_meter_multiplier',kta:kta,ktae:ktae,ktv:ktv,ktve:ktve,kj:kj});document.getElementById('em_result_value').textContent=formatNumber(result.result);document.getElementById('em_result_unit').textContent=result.unit||'';renderFormula('em_result_formula',result.formula);document.getElementById('em_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculatePower3Phase(){const current=parseFloat(document.getElementById('p3_current').value);const voltage=parseFloat(document.getElementById('p3_voltage').value);const cosPhi=parseFloat(document.getElementById('p3_cos_phi').value);let efficiency=parseFloat(document.getElementById('p3_efficiency').value);if(!current||current<=0){showError('请输入有效的电流值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数');return;}
+if(isNaN(efficiency)||efficiency<=0||efficiency>1){if(isNaN(efficiency)||efficiency===0){efficiency=1.0;}else{showError('效率必须在0-1之间');return;}}
+try{const result=await calculateTool('current-calc',{scenario:'power_from_current_3phase',current:current,voltage:voltage,cos_phi:cosPhi,efficiency:efficiency});document.getElementById('p3_result_value').textContent=formatNumber(result.result);document.getElementById('p3_result_unit').textContent=result.unit;renderFormula('p3_result_formula',result.formula);document.getElementById('p3_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculatePower1Phase(){const current=parseFloat(document.getElementById('p1_current').value);const voltage=parseFloat(document.getElementById('p1_voltage').value);const cosPhi=parseFloat(document.getElementById('p1_cos_phi').value);const efficiency=parseFloat(document.getElementById('p1_efficiency').value)||1.0;if(!current||current<=0){showError('请输入有效的电流值');return;}
+if(!voltage||voltage<=0){showError('请输入有效的电压值');return;}
+if(!cosPhi||cosPhi<=0||cosPhi>1){showError('请输入有效的功率因数');return;}
+if(efficiency<0||efficiency>1){showError('效率必须在0-1之间');return;}
+try{const result=await calculateTool('current-calc',{scenario:'power_from_current_1phase',current:current,voltage:voltage,cos_phi:cosPhi,efficiency:efficiency});document.getElementById('p1_result_value').textContent=formatNumber(result.result);document.getElementById('p1_result_unit').textContent=result.unit;renderFormula('p1_result_formula',result.formula);document.getElementById('p1_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateAirConditionerHome(){const areaInput=document.getElementById('ach_area').value.trim();const area=parseFloat(areaInput);const unitCapacityInput=document.getElementById('ach_unit_capacity').value.trim();const unitCapacity=parseFloat(unitCapacityInput);if(isNaN(area)||area<=0||areaInput===''){showError('请输入有效的房间面积');return;}
+if(isNaN(unitCapacity)||unitCapacity<=0||unitCapacityInput===''){showError('请输入有效的单位面积制冷量');return;}
+try{const result=await calculateTool('current-calc',{scenario:'air_conditioner_home',area:area,unit_capacity:unitCapacity});document.getElementById('ach_result_value').textContent=formatNumber(result.result);document.getElementById('ach_result_unit').textContent=result.unit;renderFormula('ach_result_formula',result.formula);document.getElementById('ach_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleAirConditionerLargeX(){const xType=document.getElementById('acl_x_type').value;document.getElementById('acl_x').value=xType;}
+async function calculateAirConditionerLarge(){const kInput=document.getElementById('acl_k').value.trim();const k=parseFloat(kInput);const qInput=document.getElementById('acl_q').value.trim();const q=parseFloat(qInput);const volumeInput=document.getElementById('acl_volume').value.trim();const volume=parseFloat(volumeInput);const peopleCountInput=document.getElementById('acl_people_count').value.trim();const peopleCount=parseFloat(peopleCountInput)||0;const xInput=document.getElementById('acl_x').value.trim();const x=parseFloat(xInput)||432;const uInput=document.getElementById('acl_u').value.trim();const u=parseFloat(uInput)||0;const qzInput=document.getElementById('acl_qz').value.trim();const qz=parseFloat(qzInput)||0;if(isNaN(k)||k<=0||kInput===''){showError('请输入有效的容量裕量系数');return;}
+if(isNaN(q)||q<=0||qInput===''){showError('请输入有效的房间所需冷量');return;}
+if(isNaN(volume)||volume<=0||volumeInput===''){showError('请输入有效的房间总容积');return;}
+if(peopleCount<0||isNaN(peopleCount)){showError('房间总人数不能为负数');return;}
+if(isNaN(x)||x<=0){showError('请输入有效的人体排热量');return;}
+if(isNaN(u)||u<0||u>0.6){showError('设备同时使用率和利用率之积应在0~0.6之间');return;}
+if(isNaN(qz)||qz<0){showError('房间设备总发热量不能为负数');return;}
+try{const result=await calculateTool('current-calc',{scenario:'air_conditioner_large',k:k,q:q,volume:volume,people_count:peopleCount,x:x,u:u,qz:qz});document.getElementById('acl_result_value').textContent=formatNumber(result.result);document.getElementById('acl_result_unit').textContent=result.unit;renderFormula('acl_result_formula',result.formula);document.getElementById('acl_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function convertRefrigerationUnit(){const fromUnit=document.getElementById('ruc_from_unit').value;const toUnit=document.getElementById('ruc_to_unit').value;const valueInput=document.getElementById('ruc_value').value.trim();const value=parseFloat(valueInput);if(isNaN(value)||value<0||valueInput===''){showError('请输入有效的数值');return;}
+if(fromUnit===toUnit){showError('从单位和到单位不能相同');return;}
+let valueInW=0;if(fromUnit==='W'){valueInW=value;}else if(fromUnit==='Kcal/h'){valueInW=value*1.163;}else if(fromUnit==='BTU/h'){valueInW=value*0.293;}else if(fromUnit==='KJ/H'){valueInW=value*0.278;}
+let result=0;if(toUnit==='W'){result=valueInW;}else if(toUnit==='Kcal/h'){result=valueInW/1.163;}else if(toUnit==='BTU/h'){result=valueInW/0.293;}else if(toUnit==='KJ/H'){result=valueInW/0.278;}
+document.getElementById('ruc_result_value').textContent=formatNumber(result,4);document.getElementById('ruc_result_unit').textContent=toUnit;document.getElementById('ruc_result_formula').textContent=`${value} ${fromUnit} = ${formatNumber(result, 4)} ${toUnit}`;document.getElementById('ruc_result').style.display='block';}
+function toggleVoltageLossEndLoadType(){const calcType=document.getElementById('vlel_type').value;const powerDiv=document.getElementById('vlel_power');const currentDiv=document.getElementById('vlel_current');if(calcType==='power'){powerDiv.style.display='block';currentDiv.style.display='none';}else{powerDiv.style.display='none';currentDiv.style.display='block';}}
+async function calculateVoltageLossEndLoad(){const calcType=document.getElementById('vlel_type').value;let params={scenario:'voltage_loss_end_load'};if(calcType==='power'){const powerInput=document.getElementById('vlel_power_input').value.trim();const power=parseFloat(powerInput);const reactivePowerInput=document.getElementById('vlel_reactive_power').value.trim();const reactivePower=parseFloat(reactivePowerInput)||null;const cosPhiInput=document.getElementById('vlel_cos_phi').value.trim();const cosPhi=parseFloat(cosPhiInput)||null;const resistanceInput=document.getElementById('vlel_resistance').value.trim();const resistance=parseFloat(resistanceInput);const reactanceInput=document.getElementById('vlel_reactance').value.trim();const reactance=parseFloat(reactanceInput);const voltageInput=document.getElementById('vlel_voltage').value.trim();const voltage=parseFloat(voltageInput);if(isNaN(power)||power<=0||powerInput===''){showError('请输入有效的有功功率');return;}
+if(isNaN(resistance)||resistance<=0||resistanceInput===''){showError('请输入有效的线路电阻');return;}
+if(isNaN(reactance)||reactanceInput===''){showError('请输入有效的线路电抗');return;}
+if(isNaN(voltage)||voltage<=0||voltageInput===''){showError('请输入有效的线路电压');return;}
+if(!reactivePower&&(!cosPhi||cosPhi<=0||cosPhi>1)){showError('请提供无功功率或功率因数');return;}
+params.power=power;params.resistance=resistance;params.reactance=reactance;params.voltage=voltage;if(reactivePower){params.reactive_power=reactivePower;}else if(cosPhi){params.cos_phi=cosPhi;}}else{const currentInput=document.getElementById('vlel_current_input').value.trim();const current=parseFloat(currentInput);const resistanceInput=document.getElementById('vlel_resistance2').value.trim();const resistance=parseFloat(resistanceInput);const reactanceInput=document.getElementById('vlel_reactance2').value.trim();const reactance=parseFloat(reactanceInput);const cosPhiInput=document.getElementById('vlel_cos_phi2').value.trim();const cosPhi=parseFloat(cosPhiInput);if(isNaN(current)||current<=0||currentInput===''){showError('请输入有效的电流');return;}
+if(isNaN(resistance)||resistance<=0||resistanceInput===''){showError('请输入有效的线路电阻');return;}
+if(isNaN(reactance)||reactanceInput===''){showError('请输入有效的线路电抗');return;}
+if(isNaN(cosPhi)||cosPhi<=0||cosPhi>1||cosPhiInput===''){showError('请输入有效的功率因数');return;}
+params.current=current;params.resistance=resistance;params.reactance=reactance;params.cos_phi=cosPhi;}
+try{const result=await calculateTool('current-calc',params);document.getElementById('vlel_result_value').textContent=formatNumber(result.result);document.getElementById('vlel_result_unit').textContent=result.unit;renderFormula('vlel_result_formula',result.formula);document.getElementById('vlel_result').style.display='block';drawVoltagePhasorDiagram(params,result);}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function toggleVoltageLossLineVoltageType(){const calcType=document.getElementById('vllv_type').value;const powerDiv=document.getElementById('vllv_power');const currentDiv=document.getElementById('vllv_current');if(calcType==='power'){powerDiv.style.display='block';currentDiv.style.display='none';}else{powerDiv.style.display='none';currentDiv.style.display='block';}}
+async function calculateVoltageLossLineVoltage(){const calcType=document.getElementById('vllv_type').value;let params={scenario:'voltage_loss_line_voltage'};if(calcType==='power'){const powerInput=document.getElementById('vllv_power_input').value.trim();const power=parseFloat(powerInput);const reactivePowerInput=document.getElementById('vllv_reactive_power').value.trim();const reactivePower=parseFloat(reactivePowerInput)||null;const cosPhiInput=document.getElementById('vllv_cos_phi').value.trim();const cosPhi=parseFloat(cosPhiInput)||null;const resistanceInput=document.getElementById('vllv_resistance').value.trim();const resistance=parseFloat(resistanceInput);const reactanceInput=document.getElementById('vllv_reactance').value.trim();const reactance=parseFloat(reactanceInput);const voltageInput=document.getElementById('vllv_voltage').value.trim();const voltage=parseFloat(voltageInput);if(isNaN(power)||power<=0||powerInput===''){showError('请输入有效的有功功率');return;}
+if(isNaN(resistance)||resistance<=0||resistanceInput===''){showError('请输入有效的线路电阻');return;}
+if(isNaN(reactance)||reactanceInput===''){showError('请输入有效的线路电抗');return;}
+if(isNaN(voltage)||voltage<=0||voltageInput===''){showError('请输入有效的受电端电压');return;}
+if(!reactivePower&&(!cosPhi||cosPhi<=0||cosPhi>1)){showError('请提供无功功率或功率因数');return;}
+params.power=power;params.resistance=resistance;params.reactance=reactance;params.voltage=voltage;if(reactivePower){params.reactive_power=reactivePower;}else if(cosPhi){params.cos_phi=cosPhi;}}else{const currentInput=document.getElementById('vllv_current_input').value.trim();const current=parseFloat(currentInput);const resistanceInput=document.getElementById('vllv_resistance2').value.trim();const resistance=parseFloat(resistanceInput);const reactanceInput=document.getElementById('vllv_reactance2').value.trim();const reactance=parseFloat(reactanceInput);const cosPhiInput=document.getElementById('vllv_cos_phi2').value.trim();const cosPhi=parseFloat(cosPhiInput);if(isNaN(current)||current<=0||currentInput===''){showError('请输入有效的电流');return;}
+if(isNaN(resistance)||resistance<=0||resistanceInput===''){showError('请输入有效的线路电阻');return;}
+if(isNaN(reactance)||reactanceInput===''){showError('请输入有效的线路电抗');return;}
+if(isNaN(cosPhi)||cosPhi<=0||cosPhi>1||cosPhiInput===''){showError('请输入有效的功率因数');return;}
+params.current=current;params.resistance=resistance;params.reactance=reactance;params.cos_phi=cosPhi;}
+try{const result=await calculateTool('current-calc',params);document.getElementById('vllv_result_value').textContent=formatNumber(result.result);document.getElementById('vllv_result_unit').textContent=result.unit;renderFormula('vllv_result_formula',result.formula);document.getElementById('vllv_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateVoltageLossPercentFormula(){const powerInput=document.getElementById('vlpf_power').value.trim();const power=parseFloat(powerInput);const resistanceInput=document.getElementById('vlpf_resistance').value.trim();const resistance=parseFloat(resistanceInput);const reactanceInput=document.getElementById('vlpf_reactance').value.trim();const reactance=parseFloat(reactanceInput);const cosPhiInput=document.getElementById('vlpf_cos_phi').value.trim();const cosPhi=parseFloat(cosPhiInput);const ueInput=document.getElementById('vlpf_ue').value.trim();const ue=parseFloat(ueInput);if(isNaN(power)||power<=0||powerInput===''){showError('请输入有效的有功功率');return;}
+if(isNaN(resistance)||resistance<=0||resistanceInput===''){showError('请输入有效的线路电阻');return;}
+if(isNaN(reactance)||reactanceInput===''){showError('请输入有效的线路电抗');return;}
+if(isNaN(cosPhi)||cosPhi<=0||cosPhi>1||cosPhiInput===''){showError('请输入有效的功率因数');return;}
+if(isNaN(ue)||ue<=0||ueInput===''){showError('请输入有效的线路额定电压（单位：KV）');return;}
+try{const result=await calculateTool('current-calc',{scenario:'voltage_loss_percent_formula',power:power,resistance:resistance,reactance:reactance,cos_phi:cosPhi,ue_kv:ue});document.getElementById('vlpf_result_value').textContent=formatNumber(result.result);document.getElementById('vlpf_result_unit').textContent=result.unit;renderFormula('vlpf_result_formula',result.formula);document.getElementById('vlpf_result').style.display='block';}catch(error){showError(error.message||'计算失败，请检查输入');}}
+function drawVoltagePhasorDiagram(params,result){const svg=document.getElementById('vlel_phasor_svg');if(!svg)return;svg.innerHTML='';let U2,I,R,X,cosPhi,sinPhi,phi;if(params.current!==undefined){I=params.current;R=params.resistance;X=params.reactance;cosPhi=params.cos_phi;sinPhi=Math.sqrt(1-cosPhi*cosPhi);phi=Math.acos(cosPhi);U2=params.voltage||220;}else{const P=params.power*1000;const U=params.voltage;if(params.reactive_power){const Q=params.reactive_power*1000;const S=Math.sqrt(P*P+Q*Q);cosPhi=P/S;}else{cosPhi=params.cos_phi||0.85;}
+sinPhi=Math.sqrt(1-cosPhi*cosPhi);phi=Math.acos(cosPhi);R=params.resistance;X=params.reactance;U2=U;I=P/(U2*cosPhi);}
+if(!U2||!I||!R||isNaN(X)||!cosPhi){console.error('绘制矢量图参数错误:',{U2,I,R,X,cosPhi,params});return;}
+console.log('绘制矢量图参数:',{U2,I,R,X,cosPhi,sinPhi,phi:phi*180/Math.PI});const IR=I*R;const IX=I*X;const IRcosPhi=IR*cosPhi;const IRsinPhi=IR*sinPhi;const IXcosPhi=IX*cosPhi;const IXsinPhi=IX*sinPhi;const U1x=U2+IRcosPhi+IXsinPhi;const U1y=IXcosPhi-IRsinPhi;const U1=Math.sqrt(U1x*U1x+U1y*U1y);const originX=100;const originY=350;const maxLength=Math.max(U2,U1,IR,IX,I*10);const scale=400/maxLength;const U2Length=U2*scale;const IAngle=phi;const ILength=I*scale*0.5;const IRLength=IR*scale;const IXLength=IX*scale;const axisGroup=document.createElementNS('http://www.w3.org/2000/svg','g');axisGroup.setAttribute('class','axis-group');const xAxis=document.createElementNS('http://www.w3.org/2000/svg','line');xAxis.setAttribute('x1',originX-50);xAxis.setAttribute('y1',originY);xAxis.setAttribute('x2',originX+500);xAxis.setAttribute('y2',originY);xAxis.setAttribute('stroke','#ccc');xAxis.setAttribute('stroke-width','1');xAxis.setAttribute('stroke-dasharray','3,3');axisGroup.appendChild(xAxis);const yAxis=document.createElementNS('http://www.w3.org/2000/svg','line');yAxis.setAttribute('x1',originX);yAxis.setAttribute('y1',originY-200);yAxis.setAttribute('x2',originX);yAxis.setAttribute('y2',originY+50);yAxis.setAttribute('stroke','#ccc');yAxis.setAttribute('stroke-width','1');yAxis.setAttribute('stroke-dasharray','3,3');axisGroup.appendChild(yAxis);svg.appendChild(axisGroup);const U2Group=drawPhasor(svg,originX,originY,U2Length,0,'#3498db','U₂','end');const IEndX=originX+ILength*Math.cos(IAngle);const IEndY=originY+ILength*Math.sin(IAngle);const IGroup=drawPhasor(svg,originX,originY,ILength,IAngle,'#e74c3c','I','end');const U2EndX=originX+U2Length;const U2EndY=originY;const IREndX=U2EndX+IRLength*Math.cos(IAngle);const IREndY=U2EndY+IRLength*Math.sin(IAngle);const IRGroup=drawPhasor(svg,U2EndX,U2EndY,IRLength,IAngle,'#27ae60','IR','middle');const IXAngle=IAngle-Math.PI/2;const IXEndX=IREndX+IXLength*Math.cos(IXAngle);const IXEndY=IREndY+IXLength*Math.sin(IXAngle);const IXGroup=drawPhasor(svg,IREndX,IREndY,IXLength,IXAngle,'#3498db','IX','middle');const U1Angle=Math.atan2(IXEndY-originY,IXEndX-originX);const U1Length=U1*scale;const U1Group=drawPhasor(svg,originX,originY,U1Length,U1Angle,'#9b59b6','U₁','end');const IRcosPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IRcosPhiLine.setAttribute('x1',U2EndX);IRcosPhiLine.setAttribute('y1',U2EndY);IRcosPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale);IRcosPhiLine.setAttribute('y2',U2EndY);IRcosPhiLine.setAttribute('stroke','#27ae60');IRcosPhiLine.setAttribute('stroke-width','1.5');IRcosPhiLine.setAttribute('stroke-dasharray','5,5');IRcosPhiLine.setAttribute('opacity','0.6');svg.appendChild(IRcosPhiLine);const IRsinPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IRsinPhiLine.setAttribute('x1',U2EndX+IRcosPhi*scale);IRsinPhiLine.setAttribute('y1',U2EndY);IRsinPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale);IRsinPhiLine.setAttribute('y2',U2EndY+IRsinPhi*scale);IRsinPhiLine.setAttribute('stroke','#27ae60');IRsinPhiLine.setAttribute('stroke-width','1.5');IRsinPhiLine.setAttribute('stroke-dasharray','5,5');IRsinPhiLine.setAttribute('opacity','0.6');svg.appendChild(IRsinPhiLine);const IXsinPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IXsinPhiLine.setAttribute('x1',U2EndX+IRcosPhi*scale);IXsinPhiLine.setAttribute('y1',U2EndY);IXsinPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale+IXsinPhi*scale);IXsinPhiLine.setAttribute('y2',U2EndY);IXsinPhiLine.setAttribute('stroke','#f39c12');IXsinPhiLine.setAttribute('stroke-width','1.5');IXsinPhiLine.setAttribute('stroke-dasharray','5,5');IXsinPhiLine.setAttribute('opacity','0.6');svg.appendChild(IXsinPhiLine);const IXcosPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IXcosPhiLine.setAttribute('x1',U2EndX+IRcosPhi*scale+IXsinPhi*scale);IXcosPhiLine.setAttribute('y1',U2EndY);IXcosPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale+IXsinPhi*scale);IXcosPhiLine.setAttribute('y2',U2EndY-IXcosPhi*scale);IXcosPhiLine.setAttribute('stroke','#f39c12');IXcosPhiLine.setAttribute('stroke-width','1.5');IXcosPhiLine.setAttribute('stroke-dasharray','5,5');IXcosPhiLine.setAttribute('opacity','0.6');svg.appendChild(IXcosPhiLine);addLabel(svg,U2EndX+IRcosPhi*scale/2,U2EndY-10,'IRcosφ','#27ae60',12);addLabel(svg,U2EndX+IRcosPhi*scale+5,U2EndY+IRsinPhi*scale/2,'IRsinφ','#27ae60',12);addLabel(svg,U2EndX+IRcosPhi*scale+IXsinPhi*scale/2,U2EndY-10,'IXsinφ','#f39c12',12);addLabel(svg,U2EndX+IRcosPhi*scale+IXsinPhi*scale+5,U2EndY-IXcosPhi*scale/2,'IXcosφ','#f39c12',12);const phiArcRadius=40;const phiArc=document.createElementNS('http://www.w3.org/2000/svg','path');const phiArcStartX=originX+phiArcRadius;const phiArcStartY=originY;const phiArcEndX=originX+phiArcRadius*Math.cos(IAngle);const phiArcEndY=originY+phiArcRadius*Math.sin(IAngle);phiArc.setAttribute('d',`M ${phiArcStartX} ${phiArcStartY} A ${phiArcRadius} ${phiArcRadius} 0 0 1 ${phiArcEndX} ${phiArcEndY}`);phiArc.setAttribute('stroke','#7f8c8d');phiArc.setAttribute('stroke-width','1.5');phiArc.setAttribute('fill','none');svg.appendChild(phiArc);addLabel(svg,originX+phiArcRadius*1.3*Math.cos(IAngle/2),originY+phiArcRadius*1.3*Math.sin(IAngle/2),'φ','#7f8c8d',14);addLabel(svg,originX-20,originY+5,'O','#2c3e50',14);const legendX=600;const legendY=50;const legendGroup=document.createElementNS('http://www.w3.org/2000/svg','g');legendGroup.setAttribute('class','legend');const legendItems=[{color:'#3498db',label:'U₂ - 受电端电压'},{color:'#9b59b6',label:'U₁ - 送电端电压'},{color:'#e74c3c',label:'I - 电流'},{color:'#27ae60',label:'IR - 电阻压降'},{color:'#f39c12',label:'IX - 电抗压降'}];legendItems.forEach((item,index)=>{const legendLine=document.createElementNS('http://www.w3.org/2000/svg','line');legendLine.setAttribute('x1',legendX);legendLine.setAttribute('y1',legendY+index*25);legendLine.setAttribute('x2',legendX+30);legendLine.setAttribute('y2',legendY+index*25);legendLine.setAttribute('stroke',item.color);legendLine.setAttribute('stroke-width','3');legendGroup.appendChild(legendLine);const legendText=document.createElementNS('http://www.w3.org/2000/svg','text');legendText.setAttribute('x',legendX+35);legendText.setAttribute('y',legendY+index*25+5);legendText.setAttribute('fill','#2c3e50');legendText.setAttribute('font-size','12');legendText.textContent=item.label;legendGroup.appendChild(legendText);});svg.appendChild(legendGroup);function drawPhasor(svg,x1,y1,length,angle,color,label,labelPos){const group=document.createElementNS('http://www.w3.org/2000/svg','g');const x2=x1+length*Math.cos(angle);const y2=y1+length*Math.sin(angle);const line=document.createElementNS('http://www.w3.org/2000/svg','line');line.setAttribute('x1',x1);line.setAttribute('y1',y1);line.setAttribute('x2',x2);line.setAttribute('y2',y2);line.setAttribute('stroke',color);line.setAttribute('stroke-width','3');line.setAttribute('class','phasor-line');group.appendChild(line);const arrowLength=10;const arrowAngle=Math.PI/6;const arrow1X=x2-arrowLength*Math.cos(angle-arrowAngle);const arrow1Y=y2-arrowLength*Math.sin(angle-arrowAngle);const arrow2X=x2-arrowLength*Math.cos(angle+arrowAngle);const arrow2Y=y2-arrowLength*Math.sin(angle+arrowAngle);const arrow=document.createElementNS('http://www.w3.org/2000/svg','path');arrow.setAttribute('d',`M ${x2} ${y2} L ${arrow1X} ${arrow1Y} L ${arrow2X} ${arrow2Y} Z`);arrow.setAttribute('fill',color);arrow.setAttribute('class','phasor-arrow');group.appendChild(arrow);let labelX,labelY;if(labelPos==='end'){labelX=x2+10*Math.cos(angle);labelY=y2+10*Math.sin(angle);}else if(labelPos==='middle'){labelX=(x1+x2)/2+10*Math.cos(angle+Math.PI/2);labelY=(y1+y2)/2+10*Math.sin(angle+Math.PI/2);}else{labelX=x1+10*Math.cos(angle);labelY=y1+10*Math.sin(angle);}
+addLabel(svg,labelX,labelY,label,color,14);svg.appendChild(group);return group;}
+function addLabel(svg,x,y,text,color,fontSize){const label=document.createElementNS('http://www.w3.org/2000/svg','text');label.setAttribute('x',x);label.setAttribute('y',y);label.setAttribute('fill',color||'#2c3e50');label.setAttribute('font-size',fontSize||'14');label.setAttribute('font-weight','500');label.setAttribute('class','phasor-label');if(text.includes('₂')||text.includes('₁')){const tspan1=document.createElementNS('http://www.w3.org/2000/svg','tspan');tspan1.textContent=text.substring(0,text.length-1);label.appendChild(tspan1);const tspan2=document.createElementNS('http://www.w3.org/2000/svg','tspan');tspan2.setAttribute('baseline-shift','sub');tspan2.setAttribute('font-size',(fontSize*0.7)+'px');tspan2.textContent=text.substring(text.length-1);label.appendChild(tspan2);}else{label.textContent=text;}
+svg.appendChild(label);return label;}}
+function drawFixedPhasorDiagram(){const svg=document.getElementById('fixed_phasor_diagram');if(!svg)return;svg.innerHTML='';const U2=220;const I=100;const R=0.1;const X=0.05;const cosPhi=0.85;const sinPhi=Math.sqrt(1-cosPhi*cosPhi);const phi=Math.acos(cosPhi);const IR=I*R;const IX=I*X;const IRcosPhi=IR*cosPhi;const IRsinPhi=IR*sinPhi;const IXcosPhi=IX*cosPhi;const IXsinPhi=IX*sinPhi;const U1x=U2+IRcosPhi+IXsinPhi;const U1y=IXcosPhi-IRsinPhi;const U1=Math.sqrt(U1x*U1x+U1y*U1y);const originX=100;const originY=300;const maxLength=Math.max(U2,U1,IR,IX,I*0.5);const scale=350/maxLength;const IAngle=0;const U2Angle=-phi;const IRAngle=0;const IXAngle=-Math.PI/2;const U2Length=U2*scale;const ILength=I*scale*0.3;const IRLength=IR*scale;const IXLength=IX*scale;const U1Length=U1*scale;const defs=document.createElementNS('http://www.w3.org/2000/svg','defs');const gridPattern=document.createElementNS('http://www.w3.org/2000/svg','pattern');gridPattern.setAttribute('id','fixed-grid');gridPattern.setAttribute('width','20');gridPattern.setAttribute('height','20');gridPattern.setAttribute('patternUnits','userSpaceOnUse');const gridPath=document.createElementNS('http://www.w3.org/2000/svg','path');gridPath.setAttribute('d','M 20 0 L 0 0 0 20');gridPath.setAttribute('fill','none');gridPath.setAttribute('stroke','#e0e0e0');gridPath.setAttribute('stroke-width','0.5');gridPattern.appendChild(gridPath);defs.appendChild(gridPattern);const markers=[{id:'fixed-arrow-blue',color:'#3498db'},{id:'fixed-arrow-green',color:'#27ae60'},{id:'fixed-arrow-purple',color:'#9b59b6'},{id:'fixed-arrow-red',color:'#e74c3c',size:8}];markers.forEach(m=>{const marker=document.createElementNS('http://www.w3.org/2000/svg','marker');marker.setAttribute('id',m.id);marker.setAttribute('markerWidth',m.size||10);marker.setAttribute('markerHeight',m.size||10);marker.setAttribute('refX',(m.size||10)-1);marker.setAttribute('refY',(m.size||10)/2);marker.setAttribute('orient','auto');const polygon=document.createElementNS('http://www.w3.org/2000/svg','polygon');const size=m.size||10;polygon.setAttribute('points',`0 0, ${size} ${size/2}, 0 ${size}`);polygon.setAttribute('fill',m.color);marker.appendChild(polygon);defs.appendChild(marker);});svg.appendChild(defs);const gridRect=document.createElementNS('http://www.w3.org/2000/svg','rect');gridRect.setAttribute('width','100%');gridRect.setAttribute('height','100%');gridRect.setAttribute('fill','url(#fixed-grid)');svg.appendChild(gridRect);const originCircle=document.createElementNS('http://www.w3.org/2000/svg','circle');originCircle.setAttribute('cx',originX);originCircle.setAttribute('cy',originY);originCircle.setAttribute('r','4');originCircle.setAttribute('fill','#2c3e50');svg.appendChild(originCircle);const originText=document.createElementNS('http://www.w3.org/2000/svg','text');originText.setAttribute('x',originX-15);originText.setAttribute('y',originY+15);originText.setAttribute('fill','#2c3e50');originText.setAttribute('font-size','14');originText.setAttribute('font-weight','bold');originText.textContent='O';svg.appendChild(originText);const IEndX=originX+ILength;const IEndY=originY;const ILine=document.createElementNS('http://www.w3.org/2000/svg','line');ILine.setAttribute('x1',originX);ILine.setAttribute('y1',originY);ILine.setAttribute('x2',IEndX);ILine.setAttribute('y2',IEndY);ILine.setAttribute('stroke','#3498db');ILine.setAttribute('stroke-width','3');ILine.setAttribute('marker-end','url(#fixed-arrow-blue)');svg.appendChild(ILine);const ILabel=document.createElementNS('http://www.w3.org/2000/svg','text');ILabel.setAttribute('x',IEndX+10);ILabel.setAttribute('y',IEndY+5);ILabel.setAttribute('fill','#3498db');ILabel.setAttribute('font-size','16');ILabel.setAttribute('font-weight','bold');ILabel.textContent='I';svg.appendChild(ILabel);const U2EndX=originX+U2Length*Math.cos(U2Angle);const U2EndY=originY+U2Length*Math.sin(U2Angle);const U2Line=document.createElementNS('http://www.w3.org/2000/svg','line');U2Line.setAttribute('x1',originX);U2Line.setAttribute('y1',originY);U2Line.setAttribute('x2',U2EndX);U2Line.setAttribute('y2',U2EndY);U2Line.setAttribute('stroke','#9b59b6');U2Line.setAttribute('stroke-width','3');U2Line.setAttribute('marker-end','url(#fixed-arrow-purple)');svg.appendChild(U2Line);const U2Label=document.createElementNS('http://www.w3.org/2000/svg','text');U2Label.setAttribute('x',U2EndX+10);U2Label.setAttribute('y',U2EndY-5);U2Label.setAttribute('fill','#9b59b6');U2Label.setAttribute('font-size','16');U2Label.setAttribute('font-weight','bold');U2Label.textContent='U₂';svg.appendChild(U2Label);const phiArcRadius=30;const phiArc=document.createElementNS('http://www.w3.org/2000/svg','path');const phiArcStartX=originX+phiArcRadius;const phiArcStartY=originY;const phiArcEndX=originX+phiArcRadius*Math.cos(U2Angle);const phiArcEndY=originY+phiArcRadius*Math.sin(U2Angle);phiArc.setAttribute('d',`M ${phiArcStartX} ${phiArcStartY} A ${phiArcRadius} ${phiArcRadius} 0 0 0 ${phiArcEndX} ${phiArcEndY}`);phiArc.setAttribute('stroke','#7f8c8d');phiArc.setAttribute('stroke-width','1.5');phiArc.setAttribute('fill','none');svg.appendChild(phiArc);const phiLabel=document.createElementNS('http://www.w3.org/2000/svg','text');phiLabel.setAttribute('x',originX+phiArcRadius*1.3*Math.cos(U2Angle/2));phiLabel.setAttribute('y',originY+phiArcRadius*1.3*Math.sin(U2Angle/2));phiLabel.setAttribute('fill','#7f8c8d');phiLabel.setAttribute('font-size','14');phiLabel.textContent='φ';svg.appendChild(phiLabel);const IREndX=U2EndX+IRLength;const IREndY=U2EndY;const IRLine=document.createElementNS('http://www.w3.org/2000/svg','line');IRLine.setAttribute('x1',U2EndX);IRLine.setAttribute('y1',U2EndY);IRLine.setAttribute('x2',IREndX);IRLine.setAttribute('y2',IREndY);IRLine.setAttribute('stroke','#27ae60');IRLine.setAttribute('stroke-width','3');IRLine.setAttribute('marker-end','url(#fixed-arrow-green)');svg.appendChild(IRLine);const IRLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IRLabel.setAttribute('x',IREndX+10);IRLabel.setAttribute('y',IREndY+15);IRLabel.setAttribute('fill','#27ae60');IRLabel.setAttribute('font-size','16');IRLabel.setAttribute('font-weight','bold');IRLabel.textContent='IR';svg.appendChild(IRLabel);const IXEndX=IREndX;const IXEndY=IREndY+IXLength*Math.sin(IXAngle);const IXLine=document.createElementNS('http://www.w3.org/2000/svg','line');IXLine.setAttribute('x1',IREndX);IXLine.setAttribute('y1',IREndY);IXLine.setAttribute('x2',IXEndX);IXLine.setAttribute('y2',IXEndY);IXLine.setAttribute('stroke','#3498db');IXLine.setAttribute('stroke-width','3');IXLine.setAttribute('marker-end','url(#fixed-arrow-blue)');svg.appendChild(IXLine);const IXLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IXLabel.setAttribute('x',IXEndX+10);IXLabel.setAttribute('y',IXEndY-5);IXLabel.setAttribute('fill','#3498db');IXLabel.setAttribute('font-size','16');IXLabel.setAttribute('font-weight','bold');IXLabel.textContent='IX';svg.appendChild(IXLabel);const U1Angle=Math.atan2(IXEndY-originY,IXEndX-originX);const U1Line=document.createElementNS('http://www.w3.org/2000/svg','line');U1Line.setAttribute('x1',originX);U1Line.setAttribute('y1',originY);U1Line.setAttribute('x2',IXEndX);U1Line.setAttribute('y2',IXEndY);U1Line.setAttribute('stroke','#9b59b6');U1Line.setAttribute('stroke-width','3');U1Line.setAttribute('marker-end','url(#fixed-arrow-purple)');svg.appendChild(U1Line);const U1Label=document.createElementNS('http://www.w3.org/2000/svg','text');U1Label.setAttribute('x',IXEndX+10);U1Label.setAttribute('y',IXEndY-15);U1Label.setAttribute('fill','#9b59b6');U1Label.setAttribute('font-size','16');U1Label.setAttribute('font-weight','bold');U1Label.textContent='U₁';svg.appendChild(U1Label);const projectionLines=[{x1:U2EndX,y1:U2EndY,x2:U2EndX,y2:450},{x1:IREndX,y1:IREndY,x2:IREndX,y2:450},{x1:IXEndX,y1:IXEndY,x2:IXEndX,y2:450},{x1:U2EndX,y1:U2EndY,x2:750,y2:U2EndY},{x1:IREndX,y1:IREndY,x2:750,y2:IREndY},{x1:IXEndX,y1:IXEndY,x2:750,y2:IXEndY}];projectionLines.forEach(line=>{const projLine=document.createElementNS('http://www.w3.org/2000/svg','line');projLine.setAttribute('x1',line.x1);projLine.setAttribute('y1',line.y1);projLine.setAttribute('x2',line.x2);projLine.setAttribute('y2',line.y2);projLine.setAttribute('stroke','#666');projLine.setAttribute('stroke-width','1');projLine.setAttribute('stroke-dasharray','5,5');projLine.setAttribute('opacity','0.6');svg.appendChild(projLine);});const componentY1=U2EndY+60;const componentY2=U2EndY+80;const IRcosPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IRcosPhiLine.setAttribute('x1',U2EndX);IRcosPhiLine.setAttribute('y1',componentY1);IRcosPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale);IRcosPhiLine.setAttribute('y2',componentY1);IRcosPhiLine.setAttribute('stroke','#e74c3c');IRcosPhiLine.setAttribute('stroke-width','2');IRcosPhiLine.setAttribute('marker-end','url(#fixed-arrow-red)');svg.appendChild(IRcosPhiLine);const IRcosPhiLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IRcosPhiLabel.setAttribute('x',U2EndX+IRcosPhi*scale/2);IRcosPhiLabel.setAttribute('y',componentY1-5);IRcosPhiLabel.setAttribute('fill','#e74c3c');IRcosPhiLabel.setAttribute('font-size','12');IRcosPhiLabel.setAttribute('font-weight','bold');IRcosPhiLabel.setAttribute('text-anchor','middle');IRcosPhiLabel.textContent='IRcosφ';svg.appendChild(IRcosPhiLabel);const IXsinPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IXsinPhiLine.setAttribute('x1',U2EndX+IRcosPhi*scale);IXsinPhiLine.setAttribute('y1',componentY2);IXsinPhiLine.setAttribute('x2',U2EndX+IRcosPhi*scale+IXsinPhi*scale);IXsinPhiLine.setAttribute('y2',componentY2);IXsinPhiLine.setAttribute('stroke','#e74c3c');IXsinPhiLine.setAttribute('stroke-width','2');IXsinPhiLine.setAttribute('marker-end','url(#fixed-arrow-red)');svg.appendChild(IXsinPhiLine);const IXsinPhiLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IXsinPhiLabel.setAttribute('x',U2EndX+IRcosPhi*scale+IXsinPhi*scale/2);IXsinPhiLabel.setAttribute('y',componentY2-5);IXsinPhiLabel.setAttribute('fill','#e74c3c');IXsinPhiLabel.setAttribute('font-size','12');IXsinPhiLabel.setAttribute('font-weight','bold');IXsinPhiLabel.setAttribute('text-anchor','middle');IXsinPhiLabel.textContent='IXsinφ';svg.appendChild(IXsinPhiLabel);const IRsinPhiX=U2EndX+IRcosPhi*scale+20;const IRsinPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IRsinPhiLine.setAttribute('x1',IRsinPhiX);IRsinPhiLine.setAttribute('y1',U2EndY);IRsinPhiLine.setAttribute('x2',IRsinPhiX);IRsinPhiLine.setAttribute('y2',U2EndY+IRsinPhi*scale);IRsinPhiLine.setAttribute('stroke','#e74c3c');IRsinPhiLine.setAttribute('stroke-width','2');IRsinPhiLine.setAttribute('marker-end','url(#fixed-arrow-red)');svg.appendChild(IRsinPhiLine);const IRsinPhiLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IRsinPhiLabel.setAttribute('x',IRsinPhiX+10);IRsinPhiLabel.setAttribute('y',U2EndY+IRsinPhi*scale/2);IRsinPhiLabel.setAttribute('fill','#e74c3c');IRsinPhiLabel.setAttribute('font-size','12');IRsinPhiLabel.setAttribute('font-weight','bold');IRsinPhiLabel.textContent='IRsinφ';svg.appendChild(IRsinPhiLabel);const IXcosPhiX=U2EndX+IRcosPhi*scale+IXsinPhi*scale+20;const IXcosPhiLine=document.createElementNS('http://www.w3.org/2000/svg','line');IXcosPhiLine.setAttribute('x1',IXcosPhiX);IXcosPhiLine.setAttribute('y1',U2EndY);IXcosPhiLine.setAttribute('x2',IXcosPhiX);IXcosPhiLine.setAttribute('y2',U2EndY-IXcosPhi*scale);IXcosPhiLine.setAttribute('stroke','#e74c3c');IXcosPhiLine.setAttribute('stroke-width','2');IXcosPhiLine.setAttribute('marker-end','url(#fixed-arrow-red)');svg.appendChild(IXcosPhiLine);const IXcosPhiLabel=document.createElementNS('http://www.w3.org/2000/svg','text');IXcosPhiLabel.setAttribute('x',IXcosPhiX+10);IXcosPhiLabel.setAttribute('y',U2EndY-IXcosPhi*scale/2);IXcosPhiLabel.setAttribute('fill','#e74c3c');IXcosPhiLabel.setAttribute('font-size','12');IXcosPhiLabel.setAttribute('font-weight','bold');IXcosPhiLabel.textContent='IXcosφ';svg.appendChild(IXcosPhiLabel);const arcPath=document.createElementNS('http://www.w3.org/2000/svg','path');const midX=(U2EndX+IXEndX)/2;const midY=(U2EndY+IXEndY)/2;arcPath.setAttribute('d',`M ${U2EndX} ${U2EndY} Q ${midX} ${midY} ${IXEndX} ${IXEndY}`);arcPath.setAttribute('fill','none');arcPath.setAttribute('stroke','#999');arcPath.setAttribute('stroke-width','1.5');arcPath.setAttribute('stroke-dasharray','8,4');arcPath.setAttribute('opacity','0.7');svg.appendChild(arcPath);}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',drawFixedPhasorDiagram);}else{drawFixedPhasorDiagram();}
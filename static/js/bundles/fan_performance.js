@@ -0,0 +1,108 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;let pressureChart=null;let efficiencyChart=null;let performancePoints=[];document.addEventListener('DOMContentLoaded',function(){const defaultPoints=[{psi_p:0.43,phi:0.2231,eta:0.88},{psi_p:0.409,phi:0.238,eta:0.89},{psi_p:0.386,phi:0.2545,eta:0.87},{psi_p:0.3598,phi:0.271,eta:0.83}];defaultPoints.forEach(point=>{addPerformancePoint(point.psi_p,point.phi,point.eta);});});function addPerformancePoint(psi_p='',phi='',eta=''){const container=document.getElementById('performance-points-container');const pointIndex=performancePoints.length;const pointDiv=document.createElement('div');pointDiv.className='performance-point';pointDiv.id=`point-${pointIndex}`;pointDiv.innerHTML=`
+        <div class="form-group">
+            <label>压力系数 ψ<sub>p</sub> <span class="required">*</span></label>
+            <input type="number" class="psi-p-input" step="0.0001" value="${psi_p}" placeholder="例如: 0.43">
+        </div>
+        <div class="form-group">
+            <label>流量系数 φ <span class="required">*</span></label>
+            <input type="number" class="phi-input" step="0.0001" value="${phi}" placeholder="例如: 0.2231">
+        </div>
+        <div class="form-group">
+            <label>效率 η <span class="required">*</span></label>
+            <input type="number" class="eta-input" step="0.01" min="0" max="1" value="${eta}" placeholder="例如: 0.88">
+        </div>
+        <button type="button" class="remove-point-btn" onclick="removePerformancePoint(${pointIndex})">删除</button>
+    `;container.appendChild(pointDiv);performancePoints.push({psi_p,phi,eta});}
+function removePerformancePoint(index){const pointDiv=document.getElementById(`point-${index}`);if(pointDiv){pointDiv.remove();performancePoints.splice(index,1);updatePerformancePointsIndex();}}
+function updatePerformancePointsIndex(){const container=document.getElementById('performance-points-container');const points=container.querySelectorAll('.performance-point');performancePoints=[];points.forEach((pointDiv,index)=>{pointDiv.id=`point-${index}`;const removeBtn=pointDiv.querySelector('.remove-point-btn');if(removeBtn){removeBtn.setAttribute('onclick',`removePerformancePoint(${index})`);}
+const psi_p_input=pointDiv.querySelector('.psi-p-input');const phi_input=pointDiv.querySelector('.phi-input');const eta_input=pointDiv.querySelector('.eta-input');if(psi_p_input&&phi_input&&eta_input){const psi_p=psi_p_input.value?parseFloat(psi_p_input.value):'';const phi=phi_input.value?parseFloat(phi_input.value):'';const eta=eta_input.value?parseFloat(eta_input.value):'';performancePoints.push({psi_p,phi,eta});}});}
+function clearPerformancePoints(){if(confirm('确定要清空所有性能点吗？')){const container=document.getElementById('performance-points-container');container.innerHTML='';performancePoints=[];}}
+function getPerformancePoints(){const container=document.getElementById('performance-points-container');const points=container.querySelectorAll('.performance-point');const result=[];points.forEach(pointDiv=>{const psi_p=parseFloat(pointDiv.querySelector('.psi-p-input').value);const phi=parseFloat(pointDiv.querySelector('.phi-input').value);const eta=parseFloat(pointDiv.querySelector('.eta-input').value);if(!isNaN(psi_p)&&!isNaN(phi)&&!isNaN(eta)&&eta>0&&eta<=1){result.push({psi_p,phi,eta});}});return result;}
+async function calculateFanPerformance(){const D=parseFloat(document.getElementById('D').value);const n=parseFloat(document.getElementById('n').value);const T=parseFloat(document.getElementById('T').value);const P_inlet=parseFloat(document.getElementById('P_inlet').value);if(isNaN(D)||D<=0){showError('请输入有效的叶轮直径');return;}
+if(isNaN(n)||n<=0){showError('请输入有效的主轴转速');return;}
+if(isNaN(T)){showError('请输入有效的介质温度');return;}
+if(isNaN(P_inlet)||P_inlet<=0){showError('请输入有效的进口大气压');return;}
+const points=getPerformancePoints();if(points.length===0){showError('请至少添加一个性能点');return;}
+const params={scenario:'fan_performance',D:D,n:n,T:T,P_inlet:P_inlet,performance_points:points};try{const result=await calculateTool('fan-performance',params);displayResults(result);}catch(error){showError(error.message||'计算失败，请检查输入参数');}}
+function displayResults(result){const container=document.getElementById('result-container');container.style.display='block';displayResultTable(result.result);drawCharts(result.result);container.scrollIntoView({behavior:'smooth'});}
+function displayResultTable(results){const container=document.getElementById('result-table-container');let html='<table class="result-table">';html+='<thead><tr>';html+='<th>序号</th>';html+='<th>压力系数 ψ<sub>p</sub></th>';html+='<th>流量系数 φ</th>';html+='<th>效率 η</th>';html+='<th>压力 P (Pa)</th>';html+='<th>流量 Q (m³/h)</th>';html+='<th>内功率 P<sub>internal</sub> (kW)</th>';html+='</tr></thead>';html+='<tbody>';results.forEach((point,index)=>{html+='<tr>';html+=`<td>${index + 1}</td>`;html+=`<td>${point.psi_p}</td>`;html+=`<td>${point.phi}</td>`;html+=`<td>${point.eta}</td>`;html+=`<td>${point.pressure.toFixed(2)}</td>`;html+=`<td>${point.flow_rate.toFixed(2)}</td>`;html+=`<td>${point.internal_power.toFixed(2)}</td>`;html+='</tr>';});html+='</tbody></table>';container.innerHTML=html;}
+function drawCharts(results){const flowRates=results.map(p=>p.flow_rate);const pressures=results.map(p=>p.pressure);const efficiencies=results.map(p=>p.eta*100);drawPressureChart(flowRates,pressures);drawEfficiencyChart(flowRates,efficiencies);}
+function drawPressureChart(flowRates,pressures){const ctx=document.getElementById('pressureChart').getContext('2d');if(pressureChart){pressureChart.destroy();}
+pressureChart=new Chart(ctx,{type:'line',data:{labels:flowRates.map(f=>f.toFixed(0)),datasets:[{label:'压力 (Pa)',data:pressures,borderColor:'rgb(75, 192, 192)',backgroundColor:'rgba(75, 192, 192, 0.2)',tension:0.4,fill:false,pointRadius:5,pointHoverRadius:7}]},options:{responsive:true,maintainAspectRatio:true,plugins:{title:{display:true,text:'流量-压力曲线',font:{size:16}},legend:{display:true,position:'top'}},scales:{x:{title:{display:true,text:'流量 (m³/h)'},ticks:{callback:function(value){return value.toLocaleString();}}},y:{title:{display:true,text:'压力 (Pa)'},ticks:{callback:function(value){return value.toLocaleString();}}}}}});}
+function drawEfficiencyChart(flowRates,efficiencies){const ctx=document.getElementById('efficiencyChart').getContext('2d');if(efficiencyChart){efficiencyChart.destroy();}
+efficiencyChart=new Chart(ctx,{type:'line',data:{labels:flowRates.map(f=>f.toFixed(0)),datasets:[{label:'效率 (%)',data:efficiencies,borderColor:'rgb(255, 99, 132)',backgroundColor:'rgba(255, 99, 132, 0.2)',tension:0.4,fill:false,pointRadius:5,pointHoverRadius:7}]},options:{responsive:true,maintainAspectRatio:true,plugins:{title:{display:true,text:'流量-效率曲线',font:{size:16}},legend:{display:true,position:'top'}},scales:{x:{title:{display:true,text:'流量 (m³/h)'},ticks:{callback:function(value){return value.toLocaleString();}}},y:{title:{display:true,text:'效率 (%)'},min:0,max:100,ticks:{callback:function(value){return value+'%';}}}}}});}
@@ -0,0 +1,84 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;async function calculate(){const params={scenario:"fan_selection_example",Car:parseFloat(document.getElementById("Car").value),OAR:parseFloat(document.getElementById("OAR").value),Hy:parseFloat(document.getElementById("Hy").value),Nar:parseFloat(document.getElementById("Nar").value),War:parseFloat(document.getElementById("War").value),Aar:parseFloat(document.getElementById("Aar").value),Sar:parseFloat(document.getElementById("Sar").value),Qnet_ar:parseFloat(document.getElementById("Qnet_ar").value),};const B=document.getElementById("B").value;if(B&&B.trim()!==""){params.B=parseFloat(B);}else{const D=document.getElementById("D").value;const h_main=document.getElementById("h_main").value;const h_feed=document.getElementById("h_feed").value;if(D&&h_main&&h_feed){params.D=parseFloat(D);params.h_main=parseFloat(h_main);params.h_feed=parseFloat(h_feed);const blowdown=document.getElementById("blowdown").value;if(blowdown)params.blowdown=parseFloat(blowdown);const h_blowdown=document.getElementById("h_blowdown").value;if(h_blowdown)params.h_blowdown=parseFloat(h_blowdown);const eta_boiler=document.getElementById("eta_boiler").value;if(eta_boiler)params.eta_boiler=parseFloat(eta_boiler);}}
+const alpha=document.getElementById("alpha").value;if(alpha)params.alpha=parseFloat(alpha);const tk=document.getElementById("tk").value;if(tk)params.tk=parseFloat(tk);const tg=document.getElementById("tg").value;if(tg)params.tg=parseFloat(tg);const b=document.getElementById("b").value;if(b)params.b=parseFloat(b);const k1=document.getElementById("k1").value;if(k1)params.k1=parseFloat(k1);const k2_primary=document.getElementById("k2_primary").value;if(k2_primary)params.k2_primary=parseFloat(k2_primary);const k2_secondary=document.getElementById("k2_secondary").value;if(k2_secondary)params.k2_secondary=parseFloat(k2_secondary);const delta_h_primary=document.getElementById("delta_h_primary").value;if(delta_h_primary)params.delta_h_primary=parseFloat(delta_h_primary);const delta_h_secondary=document.getElementById("delta_h_secondary").value;if(delta_h_secondary)params.delta_h_secondary=parseFloat(delta_h_secondary);const eta1=document.getElementById("eta1").value;if(eta1)params.eta1=parseFloat(eta1);const eta2=document.getElementById("eta2").value;if(eta2)params.eta2=parseFloat(eta2);const eta3=document.getElementById("eta3").value;if(eta3)params.eta3=parseFloat(eta3);const K_motor=document.getElementById("K_motor").value;if(K_motor)params.K_motor=parseFloat(K_motor);const rho_ko=document.getElementById("rho_ko").value;if(rho_ko)params.rho_ko=parseFloat(rho_ko);const required=["Car","OAR","Hy","Nar","War","Aar","Sar","Qnet_ar","b"];for(const key of required){if(!params[key]&&params[key]!==0){alert(`请填写必需参数: ${key}`);return;}}
+if(!params.B&&(!params.D||!params.h_main||!params.h_feed)){alert("请提供燃煤量B，或提供计算燃煤量所需的参数(D, h_main, h_feed)");return;}
+if(!params.delta_h_primary||!params.delta_h_secondary){alert("请填写一次风机和二次风机的总阻力");return;}
+try{const data=await calculateTool("fan-selection-example",params);displayResult(data);}catch(error){alert("计算错误: "+error.message);console.error("计算错误:",error);}}
+function displayResult(data){const container=document.getElementById("result-container");const content=document.getElementById("result-content");if(!data.result){content.innerHTML="<p>计算结果为空</p>";container.style.display="block";return;}
+const result=data.result;let html="";if(data.formula){html+=`<div style="margin-bottom: 2rem; padding: 1rem; background: #f8f9fa; border-radius: 4px; border-left: 4px solid #3498db;">`;html+=`<h3 style="margin-top: 0; color: #2c3e50;">计算过程</h3>`;html+=`<div style="line-height: 1.8; color: #34495e;">${data.formula}</div>`;html+=`</div>`;}
+html+=`<div style="overflow-x: auto;">`;html+=`<table class="result-table" style="width: 100%; border-collapse: collapse; margin-top: 1rem;">`;html+=`<thead><tr style="background: #3498db; color: white;">`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">参数</th>`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">符号</th>`;html+=`<th style="padding: 0.75rem; text-align: right; border: 1px solid #2980b9;">数值</th>`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">单位</th>`;html+=`</tr></thead>`;html+=`<tbody>`;html+=resultTableSection("燃烧空气量和烟气量");html+=resultTableRow("燃烧空气量","V<sub>o</sub>",result.Vo.toFixed(6),"Nm³/kg");html+=resultTableRow("CO<sub>2</sub>和SO<sub>2</sub>产生量","V<sub>RO2</sub>",result.VRO2.toFixed(6),"Nm³/kg");html+=resultTableRow("含氮量","V<sub>N2</sub>",result.VN2.toFixed(6),"Nm³/kg");html+=resultTableRow("理论水蒸气含量","V<sub>H2Oo</sub>",result.VH2Oo.toFixed(6),"Nm³/kg");html+=resultTableRow("理论烟气量","V<sub>yo</sub>",result.Vyo.toFixed(6),"Nm³/kg");html+=resultTableRow("实际烟气量","V<sub>y</sub>",result.Vy.toFixed(6),"Nm³/kg");html+=resultTableSection("送风机风量");html+=resultTableRow("送风机总风量","V<sub>g</sub>",result.Vg.toFixed(2),"m³/h");html+=resultTableRow("一次风量","V<sub>g1</sub>",result.Vg_primary.toFixed(2),"m³/h");html+=resultTableRow("二次风量","V<sub>g2</sub>",result.Vg_secondary.toFixed(2),"m³/h");html+=resultTableSection("送风机阻力");html+=resultTableRow("一次风机阻力","H<sub>g1</sub>",result.Hg_primary.toFixed(2),"Pa");html+=resultTableRow("二次风机阻力","H<sub>g2</sub>",result.Hg_secondary.toFixed(2),"Pa");html+=resultTableSection("电动机功率");html+=resultTableRow("一次风机电动机功率","N<sub>g1</sub>",result.Ng_primary.toFixed(2),"kW");html+=resultTableRow("二次风机电动机功率","N<sub>g2</sub>",result.Ng_secondary.toFixed(2),"kW");html+=`</tbody></table>`;html+=`</div>`;content.innerHTML=html;container.style.display="block";container.scrollIntoView({behavior:"smooth",block:"start"});}
+function resetForm(){document.getElementById("Car").value="43.83";document.getElementById("OAR").value="21.51";document.getElementById("Hy").value="4.39";document.getElementById("Nar").value="0.72";document.getElementById("War").value="5.35";document.getElementById("Aar").value="24.02";document.getElementById("Sar").value="0.18";document.getElementById("Qnet_ar").value="16929";document.getElementById("B").value="";document.getElementById("D").value="90";document.getElementById("h_main").value="3500";document.getElementById("h_feed").value="947";document.getElementById("blowdown").value="0.02";document.getElementById("h_blowdown").value="1491";document.getElementById("eta_boiler").value="0.89";document.getElementById("alpha").value="1.2";document.getElementById("tk").value="20";document.getElementById("tg").value="20";document.getElementById("b").value="89.515";document.getElementById("k1").value="1.15";document.getElementById("k2_primary").value="1.2";document.getElementById("k2_secondary").value="1.25";document.getElementById("delta_h_primary").value="16100";document.getElementById("delta_h_secondary").value="8315";document.getElementById("eta1").value="0.85";document.getElementById("eta2").value="0.98";document.getElementById("eta3").value="0.9";document.getElementById("K_motor").value="1.1";document.getElementById("rho_ko").value="1.293";document.getElementById("result-container").style.display="none";}
@@ -0,0 +1,132 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;function switchSubTab(tabName){const tabContents=document.querySelectorAll('.tab-content');tabContents.forEach(content=>{content.classList.remove('active');});const subTabs=document.querySelectorAll('.sub-tab');subTabs.forEach(tab=>{tab.classList.remove('active');});const targetContent=document.getElementById(tabName);if(targetContent){targetContent.classList.add('active');}
+subTabs.forEach(tab=>{const onclick=tab.getAttribute('onclick');if(onclick&&onclick.includes(tabName)){tab.classList.add('active');}});}
+async function calculateBallScrew(){const FAInput=document.getElementById('bs_FA').value.trim();const mInput=document.getElementById('bs_m').value.trim();const gInput=document.getElementById('bs_g').value.trim();const alphaInput=document.getElementById('bs_alpha').value.trim();const muInput=document.getElementById('bs_mu').value.trim();const PBInput=document.getElementById('bs_PB').value.trim();const etaInput=document.getElementById('bs_eta').value.trim();const mu0Input=document.getElementById('bs_mu0').value.trim();const F0Input=document.getElementById('bs_F0').value.trim();const iInput=document.getElementById('bs_i').value.trim();if(FAInput===''){showError('请输入外力');return;}
+const FA=parseFloat(FAInput);if(isNaN(FA)){showError('外力必须是有效数字');return;}
+if(mInput===''){showError('请输入工作物与工作台的总质量');return;}
+const m=parseFloat(mInput);if(isNaN(m)||m<=0){showError('工作物与工作台的总质量必须大于0');return;}
+const g=gInput===''?9.807:parseFloat(gInput);if(isNaN(g)||g<=0){showError('重力加速度必须大于0');return;}
+if(alphaInput===''){showError('请输入倾斜角度');return;}
+const alpha=parseFloat(alphaInput);if(isNaN(alpha)){showError('倾斜角度必须是有效数字');return;}
+if(muInput===''){showError('请输入滑动面的摩擦系数');return;}
+const mu=parseFloat(muInput);if(isNaN(mu)||mu<0){showError('滑动面的摩擦系数必须大于等于0');return;}
+if(PBInput===''){showError('请输入滚珠螺杆螺距');return;}
+const PB=parseFloat(PBInput);if(isNaN(PB)||PB<=0){showError('滚珠螺杆螺距必须大于0');return;}
+if(etaInput===''){showError('请输入机械效率');return;}
+const eta=parseFloat(etaInput);if(isNaN(eta)||eta<=0||eta>1){showError('机械效率应在0-1之间');return;}
+if(mu0Input===''){showError('请输入预压螺帽的内部摩擦系数');return;}
+const mu0=parseFloat(mu0Input);if(isNaN(mu0)||mu0<0){showError('预压螺帽的内部摩擦系数必须大于等于0');return;}
+if(F0Input===''){showError('请输入预负载');return;}
+const F0=parseFloat(F0Input);if(isNaN(F0)||F0<0){showError('预负载必须大于等于0');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+const params={scenario:'ball_screw',FA:FA,m:m,g:g,alpha:alpha,mu:mu,PB:PB,eta:eta,mu0:mu0,F0:F0,i:i};try{const result=await calculateTool('load-torque',params);if(result.extra&&result.extra.F!==undefined){document.getElementById('bs_F_value').textContent=formatNumber(result.extra.F,10);}
+document.getElementById('bs_result_value').textContent=formatNumber(result.result,10);document.getElementById('bs_result_unit').textContent=result.unit;renderFormula('bs_result_formula',result.formula);document.getElementById('bs_result').style.display='block';document.getElementById('bs_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculatePulley(){const FAInput=document.getElementById('p_FA').value.trim();const mInput=document.getElementById('p_m').value.trim();const gInput=document.getElementById('p_g').value.trim();const muInput=document.getElementById('p_mu').value.trim();const DInput=document.getElementById('p_D').value.trim();const iInput=document.getElementById('p_i').value.trim();if(FAInput===''){showError('请输入外力');return;}
+const FA=parseFloat(FAInput);if(isNaN(FA)){showError('外力必须是有效数字');return;}
+if(mInput===''){showError('请输入工作物与工作台的总质量');return;}
+const m=parseFloat(mInput);if(isNaN(m)||m<=0){showError('工作物与工作台的总质量必须大于0');return;}
+const g=gInput===''?9.807:parseFloat(gInput);if(isNaN(g)||g<=0){showError('重力加速度必须大于0');return;}
+if(muInput===''){showError('请输入滑动面的摩擦系数');return;}
+const mu=parseFloat(muInput);if(isNaN(mu)||mu<0){showError('滑动面的摩擦系数必须大于等于0');return;}
+if(DInput===''){showError('请输入终段滑轮直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('终段滑轮直径必须大于0');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+const params={scenario:'pulley',FA:FA,m:m,g:g,mu:mu,D:D,i:i};try{const result=await calculateTool('load-torque',params);document.getElementById('p_result_value').textContent=formatNumber(result.result,6);document.getElementById('p_result_unit').textContent=result.unit;renderFormula('p_result_formula',result.formula);document.getElementById('p_result').style.display='block';document.getElementById('p_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateBeltGearRack(){const FAInput=document.getElementById('bgr_FA').value.trim();const mInput=document.getElementById('bgr_m').value.trim();const gInput=document.getElementById('bgr_g').value.trim();const alphaInput=document.getElementById('bgr_alpha').value.trim();const muInput=document.getElementById('bgr_mu').value.trim();const DInput=document.getElementById('bgr_D').value.trim();const etaInput=document.getElementById('bgr_eta').value.trim();const iInput=document.getElementById('bgr_i').value.trim();if(FAInput===''){showError('请输入外力');return;}
+const FA=parseFloat(FAInput);if(isNaN(FA)){showError('外力必须是有效数字');return;}
+if(mInput===''){showError('请输入工作物与工作台的总质量');return;}
+const m=parseFloat(mInput);if(isNaN(m)||m<=0){showError('工作物与工作台的总质量必须大于0');return;}
+const g=gInput===''?9.807:parseFloat(gInput);if(isNaN(g)||g<=0){showError('重力加速度必须大于0');return;}
+if(alphaInput===''){showError('请输入倾斜角度');return;}
+const alpha=parseFloat(alphaInput);if(isNaN(alpha)){showError('倾斜角度必须是有效数字');return;}
+if(muInput===''){showError('请输入滑动面的摩擦系数');return;}
+const mu=parseFloat(muInput);if(isNaN(mu)||mu<0){showError('滑动面的摩擦系数必须大于等于0');return;}
+if(DInput===''){showError('请输入小齿轮/链轮直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('小齿轮/链轮直径必须大于0');return;}
+if(etaInput===''){showError('请输入机械效率');return;}
+const eta=parseFloat(etaInput);if(isNaN(eta)||eta<=0||eta>1){showError('机械效率应在0-1之间');return;}
+if(iInput===''){showError('请输入减速比');return;}
+const i=parseFloat(iInput);if(isNaN(i)||i<=0){showError('减速比必须大于0');return;}
+const params={scenario:'belt_gear_rack',FA:FA,m:m,g:g,alpha:alpha,mu:mu,D:D,eta:eta,i:i};try{const result=await calculateTool('load-torque',params);if(result.extra&&result.extra.F!==undefined){document.getElementById('bgr_F_value').textContent=formatNumber(result.extra.F,10);}
+document.getElementById('bgr_result_value').textContent=formatNumber(result.result,6);document.getElementById('bgr_result_unit').textContent=result.unit;renderFormula('bgr_result_formula',result.formula);document.getElementById('bgr_result').style.display='block';document.getElementById('bgr_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
+async function calculateTestMethod(){const FBInput=document.getElementById('tm_FB').value.trim();const DInput=document.getElementById('tm_D').value.trim();if(FBInput===''){showError('请输入主轴开始运动时的力');return;}
+const FB=parseFloat(FBInput);if(isNaN(FB)||FB<=0){showError('主轴开始运动时的力必须大于0');return;}
+if(DInput===''){showError('请输入终段滑轮直径');return;}
+const D=parseFloat(DInput);if(isNaN(D)||D<=0){showError('终段滑轮直径必须大于0');return;}
+const params={scenario:'test_method',FB:FB,D:D};try{const result=await calculateTool('load-torque',params);document.getElementById('tm_result_value').textContent=formatNumber(result.result,6);document.getElementById('tm_result_unit').textContent=result.unit;renderFormula('tm_result_formula',result.formula);document.getElementById('tm_result').style.display='block';document.getElementById('tm_result').scrollIntoView({behavior:'smooth',block:'nearest'});}catch(error){showError(error.message||'计算失败，请检查输入');}}
@@ -0,0 +1,87 @@
+function showError(message){const existingModal=document.getElementById('error-modal');if(existingModal){existingModal.remove();}
+const overlay=document.createElement('div');overlay.className='error-modal-overlay';overlay.id='error-modal';const errorBox=document.createElement('div');errorBox.className='error-modal-box';const icon=document.createElement('div');icon.className='error-modal-icon';icon.innerHTML='⚠️';const messageDiv=document.createElement('div');messageDiv.className='error-modal-message';messageDiv.textContent=message;const closeBtn=document.createElement('button');closeBtn.className='error-modal-close';closeBtn.textContent='确定';closeBtn.onclick=()=>{overlay.remove();};errorBox.appendChild(icon);errorBox.appendChild(messageDiv);errorBox.appendChild(closeBtn);overlay.appendChild(errorBox);document.body.appendChild(overlay);overlay.onclick=(e)=>{if(e.target===overlay){overlay.remove();}};setTimeout(()=>{if(overlay.parentNode){overlay.remove();}},3000);setTimeout(()=>{errorBox.classList.add('show');},10);}
+function showSuccess(message){const successDiv=document.createElement('div');successDiv.className='success-message';successDiv.textContent=message;const container=document.querySelector('.main-content .container');if(container){container.insertBefore(successDiv,container.firstChild);setTimeout(()=>{successDiv.remove();},3000);}}
+function formatNumber(num,decimals=4){if(num===null||num===undefined||isNaN(num)){return'N/A';}
+return Number(num).toFixed(decimals);}
+const requestLayer=(()=>{const CALCULATE_PATH=/^\/api\/tools\/[^/]+\/calculate$/;const DEBOUNCE_MS=250;const CACHE_MAX_ENTRIES=100;const CACHE_TTL_MS=10*60*1000;const cache=new Map();const inflight=new Map();const channels=new Map();const stats={calls:0,fetches:0,cacheHits:0,deduped:0,superseded:0,aborted:0};function canonicalJSON(value){if(Array.isArray(value)){return`[${value.map(canonicalJSON).join(',')}]`;}
+if(value&&typeof value==='object'){const items=Object.keys(value).sort().map(key=>`${JSON.stringify(key)}:${canonicalJSON(value[key])}`);return`{${items.join(',')}}`;}
+return JSON.stringify(value);}
+function cacheGet(key){const entry=cache.get(key);if(!entry)return undefined;cache.delete(key);if(Date.now()-entry.time>CACHE_TTL_MS)return undefined;cache.set(key,entry);return entry.text;}
+function cacheSet(key,text){cache.delete(key);cache.set(key,{text,time:Date.now()});while(cache.size>CACHE_MAX_ENTRIES){cache.delete(cache.keys().next().value);}}
+async function send(url,method,data,signal){const options={method:method,headers:{'Content-Type':'application/json',},signal:signal};if(data&&method!=='GET'){options.body=JSON.stringify(data);}
+stats.fetches+=1;const response=await fetch(url,options);const text=await response.text();const result=JSON.parse(text);if(!response.ok){throw new Error(result.detail||'请求失败');}
+return text;}
+function acquire(url,method,data,key){const text=key?cacheGet(key):undefined;if(text!==undefined){stats.cacheHits+=1;return{key,promise:Promise.resolve(text),release(){}};}
+let entry=key?inflight.get(key):undefined;if(entry){stats.deduped+=1;}else{const controller=new AbortController();entry={controller,users:0,done:false,promise:send(url,method,data,controller.signal)};const settled=()=>{entry.done=true;if(key&&inflight.get(key)===entry)inflight.delete(key);};entry.promise.then(responseText=>{if(key)cacheSet(key,responseText);settled();},settled);if(key)inflight.set(key,entry);}
+entry.users+=1;let released=false;return{key,promise:entry.promise,release(){if(released||entry.done)return;released=true;entry.users-=1;if(entry.users===0){entry.controller.abort();stats.aborted+=1;if(key&&inflight.get(key)===entry)inflight.delete(key);}}};}
+function requestOnChannel(url,method,data,key,channel){let state=channels.get(channel);if(!state){state={lastCall:-Infinity,timer:null,ticket:null};channels.set(channel,state);}
+if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+const previous=state.ticket;state.ticket=null;const now=Date.now();const quiet=now-state.lastCall>=DEBOUNCE_MS;state.lastCall=now;const promise=new Promise((resolve,reject)=>{const start=()=>{state.timer=null;const ticket=acquire(url,method,data,key);state.ticket=ticket;ticket.promise.then(text=>{if(state.ticket!==ticket)return;state.ticket=null;resolve(JSON.parse(text));},error=>{if(state.ticket!==ticket)return;state.ticket=null;reject(error);});};if(quiet||(key&&(cache.has(key)||inflight.has(key)))){start();}else{state.timer=setTimeout(start,DEBOUNCE_MS);}});if(previous){previous.release();stats.superseded+=1;}
+return promise;}
+function cancel(channel){const state=channels.get(channel);if(!state)return;if(state.timer){clearTimeout(state.timer);state.timer=null;stats.superseded+=1;}
+if(state.ticket){state.ticket.release();state.ticket=null;stats.superseded+=1;}}
+async function request(url,method='GET',data=null,channel=null){stats.calls+=1;const key=method==='POST'&&CALCULATE_PATH.test(url)?`${url}?${canonicalJSON(data)}`:null;if(channel){return requestOnChannel(url,method,data,key,channel);}
+return JSON.parse(await acquire(url,method,data,key).promise);}
+return{request,cancel,stats,canonicalJSON};})();async function apiRequest(url,method='GET',data=null,options={}){return requestLayer.request(url,method,data,options.channel||null);}
+const pyRuntime=(()=>{const FALLBACK=new Error('fallback to server');const MAX_EXACT=2**53;const hasOwn=(object,key)=>Object.prototype.hasOwnProperty.call(object,key);function inputs(params,specs){const values=[];const ints=[];for(const[name,type,fieldDefault,calcDefault]of specs){const given=hasOwn(params,name)?params[name]:undefined;if(given===undefined||given===null){const entry=(given===undefined&&fieldDefault)||calcDefault;if(!entry)throw FALLBACK;values.push(entry[0]);ints.push(entry[1]);continue;}
+if(typeof given!=='number'||!Number.isFinite(given)||Math.abs(given)>=MAX_EXACT)throw FALLBACK;if(type==='int'&&!Number.isInteger(given))throw FALLBACK;values.push(given+0);ints.push(type==='int'||(type===null&&Number.isInteger(given)));}
+return[values,ints];}
+function need(condition){if(!condition)throw FALLBACK;}
+function n(x){if(!Number.isFinite(x)||Math.abs(x)>=MAX_EXACT||Object.is(x,-0))throw FALLBACK;return x;}
+function div(a,b){if(b===0)throw FALLBACK;return n(a/b);}
+function sqrt(x){if(x<0)throw FALLBACK;return Math.sqrt(x);}
+function min(...args){return args.reduce((best,x)=>(x<best?x:best));}
+function max(...args){return args.reduce((best,x)=>(x>best?x:best));}
+function fixed(x,digits){let text=Math.abs(x).toFixed(digits);const scaled=Math.abs(x)*2**(digits+1);if(Number.isInteger(scaled)&&scaled%2===1&&/[13579]$/.test(text)){text=text.slice(0,-1)+(Number(text.slice(-1))-1);}
+return(x<0||Object.is(x,-0)?'-':'')+text;}
+function round(x,digits){return parseFloat(fixed(x,digits));}
+function str(x,isInt){if(isInt)return String(x);const[mantissa,exp]=x.toExponential().split('e');const exponent=Number(exp);const digits=mantissa.replace('-','').replace('.','');const sign=x<0||Object.is(x,-0)?'-':'';if(exponent<-4||exponent>=16){const fraction=digits.length>1?`.${digits.slice(1)}`:'';return`${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;}
+if(exponent<0){return`${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;}
+const whole=digits.slice(0,exponent+1).padEnd(exponent+1,'0');return`${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;}
+return{FALLBACK,inputs,need,n,div,sqrt,min,max,fixed,round,str};})();function evaluateLocally(toolId,params){const evaluators=(window.CLIENT_EVALUATORS||{})[toolId];const scenario=params&&params.scenario;if(!evaluators||typeof scenario!=='string'||!Object.prototype.hasOwnProperty.call(evaluators,scenario)){return null;}
+if(params.input_units!=null||params.output_units!=null){return null;}
+try{return evaluators[scenario](params,pyRuntime);}catch(error){return null;}}
+async function calculateTool(toolId,params){const channel=`${toolId}:${params && params.scenario}`;const local=evaluateLocally(toolId,params);if(local){requestLayer.cancel(channel);return local;}
+return apiRequest(`/api/tools/${toolId}/calculate`,'POST',params,{channel});}
+function resultRow(label,value,unit){return`<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;}
+function resultSection(title){return`<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;}
+function resultTableRow(label,symbol,value,unit){const cell='padding: 0.5rem; border: 1px solid #bdc3c7;';return`<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;}
+function resultTableSection(title){return`<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;}
+function renderFormula(elementId,formulaText){const element=document.getElementById(elementId);if(!element)return;let displayText=formulaText;if(!displayText.startsWith('公式:')){displayText='公式: '+displayText;}
+if(displayText.includes('<br>')||displayText.includes('<sub>')||displayText.includes('<sup>')){element.innerHTML=displayText;}else{element.textContent=displayText;}}
+function collectFormData(formElement){const formData=new FormData(formElement);const payload={};for(const[key,value]of formData.entries()){if(value!==""){payload[key]=isNaN(value)?value:Number(value);}}
+return payload;}
+function validateFields(fields,payload){for(const field of fields){const value=payload[field.name];if(field.required&&(value===undefined||value===null||value==="")){return{valid:false,message:`${field.label} 为必填项`};}
+if(field.type==="number"&&value!==undefined){if(typeof value!=="number"||Number.isNaN(value)){return{valid:false,message:`${field.label} 必须是数字`};}
+if(field.min!==null&&field.min!==undefined&&value<field.min){return{valid:false,message:`${field.label} 不能小于 ${field.min}`};}
+if(field.max!==null&&field.max!==undefined&&value>field.max){return{valid:false,message:`${field.label} 不能大于 ${field.max}`};}}}
+return{valid:true};}
+function renderResult(container,contentElement,response){if(!container||!contentElement)return;const details=[`<div><strong>结果：</strong>${response.result}</div>`,`<div><strong>单位：</strong>${response.unit || ""}</div>`,`<div><strong>公式：</strong>${response.formula || ""}</div>`,];if(response.scenario_name){details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);}
+if(response.extra){details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);}
+contentElement.innerHTML=details.join("\n");container.style.display="block";}
+function getValueByPath(obj,path){if(!obj||!path)return undefined;return path.split('.').reduce((acc,key)=>(acc&&acc[key]!==undefined?acc[key]:undefined),obj);}
+function parseFieldValue(input,field){const raw=input.value.trim();if(raw===''){return{valid:!field.required,value:null,message:`${field.label}不能为空`};}
+if(field.type==='select'){return{valid:true,value:raw};}
+const numeric=parseFloat(raw);if(isNaN(numeric)){return{valid:false,value:null,message:`${field.label}必须是数字`};}
+if(field.min!==undefined&&numeric<field.min){return{valid:false,value:null,message:`${field.label}不能小于${field.min}`};}
+if(field.max!==undefined&&numeric>field.max){return{valid:false,value:null,message:`${field.label}不能大于${field.max}`};}
+return{valid:true,value:numeric};}
+function renderResultCard(resultConfig,response,formatters={}){if(!resultConfig)return;const container=document.getElementById(resultConfig.id);if(!container)return;(resultConfig.items||[]).forEach(item=>{const target=document.getElementById(item.id);if(!target)return;let value=getValueByPath(response,item.source||'result');if(item.formatter&&typeof formatters[item.formatter]==='function'){value=formatters[item.formatter](value,response,item);}else if(typeof value==='number'){value=formatNumber(value,item.decimals||4);}else if(value===undefined||value===null||value===''){value='N/A';}
+target.innerHTML=value;});if(resultConfig.formula_id&&response.formula){renderFormula(resultConfig.formula_id,response.formula);}
+container.style.display='block';container.scrollIntoView({behavior:'smooth',block:'nearest'});}
+function initTabbedTool(config){const tabGroup=document.getElementById(config.tabGroupId);const sections=config.sections||[];const sectionClass=config.sectionClass||'tab-content';if(tabGroup){tabGroup.querySelectorAll('.sub-tab').forEach(button=>{button.addEventListener('click',()=>{const target=button.getAttribute('data-target');document.querySelectorAll(`.${sectionClass}`).forEach(div=>{div.classList.remove('active');});document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn=>btn.classList.remove('active'));const tabContent=document.getElementById(target);if(tabContent)tabContent.classList.add('active');button.classList.add('active');});});}
+sections.forEach(section=>{const submitButton=document.querySelector(`[data-submit="${section.id}"]`);if(!submitButton)return;submitButton.addEventListener('click',async()=>{const payload={scenario:section.scenario};for(const field of section.section.fields||[]){const input=document.getElementById(field.id);if(!input)continue;const{valid,value,message}=parseFieldValue(input,field);if(!valid){showError(message);return;}
+if(value!==null&&value!==undefined){payload[field.name||field.id]=value;}}
+try{const apiPath=section.section.apiPath||config.apiPath;const response=await apiRequest(apiPath,'POST',payload,{channel:`${apiPath}:${section.scenario}`});renderResultCard(section.section.result,response,config.formatters);}catch(error){showError(error.message||'计算失败，请检查输入');}});});}
+;async function calculate(){const params={scenario:"servo_motor_inertia",M:parseFloat(document.getElementById("M").value),v_fast:parseFloat(document.getElementById("v_fast").value),t_acc:parseFloat(document.getElementById("t_acc").value),a:parseFloat(document.getElementById("a").value),u:parseFloat(document.getElementById("u").value)||0.1,m_gear:parseFloat(document.getElementById("m_gear").value),Z:parseFloat(document.getElementById("Z").value),D:parseFloat(document.getElementById("D").value),eta:parseFloat(document.getElementById("eta").value)||0.98,i:parseFloat(document.getElementById("i").value),eta_reducer:parseFloat(document.getElementById("eta_reducer").value)||0.8,Jm:parseFloat(document.getElementById("Jm").value),JG:parseFloat(document.getElementById("JG").value)||0,Jg:parseFloat(document.getElementById("Jg").value)||0,is_vertical:document.getElementById("is_vertical").value==="true",g:parseFloat(document.getElementById("g").value)||9.8,};const Jm_inertia=document.getElementById("Jm_inertia").value;if(Jm_inertia){params.Jm_inertia=parseFloat(Jm_inertia);}
+const an=document.getElementById("an").value;if(an)params.an=parseFloat(an);const a0=document.getElementById("a0").value;if(a0)params.a0=parseFloat(a0);const Z2=document.getElementById("Z2").value;if(Z2)params.Z2=parseFloat(Z2);const X2=document.getElementById("X2").value;if(X2)params.X2=parseFloat(X2);const y2=document.getElementById("y2").value;if(y2)params.y2=parseFloat(y2);const FC=document.getElementById("FC").value;if(FC&&FC.trim()!==""){params.FC=parseFloat(FC);}
+const v_cut=document.getElementById("v_cut").value;if(v_cut&&v_cut.trim()!==""){params.v_cut=parseFloat(v_cut);}
+const required=["M","v_fast","t_acc","a","m_gear","Z","D","i","Jm"];for(const key of required){if(!params[key]&&params[key]!==0){alert(`请填写必需参数: ${key}`);return;}}
+try{const data=await calculateTool("servo-motor-inertia",params);displayResult(data);}catch(error){alert("计算错误: "+error.message);console.error("计算错误:",error);}}
+function displayResult(data){const container=document.getElementById("result-container");const content=document.getElementById("result-content");if(!data.result){content.innerHTML="<p>计算结果为空</p>";container.style.display="block";return;}
+const result=data.result;let html="";if(data.formula){html+=`<div style="margin-bottom: 2rem; padding: 1rem; background: #f8f9fa; border-radius: 4px; border-left: 4px solid #3498db;">`;html+=`<h3 style="margin-top: 0; color: #2c3e50;">计算过程</h3>`;html+=`<div style="line-height: 1.8; color: #34495e;">${data.formula}</div>`;html+=`</div>`;}
+html+=`<div style="overflow-x: auto;">`;html+=`<table class="result-table" style="width: 100%; border-collapse: collapse; margin-top: 1rem;">`;html+=`<thead><tr style="background: #3498db; color: white;">`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">参数</th>`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">符号</th>`;html+=`<th style="padding: 0.75rem; text-align: right; border: 1px solid #2980b9;">数值</th>`;html+=`<th style="padding: 0.75rem; text-align: left; border: 1px solid #2980b9;">单位</th>`;html+=`</tr></thead>`;html+=`<tbody>`;html+=resultTableSection("快速移动时");html+=resultTableRow("加速力","F<sub>a</sub>",result.Fa.toFixed(2),"N");html+=resultTableRow("摩擦力","F<sub>f</sub>",result.Ff.toFixed(2),"N");html+=resultTableRow("合力","F<sub>total</sub>",result.F_total.toFixed(2),"N");html+=resultTableRow("齿轮最高转速","n<sub>1</sub>",result.n1.toFixed(2),"rpm");html+=resultTableRow("齿轮角加速度","β<sub>G</sub>",result.beta_G.toFixed(6),"rad/s²");html+=resultTableRow("合力矩","T<sub>req</sub>",result.Treq.toFixed(6),"N·m");html+=resultTableRow("减速机输入端的加速力矩","T<sub>2</sub>",result.T2.toFixed(6),"N·m");html+=resultTableRow("电机最大转速","n<sub>2</sub>",result.n2.toFixed(2),"rpm");html+=resultTableRow("电机角加速度","β<sub>m</sub>",result.beta_m.toFixed(6),"rad/s²");html+=resultTableRow("电机克服自身惯量加速的力矩","T<sub>m</sub>",result.Tm.toFixed(6),"N·m");html+=`<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">电机在加速时总的输出力矩</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>m1</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Tm1.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;if(result.Fc!==undefined){html+=resultTableSection("切削时");html+=resultTableRow("切削抗力","F<sub>c</sub>",result.Fc.toFixed(2),"N");html+=resultTableRow("合力","F<sub>cut</sub>",result.F_cut.toFixed(2),"N");html+=resultTableRow("力矩","T<sub>c</sub>",result.Tc.toFixed(6),"N·m");html+=resultTableRow("电机输出端的额定力矩","T<sub>3</sub>",result.T3.toFixed(6),"N·m");if(result.n_cut!==undefined){html+=resultTableRow("对应的齿轮转速","n<sub>cut</sub>",result.n_cut.toFixed(2),"rpm");html+=resultTableRow("电机转速","n<sub>motor_cut</sub>",result.n_motor_cut.toFixed(2),"rpm");}}
+if(result.F2rmax!==undefined){html+=resultTableSection("侧倾力矩计算");html+=resultTableRow("最大水平切向力","F<sub>tangential</sub>",result.F_tangential.toFixed(2),"N");html+=resultTableRow("最大径向力","F<sub>2rmax</sub>",result.F2rmax.toFixed(2),"N");html+=resultTableRow("最大轴向力","F<sub>2amax</sub>",result.F2amax.toFixed(2),"N");html+=resultTableRow("侧倾力矩","M<sub>2Kmax</sub>",result.M2Kmax.toFixed(6),"N·m");}
+html+=resultTableSection("惯量匹配");html+=resultTableRow("负载惯量","J<sub>L</sub>",result.JL.toFixed(6),"kg·m²");html+=resultTableRow("折算到减速机输入端的惯量","J<sub>1</sub>",result.J1.toFixed(6),"kg·m²");html+=resultTableRow("折算到电机输出端的惯量","J<sub>2</sub>",result.J2.toFixed(6),"kg·m²");html+=`<tr style="background: ${result.lambda_inertia > 10 ? '#ffebee' : '#e8f5e9'};"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">惯量匹配值</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">λ</td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: ${result.lambda_inertia > 10 ? '#e74c3c' : '#27ae60'}; border: 1px solid #bdc3c7;">${result.lambda_inertia.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">-</td></tr>`;if(result.lambda_inertia>10){html+=`<tr><td colspan="4" style="padding: 0.5rem; color: #e74c3c; border: 1px solid #bdc3c7;">⚠ 警告: 惯量匹配值λ > 10，建议重新选型</td></tr>`;}
+html+=`</tbody></table>`;html+=`</div>`;content.innerHTML=html;container.style.display="block";container.scrollIntoView({behavior:"smooth",block:"start"});}
+function resetForm(){document.getElementById("M").value="2000";document.getElementById("v_fast").value="50";document.getElementById("t_acc").value="1";document.getElementById("a").value="10";document.getElementById("u").value="0.1";document.getElementById("is_vertical").value="false";document.getElementById("FC").value="0";document.getElementById("v_cut").value="0";document.getElementById("m_gear").value="3";document.getElementById("Z").value="20";document.getElementById("D").value="0.06048";document.getElementById("eta").value="0.98";document.getElementById("JG").value="0";document.getElementById("i").value="16";document.getElementById("eta_reducer").value="0.8";document.getElementById("Jm").value="0.0036";document.getElementById("Jm_inertia").value="0.0061";document.getElementById("Jg").value="0.0006";document.getElementById("g").value="9.8";document.getElementById("an").value="21.116";document.getElementById("a0").value="19.5283";document.getElementById("Z2").value="0.0812";document.getElementById("X2").value="15.5";document.getElementById("y2").value="0.089127";document.getElementById("result-container").style.display="none";}
@@ -0,0 +1,642 @@
+/**
+ * 公共JavaScript函数
+ */
+
+/**
+ * 显示错误消息（屏幕中间模态框）
+ */
+function showError(message) {
+    // 移除已存在的错误提示
+    const existingModal = document.getElementById('error-modal');
+    if (existingModal) {
+        existingModal.remove();
+    }
+    
+    // 创建遮罩层
+    const overlay = document.createElement('div');
+    overlay.className = 'error-modal-overlay';
+    overlay.id = 'error-modal';
+    
+    // 创建错误提示框
+    const errorBox = document.createElement('div');
+    errorBox.className = 'error-modal-box';
+    
+    // 错误图标
+    const icon = document.createElement('div');
+    icon.className = 'error-modal-icon';
+    icon.innerHTML = '⚠️';
+    
+    // 错误消息
+    const messageDiv = document.createElement('div');
+    messageDiv.className = 'error-modal-message';
+    messageDiv.textContent = message;
+    
+    // 关闭按钮
+    const closeBtn = document.createElement('button');
+    closeBtn.className = 'error-modal-close';
+    closeBtn.textContent = '确定';
+    closeBtn.onclick = () => {
+        overlay.remove();
+    };
+    
+    errorBox.appendChild(icon);
+    errorBox.appendChild(messageDiv);
+    errorBox.appendChild(closeBtn);
+    overlay.appendChild(errorBox);
+    
+    // 添加到页面
+    document.body.appendChild(overlay);
+    
+    // 点击遮罩层也可以关闭
+    overlay.onclick = (e) => {
+        if (e.target === overlay) {
+            overlay.remove();
+        }
+    };
+    
+    // 3秒后自动关闭
+    setTimeout(() => {
+        if (overlay.parentNode) {
+            overlay.remove();
+        }
+    }, 3000);
+    
+    // 添加动画效果
+    setTimeout(() => {
+        errorBox.classList.add('show');
+    }, 10);
+}
+
+/**
+ * 显示成功消息
+ */
+function showSuccess(message) {
+    const successDiv = document.createElement('div');
+    successDiv.className = 'success-message';
+    successDiv.textContent = message;
+    
+    const container = document.querySelector('.main-content .container');
+    if (container) {
+        container.insertBefore(successDiv, container.firstChild);
+        
+        // 3秒后自动移除
+        setTimeout(() => {
+            successDiv.remove();
+        }, 3000);
+    }
+}
+
+/**
+ * 格式化数字
+ */
+function formatNumber(num, decimals = 4) {
+    if (num === null || num === undefined || isNaN(num)) {
+        return 'N/A';
+    }
+    return Number(num).toFixed(decimals);
+}
+
+/**
+ * 请求层
+ * - 计算接口是参数的纯函数：成功的响应按规范化请求缓存在内存中（LRU），相同的并发请求只发送一次
+ * - 同一通道（如一个计算场景）的请求防抖：距上次请求不足 DEBOUNCE_MS 时等待，期间的新请求取代旧请求
+ * - 新请求使同一通道上等待中或进行中的旧请求过期：旧请求被取消（没有其他调用方共享时中止 fetch），
+ *   其调用方不再得到结果，过期的响应不会覆盖页面
+ */
+const requestLayer = (() => {
+    const CALCULATE_PATH = /^\/api\/tools\/[^/]+\/calculate$/;
+    const DEBOUNCE_MS = 250;
+    const CACHE_MAX_ENTRIES = 100;
+    // 工具配置可热加载，长时间打开的页面不无限期使用旧结果
+    const CACHE_TTL_MS = 10 * 60 * 1000;
+
+    const cache = new Map(); // 键 -> { text, time }；Map 按插入顺序遍历，命中时重新插入即为 LRU
+    const inflight = new Map(); // 键 -> 进行中的请求
+    const channels = new Map(); // 通道 -> { lastCall, timer, ticket }
+    const stats = { calls: 0, fetches: 0, cacheHits: 0, deduped: 0, superseded: 0, aborted: 0 };
+
+    // 键按字母顺序排列的 JSON（与 service_worker.js 相同），键顺序不同的相同参数得到同一个缓存键
+    function canonicalJSON(value) {
+        if (Array.isArray(value)) {
+            return `[${value.map(canonicalJSON).join(',')}]`;
+        }
+        if (value && typeof value === 'object') {
+            const items = Object.keys(value).sort().map(key => `${JSON.stringify(key)}:${canonicalJSON(value[key])}`);
+            return `{${items.join(',')}}`;
+        }
+        return JSON.stringify(value);
+    }
+
+    function cacheGet(key) {
+        const entry = cache.get(key);
+        if (!entry) return undefined;
+        cache.delete(key);
+        if (Date.now() - entry.time > CACHE_TTL_MS) return undefined;
+        cache.set(key, entry);
+        return entry.text;
+    }
+
+    function cacheSet(key, text) {
+        cache.delete(key);
+        cache.set(key, { text, time: Date.now() });
+        while (cache.size > CACHE_MAX_ENTRIES) {
+            cache.delete(cache.keys().next().value);
+        }
+    }
+
+    async function send(url, method, data, signal) {
+        const options = {
+            method: method,
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            signal: signal
+        };
+        if (data && method !== 'GET') {
+            options.body = JSON.stringify(data);
+        }
+        stats.fetches += 1;
+        const response = await fetch(url, options);
+        const text = await response.text();
+        const result = JSON.parse(text);
+        if (!response.ok) {
+            throw new Error(result.detail || '请求失败');
+        }
+        return text;
+    }
+
+    // 取得一次请求的响应文本：缓存命中、加入相同的进行中请求或发送新请求
+    // release() 表示调用方不再需要结果，最后一个调用方放弃时中止 fetch
+    function acquire(url, method, data, key) {
+        const text = key ? cacheGet(key) : undefined;
+        if (text !== undefined) {
+            stats.cacheHits += 1;
+            return { key, promise: Promise.resolve(text), release() {} };
+        }
+        let entry = key ? inflight.get(key) : undefined;
+        if (entry) {
+            stats.deduped += 1;
+        } else {
+            const controller = new AbortController();
+            entry = { controller, users: 0, done: false, promise: send(url, method, data, controller.signal) };
+            const settled = () => {
+                entry.done = true;
+                if (key && inflight.get(key) === entry) inflight.delete(key);
+            };
+            entry.promise.then(responseText => {
+                if (key) cacheSet(key, responseText);
+                settled();
+            }, settled);
+            if (key) inflight.set(key, entry);
+        }
+        entry.users += 1;
+        let released = false;
+        return {
+            key,
+            promise: entry.promise,
+            release() {
+                if (released || entry.done) return;
+                released = true;
+                entry.users -= 1;
+                if (entry.users === 0) {
+                    entry.controller.abort();
+                    stats.aborted += 1;
+                    if (key && inflight.get(key) === entry) inflight.delete(key);
+                }
+            }
+        };
+    }
+
+    function requestOnChannel(url, method, data, key, channel) {
+        let state = channels.get(channel);
+        if (!state) {
+            state = { lastCall: -Infinity, timer: null, ticket: null };
+            channels.set(channel, state);
+        }
+        if (state.timer) {
+            // 还在防抖等待的旧请求不再发送，其调用方不再得到结果
+            clearTimeout(state.timer);
+            state.timer = null;
+            stats.superseded += 1;
+        }
+        const previous = state.ticket;
+        state.ticket = null;
+        const now = Date.now();
+        const quiet = now - state.lastCall >= DEBOUNCE_MS;
+        state.lastCall = now;
+
+        const promise = new Promise((resolve, reject) => {
+            const start = () => {
+                state.timer = null;
+                const ticket = acquire(url, method, data, key);
+                state.ticket = ticket;
+                ticket.promise.then(text => {
+                    if (state.ticket !== ticket) return;
+                    state.ticket = null;
+                    resolve(JSON.parse(text));
+                }, error => {
+                    if (state.ticket !== ticket) return;
+                    state.ticket = null;
+                    reject(error);
+                });
+            };
+            // 已有结果或相同请求正在进行时无需等待
+            if (quiet || (key && (cache.has(key) || inflight.has(key)))) {
+                start();
+            } else {
+                state.timer = setTimeout(start, DEBOUNCE_MS);
+            }
+        });
+        if (previous) {
+            // 新请求先加入相同的进行中请求，再放弃旧请求，避免中止后重发
+            previous.release();
+            stats.superseded += 1;
+        }
+        return promise;
+    }
+
+    // 取消通道上等待中或进行中的请求（如结果已在浏览器端算出）
+    function cancel(channel) {
+        const state = channels.get(channel);
+        if (!state) return;
+        if (state.timer) {
+            clearTimeout(state.timer);
+            state.timer = null;
+            stats.superseded += 1;
+        }
+        if (state.ticket) {
+            state.ticket.release();
+            state.ticket = null;
+            stats.superseded += 1;
+        }
+    }
+
+    /**
+     * 发送请求并返回解析后的 JSON；channel 为空时不防抖、不取消
+     */
+    async function request(url, method = 'GET', data = null, channel = null) {
+        stats.calls += 1;
+        const key = method === 'POST' && CALCULATE_PATH.test(url) ? `${url}?${canonicalJSON(data)}` : null;
+        if (channel) {
+            return requestOnChannel(url, method, data, key, channel);
+        }
+        return JSON.parse(await acquire(url, method, data, key).promise);
+    }
+
+    return { request, cancel, stats, canonicalJSON };
+})();
+
+/**
+ * 发送API请求
+ * options.channel：同一通道的请求防抖，新请求取代尚未返回的旧请求（见 requestLayer）
+ */
+async function apiRequest(url, method = 'GET', data = null, options = {}) {
+    return requestLayer.request(url, method, data, options.channel || null);
+}
+
+/**
+ * 浏览器端计算函数的运行时（计算函数由 app/services/client_evaluators.py 生成并内联到工具页面）
+ * 运算与格式化都与服务器端的 Python 逐位一致；服务器可能报错或结果可能不同时抛出 FALLBACK，改为请求服务器
+ */
+const pyRuntime = (() => {
+    const FALLBACK = new Error('fallback to server');
+    // Python 整数运算不舍入：中间结果限制在双精度可精确表示的整数范围内，两端结果才相同
+    const MAX_EXACT = 2 ** 53;
+    const hasOwn = (object, key) => Object.prototype.hasOwnProperty.call(object, key);
+
+    // 请求参数按服务器请求模型取值：[[值...], [是否为Python整数...]]
+    // specs 每项为 [参数名, 模型类型 'float'/'int'/null, 模型默认值, 计算器默认值]，默认值形如 [值, 是否为整数]
+    function inputs(params, specs) {
+        const values = [];
+        const ints = [];
+        for (const [name, type, fieldDefault, calcDefault] of specs) {
+            const given = hasOwn(params, name) ? params[name] : undefined;
+            if (given === undefined || given === null) {
+                // 缺省的字段取模型默认值；显式的 null 被服务器丢弃，取计算器默认值
+                const entry = (given === undefined && fieldDefault) || calcDefault;
+                if (!entry) throw FALLBACK;
+                values.push(entry[0]);
+                ints.push(entry[1]);
+                continue;
+            }
+            if (typeof given !== 'number' || !Number.isFinite(given) || Math.abs(given) >= MAX_EXACT) throw FALLBACK;
+            if (type === 'int' && !Number.isInteger(given)) throw FALLBACK;
+            // JSON 中整数值没有小数点，未声明类型的参数在服务器端是 int；-0 序列化为 0
+            values.push(given + 0);
+            ints.push(type === 'int' || (type === null && Number.isInteger(given)));
+        }
+        return [values, ints];
+    }
+
+    function need(condition) {
+        if (!condition) throw FALLBACK;
+    }
+
+    function n(x) {
+        if (!Number.isFinite(x) || Math.abs(x) >= MAX_EXACT || Object.is(x, -0)) throw FALLBACK;
+        return x;
+    }
+
+    function div(a, b) {
+        if (b === 0) throw FALLBACK;
+        return n(a / b);
+    }
+
+    function sqrt(x) {
+        if (x < 0) throw FALLBACK;
+        return Math.sqrt(x);
+    }
+
+    // Python 的 min/max：返回第一个最小（大）值
+    function min(...args) {
+        return args.reduce((best, x) => (x < best ? x : best));
+    }
+
+    function max(...args) {
+        return args.reduce((best, x) => (x > best ? x : best));
+    }
+
+    // format(x, '.Nf')：toFixed 同样按二进制精确值舍入，但恰好居中时远离 0，Python 取偶数
+    function fixed(x, digits) {
+        let text = Math.abs(x).toFixed(digits);
+        const scaled = Math.abs(x) * 2 ** (digits + 1);
+        if (Number.isInteger(scaled) && scaled % 2 === 1 && /[13579]$/.test(text)) {
+            text = text.slice(0, -1) + (Number(text.slice(-1)) - 1);
+        }
+        return (x < 0 || Object.is(x, -0) ? '-' : '') + text;
+    }
+
+    // round(x, digits)
+    function round(x, digits) {
+        return parseFloat(fixed(x, digits));
+    }
+
+    // str(x)：整数原样输出，浮点数按 repr 的最短表示（1.0、0.0001、1e-05、1e+16）
+    function str(x, isInt) {
+        if (isInt) return String(x);
+        const [mantissa, exp] = x.toExponential().split('e');
+        const exponent = Number(exp);
+        const digits = mantissa.replace('-', '').replace('.', '');
+        const sign = x < 0 || Object.is(x, -0) ? '-' : '';
+        if (exponent < -4 || exponent >= 16) {
+            const fraction = digits.length > 1 ? `.${digits.slice(1)}` : '';
+            return `${sign}${digits[0]}${fraction}e${exponent < 0 ? '-' : '+'}${String(Math.abs(exponent)).padStart(2, '0')}`;
+        }
+        if (exponent < 0) {
+            return `${sign}0.${'0'.repeat(-exponent - 1)}${digits}`;
+        }
+        const whole = digits.slice(0, exponent + 1).padEnd(exponent + 1, '0');
+        return `${sign}${whole}.${digits.slice(exponent + 1) || '0'}`;
+    }
+
+    return { FALLBACK, inputs, need, n, div, sqrt, min, max, fixed, round, str };
+})();
+
+/**
+ * 在浏览器端计算（页面内联了该工具场景的计算函数时），结果与服务器相同
+ * 没有计算函数、需要单位换算或服务器可能报错时返回 null
+ */
+function evaluateLocally(toolId, params) {
+    const evaluators = (window.CLIENT_EVALUATORS || {})[toolId];
+    const scenario = params && params.scenario;
+    if (!evaluators || typeof scenario !== 'string' || !Object.prototype.hasOwnProperty.call(evaluators, scenario)) {
+        return null;
+    }
+    if (params.input_units != null || params.output_units != null) {
+        return null;
+    }
+    try {
+        return evaluators[scenario](params, pyRuntime);
+    } catch (error) {
+        // FALLBACK 或意外错误：交给服务器
+        return null;
+    }
+}
+
+/**
+ * 调用工具计算接口 /api/tools/{toolId}/calculate（简单场景直接在浏览器端计算）
+ * 每个工具的每个场景是一个请求通道：重复点击、快速修改参数后重新计算时只发送最后一次请求
+ */
+async function calculateTool(toolId, params) {
+    const channel = `${toolId}:${params && params.scenario}`;
+    const local = evaluateLocally(toolId, params);
+    if (local) {
+        // 之前回退到服务器的请求不再需要，避免其结果覆盖本次结果
+        requestLayer.cancel(channel);
+        return local;
+    }
+    return apiRequest(`/api/tools/${toolId}/calculate`, 'POST', params, { channel });
+}
+
+/**
+ * 三列结果表的一行：名称、数值、单位
+ */
+function resultRow(label, value, unit) {
+    return `<tr><td style="padding: 0.5rem;">${label}</td><td style="padding: 0.5rem; text-align: right;">${value}</td><td style="padding: 0.5rem;">${unit}</td></tr>`;
+}
+
+/**
+ * 三列结果表的分组标题行
+ */
+function resultSection(title) {
+    return `<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">${title}</td></tr>`;
+}
+
+/**
+ * 带边框的四列结果表的一行：名称、符号、数值、单位
+ */
+function resultTableRow(label, symbol, value, unit) {
+    const cell = 'padding: 0.5rem; border: 1px solid #bdc3c7;';
+    return `<tr><td style="${cell}">${label}</td><td style="${cell}">${symbol}</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${value}</td><td style="${cell}">${unit}</td></tr>`;
+}
+
+/**
+ * 带边框的四列结果表的分组标题行
+ */
+function resultTableSection(title) {
+    return `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">${title}</td></tr>`;
+}
+
+/**
+ * 渲染数学公式到指定元素（简单文本格式）
+ */
+function renderFormula(elementId, formulaText) {
+    const element = document.getElementById(elementId);
+    if (!element) return;
+    
+    // 如果公式文本包含HTML标签（如<br>），使用innerHTML；否则使用textContent
+    let displayText = formulaText;
+    if (!displayText.startsWith('公式:')) {
+        displayText = '公式: ' + displayText;
+    }
+    
+    // 检查是否包含HTML标签
+    if (displayText.includes('<br>') || displayText.includes('<sub>') || displayText.includes('<sup>')) {
+        element.innerHTML = displayText;
+    } else {
+        element.textContent = displayText;
+    }
+}
+
+
+/**
+ * 收集表单数据为简单对象
+ */
+function collectFormData(formElement) {
+    const formData = new FormData(formElement);
+    const payload = {};
+    for (const [key, value] of formData.entries()) {
+        if (value !== "") {
+            payload[key] = isNaN(value) ? value : Number(value);
+        }
+    }
+    return payload;
+}
+
+/**
+ * 基于字段定义进行基础校验
+ */
+function validateFields(fields, payload) {
+    for (const field of fields) {
+        const value = payload[field.name];
+        if (field.required && (value === undefined || value === null || value === "")) {
+            return { valid: false, message: `${field.label} 为必填项` };
+        }
+        if (field.type === "number" && value !== undefined) {
+            if (typeof value !== "number" || Number.isNaN(value)) {
+                return { valid: false, message: `${field.label} 必须是数字` };
+            }
+            if (field.min !== null && field.min !== undefined && value < field.min) {
+                return { valid: false, message: `${field.label} 不能小于 ${field.min}` };
+            }
+            if (field.max !== null && field.max !== undefined && value > field.max) {
+                return { valid: false, message: `${field.label} 不能大于 ${field.max}` };
+            }
+        }
+    }
+    return { valid: true };
+}
+
+/**
+ * 渲染通用结果面板
+ */
+function renderResult(container, contentElement, response) {
+    if (!container || !contentElement) return;
+    const details = [
+        `<div><strong>结果：</strong>${response.result}</div>`,
+        `<div><strong>单位：</strong>${response.unit || ""}</div>`,
+        `<div><strong>公式：</strong>${response.formula || ""}</div>`,
+    ];
+    if (response.scenario_name) {
+        details.push(`<div><strong>场景：</strong>${response.scenario_name}</div>`);
+    }
+    if (response.extra) {
+        details.push(`<pre>${JSON.stringify(response.extra, null, 2)}</pre>`);
+    }
+    contentElement.innerHTML = details.join("\n");
+    container.style.display = "block";
+}
+
+function getValueByPath(obj, path) {
+    if (!obj || !path) return undefined;
+    return path.split('.').reduce((acc, key) => (acc && acc[key] !== undefined ? acc[key] : undefined), obj);
+}
+
+function parseFieldValue(input, field) {
+    const raw = input.value.trim();
+    if (raw === '') {
+        return { valid: !field.required, value: null, message: `${field.label}不能为空` };
+    }
+
+    if (field.type === 'select') {
+        return { valid: true, value: raw };
+    }
+
+    const numeric = parseFloat(raw);
+    if (isNaN(numeric)) {
+        return { valid: false, value: null, message: `${field.label}必须是数字` };
+    }
+    if (field.min !== undefined && numeric < field.min) {
+        return { valid: false, value: null, message: `${field.label}不能小于${field.min}` };
+    }
+    if (field.max !== undefined && numeric > field.max) {
+        return { valid: false, value: null, message: `${field.label}不能大于${field.max}` };
+    }
+    return { valid: true, value: numeric };
+}
+
+function renderResultCard(resultConfig, response, formatters = {}) {
+    if (!resultConfig) return;
+    const container = document.getElementById(resultConfig.id);
+    if (!container) return;
+
+    (resultConfig.items || []).forEach(item => {
+        const target = document.getElementById(item.id);
+        if (!target) return;
+        let value = getValueByPath(response, item.source || 'result');
+        if (item.formatter && typeof formatters[item.formatter] === 'function') {
+            value = formatters[item.formatter](value, response, item);
+        } else if (typeof value === 'number') {
+            value = formatNumber(value, item.decimals || 4);
+        } else if (value === undefined || value === null || value === '') {
+            value = 'N/A';
+        }
+        target.innerHTML = value;
+    });
+
+    if (resultConfig.formula_id && response.formula) {
+        renderFormula(resultConfig.formula_id, response.formula);
+    }
+    container.style.display = 'block';
+    container.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+}
+
+function initTabbedTool(config) {
+    const tabGroup = document.getElementById(config.tabGroupId);
+    const sections = config.sections || [];
+    const sectionClass = config.sectionClass || 'tab-content';
+
+    if (tabGroup) {
+        tabGroup.querySelectorAll('.sub-tab').forEach(button => {
+            button.addEventListener('click', () => {
+                const target = button.getAttribute('data-target');
+                document.querySelectorAll(`.${sectionClass}`).forEach(div => {
+                    div.classList.remove('active');
+                });
+                document.querySelectorAll(`#${config.tabGroupId} .sub-tab`).forEach(btn => btn.classList.remove('active'));
+                const tabContent = document.getElementById(target);
+                if (tabContent) tabContent.classList.add('active');
+                button.classList.add('active');
+            });
+        });
+    }
+
+    sections.forEach(section => {
+        const submitButton = document.querySelector(`[data-submit="${section.id}"]`);
+        if (!submitButton) return;
+        submitButton.addEventListener('click', async () => {
+            const payload = { scenario: section.scenario };
+            for (const field of section.section.fields || []) {
+                const input = document.getElementById(field.id);
+                if (!input) continue;
+                const { valid, value, message } = parseFieldValue(input, field);
+                if (!valid) {
+                    showError(message);
+                    return;
+                }
+                if (value !== null && value !== undefined) {
+                    payload[field.name || field.id] = value;
+                }
+            }
+
+            try {
+                const apiPath = section.section.apiPath || config.apiPath;
+                const response = await apiRequest(apiPath, 'POST', payload, { channel: `${apiPath}:${section.scenario}` });
+                renderResultCard(section.section.result, response, config.formatters);
+            } catch (error) {
+                showError(error.message || '计算失败，请检查输入');
+            }
+        });
+    });
+}
+
@@ -0,0 +1,257 @@
+/**
+ * Service Worker：离线访问工具页面，缓存计算结果
+ *
+ * 由根路径的 /sw.js 入口加载，配置在 self.SW_CONFIG 中（见 app/services/service_worker.py）：
+ * - 指纹化静态资源在安装时预缓存，之后直接从缓存返回
+ * - 首页与工具页 stale-while-revalidate：先返回缓存的页面，同时在后台更新
+ * - 计算接口的成功响应按规范化参数存入 IndexedDB，相同参数再次计算时先返回保存的结果，
+ *   同时在后台重新请求并更新（离线时直接使用）；超过 calcCacheMaxAgeMs 的结果不再返回
+ * - 版本号变化（模板、静态资源或工具配置变化）时旧的缓存和计算结果全部失效；
+ *   结果版本号还计入计算器源码与风机曲线数据，二者变化时旧的计算结果失效
+ */
+
+const CONFIG = self.SW_CONFIG;
+const CACHE_PREFIXES = ['precache-', 'pages-'];
+const PRECACHE = `precache-${CONFIG.version}`;
+const PAGE_CACHE = `pages-${CONFIG.version}`;
+const DB_NAME = 'calc-cache';
+const STORE = 'responses';
+const CALCULATE_PATH = /^\/api\/tools\/[^/]+\/calculate$/;
+const PAGE_PATH = /^\/(tools\/[^/]+)?$/;
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(PRECACHE)
+            .then(cache => cache.addAll(CONFIG.precache))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        for (const name of await caches.keys()) {
+            const ours = CACHE_PREFIXES.some(prefix => name.startsWith(prefix));
+            if (ours && name !== PRECACHE && name !== PAGE_CACHE) {
+                await caches.delete(name);
+            }
+        }
+        try {
+            await purgeResults(record => !isFresh(record));
+        } catch (error) {
+            // IndexedDB 不可用时计算结果不缓存，不影响激活
+        }
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (url.origin !== self.location.origin) return;
+
+    if (request.method === 'POST' && CALCULATE_PATH.test(url.pathname)) {
+        event.respondWith(cachedCalculation(event, url));
+    } else if (request.method === 'GET' && url.pathname.startsWith('/static/')) {
+        event.respondWith(cacheFirst(request));
+    } else if (request.method === 'GET' && request.mode === 'navigate' && PAGE_PATH.test(url.pathname)) {
+        event.respondWith(staleWhileRevalidate(event, request));
+    }
+});
+
+/**
+ * 静态资源：预缓存命中直接返回，否则走网络
+ */
+async function cacheFirst(request) {
+    const cached = await caches.match(request, { cacheName: PRECACHE, ignoreVary: true });
+    return cached || fetch(request);
+}
+
+/**
+ * 页面：有缓存时立即返回并在后台更新，没有缓存时等待网络
+ */
+async function staleWhileRevalidate(event, request) {
+    const cache = await caches.open(PAGE_CACHE);
+    const cached = await cache.match(request.url, { ignoreVary: true });
+    const update = fetch(request).then(async response => {
+        if (response.ok && !response.redirected) {
+            await cache.put(request.url, response.clone());
+            await trimCache(cache, CONFIG.pageCacheMaxEntries);
+        }
+        return response;
+    });
+    if (cached) {
+        event.waitUntil(update.catch(() => undefined));
+        return cached;
+    }
+    return update;
+}
+
+/**
+ * 删除最早写入的页面，使缓存不超过 limit 条（重新写入的页面排在最后）
+ */
+async function trimCache(cache, limit) {
+    const keys = await cache.keys();
+    for (const key of keys.slice(0, Math.max(0, keys.length - limit))) {
+        await cache.delete(key);
+    }
+}
+
+/**
+ * 参数对象的规范化 JSON：键按字母顺序排列，键顺序不同的相同参数得到同一个缓存键
+ */
+function canonicalJSON(value) {
+    if (Array.isArray(value)) {
+        return `[${value.map(canonicalJSON).join(',')}]`;
+    }
+    if (value && typeof value === 'object') {
+        const items = Object.keys(value).sort().map(key => `${JSON.stringify(key)}:${canonicalJSON(value[key])}`);
+        return `{${items.join(',')}}`;
+    }
+    return JSON.stringify(value);
+}
+
+/**
+ * 保存的计算结果是否仍可使用：结果版本号一致且未超过最长保存时间
+ */
+function isFresh(record) {
+    return record.version === CONFIG.resultsVersion && Date.now() - record.stored <= CONFIG.calcCacheMaxAgeMs;
+}
+
+/**
+ * 计算接口：相同参数先返回保存的结果并在后台重新请求，否则等待服务器；
+ * 成功的响应写入（或更新）保存的结果，服务器拒绝的参数删除保存的结果
+ */
+async function cachedCalculation(event, url) {
+    const request = event.request;
+    let key;
+    try {
+        key = `${url.pathname}?${canonicalJSON(JSON.parse(await request.clone().text()))}`;
+    } catch (error) {
+        // 请求体不是 JSON，交给服务器返回校验错误
+        return fetch(request);
+    }
+
+    const record = await readResult(key).catch(() => undefined);
+    const network = fetch(request).then(async response => {
+        if (response.ok) {
+            const body = await response.clone().text();
+            if (body.length <= CONFIG.calcCacheMaxBytes) {
+                const type = response.headers.get('Content-Type') || 'application/json';
+                const now = Date.now();
+                await storeResult({ key, body, type, version: CONFIG.resultsVersion, stored: now, used: now })
+                    .catch(() => undefined);
+            }
+        } else if (record && response.status < 500) {
+            await deleteResult(key).catch(() => undefined);
+        }
+        return response;
+    });
+    if (record && isFresh(record)) {
+        // 在线时后台更新保存的结果；离线时请求失败，只记录这次使用
+        event.waitUntil(network.catch(() => touchResult(record).catch(() => undefined)));
+        return resultResponse(record);
+    }
+
+    try {
+        return await network;
+    } catch (error) {
+        return offlineResponse();
+    }
+}
+
+function resultResponse(record) {
+    return new Response(record.body, {
+        status: 200,
+        headers: { 'Content-Type': record.type, 'X-Calc-Cache': 'hit' }
+    });
+}
+
+function offlineResponse() {
+    return new Response(JSON.stringify({ detail: '网络不可用，且没有这组参数的缓存结果，请联网后重试' }), {
+        status: 503,
+        headers: { 'Content-Type': 'application/json' }
+    });
+}
+
+let dbPromise = null;
+
+function openDb() {
+    if (!dbPromise) {
+        dbPromise = new Promise((resolve, reject) => {
+            const open = indexedDB.open(DB_NAME, 1);
+            open.onupgradeneeded = () => {
+                const store = open.result.createObjectStore(STORE, { keyPath: 'key' });
+                store.createIndex('used', 'used');
+            };
+            open.onsuccess = () => resolve(open.result);
+            open.onerror = () => reject(open.error);
+        });
+        // 打开失败时下次重试
+        dbPromise.catch(() => {
+            dbPromise = null;
+        });
+    }
+    return dbPromise;
+}
+
+/**
+ * 在一个事务中操作计算结果表，事务完成后返回 callback 所发请求的结果
+ */
+async function withStore(mode, callback) {
+    const db = await openDb();
+    return new Promise((resolve, reject) => {
+        const transaction = db.transaction(STORE, mode);
+        const request = callback(transaction.objectStore(STORE));
+        transaction.oncomplete = () => resolve(request ? request.result : undefined);
+        transaction.onerror = () => reject(transaction.error);
+        transaction.onabort = () => reject(transaction.error);
+    });
+}
+
+function readResult(key) {
+    return withStore('readonly', store => store.get(key));
+}
+
+function deleteResult(key) {
+    return withStore('readwrite', store => {
+        store.delete(key);
+    });
+}
+
+function touchResult(record) {
+    return withStore('readwrite', store => {
+        store.put({ ...record, used: Date.now() });
+    });
+}
+
+/**
+ * 写入计算结果，超过条数上限时删除最久未使用的记录
+ */
+async function storeResult(record) {
+    await withStore('readwrite', store => {
+        store.put(record);
+        const count = store.count();
+        count.onsuccess = () => {
+            let excess = count.result - CONFIG.calcCacheMaxEntries;
+            if (excess <= 0) return;
+            store.index('used').openCursor().onsuccess = event => {
+                const cursor = event.target.result;
+                if (!cursor || excess <= 0) return;
+                cursor.delete();
+                excess -= 1;
+                cursor.continue();
+            };
+        };
+    });
+}
+
+function purgeResults(predicate) {
+    return withStore('readwrite', store => {
+        store.openCursor().onsuccess = event => {
+            const cursor = event.target.result;
+            if (!cursor) return;
+            if (predicate(cursor.value)) cursor.delete();
+            cursor.continue();
+        };
+    });
+}
@@ -81,7 +81,7 @@ async function calculateMotorSpeed() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-continuous/calculate', 'POST', params);
+        const result = await calculateTool('belt-continuous', params);
         if (result.extra && result.extra.N) {
             document.getElementById('ms_N_value').textContent = formatNumber(result.extra.N, 2);
         }
@@ -181,7 +181,7 @@ async function calculateLoadTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-continuous/calculate', 'POST', params);
+        const result = await calculateTool('belt-continuous', params);
         if (result.extra) {
             if (result.extra.F !== undefined) {
                 document.getElementById('lt_F_value').textContent = formatNumber(result.extra.F, 4);
@@ -246,7 +246,7 @@ async function calculateInertiaConversion() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-continuous/calculate', 'POST', params);
+        const result = await calculateTool('belt-continuous', params);
         if (result.extra) {
             if (result.extra.JM1 !== undefined) {
                 document.getElementById('ic_JM1_value').textContent = formatNumber(result.extra.JM1, 6);
@@ -295,7 +295,7 @@ async function calculateRequiredTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-continuous/calculate', 'POST', params);
+        const result = await calculateTool('belt-continuous', params);
         document.getElementById('rt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('rt_result_unit').textContent = result.unit;
         renderFormula('rt_result_formula', result.formula);
@@ -352,7 +352,7 @@ async function calculateInertiaRatio() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-continuous/calculate', 'POST', params);
+        const result = await calculateTool('belt-continuous', params);
         document.getElementById('ir_result_value').textContent = formatNumber(result.result, 2);
         renderFormula('ir_result_formula', result.formula);
         
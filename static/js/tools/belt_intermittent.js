@@ -58,7 +58,7 @@ async function calculateSpeedCurve() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         document.getElementById('sc_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('sc_result_unit').textContent = result.unit;
         renderFormula('sc_result_formula', result.formula);
@@ -142,7 +142,7 @@ async function calculateMotorSpeed() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         if (result.extra) {
             document.getElementById('ms_beta_value').textContent = formatNumber(result.extra.beta, 4);
             document.getElementById('ms_N_value').textContent = formatNumber(result.extra.N, 2);
@@ -244,7 +244,7 @@ async function calculateLoadTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         if (result.extra) {
             if (result.extra.F) {
             document.getElementById('lt_F_value').textContent = formatNumber(result.extra.F, 4);
@@ -349,7 +349,7 @@ async function calculateAccelerationTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         if (result.extra) {
             if (result.extra.JM1 !== undefined) {
                 document.getElementById('at_JM1_value').textContent = formatNumber(result.extra.JM1, 6);
@@ -416,7 +416,7 @@ async function calculateRequiredTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         document.getElementById('rt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('rt_result_unit').textContent = result.unit;
         renderFormula('rt_result_formula', result.formula);
@@ -473,7 +473,7 @@ async function calculateInertiaRatio() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/belt-intermittent/calculate', 'POST', params);
+        const result = await calculateTool('belt-intermittent', params);
         document.getElementById('ir_result_value').textContent = formatNumber(result.result, 2);
         renderFormula('ir_result_formula', result.formula);
         
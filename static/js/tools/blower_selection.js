@@ -90,20 +90,7 @@ async function calculateBlowerSelection() {
     
     try {
         // 调用API
-        const response = await fetch('/api/tools/blower-selection/calculate', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify(params)
-        });
-        
-        if (!response.ok) {
-            const errorData = await response.json();
-            throw new Error(errorData.detail || '计算失败');
-        }
-        
-        const result = await response.json();
+        const result = await calculateTool('blower-selection', params);
         displayResult(result);
     } catch (error) {
         alert('计算错误: ' + error.message);
@@ -133,28 +120,28 @@ function displayResult(result) {
     html += '<tbody>';
     
     // 压力相关结果
-    html += '<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">压力参数</td></tr>';
-    html += `<tr><td style="padding: 0.5rem;">高炉所需风压 P<sub>c</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Pc.toFixed(6)}</td><td style="padding: 0.5rem;">MPa</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">风机入口压力 P<sub>fx</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Pfx.toFixed(6)}</td><td style="padding: 0.5rem;">MPa</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">风机出口风压 P<sub>h</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Ph.toFixed(6)}</td><td style="padding: 0.5rem;">MPa</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">压比 ε</td><td style="padding: 0.5rem; text-align: right;">${data.epsilon.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
+    html += resultSection('压力参数');
+    html += resultRow('高炉所需风压 P<sub>c</sub>', data.Pc.toFixed(6), 'MPa');
+    html += resultRow('风机入口压力 P<sub>fx</sub>', data.Pfx.toFixed(6), 'MPa');
+    html += resultRow('风机出口风压 P<sub>h</sub>', data.Ph.toFixed(6), 'MPa');
+    html += resultRow('压比 ε', data.epsilon.toFixed(6), '-');
     
     // 风量相关结果
-    html += '<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">风量参数</td></tr>';
-    html += `<tr><td style="padding: 0.5rem;">高炉入炉风量 Q<sub>g</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Qg.toFixed(2)}</td><td style="padding: 0.5rem;">m³/h</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">风机出口风量1 Q<sub>2</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Q2.toFixed(2)}</td><td style="padding: 0.5rem;">m³/h</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">风机出口风量2 Q<sub>3</sub></td><td style="padding: 0.5rem; text-align: right;">${data.Q3.toFixed(2)}</td><td style="padding: 0.5rem;">m³/h</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">实际送风量 Q</td><td style="padding: 0.5rem; text-align: right;">${data.Q.toFixed(2)}</td><td style="padding: 0.5rem;">m³/min</td></tr>`;
+    html += resultSection('风量参数');
+    html += resultRow('高炉入炉风量 Q<sub>g</sub>', data.Qg.toFixed(2), 'm³/h');
+    html += resultRow('风机出口风量1 Q<sub>2</sub>', data.Q2.toFixed(2), 'm³/h');
+    html += resultRow('风机出口风量2 Q<sub>3</sub>', data.Q3.toFixed(2), 'm³/h');
+    html += resultRow('实际送风量 Q', data.Q.toFixed(2), 'm³/min');
     
     // 修正系数
-    html += '<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">修正系数</td></tr>';
-    html += `<tr><td style="padding: 0.5rem;">气压修正系数 K<sub>1</sub></td><td style="padding: 0.5rem; text-align: right;">${data.K1.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">气温修正系数 K<sub>2</sub></td><td style="padding: 0.5rem; text-align: right;">${data.K2.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">湿度修正系数 K<sub>3</sub></td><td style="padding: 0.5rem; text-align: right;">${data.K3.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">风量修正系数 K</td><td style="padding: 0.5rem; text-align: right;">${data.K.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
+    html += resultSection('修正系数');
+    html += resultRow('气压修正系数 K<sub>1</sub>', data.K1.toFixed(6), '-');
+    html += resultRow('气温修正系数 K<sub>2</sub>', data.K2.toFixed(6), '-');
+    html += resultRow('湿度修正系数 K<sub>3</sub>', data.K3.toFixed(6), '-');
+    html += resultRow('风量修正系数 K', data.K.toFixed(6), '-');
     
     // 功率
-    html += '<tr style="background: #ecf0f1;"><td colspan="3" style="padding: 0.5rem; font-weight: bold;">功率参数</td></tr>';
+    html += resultSection('功率参数');
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold;">鼓风机轴功率 N<sub>e</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c;">${data.Ne.toFixed(2)}</td><td style="padding: 0.5rem; font-weight: bold;">kW</td></tr>`;
     
     html += '</tbody></table>';
@@ -62,7 +62,7 @@ async function calculateCartDrivePower() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/cart-drive-power/calculate', 'POST', params);
+        const result = await calculateTool('cart-drive-power', params);
         if (result.extra) {
             if (result.extra.F !== undefined) {
                 document.getElementById('F_value').textContent = formatNumber(result.extra.F, 2);
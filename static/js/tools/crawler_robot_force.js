@@ -129,7 +129,7 @@ async function calculatePower() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.P1 !== undefined) {
                 document.getElementById('pc_P1_value').textContent = formatNumber(result.extra.P1, 2);
@@ -305,7 +305,7 @@ async function calculateTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.T1 !== undefined) {
                 document.getElementById('tc_T1_value').textContent = formatNumber(result.extra.T1, 4);
@@ -469,7 +469,7 @@ async function calculateAccelerationTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.T4 !== undefined) {
                 document.getElementById('atc_T4_value').textContent = formatNumber(result.extra.T4, 4);
@@ -642,7 +642,7 @@ async function calculateObstacle() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.T7 !== undefined) {
                 document.getElementById('oc_T7_value').textContent = formatNumber(result.extra.T7, 4);
@@ -843,7 +843,7 @@ async function calculateRotation() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.F1 !== undefined) {
                 document.getElementById('rc_F1_value').textContent = formatNumber(result.extra.F1, 2);
@@ -989,7 +989,7 @@ async function calculateReducerCheck() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra) {
             if (result.extra.T_gear_large_out !== undefined) {
                 document.getElementById('rch_T_gear_large_out_value').textContent = formatNumber(result.extra.T_gear_large_out, 4);
@@ -1097,7 +1097,7 @@ async function calculateSpeed() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/crawler-robot-force/calculate', 'POST', params);
+        const result = await calculateTool('crawler-robot-force', params);
         if (result.extra && result.extra.v_max_calc !== undefined) {
             document.getElementById('sc_v_max_calc_value').textContent = formatNumber(result.extra.v_max_calc, 4);
         }
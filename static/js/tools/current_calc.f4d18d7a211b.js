@@ -271,7 +271,7 @@ async function calculateThreePhaseMotor() {
     
     try {
         // 调用后端API：I = P / (√3 × U × η × cosφ)
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'three_phase_motor',
             power: power,
             voltage: voltage,
@@ -319,7 +319,7 @@ async function calculateResidential() {
     
     try {
         // 调用后端API
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'residential',
             total_power: totalPower,
             kc: kc,
@@ -398,7 +398,7 @@ async function calculateWireResistance() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('wr_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('wr_result_unit').textContent = result.unit;
         renderFormula('wr_result_formula', result.formula);
@@ -421,7 +421,7 @@ async function calculateBusbarResistance() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'busbar_resistance',
             conductivity: conductivity,
             area: area
@@ -500,7 +500,7 @@ async function calculateWireCurrent3Phase() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('wc3_result_value').textContent = formatNumber(result.result);
         document.getElementById('wc3_result_unit').textContent = result.unit;
         renderFormula('wc3_result_formula', result.formula);
@@ -574,7 +574,7 @@ async function calculateWireCurrent1Phase() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('wc1_result_value').textContent = formatNumber(result.result);
         document.getElementById('wc1_result_unit').textContent = result.unit;
         renderFormula('wc1_result_formula', result.formula);
@@ -627,7 +627,7 @@ async function calculateVoltageLoss() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('vl_result_value').textContent = formatNumber(result.result);
         document.getElementById('vl_result_unit').textContent = result.unit;
         renderFormula('vl_result_formula', result.formula);
@@ -669,7 +669,7 @@ async function calculateEnergyMeter() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'energy_meter_multiplier',
             kta: kta,
             ktae: ktae,
@@ -720,7 +720,7 @@ async function calculatePower3Phase() {
     
     try {
         // 调用后端API：P = √3 × U × I × cosφ × η
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'power_from_current_3phase',
             current: current,
             voltage: voltage,
@@ -764,7 +764,7 @@ async function calculatePower1Phase() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'power_from_current_1phase',
             current: current,
             voltage: voltage,
@@ -800,7 +800,7 @@ async function calculateAirConditionerHome() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'air_conditioner_home',
             area: area,
             unit_capacity: unitCapacity
@@ -873,7 +873,7 @@ async function calculateAirConditionerLarge() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'air_conditioner_large',
             k: k,
             q: q,
@@ -1051,7 +1051,7 @@ async function calculateVoltageLossEndLoad() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('vlel_result_value').textContent = formatNumber(result.result);
         document.getElementById('vlel_result_unit').textContent = result.unit;
         renderFormula('vlel_result_formula', result.formula);
@@ -1166,7 +1166,7 @@ async function calculateVoltageLossLineVoltage() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', params);
+        const result = await calculateTool('current-calc', params);
         document.getElementById('vllv_result_value').textContent = formatNumber(result.result);
         document.getElementById('vllv_result_unit').textContent = result.unit;
         renderFormula('vllv_result_formula', result.formula);
@@ -1213,7 +1213,7 @@ async function calculateVoltageLossPercentFormula() {
     }
     
     try {
-        const result = await apiRequest('/api/tools/current-calc/calculate', 'POST', {
+        const result = await calculateTool('current-calc', {
             scenario: 'voltage_loss_percent_formula',
             power: power,
             resistance: resistance,
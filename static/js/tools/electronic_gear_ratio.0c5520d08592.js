@@ -74,20 +74,7 @@ async function calculateMethod1() {
     
     try {
         // 发送API请求
-        const response = await fetch("/api/tools/electronic-gear-ratio/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json"
-            },
-            body: JSON.stringify(params)
-        });
-        
-        if (!response.ok) {
-            const errorData = await response.json();
-            throw new Error(errorData.detail || "计算失败");
-        }
-        
-        const result = await response.json();
+        const result = await calculateTool("electronic-gear-ratio", params);
         
         // 显示计算结果
         document.getElementById("m1_result_value").textContent = result.result.toFixed(6);
@@ -145,20 +132,7 @@ async function calculateMethod2() {
     
     try {
         // 发送API请求
-        const response = await fetch("/api/tools/electronic-gear-ratio/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json"
-            },
-            body: JSON.stringify(params)
-        });
-        
-        if (!response.ok) {
-            const errorData = await response.json();
-            throw new Error(errorData.detail || "计算失败");
-        }
-        
-        const result = await response.json();
+        const result = await calculateTool("electronic-gear-ratio", params);
         
         // 显示计算结果
         document.getElementById("m2_result_value").textContent = result.result.toFixed(6);
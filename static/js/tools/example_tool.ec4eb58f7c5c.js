@@ -43,7 +43,7 @@ if (example_toolForm) {
         }
 
         try {
-            const response = await apiRequest(example_toolEndpoint, "POST", payload);
+            const response = await apiRequest(example_toolEndpoint, "POST", payload, { channel: example_toolEndpoint });
             renderResult(example_toolResult, example_toolResultContent, response);
         } catch (error) {
             showError(error.message || "请求失败");
@@ -173,20 +173,7 @@ async function calculateFanPerformance() {
     
     try {
         // 4. 调用API
-        const response = await fetch('/api/tools/fan-performance/calculate', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify(params)
-        });
-        
-        if (!response.ok) {
-            const error = await response.json();
-            throw new Error(error.detail || '计算失败');
-        }
-        
-        const result = await response.json();
+        const result = await calculateTool('fan-performance', params);
         
         // 5. 显示结果
         displayResults(result);
@@ -184,20 +184,7 @@ async function calculateFanSelection() {
     
     try {
         // 调用API
-        const response = await fetch('/api/tools/fan-selection/calculate', {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify(params)
-        });
-        
-        if (!response.ok) {
-            const errorData = await response.json();
-            throw new Error(errorData.detail || '计算失败');
-        }
-        
-        const result = await response.json();
+        const result = await calculateTool('fan-selection', params);
         displayResult(result);
     } catch (error) {
         alert('计算错误: ' + error.message);
@@ -228,13 +215,13 @@ function displayResult(result) {
     html += '<table style="width: 100%; border-collapse: collapse; margin-bottom: 2rem;">';
     html += '<thead><tr style="background: #3498db; color: white;"><th style="padding: 0.75rem; text-align: left;">参数</th><th style="padding: 0.75rem; text-align: right;">数值</th><th style="padding: 0.75rem; text-align: left;">单位</th></tr></thead>';
     html += '<tbody>';
-    html += `<tr><td style="padding: 0.5rem;">当地大气压 P<sub>atm</sub></td><td style="padding: 0.5rem; text-align: right;">${data.P_atm.toFixed(2)}</td><td style="padding: 0.5rem;">Pa</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">工况密度 ρ<sub>working</sub></td><td style="padding: 0.5rem; text-align: right;">${data.rho_working.toFixed(6)}</td><td style="padding: 0.5rem;">kg/m³</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">压缩性系数 Z</td><td style="padding: 0.5rem; text-align: right;">${data.Z.toFixed(6)}</td><td style="padding: 0.5rem;">-</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">比转数 n<sub>s</sub></td><td style="padding: 0.5rem; text-align: right;">${data.ns.toFixed(2)}</td><td style="padding: 0.5rem;">-</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem;">线速度 u</td><td style="padding: 0.5rem; text-align: right;">${data.u.toFixed(2)}</td><td style="padding: 0.5rem;">m/s</td></tr>`;
+    html += resultRow('当地大气压 P<sub>atm</sub>', data.P_atm.toFixed(2), 'Pa');
+    html += resultRow('工况密度 ρ<sub>working</sub>', data.rho_working.toFixed(6), 'kg/m³');
+    html += resultRow('压缩性系数 Z', data.Z.toFixed(6), '-');
+    html += resultRow('比转数 n<sub>s</sub>', data.ns.toFixed(2), '-');
+    html += resultRow('线速度 u', data.u.toFixed(2), 'm/s');
     if (data.D_rough) {
-        html += `<tr><td style="padding: 0.5rem;">粗算叶轮直径 D<sub>rough</sub></td><td style="padding: 0.5rem; text-align: right;">${data.D_rough.toFixed(4)}</td><td style="padding: 0.5rem;">m</td></tr>`;
+        html += resultRow('粗算叶轮直径 D<sub>rough</sub>', data.D_rough.toFixed(4), 'm');
     }
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold;">选型结果</td><td style="padding: 0.5rem; text-align: right; font-weight: bold; color: #e74c3c;">${data.fan_model}</td><td style="padding: 0.5rem;"></td></tr>`;
     html += '</tbody></table>';
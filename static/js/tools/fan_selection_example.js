@@ -106,19 +106,7 @@ async function calculate() {
     
     try {
         // 调用API
-        const response = await fetch("/api/tools/fan-selection-example/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json",
-            },
-            body: JSON.stringify(params),
-        });
-        
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || "计算失败");
-        }
+        const data = await calculateTool("fan-selection-example", params);
         
         // 显示结果
         displayResult(data);
@@ -165,29 +153,29 @@ function displayResult(data) {
     html += `<tbody>`;
     
     // 燃烧空气量和烟气量
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">燃烧空气量和烟气量</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">燃烧空气量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>o</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vo.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">CO<sub>2</sub>和SO<sub>2</sub>产生量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>RO2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.VRO2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">含氮量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>N2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.VN2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">理论水蒸气含量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>H2Oo</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.VH2Oo.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">理论烟气量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>yo</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vyo.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">实际烟气量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>y</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vy.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Nm³/kg</td></tr>`;
+    html += resultTableSection("燃烧空气量和烟气量");
+    html += resultTableRow("燃烧空气量", "V<sub>o</sub>", result.Vo.toFixed(6), "Nm³/kg");
+    html += resultTableRow("CO<sub>2</sub>和SO<sub>2</sub>产生量", "V<sub>RO2</sub>", result.VRO2.toFixed(6), "Nm³/kg");
+    html += resultTableRow("含氮量", "V<sub>N2</sub>", result.VN2.toFixed(6), "Nm³/kg");
+    html += resultTableRow("理论水蒸气含量", "V<sub>H2Oo</sub>", result.VH2Oo.toFixed(6), "Nm³/kg");
+    html += resultTableRow("理论烟气量", "V<sub>yo</sub>", result.Vyo.toFixed(6), "Nm³/kg");
+    html += resultTableRow("实际烟气量", "V<sub>y</sub>", result.Vy.toFixed(6), "Nm³/kg");
     
     // 送风机风量
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">送风机风量</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">送风机总风量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>g</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vg.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">m³/h</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">一次风量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>g1</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vg_primary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">m³/h</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">二次风量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">V<sub>g2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Vg_secondary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">m³/h</td></tr>`;
+    html += resultTableSection("送风机风量");
+    html += resultTableRow("送风机总风量", "V<sub>g</sub>", result.Vg.toFixed(2), "m³/h");
+    html += resultTableRow("一次风量", "V<sub>g1</sub>", result.Vg_primary.toFixed(2), "m³/h");
+    html += resultTableRow("二次风量", "V<sub>g2</sub>", result.Vg_secondary.toFixed(2), "m³/h");
     
     // 送风机阻力
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">送风机阻力</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">一次风机阻力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">H<sub>g1</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Hg_primary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Pa</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">二次风机阻力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">H<sub>g2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Hg_secondary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">Pa</td></tr>`;
+    html += resultTableSection("送风机阻力");
+    html += resultTableRow("一次风机阻力", "H<sub>g1</sub>", result.Hg_primary.toFixed(2), "Pa");
+    html += resultTableRow("二次风机阻力", "H<sub>g2</sub>", result.Hg_secondary.toFixed(2), "Pa");
     
     // 电动机功率
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">电动机功率</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">一次风机电动机功率</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N<sub>g1</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Ng_primary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kW</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">二次风机电动机功率</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N<sub>g2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Ng_secondary.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kW</td></tr>`;
+    html += resultTableSection("电动机功率");
+    html += resultTableRow("一次风机电动机功率", "N<sub>g1</sub>", result.Ng_primary.toFixed(2), "kW");
+    html += resultTableRow("二次风机电动机功率", "N<sub>g2</sub>", result.Ng_secondary.toFixed(2), "kW");
     
     html += `</tbody></table>`;
     html += `</div>`;
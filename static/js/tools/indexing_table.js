@@ -69,7 +69,7 @@ async function calculateSpeedCurve() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         document.getElementById('sc_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('sc_result_unit').textContent = result.unit;
         renderFormula('sc_result_formula', result.formula);
@@ -143,7 +143,7 @@ async function calculateMotorSpeed() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         if (result.extra) {
             if (result.extra.betaG !== undefined) {
                 document.getElementById('ms_betaG_value').textContent = formatNumber(result.extra.betaG, 6);
@@ -174,7 +174,7 @@ async function calculateLoadTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         document.getElementById('lt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('lt_result_unit').textContent = result.unit;
         renderFormula('lt_result_formula', result.formula);
@@ -323,7 +323,7 @@ async function calculateAccelerationTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         if (result.extra) {
             if (result.extra.JT !== undefined) {
                 document.getElementById('at_JT_value').textContent = formatNumber(result.extra.JT, 6);
@@ -392,7 +392,7 @@ async function calculateRequiredTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         document.getElementById('rt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('rt_result_unit').textContent = result.unit;
         renderFormula('rt_result_formula', result.formula);
@@ -449,7 +449,7 @@ async function calculateInertiaRatio() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/indexing-table/calculate', 'POST', params);
+        const result = await calculateTool('indexing-table', params);
         document.getElementById('ir_result_value').textContent = formatNumber(result.result, 2);
         renderFormula('ir_result_formula', result.formula);
         
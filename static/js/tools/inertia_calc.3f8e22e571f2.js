@@ -81,7 +81,7 @@ async function calculateCylinderParallel() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('cp_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('cp_result_unit').textContent = result.unit;
         if (result.mass !== undefined) {
@@ -135,7 +135,7 @@ async function calculateCylinderPerpendicular() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('cperp_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('cperp_result_unit').textContent = result.unit;
         if (result.mass !== undefined) {
@@ -185,7 +185,7 @@ async function calculateRectangular() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('rect_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('rect_result_unit').textContent = result.unit;
         if (result.mass !== undefined) {
@@ -229,7 +229,7 @@ async function calculateDisk() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('disk_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('disk_result_unit').textContent = result.unit;
         if (result.mass !== undefined) {
@@ -265,7 +265,7 @@ async function calculateLinearMotion() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('lm_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('lm_result_unit').textContent = result.unit;
         renderFormula('lm_result_formula', result.formula);
@@ -304,7 +304,7 @@ async function calculateDirectInertia() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/inertia-calc/calculate', 'POST', params);
+        const result = await calculateTool('inertia-calc', params);
         document.getElementById('di_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('di_result_unit').textContent = result.unit;
         if (result.mass !== undefined) {
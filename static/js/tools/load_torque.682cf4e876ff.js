@@ -159,7 +159,7 @@ async function calculateBallScrew() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/load-torque/calculate', 'POST', params);
+        const result = await calculateTool('load-torque', params);
         
         if (result.extra && result.extra.F !== undefined) {
             document.getElementById('bs_F_value').textContent = formatNumber(result.extra.F, 10);
@@ -252,7 +252,7 @@ async function calculatePulley() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/load-torque/calculate', 'POST', params);
+        const result = await calculateTool('load-torque', params);
         
         document.getElementById('p_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('p_result_unit').textContent = result.unit;
@@ -366,7 +366,7 @@ async function calculateBeltGearRack() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/load-torque/calculate', 'POST', params);
+        const result = await calculateTool('load-torque', params);
         
         if (result.extra && result.extra.F !== undefined) {
             document.getElementById('bgr_F_value').textContent = formatNumber(result.extra.F, 10);
@@ -415,7 +415,7 @@ async function calculateTestMethod() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/load-torque/calculate', 'POST', params);
+        const result = await calculateTool('load-torque', params);
         
         document.getElementById('tm_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('tm_result_unit').textContent = result.unit;
@@ -110,7 +110,7 @@ async function calculateMotorStartupVoltage() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/motor-startup-voltage/calculate', 'POST', params);
+        const result = await calculateTool('motor-startup-voltage', params);
         if (result.extra && result.extra.Sdm !== undefined) {
             document.getElementById('Sdm_value').textContent = formatNumber(result.extra.Sdm, 2);
         }
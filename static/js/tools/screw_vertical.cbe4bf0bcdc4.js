@@ -58,7 +58,7 @@ async function calculateSpeedCurve() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         document.getElementById('sc_result_value').textContent = formatNumber(result.result, 4);
         document.getElementById('sc_result_unit').textContent = result.unit;
         renderFormula('sc_result_formula', result.formula);
@@ -91,7 +91,7 @@ async function calculateMotorSpeed() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         document.getElementById('ms_result_value').textContent = formatNumber(result.result, 2);
         document.getElementById('ms_result_unit').textContent = result.unit;
         renderFormula('ms_result_formula', result.formula);
@@ -144,7 +144,7 @@ async function calculateLoadTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         // 解析结果，可能包含F和TL
         if (result.extra && result.extra.F) {
             document.getElementById('lt_F_value').textContent = formatNumber(result.extra.F, 4);
@@ -223,7 +223,7 @@ async function calculateAccelerationTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         // 解析结果，可能包含多个值
         if (result.extra) {
             if (result.extra.JL1 !== undefined) {
@@ -277,7 +277,7 @@ async function calculateRequiredTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         document.getElementById('rt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('rt_result_unit').textContent = result.unit;
         renderFormula('rt_result_formula', result.formula);
@@ -323,7 +323,7 @@ async function calculateInertiaRatioMotor() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         document.getElementById('irm_result_value').textContent = formatNumber(result.result, 2);
         renderFormula('irm_result_formula', result.formula);
         
@@ -411,7 +411,7 @@ async function calculateInertiaRatioReducer() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/screw-vertical/calculate', 'POST', params);
+        const result = await calculateTool('screw-vertical', params);
         document.getElementById('irr_result_value').textContent = formatNumber(result.result, 2);
         renderFormula('irr_result_formula', result.formula);
         document.getElementById('irr_result').style.display = 'block';
@@ -71,19 +71,7 @@ async function calculate() {
     
     try {
         // 调用API
-        const response = await fetch("/api/tools/servo-motor-inertia/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json",
-            },
-            body: JSON.stringify(params),
-        });
-        
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || "计算失败");
-        }
+        const data = await calculateTool("servo-motor-inertia", params);
         
         // 显示结果
         displayResult(data);
@@ -130,46 +118,46 @@ function displayResult(data) {
     html += `<tbody>`;
     
     // 快速移动时
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">快速移动时</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">加速力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>a</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Fa.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">摩擦力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>f</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Ff.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">合力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>total</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.F_total.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">齿轮最高转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">n<sub>1</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.n1.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rpm</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">齿轮角加速度</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">β<sub>G</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.beta_G.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rad/s²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">合力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>req</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Treq.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">减速机输入端的加速力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.T2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机最大转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">n<sub>2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.n2.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rpm</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机角加速度</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">β<sub>m</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.beta_m.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rad/s²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机克服自身惯量加速的力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>m</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tm.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
+    html += resultTableSection("快速移动时");
+    html += resultTableRow("加速力", "F<sub>a</sub>", result.Fa.toFixed(2), "N");
+    html += resultTableRow("摩擦力", "F<sub>f</sub>", result.Ff.toFixed(2), "N");
+    html += resultTableRow("合力", "F<sub>total</sub>", result.F_total.toFixed(2), "N");
+    html += resultTableRow("齿轮最高转速", "n<sub>1</sub>", result.n1.toFixed(2), "rpm");
+    html += resultTableRow("齿轮角加速度", "β<sub>G</sub>", result.beta_G.toFixed(6), "rad/s²");
+    html += resultTableRow("合力矩", "T<sub>req</sub>", result.Treq.toFixed(6), "N·m");
+    html += resultTableRow("减速机输入端的加速力矩", "T<sub>2</sub>", result.T2.toFixed(6), "N·m");
+    html += resultTableRow("电机最大转速", "n<sub>2</sub>", result.n2.toFixed(2), "rpm");
+    html += resultTableRow("电机角加速度", "β<sub>m</sub>", result.beta_m.toFixed(6), "rad/s²");
+    html += resultTableRow("电机克服自身惯量加速的力矩", "T<sub>m</sub>", result.Tm.toFixed(6), "N·m");
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">电机在加速时总的输出力矩</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>m1</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Tm1.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;
     
     // 切削时（如果有）
     if (result.Fc !== undefined) {
-        html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">切削时</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">切削抗力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>c</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Fc.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">合力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>cut</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.F_cut.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>c</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tc.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机输出端的额定力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>3</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.T3.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
+        html += resultTableSection("切削时");
+        html += resultTableRow("切削抗力", "F<sub>c</sub>", result.Fc.toFixed(2), "N");
+        html += resultTableRow("合力", "F<sub>cut</sub>", result.F_cut.toFixed(2), "N");
+        html += resultTableRow("力矩", "T<sub>c</sub>", result.Tc.toFixed(6), "N·m");
+        html += resultTableRow("电机输出端的额定力矩", "T<sub>3</sub>", result.T3.toFixed(6), "N·m");
         if (result.n_cut !== undefined) {
-            html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">对应的齿轮转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">n<sub>cut</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.n_cut.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rpm</td></tr>`;
-            html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">n<sub>motor_cut</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.n_motor_cut.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rpm</td></tr>`;
+            html += resultTableRow("对应的齿轮转速", "n<sub>cut</sub>", result.n_cut.toFixed(2), "rpm");
+            html += resultTableRow("电机转速", "n<sub>motor_cut</sub>", result.n_motor_cut.toFixed(2), "rpm");
         }
     }
     
     // 侧倾力矩
     if (result.F2rmax !== undefined) {
-        html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">侧倾力矩计算</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">最大水平切向力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>tangential</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.F_tangential.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">最大径向力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>2rmax</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.F2rmax.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">最大轴向力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>2amax</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.F2amax.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-        html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">侧倾力矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">M<sub>2Kmax</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.M2Kmax.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
+        html += resultTableSection("侧倾力矩计算");
+        html += resultTableRow("最大水平切向力", "F<sub>tangential</sub>", result.F_tangential.toFixed(2), "N");
+        html += resultTableRow("最大径向力", "F<sub>2rmax</sub>", result.F2rmax.toFixed(2), "N");
+        html += resultTableRow("最大轴向力", "F<sub>2amax</sub>", result.F2amax.toFixed(2), "N");
+        html += resultTableRow("侧倾力矩", "M<sub>2Kmax</sub>", result.M2Kmax.toFixed(6), "N·m");
     }
     
     // 惯量匹配
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">惯量匹配</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">负载惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>L</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.JL.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">折算到减速机输入端的惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>1</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.J1.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">折算到电机输出端的惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.J2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
+    html += resultTableSection("惯量匹配");
+    html += resultTableRow("负载惯量", "J<sub>L</sub>", result.JL.toFixed(6), "kg·m²");
+    html += resultTableRow("折算到减速机输入端的惯量", "J<sub>1</sub>", result.J1.toFixed(6), "kg·m²");
+    html += resultTableRow("折算到电机输出端的惯量", "J<sub>2</sub>", result.J2.toFixed(6), "kg·m²");
     html += `<tr style="background: ${result.lambda_inertia > 10 ? '#ffebee' : '#e8f5e9'};"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">惯量匹配值</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">λ</td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: ${result.lambda_inertia > 10 ? '#e74c3c' : '#27ae60'}; border: 1px solid #bdc3c7;">${result.lambda_inertia.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">-</td></tr>`;
     if (result.lambda_inertia > 10) {
         html += `<tr><td colspan="4" style="padding: 0.5rem; color: #e74c3c; border: 1px solid #bdc3c7;">⚠ 警告: 惯量匹配值λ > 10，建议重新选型</td></tr>`;
@@ -76,19 +76,7 @@ async function calculateServoMotorParams() {
     }
     
     try {
-        const response = await fetch("/api/tools/servo-motor-params/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json",
-            },
-            body: JSON.stringify(params),
-        });
-        
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || "计算失败");
-        }
+        const data = await calculateTool("servo-motor-params", params);
         
         displayResult(data);
     } catch (error) {
@@ -133,22 +121,22 @@ function displayResult(data) {
     html += `</tr></thead>`;
     html += `<tbody>`;
     
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">电机选型变量</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机一转移动量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">P</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.P.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">m/rev</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机最大转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.N}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rev/min</td></tr>`;
+    html += resultTableSection("电机选型变量");
+    html += resultTableRow("电机一转移动量", "P", result.P.toFixed(6), "m/rev");
+    html += resultTableRow("电机最大转速", "N", result.N, "rev/min");
     
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">惯量</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">质量折算惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>11</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.J11.toFixed(5)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">丝杠折算惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>12</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.J12.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">其他惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>13</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.J13.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
+    html += resultTableSection("惯量");
+    html += resultTableRow("质量折算惯量", "J<sub>11</sub>", result.J11.toFixed(5), "kg·m²");
+    html += resultTableRow("丝杠折算惯量", "J<sub>12</sub>", result.J12.toFixed(4), "kg·m²");
+    html += resultTableRow("其他惯量", "J<sub>13</sub>", result.J13.toFixed(4), "kg·m²");
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">负载惯量</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">J<sub>1</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.J1.toFixed(5)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
     
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">扭矩</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">摩擦扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>f</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tf.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">重力扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>g</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tg.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">空载扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>m</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tm.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">切削扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>c</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tc.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">负载扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>mc</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Tmc.toFixed(4)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
+    html += resultTableSection("扭矩");
+    html += resultTableRow("摩擦扭矩", "T<sub>f</sub>", result.Tf.toFixed(4), "N·m");
+    html += resultTableRow("重力扭矩", "T<sub>g</sub>", result.Tg.toFixed(4), "N·m");
+    html += resultTableRow("空载扭矩", "T<sub>m</sub>", result.Tm.toFixed(4), "N·m");
+    html += resultTableRow("切削扭矩", "T<sub>c</sub>", result.Tc.toFixed(4), "N·m");
+    html += resultTableRow("负载扭矩", "T<sub>mc</sub>", result.Tmc.toFixed(4), "N·m");
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">加速扭矩</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>max</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Tmax.toFixed(4)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;
     
     html += `</tbody></table>`;
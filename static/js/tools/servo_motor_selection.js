@@ -52,19 +52,7 @@ async function calculateLinearMotor() {
     }
     
     try {
-        const response = await fetch("/api/tools/servo-motor-selection/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json",
-            },
-            body: JSON.stringify(params),
-        });
-        
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || "计算失败");
-        }
+        const data = await calculateTool("servo-motor-selection", params);
         
         displayLinearResult(data);
     } catch (error) {
@@ -109,13 +97,13 @@ function displayLinearResult(data) {
     html += `</tr></thead>`;
     html += `<tbody>`;
     
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">加减速阶段推力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>a</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Fa.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">匀速阶段推力</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">F<sub>v</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Fv.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">加减速时间</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">t<sub>1</sub>=t<sub>3</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.t1.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">s</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">匀速运动时间</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">t<sub>2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.t2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">s</td></tr>`;
+    html += resultTableRow("加减速阶段推力", "F<sub>a</sub>", result.Fa.toFixed(2), "N");
+    html += resultTableRow("匀速阶段推力", "F<sub>v</sub>", result.Fv.toFixed(2), "N");
+    html += resultTableRow("加减速时间", "t<sub>1</sub>=t<sub>3</sub>", result.t1.toFixed(6), "s");
+    html += resultTableRow("匀速运动时间", "t<sub>2</sub>", result.t2.toFixed(6), "s");
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">峰值推力（大于该值）</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">F<sub>p</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Fp.toFixed(2)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N</td></tr>`;
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">有效推力（大于该值）</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">F<sub>c</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Fc.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">反电势常数（小于该值）</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">K<sub>e</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Ke.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">-</td></tr>`;
+    html += resultTableRow("反电势常数（小于该值）", "K<sub>e</sub>", result.Ke.toFixed(2), "-");
     
     html += `</tbody></table>`;
     html += `</div>`;
@@ -153,19 +141,7 @@ async function calculateRotaryMotor() {
     }
     
     try {
-        const response = await fetch("/api/tools/servo-motor-selection/calculate", {
-            method: "POST",
-            headers: {
-                "Content-Type": "application/json",
-            },
-            body: JSON.stringify(params),
-        });
-        
-        const data = await response.json();
-        
-        if (!response.ok) {
-            throw new Error(data.detail || "计算失败");
-        }
+        const data = await calculateTool("servo-motor-selection", params);
         
         displayRotaryResult(data);
     } catch (error) {
@@ -210,21 +186,21 @@ function displayRotaryResult(data) {
     html += `</tr></thead>`;
     html += `<tbody>`;
     
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">惯量和转速</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">工作台转动惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>a</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Ja.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">丝杆转动惯量</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>b</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.Jb.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">kg·m²</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">电机转速</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N</td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.N.toFixed(2)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">rpm</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">加减速时间</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">t<sub>1</sub>=t<sub>3</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.t1.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">s</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">匀速移动时间</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">t<sub>2</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.t2.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">s</td></tr>`;
-    
-    html += `<tr><td colspan="4" style="padding: 0.5rem; background: #ecf0f1; font-weight: bold; border: 1px solid #bdc3c7;">扭矩</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">加速扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>A</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.TA.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">匀速扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>B</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.TB.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">减速扭矩</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">T<sub>C</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.TC.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">N·m</td></tr>`;
+    html += resultTableSection("惯量和转速");
+    html += resultTableRow("工作台转动惯量", "J<sub>a</sub>", result.Ja.toFixed(6), "kg·m²");
+    html += resultTableRow("丝杆转动惯量", "J<sub>b</sub>", result.Jb.toFixed(6), "kg·m²");
+    html += resultTableRow("电机转速", "N", result.N.toFixed(2), "rpm");
+    html += resultTableRow("加减速时间", "t<sub>1</sub>=t<sub>3</sub>", result.t1.toFixed(6), "s");
+    html += resultTableRow("匀速移动时间", "t<sub>2</sub>", result.t2.toFixed(6), "s");
+    
+    html += resultTableSection("扭矩");
+    html += resultTableRow("加速扭矩", "T<sub>A</sub>", result.TA.toFixed(6), "N·m");
+    html += resultTableRow("匀速扭矩", "T<sub>B</sub>", result.TB.toFixed(6), "N·m");
+    html += resultTableRow("减速扭矩", "T<sub>C</sub>", result.TC.toFixed(6), "N·m");
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">峰值扭矩（大于该值）</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>max</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Tmax.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">时效扭矩（大于该值）</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>rmsx</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Trmsx.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;
     html += `<tr style="background: #fff3cd;"><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">额定扭矩（大于该值）</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">T<sub>f</sub></td><td style="padding: 0.5rem; text-align: right; font-weight: bold; font-size: 1.1em; color: #e74c3c; border: 1px solid #bdc3c7;">${result.Tf.toFixed(6)}</td><td style="padding: 0.5rem; font-weight: bold; border: 1px solid #bdc3c7;">N·m</td></tr>`;
-    html += `<tr><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">转子惯量（大于该值）</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">J<sub>A</sub></td><td style="padding: 0.5rem; text-align: right; border: 1px solid #bdc3c7;">${result.JA.toFixed(6)}</td><td style="padding: 0.5rem; border: 1px solid #bdc3c7;">×10⁻⁴ kg·m²</td></tr>`;
+    html += resultTableRow("转子惯量（大于该值）", "J<sub>A</sub>", result.JA.toFixed(6), "×10⁻⁴ kg·m²");
     
     html += `</tbody></table>`;
     html += `</div>`;
@@ -110,7 +110,7 @@ async function calculate() {
     
     // 调用API
     try {
-        const result = await apiRequest('/api/tools/servo-motor-selection-example/calculate', 'POST', params);
+        const result = await calculateTool('servo-motor-selection-example', params);
         
         // 显示结果
         document.getElementById('result_value').textContent = formatNumber(result.result, 6);
@@ -79,7 +79,7 @@ async function calculateBallScrew() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/stepper-motor-inertia/calculate', 'POST', params);
+        const result = await calculateTool('stepper-motor-inertia', params);
         
         document.getElementById('bs_result_value').textContent = formatNumber(result.result, 10);
         document.getElementById('bs_result_unit').textContent = result.unit;
@@ -137,7 +137,7 @@ async function calculateRackPinion() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/stepper-motor-inertia/calculate', 'POST', params);
+        const result = await calculateTool('stepper-motor-inertia', params);
         
         document.getElementById('rp_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('rp_result_unit').textContent = result.unit;
@@ -207,7 +207,7 @@ async function calculateTurntable() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/stepper-motor-inertia/calculate', 'POST', params);
+        const result = await calculateTool('stepper-motor-inertia', params);
         
         document.getElementById('tt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('tt_result_unit').textContent = result.unit;
@@ -253,7 +253,7 @@ async function calculateAngularAcceleration() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/stepper-motor-inertia/calculate', 'POST', params);
+        const result = await calculateTool('stepper-motor-inertia', params);
         
         document.getElementById('aa_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('aa_result_unit').textContent = result.unit;
@@ -319,7 +319,7 @@ async function calculateMotorTorque() {
     };
     
     try {
-        const result = await apiRequest('/api/tools/stepper-motor-inertia/calculate', 'POST', params);
+        const result = await calculateTool('stepper-motor-inertia', params);
         
         document.getElementById('mt_result_value').textContent = formatNumber(result.result, 6);
         document.getElementById('mt_result_unit').textContent = result.unit;
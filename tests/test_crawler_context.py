@@ -0,0 +1,46 @@
+"""
+履带机器人计算上下文：共享通用参数块的结果与逐场景重新解析一致，且接口路径复用上下文
+"""
+import pytest
+
+from app.services.crawler_robot_force_calculator import CrawlerEvaluationContext, CrawlerRobotForceCalculator
+
+BASE_PARAMS = {"m1": 50, "m2": 50, "D": 120, "slope_percent": 55, "obstacle_height": 80,
+               "T_gear_large": 60, "T_gear_small": 40}
+
+
+def test_calculate_all_matches_per_scenario_methods():
+    calculator = CrawlerRobotForceCalculator(CrawlerEvaluationContext())
+    results = calculator.calculate_all(BASE_PARAMS)
+    assert set(results) == set(calculator.SCENARIO_METHODS)
+    for scenario, method_name in calculator.SCENARIO_METHODS.items():
+        assert results[scenario] == getattr(calculator, method_name)(BASE_PARAMS)
+
+
+def test_calculate_reuses_context_across_calculators():
+    context = CrawlerEvaluationContext()
+    for scenario in CrawlerRobotForceCalculator.SCENARIO_METHODS:
+        CrawlerRobotForceCalculator(context).calculate(scenario, dict(BASE_PARAMS))
+    assert (context.misses, context.hits) == (1, len(CrawlerRobotForceCalculator.SCENARIO_METHODS) - 1)
+
+
+def test_batch_rows_differing_in_run_inputs_share_vehicle_block():
+    context = CrawlerEvaluationContext()
+    calculator = CrawlerRobotForceCalculator(context)
+    rows = [dict(BASE_PARAMS, a=0.1 + 0.05 * i, I_actual=6 + i, v_rated=0.3 + 0.02 * i) for i in range(6)]
+    results = calculator.calculate_batch(rows)
+    assert (context.misses, context.hits) == (1, len(rows) - 1)
+    for row, row_results in zip(rows, results):
+        for scenario, method_name in calculator.SCENARIO_METHODS.items():
+            assert row_results[scenario] == getattr(calculator, method_name)(row)
+
+
+def test_empty_scenario_list_computes_nothing():
+    calculator = CrawlerRobotForceCalculator(CrawlerEvaluationContext())
+    assert calculator.calculate_all(BASE_PARAMS, []) == {}
+    assert calculator.calculate_batch([BASE_PARAMS, BASE_PARAMS], scenarios=[]) == [{}, {}]
+
+
+def test_unknown_scenario_raises_value_error():
+    with pytest.raises(ValueError):
+        CrawlerRobotForceCalculator(CrawlerEvaluationContext()).calculate("no_such_scenario", BASE_PARAMS)
@@ -0,0 +1,28 @@
+"""
+浏览器端计算函数交叉验证（scripts/crosscheck_client_evaluators.py）的固定种子小样本版本，需要 Node.js
+"""
+import asyncio
+import json
+import shutil
+
+import pytest
+
+from app.services.client_evaluators import render_client_evaluators
+from scripts.crosscheck_client_evaluators import TOOL_SPECS, crosscheck, generate_cases, run_node
+
+pytestmark = [
+    pytest.mark.skipif(shutil.which("node") is None, reason="需要 Node.js"),
+    # 每个请求都会经过兼容 Pydantic v1 的 payload.dict()
+    pytest.mark.filterwarnings("ignore:The `dict` method is deprecated"),
+]
+
+
+def test_client_evaluators_match_server():
+    scripts = {spec.id: render_client_evaluators(spec) for spec in TOOL_SPECS}
+    cases = generate_cases(TOOL_SPECS, 150, 11)
+    outputs = run_node(scripts, cases)
+    assert len(outputs) == len(cases)
+    # 既有浏览器端算出的用例，也有回退到服务器的用例
+    local = [json.loads(output["local"]) is not None for output in outputs]
+    assert any(local) and not all(local)
+    assert asyncio.run(crosscheck(cases, outputs)) == 0
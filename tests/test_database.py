@@ -0,0 +1,38 @@
+"""
+数据库初始化：纳入版本管理的种子库保持回滚日志模式，运行时副本从种子库复制并切换为 WAL
+"""
+import sqlite3
+
+from app.db import database
+
+
+def journal_mode(path) -> str:
+    with sqlite3.connect(str(path)) as conn:
+        return conn.execute("PRAGMA journal_mode").fetchone()[0]
+
+
+def test_seed_database_is_left_in_rollback_mode(tmp_path, monkeypatch):
+    seed = tmp_path / "fan_database.db"
+    seed.write_bytes(database.SEED_DB_PATH.read_bytes())
+    monkeypatch.setattr(database, "SEED_DB_PATH", seed)
+    monkeypatch.setattr(database, "DB_PATH", seed)
+
+    before = seed.read_bytes()
+    database.init_db()
+    assert seed.read_bytes() == before
+    assert journal_mode(seed) == "delete"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fan_database.db"]
+
+
+def test_runtime_copy_uses_wal(tmp_path, monkeypatch):
+    runtime = tmp_path / "runtime" / "fan_database.db"
+    monkeypatch.setattr(database, "DB_PATH", runtime)
+
+    database.init_db()
+    assert journal_mode(runtime) == "wal"
+    assert journal_mode(database.SEED_DB_PATH) == "delete"
+    assert database.get_all_fan_types() == sorted(
+        row[0] for row in sqlite3.connect(str(database.SEED_DB_PATH)).execute(
+            "SELECT DISTINCT fan_type FROM fan_performance")
+    )
+    database.close_connections()
@@ -0,0 +1,14 @@
+"""
+计算器随机差分测试（scripts/diff_test_calculators.py）的固定种子小样本版本
+"""
+from scripts.diff_test_calculators import ANALYTIC_REFERENCES, failed_scenarios, run_diff
+
+
+def test_calculators_match_independent_references():
+    results, skipped, _ = run_diff(samples=300, seed=7, workers=1)
+    assert skipped == []
+    assert failed_scenarios(results) == []
+    covered = {(tool_id, scenario_id) for tool_id, scenario_id, _ in results}
+    for tool_id, scenarios in ANALYTIC_REFERENCES.items():
+        assert {(tool_id, scenario_id) for scenario_id in scenarios} <= covered
+    assert all(stats["calc_errors"] == 0 for stats in results.values())
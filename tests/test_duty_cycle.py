@@ -0,0 +1,85 @@
+"""
+工作周期引擎：与伺服选型原有的 Fc/Trmsx 闭式公式、逐周期 Python 循环逐项对比，并检查参数校验
+"""
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app.services.duty_cycle import evaluate_duty_cycles, pack_segments, rms_value
+from app.services.servo_motor_selection_calculator import ServoMotorSelectionCalculator
+
+
+def _cases(count: int = 2000):
+    rng = random.Random(26)
+    for _ in range(count):
+        t1 = 10 ** rng.uniform(-4, 2)
+        t2 = rng.choice([0.0, 10 ** rng.uniform(-4, 2)])
+        loads = [rng.uniform(-1e4, 1e4) * rng.choice([1, 1e-3]) for _ in range(3)]
+        yield t1, t2, loads
+
+
+def test_fc_matches_closed_form():
+    """直线电机有效推力 Fc = √((Fa²·t1 + Fv²·t2 + Fa²·t1)/(t1+t1+t2)) × 1.2"""
+    for t1, t2, (Fa, Fv, _) in _cases():
+        expected = math.sqrt((Fa * Fa * t1 + Fv * Fv * t2 + Fa * Fa * t1) / (t1 + t1 + t2)) * 1.2
+        assert rms_value([t1, t2, t1], [Fa, Fv, Fa], safety_factor=1.2) == pytest.approx(expected, rel=1e-12)
+
+
+def test_trmsx_matches_closed_form():
+    """旋转电机时效扭矩 Trmsx = √((TA²·t1 + TB²·t2 + TC²·t1)/(t1+t1+t2))"""
+    for t1, t2, (TA, TB, TC) in _cases():
+        expected = math.sqrt((TA * TA * t1 + TB * TB * t2 + TC * TC * t1) / (t1 + t1 + t2))
+        assert rms_value([t1, t2, t1], [TA, TB, TC]) == pytest.approx(expected, rel=1e-12)
+
+
+def test_batch_matches_python_loop():
+    rng = np.random.default_rng(26)
+    times = rng.uniform(0.01, 2.0, size=(500, 12))
+    loads = rng.uniform(-50.0, 50.0, size=(500, 12))
+    speeds = rng.uniform(-3000.0, 3000.0, size=(500, 12))
+    result = evaluate_duty_cycles(times, loads, speeds=speeds, rated=40.0, peak_limit=60.0, safety_factor=1.1)
+    for index, (t_row, f_row, v_row) in enumerate(zip(times.tolist(), loads.tolist(), speeds.tolist())):
+        total = sum(t_row)
+        rms = math.sqrt(sum(f * f * t for f, t in zip(f_row, t_row)) / total) * 1.1
+        peak = max(abs(f) for f in f_row) * 1.1
+        assert result.cycle_time[index] == pytest.approx(total, rel=1e-12)
+        assert result.rms[index] == pytest.approx(rms, rel=1e-12)
+        assert result.peak[index] == pytest.approx(peak, rel=1e-12)
+        assert result.average_speed[index] == pytest.approx(
+            sum(abs(v) * t for v, t in zip(v_row, t_row)) / total, rel=1e-12
+        )
+        assert result.thermal_margin[index] == pytest.approx(1 - rms / 40.0, rel=1e-9, abs=1e-12)
+        assert result.peak_margin[index] == pytest.approx(1 - peak / 60.0, rel=1e-9, abs=1e-12)
+
+
+def test_padded_segments_do_not_change_results():
+    packed = pack_segments([[(1.0, 0, 3.0)], [(0.5, 1, -4.0), (1.5, 2, 2.0), (1.0, 0, 1.0)]])
+    result = evaluate_duty_cycles(packed["times"], packed["loads"], speeds=packed["speeds"])
+    assert result.rms[0] == pytest.approx(3.0)
+    assert result.peak[0] == pytest.approx(3.0)
+    assert result.rms[1] == pytest.approx(rms_value([0.5, 1.5, 1.0], [-4.0, 2.0, 1.0]))
+
+
+@pytest.mark.parametrize("safety_factor", ["1.2", None, True, 0, -1.0, float("nan"), float("inf"), [1.2]])
+def test_invalid_safety_factor_is_value_error(safety_factor):
+    with pytest.raises(ValueError):
+        evaluate_duty_cycles([1.0, 2.0], [3.0, 4.0], safety_factor=safety_factor)
+
+
+def test_duty_cycle_scenario_rejects_bad_input_with_value_error():
+    calculator = ServoMotorSelectionCalculator()
+    segments = [{"t": 0.1, "v": 1.0, "F": 20.0}, {"t": 0.3, "v": 1.0, "F": 5.0}]
+    for params in (
+        {"segments": segments, "safety_factor": "abc"},
+        {"segments": segments, "safety_factor": 0},
+        {"segments": segments, "rated": "abc"},
+        {"segments": [1, 2, 3]},
+        {"segments": [{"t": "x", "F": 1}]},
+    ):
+        with pytest.raises(ValueError):
+            calculator.calculate("duty_cycle", params)
+
+    response = calculator.calculate("duty_cycle", {"segments": segments, "safety_factor": 1.5, "rated": 30})
+    assert response.result["rms"] == pytest.approx(round(rms_value([0.1, 0.3], [20.0, 5.0], 1.5), 6))
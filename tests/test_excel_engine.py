@@ -0,0 +1,84 @@
+"""
+Excel 公式引擎：错误值传播，以及 .xls 公式的还原（与 Excel 保存的计算结果对照）
+"""
+import math
+
+import pytest
+from openpyxl import Workbook
+
+from app.services.excel_engine import CellError, load_workbook_model
+
+XLS_WORKBOOK = "data/非标设计计算标准集合.xls"
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet["A1"] = 2
+    sheet["A2"] = "=1+#N/A"
+    sheet["A3"] = "=IF(A1>0,#DIV/0!,1)"
+    sheet["A4"] = "=IFERROR(#N/A,5)"
+    sheet["A5"] = "=A2*2"
+    sheet["A6"] = "=IF(AND(A1>0,A1<10),1,0)"
+    sheet["A7"] = "=A1^(1/3)"
+    sheet["A8"] = "=POWER(A1,-1)"
+    sheet["A9"] = "=IFERROR(A1^0.5,-1)"
+    path = tmp_path / "errors.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_error_literals_propagate_unchanged(workbook_path):
+    model = load_workbook_model(workbook_path, cache_dir=None)
+    assert model.get("A2") == CellError("#N/A")
+    assert model.get("A3") == CellError("#DIV/0!")
+    assert model.get("A4") == 5
+    assert model.get("A5") == CellError("#N/A")
+    model.set_inputs({"A1": -1})
+    assert model.get("A3") == 1
+
+
+def test_and_or_evaluate(workbook_path):
+    model = load_workbook_model(workbook_path, cache_dir=None)
+    assert model.get("A6") == 1
+    model.set_inputs({"A1": 20})
+    assert model.get("A6") == 0
+
+
+def test_power_of_negative_base_is_num_error(workbook_path):
+    model = load_workbook_model(workbook_path, cache_dir=None)
+    assert model.get("A7") == pytest.approx(2 ** (1 / 3))
+    model.set_inputs({"A1": -8})
+    assert model.get("A7") == CellError("#NUM!")
+    assert model.get("A8") == pytest.approx(-0.125)
+    assert model.get("A9") == -1
+    model.set_inputs({"A1": 0})
+    assert model.get("A8") == CellError("#DIV/0!")
+
+
+def test_xls_formulas_match_saved_results():
+    xlrd = pytest.importorskip("xlrd")
+    sheet_name = "伺服电机选型自动版"
+    model = load_workbook_model(XLS_WORKBOOK, sheets=[sheet_name], cache_dir=None)
+    assert len(model.formulas) > 20
+    model.recalculate()
+
+    sheet = xlrd.open_workbook(XLS_WORKBOOK, on_demand=True).sheet_by_name(sheet_name)
+    compared = 0
+    for ref in model.sources:
+        cell = model.values[ref]
+        row, col = _coordinate(ref)
+        saved = sheet.cell(row, col)
+        if saved.ctype == xlrd.XL_CELL_NUMBER:
+            assert math.isclose(cell, saved.value, rel_tol=1e-9, abs_tol=1e-12), ref
+            compared += 1
+    assert compared > 20
+
+
+def _coordinate(ref):
+    from openpyxl.utils.cell import coordinate_to_tuple
+
+    row, col = coordinate_to_tuple(ref.rsplit("!", 1)[1])
+    return row - 1, col - 1
@@ -0,0 +1,71 @@
+"""
+风机型号搜索：全压与风机选型计算使用同一修正，包络筛选一次查询完成且不漏掉可行方案
+"""
+import sqlite3
+
+import pytest
+
+from app.db import database, fan_store
+from app.db.fan_envelope import FAN_SIZES, FAN_SPEEDS, SUCTION_FACTORS, flow_factor
+from app.services.fan_selection_calculator import FanSelectionCalculator
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    """种子库的运行时副本，另加一条与 4-68 曲线相同的 BB24"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "fan_database.db")
+    monkeypatch.setattr(fan_store, "_store", None)
+    database.init_db()
+    with sqlite3.connect(str(database.SEED_DB_PATH)) as seed:
+        rows = seed.execute(
+            "SELECT point_index, phi, psi_p, eta FROM fan_performance WHERE fan_type = '4-68'"
+        ).fetchall()
+    database.bulk_insert_fan_performance([("BB24", *row) for row in rows])
+    yield
+    database.close_connections()
+    fan_store.get_fan_curve_store().close()
+
+
+def search(**params):
+    return FanSelectionCalculator().calculate("fan_search", {"T": 20, **params}).result
+
+
+def test_search_pressure_matches_fan_selection(catalog):
+    Q = 0.22 * flow_factor(0.8, 1450)
+    result = search(Q=Q, P=1800)
+    matches = {match["fan_type"]: match for match in result["matches"]}
+    assert set(matches) == {"4-68", "BB24"}
+    assert matches["BB24"]["P_available"] == pytest.approx(
+        matches["4-68"]["P_available"] * 0.9784 / result["Z"], abs=0.02)
+
+    for fan_type, match in matches.items():
+        point = {"phi": match["phi"], "psi_p": match["psi_p"], "eta": match["eta"]}
+        selection = FanSelectionCalculator().calculate("fan_selection", {
+            "Q": Q, "P": 1800, "T": 20, "n": match["n"], "D": match["D"], "fan_type": fan_type,
+            "performance_points": [point],
+        }).result
+        assert selection["Z"] == pytest.approx(result["Z"], abs=1e-6)
+        assert selection["performance_points"][0]["全压"] == pytest.approx(match["P_available"], rel=1e-3)
+
+
+def test_candidates_use_one_query_and_cover_all_feasible_points(catalog):
+    statements = []
+    database.get_read_connection().set_trace_callback(statements.append)
+    Q, P, margin = 0.2 * flow_factor(0.9, 960), 1050, 0.15
+    result = search(Q=Q, P=P, pressure_margin=margin, limit=1000)
+    # 忽略 R-tree 模块内部对影子表的读取
+    assert len([sql for sql in statements if "'main'." not in sql]) == 1
+
+    # 不经索引逐个型号 × 机号 × 转速校核，可行方案必须全部出现在搜索结果中
+    calculator = FanSelectionCalculator()
+    rho, Z = result["rho_working"], result["Z"]
+    expected = set()
+    for fan_type in ("4-68", "BB24"):
+        curve = fan_store.get_fan_curve(fan_type)
+        for size_no in FAN_SIZES:
+            for n in FAN_SPEEDS:
+                point = calculator._evaluate_curve_at(curve, Q, rho, size_no / 10, n, SUCTION_FACTORS["单吸"], Z)
+                if point is not None and P <= point[3] <= P * (1 + margin):
+                    expected.add((fan_type, size_no / 10, n))
+    assert expected
+    assert {(match["fan_type"], match["D"], match["n"]) for match in result["matches"]} == expected
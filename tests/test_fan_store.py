@@ -0,0 +1,106 @@
+"""
+风机性能曲线缓存：本进程写入立即可见，其他连接/进程的写入按检查间隔经 data_version 发现，
+fork 前释放连接后父子进程都能继续使用；服务端数据指纹随内容变化
+"""
+import json
+import os
+import sqlite3
+
+import pytest
+
+from app.db import database, fan_store
+
+
+@pytest.fixture
+def runtime_db(tmp_path, monkeypatch):
+    """种子库的运行时副本（WAL 模式）"""
+    path = tmp_path / "fan_database.db"
+    monkeypatch.setattr(database, "DB_PATH", path)
+    monkeypatch.setattr(fan_store, "_store", None)
+    database.init_db()
+    yield path
+    database.close_connections()
+    fan_store.get_fan_curve_store().close()
+
+
+def external_update(path, sql, params=()):
+    """模拟其他进程：独立连接直接写库，不经过本进程的写入计数"""
+    conn = sqlite3.connect(str(path))
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_external_update_reloads_curves(runtime_db):
+    store = fan_store.FanCurveStore(check_interval=0)
+    assert store.get("4-68").eta[0] != 50
+    reloads = store.reloads
+
+    external_update(runtime_db, "UPDATE fan_performance SET eta = 50 WHERE fan_type = '4-68' AND point_index = 1")
+
+    assert store.get("4-68").eta[0] == 50
+    assert store.reloads == reloads + 1
+    store.close()
+
+
+def test_in_process_writes_bypass_check_interval(runtime_db):
+    store = fan_store.get_fan_curve_store()
+    store.check_interval = 3600
+    assert len(fan_store.get_fan_curve("4-68")) == 7
+
+    database.insert_fan_performance("4-68", 8, 0.305, 0.31, 80.0)
+    assert len(fan_store.get_fan_curve("4-68")) == 8
+
+    database.bulk_insert_fan_performance([("T1", 1, 0.1, 0.5, 80.0), ("T1", 2, 0.2, 0.4, 85.0)])
+    assert fan_store.get_fan_curve("T1").eta.tolist() == [80.0, 85.0]
+
+    database.bulk_insert_fan_performance([("T1", 1, 0.15, 0.45, 82.0)], replace=True)
+    assert fan_store.get_fan_curve("T1").eta.tolist() == [82.0]
+
+
+def test_external_writes_wait_for_check_interval(runtime_db):
+    store = fan_store.get_fan_curve_store()
+    store.check_interval = 3600
+    assert fan_store.get_fan_curve("T1") is None
+
+    external_update(runtime_db, "INSERT INTO fan_performance (fan_type, point_index, phi, psi_p, eta) "
+                                "VALUES ('T1', 1, 0.1, 0.5, 80)")
+    assert fan_store.get_fan_curve("T1") is None
+
+    store.check_interval = 0
+    assert fan_store.get_fan_curve("T1").eta.tolist() == [80.0]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="需要 os.fork")
+def test_released_connection_is_reopened_in_parent_and_child(runtime_db):
+    store = fan_store.FanCurveStore(check_interval=0)
+    assert store.get("4-68").eta[0] != 50
+    store.release_connection()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - 子进程
+        try:
+            before = float(store.get("4-68").eta[0])
+            external_update(runtime_db, "UPDATE fan_performance SET eta = 50 WHERE fan_type = '4-68' AND point_index = 1")
+            after = float(store.get("4-68").eta[0])
+            os.write(write_fd, json.dumps([before, after]).encode("utf-8"))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        before, after = json.loads(pipe.read())
+    os.waitpid(pid, 0)
+
+    assert before != 50 and after == 50
+    assert store.get("4-68").eta[0] == 50
+    store.close()
+
+
+def test_curves_fingerprint_tracks_content(runtime_db):
+    before = fan_store.curves_fingerprint()
+    assert before
+
+    external_update(runtime_db, "UPDATE fan_performance SET eta = 50 WHERE fan_type = '4-68' AND point_index = 1")
+
+    assert fan_store.curves_fingerprint() != before
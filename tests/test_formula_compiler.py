@@ -0,0 +1,56 @@
+"""
+配置公式编译器：参数校验与不合法计算结果都以 ValueError 报告（接口返回 400）
+"""
+import pytest
+
+from app.services.formula_compiler import FormulaCalculator, compile_formula
+
+CONFIG = {
+    "id": "formula-test",
+    "parameters": [
+        {"name": "base", "label": "底数", "symbol": "a", "minimum": -100, "maximum": 100},
+        {"name": "exponent", "label": "指数", "symbol": "n"},
+    ],
+    "scenarios": [
+        {"id": "power", "title": "乘方", "formula": "y = a ^ n", "parameters": ["base", "exponent"],
+         "outputs": ["y()"]},
+        {"id": "root", "title": "开方", "formula": "y = sqrt(a)", "parameters": ["base"], "outputs": ["y()"]},
+    ],
+}
+
+
+@pytest.fixture
+def calculator():
+    return FormulaCalculator(CONFIG)
+
+
+def test_calculate_rounds_result(calculator):
+    response = calculator.calculate("power", {"base": 2, "exponent": 0.5})
+    assert response.result == pytest.approx(1.4142)
+
+
+@pytest.mark.parametrize("params, message", [
+    ({"exponent": 2}, "底数必须提供"),
+    ({"base": "2", "exponent": 2}, "底数必须是数值"),
+    ({"base": True, "exponent": 2}, "底数必须是数值"),
+    ({"base": 2, "exponent": [2]}, "指数必须是数值"),
+    ({"base": 101, "exponent": 2}, "底数不能大于100"),
+    ({"base": -8, "exponent": 0.5}, "不是实数"),
+    ({"base": 0, "exponent": -1}, "除以0"),
+    ({"base": 10, "exponent": 400}, "溢出"),
+])
+def test_invalid_input_raises_value_error(calculator, params, message):
+    with pytest.raises(ValueError, match=message):
+        calculator.calculate("power", params)
+
+
+def test_math_domain_error_is_value_error(calculator):
+    with pytest.raises(ValueError, match="定义域"):
+        calculator.calculate("root", {"base": -1})
+
+
+def test_compiled_formula_and_calculator_share_checks():
+    compiled = compile_formula("y = a / b")
+    assert compiled.evaluate({"a": 1, "b": 4}) == 0.25
+    with pytest.raises(ValueError, match="参数b必须是数值"):
+        compiled.evaluate({"a": 1, "b": "4"})
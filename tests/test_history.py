@@ -0,0 +1,38 @@
+"""
+计算历史：序列化在后台线程完成，写入单独的历史数据库并只保留最新的记录
+"""
+import threading
+
+from app.db import database
+from app.services import history
+
+
+def test_writer_thread_serializes_and_prunes(tmp_path, monkeypatch):
+    serialized_on = set()
+    to_json = history._to_json
+
+    def tracking_to_json(value):
+        serialized_on.add(threading.current_thread().name)
+        return to_json(value)
+
+    monkeypatch.setattr(history, "_to_json", tracking_to_json)
+    monkeypatch.setattr(history, "HISTORY_DB_PATH", tmp_path / "history.db")
+    fan_db = database.SEED_DB_PATH.read_bytes()
+
+    recorder = history.HistoryRecorder(flush_interval=0.01, max_rows=5)
+    recorder.start()
+    try:
+        for index in range(12):
+            assert recorder.record("current-calc", "pure_resistor", {"power": index}, {"result": index}, 1.0)
+        recorder.flush()
+        assert serialized_on == {"history-writer"}
+        assert recorder.written == 12
+
+        page = history.query_history(tool="current-calc")
+        assert page["total"] == 5
+        assert [item["params"]["power"] for item in page["items"]] == [11, 10, 9, 8, 7]
+        assert recorder.pruned == 7
+    finally:
+        recorder.stop()
+        database.close_connections()
+    assert database.SEED_DB_PATH.read_bytes() == fan_db
@@ -0,0 +1,116 @@
+"""
+风机性能数据导入：表头别名、型号向下填充、无效行整批不写入、仅校验与替换导入
+"""
+import sys
+
+import pytest
+from openpyxl import Workbook
+
+from app.db import database, fan_store
+from scripts.import_fan_data import ImportReport, import_from_excel, main, parse_rows, resolve_columns
+
+
+@pytest.fixture
+def runtime_db(tmp_path, monkeypatch):
+    """种子库的运行时副本"""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "fan_database.db")
+    monkeypatch.setattr(fan_store, "_store", None)
+    database.init_db()
+    yield
+    database.close_connections()
+    fan_store.get_fan_curve_store().close()
+
+
+def write_workbook(path, rows):
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+def curve(fan_type):
+    return [(point["phi"], point["psi_p"], point["eta"]) for point in database.get_fan_performance(fan_type)]
+
+
+def test_resolve_columns_accepts_aliases_and_overrides():
+    assert resolve_columns(["风机型号", " φ ", "ψp", "效率"]) == {"fan_type": 0, "phi": 1, "psi_p": 2, "eta": 3}
+    assert resolve_columns(["Type", "序号", "phi", "psi_p", "eta"], {"fan_type": "type"})["fan_type"] == 0
+    with pytest.raises(ValueError):
+        resolve_columns(["型号", "phi", "psi_p"])
+    with pytest.raises(ValueError):
+        resolve_columns(["型号", "phi", "psi_p", "eta"], {"speed": "转速"})
+
+
+def test_parse_rows_forward_fills_fan_type_and_numbers_points():
+    columns = resolve_columns(["型号", "phi", "psi_p", "eta"])
+    rows = [("T1", 0.1, 0.5, 80), (None, 0.2, 0.4, 85), (), ("T2", 0.1, 0.3, 70), ("", 0.2, 0.2, 60)]
+    report = ImportReport()
+    assert list(parse_rows(rows, columns, report)) == [
+        ("T1", 1, 0.1, 0.5, 80.0), ("T1", 2, 0.2, 0.4, 85.0),
+        ("T2", 1, 0.1, 0.3, 70.0), ("T2", 2, 0.2, 0.2, 60.0),
+    ]
+    assert (report.valid, report.fan_types, report.error_count) == (4, {"T1", "T2"}, 0)
+
+
+def test_parse_rows_reports_bad_rows_and_counts_overflow():
+    columns = resolve_columns(["型号", "序号", "phi", "psi_p", "eta"])
+    rows = [(None, 1, 0.1, 0.5, 80), ("T1", 1, "x", 0.5, 80), ("T1", 2, 0.1, 0.5, 120), ("T1", "a", 0.1, 0.5, 80)]
+    report = ImportReport()
+    assert list(parse_rows(rows, columns, report)) == []
+    assert report.errors[0] == "第2行: 缺少风机型号"
+    assert report.error_count == 4
+
+    report = ImportReport()
+    for row_number in range(60):
+        report.add_error(row_number, "无效", limit=50)
+    assert (len(report.errors), report.omitted, report.error_count) == (50, 10, 60)
+
+
+def test_bad_rows_write_nothing(runtime_db, tmp_path):
+    path = write_workbook(tmp_path / "fans.xlsx", [
+        ["型号", "phi", "psi_p", "eta"],
+        ["T1", 0.1, 0.5, 80],
+        [None, 0.2, 0.4, "坏"],
+    ])
+    before = curve("4-68")
+    report = import_from_excel(path, replace=True)
+    assert (report.valid, report.error_count, report.written) == (1, 1, 0)
+    assert database.get_fan_performance("T1") is None
+    assert curve("4-68") == before
+
+
+def test_dry_run_writes_nothing(runtime_db, tmp_path):
+    path = write_workbook(tmp_path / "fans.xlsx", [["型号", "phi", "psi_p", "eta"], ["T1", 0.1, 0.5, 80]])
+    report = import_from_excel(path, dry_run=True)
+    assert (report.valid, report.written) == (1, 0)
+    assert database.get_fan_performance("T1") is None
+
+
+def test_replace_drops_points_missing_from_the_file(runtime_db, tmp_path):
+    path = write_workbook(tmp_path / "fans.xlsx", [
+        ["型号", "序号", "phi", "psi_p", "eta"],
+        ["4-68", 1, 0.2, 0.45, 90],
+        [None, 2, 0.25, 0.42, 91],
+    ])
+    import_from_excel(path)
+    assert len(curve("4-68")) == 7
+    assert curve("4-68")[:2] == [(0.2, 0.45, 90.0), (0.25, 0.42, 91.0)]
+
+    report = import_from_excel(path, replace=True)
+    assert report.written == 2
+    assert curve("4-68") == [(0.2, 0.45, 90.0), (0.25, 0.42, 91.0)]
+    assert fan_store.get_fan_curve("4-68").eta.tolist() == [90.0, 91.0]
+
+
+def test_main_applies_column_mapping(runtime_db, tmp_path, monkeypatch):
+    path = write_workbook(tmp_path / "fans.xlsx", [["Model", "Q", "P", "E"], ["T9", 0.1, 0.5, 80]])
+    argv = ["import_fan_data.py", "--excel", path,
+            "--map", "fan_type=Model", "--map", "phi=Q", "--map", "psi_p=P", "--map", "eta=E"]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert main() == 0
+    assert curve("T9") == [(0.1, 0.5, 80.0)]
+
+    monkeypatch.setattr(sys, "argv", argv + ["--map", "eta"])
+    with pytest.raises(ValueError):
+        main()
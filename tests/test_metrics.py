@@ -0,0 +1,105 @@
+"""
+运行指标：请求体校验失败（422）计入指标；fork 后子进程的各模块计数从 0 开始
+"""
+import asyncio
+import json
+import os
+
+import pytest
+from fastapi import FastAPI
+
+from app.db import database
+from app.db.fan_store import get_fan_curve_store
+from app.routers.tools_api import build_tools_api_router
+from app.services.history import get_history_recorder
+from app.services.metrics import ERRORS, REQUESTS, get_metrics
+from app.services.registry import ToolSpec
+from app.services.units import conversion_cache_counts, conversion_factor
+
+SPEC = ToolSpec(
+    id="current-metrics",
+    display_name="电流计算",
+    scenarios=["pure_resistor"],
+    calculator="app.services.current_calculator.CurrentCalculator",
+    template="tools/current_calc.html",
+)
+
+
+async def post(app: FastAPI, path: str, body: bytes) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"test"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("test", 80),
+    }
+    status = None
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def values():
+    return {(name, tuple(labels)): value for name, labels, value in get_metrics().snapshot()["values"]}
+
+
+def test_validation_errors_are_counted():
+    app = FastAPI()
+    app.include_router(build_tools_api_router({SPEC.id: SPEC}))
+    path = f"/api/tools/{SPEC.id}/calculate"
+    assert asyncio.run(post(app, path, b'{"power": 1}')) == 422
+    assert asyncio.run(post(app, path, b'{"scenario": 5, "power": 1}')) == 422
+    assert asyncio.run(post(app, path, b'{"scenario": "pure_resistor", "power": 1, "voltage": 1}')) == 200
+
+    counted = values()
+    assert counted[(REQUESTS.name, (SPEC.id, "none", "422"))] == 2
+    assert counted[(ERRORS.name, (SPEC.id, "none", "validation_error"))] == 2
+    assert counted[(REQUESTS.name, (SPEC.id, "pure_resistor", "200"))] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="需要 os.fork")
+def test_counters_restart_from_zero_in_forked_child():
+    store = get_fan_curve_store()
+    store.get("4-68")
+    database.get_all_fan_types()
+    conversion_factor("kW", "W")
+    conversion_factor("kW", "W")
+    get_metrics().inc(REQUESTS.name, ("parent", "none", "200"))
+    recorder = get_history_recorder()
+    recorder._count("dropped", 3)
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover - 子进程
+        try:
+            state = {
+                "store": [store.hits, store.misses, store.reloads],
+                "queries": database.query_counts(),
+                "connections": database.connection_counts(),
+                "units": list(conversion_cache_counts()),
+                "history": [recorder.written, recorder.dropped, recorder.pruned],
+                "registry": get_metrics().snapshot()["values"],
+            }
+            os.write(write_fd, json.dumps(state).encode("utf-8"))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        state = json.loads(pipe.read())
+    os.waitpid(pid, 0)
+    database.close_connections()
+
+    assert state["store"] == [0, 0, 0]
+    assert state["queries"] == {} and state["connections"] == {}
+    assert state["units"] == [0, 0]
+    assert state["history"] == [0, 0, 0]
+    assert not any(name == REQUESTS.name for name, _, _ in state["registry"])
+    assert store.hits >= 1 and recorder.dropped >= 3
+    recorder.reset_counters()
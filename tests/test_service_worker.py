@@ -0,0 +1,32 @@
+"""
+Service Worker 入口：计算结果的版本号计入计算器源码与风机曲线数据，并带最长保存时间
+"""
+import json
+
+from app.services import service_worker
+
+
+def sw_config(data_version):
+    source = service_worker.render_service_worker({}, "v1", lambda path: f"/static/{path}", data_version)
+    return json.loads(source.split("\n", 1)[0][len("self.SW_CONFIG = "):-1])
+
+
+def test_results_version_follows_data_and_calculator_sources(monkeypatch):
+    config = sw_config("[7, 7, null]")
+    assert config["version"] == "v1"
+    assert config["calcCacheMaxAgeMs"] == service_worker.CALC_CACHE_MAX_AGE * 1000
+    assert sw_config("[7, 7, null]")["resultsVersion"] == config["resultsVersion"]
+    assert sw_config("[8, 9, null]")["resultsVersion"] != config["resultsVersion"]
+
+    monkeypatch.setattr(service_worker, "calculator_sources_digest", lambda: "changed")
+    assert sw_config("[7, 7, null]")["resultsVersion"] != config["resultsVersion"]
+
+
+def test_calculator_sources_cover_every_calculator_module():
+    sources = {
+        path.relative_to(service_worker.BASE_DIR).as_posix()
+        for pattern in service_worker.RESULT_SOURCES
+        for path in service_worker.BASE_DIR.glob(pattern)
+    }
+    assert "app/services/fan_selection_calculator.py" in sources
+    assert "app/db/fan_envelope.py" in sources
@@ -0,0 +1,77 @@
+"""
+工具计算接口：单位映射参数校验，以及成功、400 与 500 都写入计算历史
+"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers import tools_api
+from app.routers.tools_api import _build_handler
+from app.services.registry import ToolSpec
+
+SPEC = ToolSpec(
+    id="current-calc",
+    display_name="电流计算",
+    scenarios=["pure_resistor"],
+    calculator="app.services.current_calculator.CurrentCalculator",
+    template="tools/current_calc.html",
+)
+
+
+def _call(body):
+    request_model = SPEC.build_request_model()
+    handler = _build_handler(SPEC, request_model)
+    return asyncio.run(handler(request_model(**body)))
+
+
+def test_valid_output_units_are_applied():
+    response = _call({"scenario": "pure_resistor", "power": 1000, "voltage": 220, "output_units": {"result": "mA"}})
+    assert response.unit == "mA"
+
+
+@pytest.mark.parametrize("field, value", [
+    ("input_units", "kW"),
+    ("input_units", ["power", "kW"]),
+    ("output_units", {"result": 1}),
+    ("output_units", 5),
+])
+def test_malformed_unit_maps_are_rejected_with_400(field, value):
+    with pytest.raises(HTTPException) as info:
+        _call({"scenario": "pure_resistor", "power": 1000, "voltage": 220, field: value})
+    assert info.value.status_code == 400
+    assert field in info.value.detail
+
+
+class ListRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def record(self, tool, scenario, params, result=None, latency_ms=0.0, error=None):
+        self.calls.append((scenario, error))
+        return True
+
+
+@pytest.mark.parametrize("body, status, error", [
+    ({"scenario": "pure_resistor", "power": 1000, "voltage": 220}, None, None),
+    ({"scenario": "pure_resistor", "power": 1000, "voltage": 0}, 400, "电压"),
+    ({"scenario": "", "power": 1000, "voltage": 220}, 400, "缺少scenario字段"),
+    ({"scenario": "pure_resistor", "power": 1000, "voltage": 220, "output_units": 5}, 400, "output_units"),
+    ({"scenario": "pure_resistor", "power": "1000", "voltage": "220"}, 500, "计算错误"),
+])
+def test_every_outcome_is_recorded(monkeypatch, body, status, error):
+    recorder = ListRecorder()
+    monkeypatch.setattr(tools_api, "get_history_recorder", lambda: recorder)
+    if status is None:
+        _call(body)
+    else:
+        with pytest.raises(HTTPException) as info:
+            _call(body)
+        assert info.value.status_code == status
+    assert len(recorder.calls) == 1
+    scenario, recorded_error = recorder.calls[0]
+    assert scenario == body["scenario"]
+    if error is None:
+        assert recorded_error is None
+    else:
+        assert error in recorded_error